@@ -4,15 +4,17 @@ Usage:
     python -m mercury [--config PATH] [--dry-run] [--log-level LEVEL]
 
 Commands:
-    run     - Start the trading bot (default)
-    health  - Check health status
-    version - Show version
+    run      - Start the trading bot (default)
+    health   - Check health status
+    version  - Show version
+    backtest - Replay recorded books through Gabagool over a parameter grid
 
 Examples:
     python -m mercury
     python -m mercury --config config/production.toml
     python -m mercury --dry-run --log-level DEBUG
     python -m mercury health
+    python -m mercury backtest books.jsonl --grid min_spread_threshold=0.01,0.015
 """
 
 import argparse
@@ -68,6 +70,19 @@ def parse_args() -> argparse.Namespace:
     # Version command
     subparsers.add_parser("version", help="Show version")
 
+    # Backtest command
+    backtest = subparsers.add_parser("backtest", help="Backtest Gabagool on recorded books")
+    backtest.add_argument("recording", type=Path, help="JSON Lines book recording")
+    backtest.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="PARAM=V1,V2",
+        help="GabagoolConfig field and candidate values (repeatable)",
+    )
+    backtest.add_argument("--workers", type=int, default=None, help="Worker processes")
+    backtest.add_argument("--top", type=int, default=20, help="Rows to print")
+
     return parser.parse_args()
 
 
@@ -172,6 +187,44 @@ async def check_health() -> int:
         return 1
 
 
+def run_backtest_sweep(args: argparse.Namespace) -> int:
+    """Run a Gabagool parameter sweep and print the ranked table."""
+    from mercury.backtest import (
+        format_results_table,
+        gabagool_factory,
+        load_recording,
+        run_parameter_sweep,
+    )
+    from mercury.core.logging import setup_logging
+
+    # Per-signal INFO logs would dominate the run time
+    setup_logging(level=args.log_level or "WARNING")
+
+    grid: dict[str, list[str]] = {}
+    for spec in args.grid:
+        key, sep, values = spec.partition("=")
+        if not sep or not values:
+            print(f"Invalid --grid {spec!r}, expected PARAM=V1,V2")
+            return 2
+        grid[key.strip()] = [v.strip() for v in values.split(",")]
+
+    try:
+        recording = load_recording(args.recording)
+        results = run_parameter_sweep(
+            gabagool_factory, recording, grid, max_workers=args.workers
+        )
+    except (OSError, ValueError) as e:
+        print(f"Backtest failed: {e}")
+        return 1
+
+    print(
+        f"{len(recording.ticks)} snapshots, {len(recording.market_ids)} markets, "
+        f"{recording.duration_hours:.2f}h, {len(results)} runs"
+    )
+    print(format_results_table(results, limit=args.top))
+    return 0
+
+
 def main() -> int:
     """Main entry point."""
     args = parse_args()
@@ -183,6 +236,9 @@ def main() -> int:
     if args.command == "health":
         return asyncio.run(check_health())
 
+    if args.command == "backtest":
+        return run_backtest_sweep(args)
+
     # Default: run the bot
     return asyncio.run(run_bot(args))
 
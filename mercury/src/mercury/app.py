@@ -19,6 +19,7 @@ from mercury.core.config import ConfigManager
 from mercury.core.events import EventBus
 from mercury.core.lifecycle import BaseComponent, HealthCheckResult, HealthStatus
 from mercury.core.logging import setup_logging
+from mercury.core.ratelimit import configure_rate_limits
 from mercury.core.shutdown import ShutdownManager, ShutdownProgress
 from mercury.services.metrics import MetricsEmitter
 
@@ -79,6 +80,9 @@ class MercuryApp(BaseComponent):
         # Initialize metrics
         self._metrics = MetricsEmitter()
 
+        # Shared request budgets for the CLOB, Gamma and chain clients
+        configure_rate_limits(self._config, self._metrics)
+
         # Shutdown manager with configurable timeouts
         shutdown_timeout = self._config.get_float("mercury.shutdown_timeout_seconds", 30.0)
         drain_timeout = self._config.get_float("mercury.drain_timeout_seconds", 60.0)
@@ -0,0 +1,35 @@
+"""Backtesting over recorded order book data.
+
+Replays recordings through any BaseStrategy, simulates fills against the
+recorded depth, and ranks parameter grids run across a process pool.
+"""
+
+from mercury.backtest.data import BookTick, Recording, load_recording, write_recording
+from mercury.backtest.runner import (
+    BacktestResult,
+    ReplayClock,
+    expand_grid,
+    format_results_table,
+    gabagool_factory,
+    replay,
+    run_backtest,
+    run_parameter_sweep,
+)
+from mercury.backtest.simulator import FillSimulator, SimulatedFill
+
+__all__ = [
+    "BacktestResult",
+    "BookTick",
+    "FillSimulator",
+    "Recording",
+    "ReplayClock",
+    "SimulatedFill",
+    "expand_grid",
+    "format_results_table",
+    "gabagool_factory",
+    "load_recording",
+    "replay",
+    "run_backtest",
+    "run_parameter_sweep",
+    "write_recording",
+]
@@ -0,0 +1,171 @@
+"""Recorded order book data for backtests.
+
+Recordings are JSON Lines files. Each line is either a book snapshot:
+
+    {"market_id": "0xabc", "timestamp": "2026-01-01T12:00:00+00:00",
+     "yes_bids": [["0.44", "50"]], "yes_asks": [["0.45", "100"]],
+     "no_bids": [], "no_asks": [["0.52", "100"]]}
+
+or a market resolution:
+
+    {"type": "resolution", "market_id": "0xabc", "outcome": "YES"}
+
+Prices and sizes are written as strings so Decimal values round-trip
+exactly; plain JSON numbers are also accepted. Timestamps may be ISO 8601
+strings or epoch seconds and are normalized to UTC.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from mercury.domain.market import OrderBook, OrderBookLevel
+
+_SIDES = ("yes_bids", "yes_asks", "no_bids", "no_asks")
+
+
+@dataclass(frozen=True)
+class BookTick:
+    """One recorded order book snapshot."""
+
+    timestamp: datetime
+    book: OrderBook
+
+
+@dataclass
+class Recording:
+    """Time-ordered book snapshots plus known market outcomes."""
+
+    ticks: list[BookTick] = field(default_factory=list)
+    resolutions: dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Stable sort keeps file order for snapshots sharing a timestamp
+        self.ticks.sort(key=lambda tick: tick.timestamp)
+
+    @property
+    def start(self) -> Optional[datetime]:
+        """Timestamp of the first snapshot."""
+        return self.ticks[0].timestamp if self.ticks else None
+
+    @property
+    def end(self) -> Optional[datetime]:
+        """Timestamp of the last snapshot."""
+        return self.ticks[-1].timestamp if self.ticks else None
+
+    @property
+    def duration_hours(self) -> float:
+        """Time covered by the recording, in hours."""
+        if not self.ticks:
+            return 0.0
+        return (self.end - self.start).total_seconds() / 3600
+
+    @property
+    def market_ids(self) -> list[str]:
+        """Markets present in the recording, in first-seen order."""
+        return list(dict.fromkeys(tick.book.market_id for tick in self.ticks))
+
+
+def _parse_timestamp(value: Union[str, int, float]) -> datetime:
+    """Parse an ISO string or epoch seconds into an aware UTC datetime."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    ts = datetime.fromisoformat(value)
+    if ts.tzinfo is None:
+        return ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+
+def _parse_levels(levels: list[Any]) -> list[OrderBookLevel]:
+    return [
+        OrderBookLevel(price=Decimal(str(price)), size=Decimal(str(size)))
+        for price, size in levels
+    ]
+
+
+def _parse_record(record: dict[str, Any], recording: Recording) -> None:
+    """Add one decoded JSON record to a recording.
+
+    Args:
+        record: Decoded JSON object.
+        recording: Recording to append to. Ticks are appended unsorted.
+
+    Raises:
+        ValueError: If the record is malformed.
+    """
+    try:
+        if record.get("type") == "resolution":
+            outcome = str(record["outcome"]).upper()
+            if outcome not in ("YES", "NO"):
+                raise ValueError(f"unknown outcome {record['outcome']!r}")
+            recording.resolutions[record["market_id"]] = outcome
+            return
+
+        timestamp = _parse_timestamp(record["timestamp"])
+        book = OrderBook(
+            market_id=record["market_id"],
+            timestamp=timestamp,
+            **{side: _parse_levels(record.get(side, [])) for side in _SIDES},
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"malformed record: {e}") from e
+
+    recording.ticks.append(BookTick(timestamp=timestamp, book=book))
+
+
+def load_recording(path: Union[str, Path]) -> Recording:
+    """Load a JSON Lines recording.
+
+    Args:
+        path: File to read.
+
+    Returns:
+        Recording with snapshots sorted by timestamp.
+
+    Raises:
+        ValueError: If a line cannot be parsed.
+    """
+    recording = Recording()
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                _parse_record(json.loads(line), recording)
+            except (json.JSONDecodeError, ValueError) as e:
+                raise ValueError(f"{path}:{line_no}: {e}") from e
+
+    recording.ticks.sort(key=lambda tick: tick.timestamp)
+    return recording
+
+
+def write_recording(path: Union[str, Path], recording: Recording) -> None:
+    """Write a recording as JSON Lines.
+
+    Args:
+        path: File to write.
+        recording: Snapshots and resolutions to store.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for tick in recording.ticks:
+            record: dict[str, Any] = {
+                "market_id": tick.book.market_id,
+                "timestamp": tick.timestamp.isoformat(),
+            }
+            for side in _SIDES:
+                record[side] = [
+                    [str(level.price), str(level.size)]
+                    for level in getattr(tick.book, side)
+                ]
+            f.write(json.dumps(record) + "\n")
+
+        for market_id, outcome in recording.resolutions.items():
+            f.write(json.dumps({
+                "type": "resolution",
+                "market_id": market_id,
+                "outcome": outcome,
+            }) + "\n")
@@ -0,0 +1,268 @@
+"""Backtest runner and parameter sweeps.
+
+A backtest replays a Recording through a strategy in timestamp order. The
+strategy is built by a factory that receives the parameter set and a replay
+clock, so time-dependent logic such as signal cooldowns follows recorded
+time rather than wall-clock time. Runs are pure functions of (factory,
+recording, params) and therefore deterministic.
+
+Parameter sweeps fan the cartesian product of a grid out over a process
+pool. The recording is shipped once per worker via the pool initializer.
+"""
+
+import asyncio
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+from mercury.backtest.data import Recording
+from mercury.backtest.simulator import FillSimulator, SimulatedFill
+from mercury.core.config import ConfigManager
+from mercury.domain.market import OrderBook
+from mercury.strategies.base import BaseStrategy
+from mercury.strategies.gabagool import GabagoolConfig, GabagoolStrategy
+
+# factory(params, clock) -> strategy. Must be picklable for parameter sweeps.
+StrategyFactory = Callable[[dict[str, Any], Callable[[], datetime]], BaseStrategy]
+
+
+class ReplayClock:
+    """Callable clock that returns the timestamp of the snapshot being replayed."""
+
+    def __init__(self, start: Optional[datetime] = None) -> None:
+        self.now = start or datetime.fromtimestamp(0, tz=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@dataclass
+class BacktestResult:
+    """Outcome of one backtest run."""
+
+    params: dict[str, Any]
+    signals: int = 0
+    fills: list[SimulatedFill] = field(default_factory=list)
+    pnl: Decimal = Decimal("0")
+    winners: int = 0
+    volume_usd: Decimal = Decimal("0")
+    duration_hours: float = 0.0
+
+    @property
+    def fill_count(self) -> int:
+        """Number of signals that bought anything."""
+        return len(self.fills)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of filled signals that made money."""
+        if not self.fills:
+            return 0.0
+        return self.winners / len(self.fills)
+
+    @property
+    def signals_per_hour(self) -> float:
+        """Signal rate over the recording's time span."""
+        if self.duration_hours <= 0:
+            return float(self.signals)
+        return self.signals / self.duration_hours
+
+    def sort_key(self) -> tuple:
+        """Ranking key: PnL, then hit rate, then params for a stable order."""
+        return (-self.pnl, -self.hit_rate, sorted(
+            (key, str(value)) for key, value in self.params.items()
+        ))
+
+
+async def replay(
+    factory: StrategyFactory,
+    recording: Recording,
+    params: Optional[dict[str, Any]] = None,
+) -> BacktestResult:
+    """Replay a recording through a freshly built strategy.
+
+    Every snapshot is passed to on_market_data(); signals are filled
+    immediately against that same snapshot. Fills are settled at the end
+    against recorded resolutions, or marked at the final best bid.
+
+    Args:
+        factory: Builds the strategy from (params, clock).
+        recording: Snapshots to replay.
+        params: Strategy parameters for this run.
+
+    Returns:
+        BacktestResult for the run.
+    """
+    params = dict(params or {})
+    clock = ReplayClock(recording.start)
+    strategy = factory(params, clock)
+    simulator = FillSimulator()
+    result = BacktestResult(params=params, duration_hours=recording.duration_hours)
+    last_books: dict[str, OrderBook] = {}
+
+    await strategy.start()
+    try:
+        for tick in recording.ticks:
+            book = tick.book
+            clock.now = tick.timestamp
+            last_books[book.market_id] = book
+            simulator.on_book(book)
+
+            async for signal in strategy.on_market_data(book.market_id, book):
+                result.signals += 1
+                fill = simulator.fill(signal, book, tick.timestamp)
+                if fill is not None:
+                    result.fills.append(fill)
+    finally:
+        await strategy.stop()
+
+    for fill in result.fills:
+        pnl = fill.settle(
+            recording.resolutions.get(fill.market_id),
+            last_books.get(fill.market_id),
+        )
+        result.pnl += pnl
+        result.volume_usd += fill.cost
+        if pnl > 0:
+            result.winners += 1
+
+    return result
+
+
+def run_backtest(
+    factory: StrategyFactory,
+    recording: Recording,
+    params: Optional[dict[str, Any]] = None,
+) -> BacktestResult:
+    """Synchronous wrapper around replay() for scripts and worker processes."""
+    return asyncio.run(replay(factory, recording, params))
+
+
+def expand_grid(grid: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Build the cartesian product of a parameter grid.
+
+    Args:
+        grid: Parameter name to candidate values.
+
+    Returns:
+        One dict per combination, in deterministic order.
+    """
+    keys = sorted(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+# --- Worker process side -------------------------------------------------
+
+_worker_factory: Optional[StrategyFactory] = None
+_worker_recording: Optional[Recording] = None
+
+
+def _init_worker(factory: StrategyFactory, recording: Recording) -> None:
+    """Store the factory and recording once per worker process."""
+    global _worker_factory, _worker_recording
+    _worker_factory = factory
+    _worker_recording = recording
+
+
+def _worker_run(params: dict[str, Any]) -> BacktestResult:
+    return run_backtest(_worker_factory, _worker_recording, params)
+
+
+def run_parameter_sweep(
+    factory: StrategyFactory,
+    recording: Recording,
+    grid: dict[str, list[Any]],
+    max_workers: Optional[int] = None,
+    mp_context: Any = None,
+) -> list[BacktestResult]:
+    """Backtest every combination in a grid and rank the results.
+
+    Args:
+        factory: Picklable strategy factory (a module-level function).
+        recording: Snapshots to replay.
+        grid: Parameter name to candidate values.
+        max_workers: Pool size. None uses the CPU count; 1 runs inline.
+        mp_context: Optional multiprocessing context for the pool.
+
+    Returns:
+        Results sorted best first (highest PnL, then hit rate).
+    """
+    combos = expand_grid(grid)
+
+    if max_workers == 1 or len(combos) <= 1:
+        results = [run_backtest(factory, recording, params) for params in combos]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(factory, recording),
+        ) as pool:
+            results = list(pool.map(_worker_run, combos))
+
+    return sorted(results, key=BacktestResult.sort_key)
+
+
+def format_results_table(results: list[BacktestResult], limit: Optional[int] = None) -> str:
+    """Render ranked results as a fixed-width text table.
+
+    Args:
+        results: Results in ranked order.
+        limit: Optional maximum number of rows.
+
+    Returns:
+        Table text, one line per result.
+    """
+    rows = results[:limit] if limit else results
+    param_keys = sorted({key for result in rows for key in result.params})
+    headers = ["rank", *param_keys, "signals", "fills", "pnl", "hit_rate", "signals/hr"]
+
+    lines = [headers]
+    for rank, result in enumerate(rows, start=1):
+        lines.append([
+            str(rank),
+            *(str(result.params.get(key, "")) for key in param_keys),
+            str(result.signals),
+            str(result.fill_count),
+            f"{result.pnl:.4f}",
+            f"{result.hit_rate:.1%}",
+            f"{result.signals_per_hour:.1f}",
+        ])
+
+    widths = [max(len(line[i]) for line in lines) for i in range(len(headers))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(line, widths))
+        for line in lines
+    )
+
+
+def gabagool_factory(params: dict[str, Any], clock: Callable[[], datetime]) -> BaseStrategy:
+    """Build a GabagoolStrategy with GabagoolConfig fields overridden by params.
+
+    Values are coerced to the type of the field they override, so grids
+    read from the command line can pass strings.
+
+    Raises:
+        ValueError: If a parameter is not a GabagoolConfig field.
+    """
+    base = GabagoolConfig()
+    overrides: dict[str, Any] = {}
+    for key, value in params.items():
+        if not hasattr(base, key):
+            raise ValueError(f"unknown gabagool parameter {key!r}")
+        current = getattr(base, key)
+        if isinstance(current, Decimal):
+            overrides[key] = Decimal(str(value))
+        elif isinstance(current, bool) and isinstance(value, str):
+            overrides[key] = value.lower() in ("true", "1", "yes", "on")
+        else:
+            overrides[key] = type(current)(value)
+
+    return GabagoolStrategy(
+        config=ConfigManager(),
+        gabagool_config=replace(base, **overrides),
+        clock=clock,
+    )
@@ -0,0 +1,215 @@
+"""Fill simulation against recorded order book depth.
+
+Signals are filled by walking the recorded ask ladders, never by assuming
+the signal's quoted price. Liquidity taken from a snapshot stays consumed
+until the next snapshot for that market arrives, so repeated signals on the
+same book cannot fill the same size twice.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from mercury.domain.market import OrderBook, OrderBookLevel
+from mercury.domain.signal import SignalType, TradingSignal
+
+ZERO = Decimal("0")
+ONE = Decimal("1")
+
+
+@dataclass(frozen=True)
+class SimulatedFill:
+    """Shares bought for one signal."""
+
+    signal_id: str
+    market_id: str
+    signal_type: SignalType
+    timestamp: datetime
+    yes_shares: Decimal
+    no_shares: Decimal
+    cost: Decimal
+
+    @property
+    def hedged_shares(self) -> Decimal:
+        """Shares held on both sides, which pay $1 whatever the outcome."""
+        return min(self.yes_shares, self.no_shares)
+
+    def settle(self, outcome: Optional[str], last_book: Optional[OrderBook] = None) -> Decimal:
+        """Compute realized or marked PnL.
+
+        Args:
+            outcome: "YES" or "NO" if the market resolved in the recording.
+            last_book: Final snapshot, used to mark unhedged shares at the
+                best bid when the outcome is unknown.
+
+        Returns:
+            PnL in USD.
+        """
+        if outcome == "YES":
+            return self.yes_shares - self.cost
+        if outcome == "NO":
+            return self.no_shares - self.cost
+
+        payout = self.hedged_shares
+        yes_left = self.yes_shares - payout
+        no_left = self.no_shares - payout
+        if last_book is not None:
+            if yes_left > 0 and last_book.yes_best_bid is not None:
+                payout += yes_left * last_book.yes_best_bid
+            if no_left > 0 and last_book.no_best_bid is not None:
+                payout += no_left * last_book.no_best_bid
+        return payout - self.cost
+
+
+class FillSimulator:
+    """Taker fill model over recorded depth.
+
+    ARBITRAGE signals buy equal YES and NO shares level by level while the
+    pair cost stays below $1. BUY_YES / BUY_NO signals walk one ladder.
+    Both stop at the signal's price plus max_slippage and at its
+    target_size_usd budget. Other signal types are not filled.
+
+    Usage:
+        simulator = FillSimulator()
+        simulator.on_book(book)
+        fill = simulator.fill(signal, book, timestamp)
+    """
+
+    def __init__(self) -> None:
+        # Shares consumed from the current snapshot, keyed by (market_id, side)
+        self._consumed: dict[tuple[str, str], Decimal] = {}
+
+    def on_book(self, book: OrderBook) -> None:
+        """Register a new snapshot, restoring its market's liquidity."""
+        self._consumed.pop((book.market_id, "yes"), None)
+        self._consumed.pop((book.market_id, "no"), None)
+
+    def fill(
+        self,
+        signal: TradingSignal,
+        book: OrderBook,
+        timestamp: datetime,
+    ) -> Optional[SimulatedFill]:
+        """Fill a signal against the book it was generated from.
+
+        Args:
+            signal: Signal to execute.
+            book: Current snapshot of the signal's market.
+            timestamp: Replay time of the snapshot.
+
+        Returns:
+            SimulatedFill, or None if nothing could be bought.
+        """
+        if signal.signal_type == SignalType.ARBITRAGE:
+            yes_shares, no_shares, cost = self._fill_pair(signal, book)
+        elif signal.signal_type == SignalType.BUY_YES:
+            yes_shares, cost = self._fill_side(
+                book, "yes", book.yes_asks, signal.yes_price + signal.max_slippage,
+                signal.target_size_usd,
+            )
+            no_shares = ZERO
+        elif signal.signal_type == SignalType.BUY_NO:
+            no_shares, cost = self._fill_side(
+                book, "no", book.no_asks, signal.no_price + signal.max_slippage,
+                signal.target_size_usd,
+            )
+            yes_shares = ZERO
+        else:
+            return None
+
+        if yes_shares <= 0 and no_shares <= 0:
+            return None
+
+        return SimulatedFill(
+            signal_id=signal.signal_id,
+            market_id=signal.market_id,
+            signal_type=signal.signal_type,
+            timestamp=timestamp,
+            yes_shares=yes_shares,
+            no_shares=no_shares,
+            cost=cost,
+        )
+
+    def _available(
+        self,
+        market_id: str,
+        side: str,
+        levels: list[OrderBookLevel],
+        limit: Decimal,
+    ) -> list[list[Decimal]]:
+        """Get [price, size] levels at or below limit, net of consumed size."""
+        consumed = self._consumed.get((market_id, side), ZERO)
+        available = []
+        for level in levels:
+            if level.price > limit:
+                break
+            size = level.size
+            if consumed > 0:
+                taken = min(consumed, size)
+                consumed -= taken
+                size -= taken
+            if size > 0:
+                available.append([level.price, size])
+        return available
+
+    def _consume(self, market_id: str, side: str, shares: Decimal) -> None:
+        key = (market_id, side)
+        self._consumed[key] = self._consumed.get(key, ZERO) + shares
+
+    def _fill_side(
+        self,
+        book: OrderBook,
+        side: str,
+        levels: list[OrderBookLevel],
+        limit: Decimal,
+        budget: Decimal,
+    ) -> tuple[Decimal, Decimal]:
+        """Walk one ask ladder. Returns (shares, cost)."""
+        shares = cost = ZERO
+        for price, size in self._available(book.market_id, side, levels, limit):
+            remaining = budget - cost
+            if remaining <= 0:
+                break
+            qty = min(size, remaining / price)
+            shares += qty
+            cost += qty * price
+
+        self._consume(book.market_id, side, shares)
+        return shares, cost
+
+    def _fill_pair(
+        self,
+        signal: TradingSignal,
+        book: OrderBook,
+    ) -> tuple[Decimal, Decimal, Decimal]:
+        """Walk both ask ladders buying equal shares. Returns (yes, no, cost)."""
+        yes = self._available(
+            book.market_id, "yes", book.yes_asks, signal.yes_price + signal.max_slippage
+        )
+        no = self._available(
+            book.market_id, "no", book.no_asks, signal.no_price + signal.max_slippage
+        )
+
+        shares = cost = ZERO
+        i = j = 0
+        while i < len(yes) and j < len(no):
+            pair_price = yes[i][0] + no[j][0]
+            remaining = signal.target_size_usd - cost
+            if pair_price >= ONE or remaining <= 0:
+                break
+
+            qty = min(yes[i][1], no[j][1], remaining / pair_price)
+            shares += qty
+            cost += qty * pair_price
+
+            yes[i][1] -= qty
+            no[j][1] -= qty
+            if yes[i][1] <= 0:
+                i += 1
+            if no[j][1] <= 0:
+                j += 1
+
+        self._consume(book.market_id, "yes", shares)
+        self._consume(book.market_id, "no", shares)
+        return shares, shares, cost
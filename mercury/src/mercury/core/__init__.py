@@ -1,9 +1,19 @@
-"""Core framework infrastructure - config, events, logging, lifecycle, retry, shutdown."""
+"""Core framework infrastructure.
+
+Config, events, logging, lifecycle, retry, rate limits, shutdown.
+"""
 
 from mercury.core.config import ConfigManager
 from mercury.core.events import EventBus
 from mercury.core.logging import setup_logging
 from mercury.core.lifecycle import Startable, Stoppable, HealthCheckable
+from mercury.core.ratelimit import (
+    Priority,
+    RateLimiterRegistry,
+    TokenBucket,
+    configure_rate_limits,
+    get_rate_limiter,
+)
 from mercury.core.shutdown import ShutdownManager, ShutdownPhase, ShutdownProgress
 from mercury.core.retry import (
     RetryConfig,
@@ -70,4 +80,10 @@ __all__ = [
     "is_retryable",
     "classify_error",
     "wrap_external_error",
+    # Rate limits
+    "Priority",
+    "RateLimiterRegistry",
+    "TokenBucket",
+    "configure_rate_limits",
+    "get_rate_limiter",
 ]
@@ -264,6 +264,16 @@ class ConfigManager:
         if callback in self._reload_callbacks:
             self._reload_callbacks.remove(callback)
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle support for shipping config to worker processes.
+
+        Reload callbacks are bound to objects in the parent process and are
+        not carried across.
+        """
+        state = self.__dict__.copy()
+        state["_reload_callbacks"] = []
+        return state
+
     @property
     def raw_data(self) -> dict[str, Any]:
         """Get raw configuration data (for debugging)."""
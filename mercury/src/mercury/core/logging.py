@@ -50,6 +50,8 @@ def setup_logging(
 
     # Configure structlog processors
     shared_processors: list[structlog.types.Processor] = [
+        # Drop below-level events before any formatting work is done
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
@@ -0,0 +1,389 @@
+"""
+Shared request budgets for external APIs.
+
+This module provides:
+- TokenBucket: an awaitable token bucket with priority-ordered waiters
+- RateLimiterRegistry: per-endpoint buckets configured from TOML
+- A process-wide registry shared by the CLOB, Gamma and chain clients
+
+Retries (tenacity or mercury.core.retry) only react to failures; the buckets
+keep each client under its budget in the first place. Endpoints are dotted
+names and fall back to their parent: with only [rate_limits.clob] configured,
+"clob.orders" and "clob.book" draw from the "clob" bucket. Endpoints with no
+bucket are not limited.
+
+When a bucket is empty, waiters are served by priority and then arrival
+order, so a queued order placement goes ahead of queued book fetches and
+metadata lookups. A request resent after a 429 goes ahead of first attempts
+of its priority, so it is not starved by newer requests.
+
+Usage:
+    from mercury.core.ratelimit import Priority, get_rate_limiter
+
+    limiter = get_rate_limiter()
+    await limiter.acquire("clob.orders", Priority.ORDER)
+
+    # After a 429
+    limiter.backoff("clob.orders", retry_after_seconds)
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Optional
+
+import structlog
+
+if TYPE_CHECKING:
+    from mercury.core.config import ConfigManager
+    from mercury.services.metrics import MetricsEmitter
+
+log = structlog.get_logger()
+
+DEFAULT_SECTION = "rate_limits"
+
+
+class Priority(IntEnum):
+    """Request priority classes; lower values are served first."""
+
+    ORDER = 0  # Order placement, cancels and fill checks
+    MARKET_DATA = 1  # Order book fetches
+    METADATA = 2  # Market metadata, balances, positions, chain reads
+
+
+class TokenBucket:
+    """Token bucket refilling at a constant rate up to a burst capacity.
+
+    acquire() takes a token immediately when one is available and nobody
+    is queued; otherwise it waits in a priority queue until the bucket has
+    refilled enough. A single timer wakes the head waiter, so idle buckets
+    cost nothing.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: Optional[float] = None,
+        metrics_emitter: Optional["MetricsEmitter"] = None,
+    ):
+        """Initialize the bucket.
+
+        Args:
+            name: Endpoint name, used for metrics.
+            rate: Tokens added per second.
+            burst: Capacity (defaults to one second of tokens).
+            metrics_emitter: Optional metrics emitter for fill and wait time.
+        """
+        self.name = name
+        self._rate = 0.0
+        self._burst = 0.0
+        self._tokens = float("inf")
+        self.reconfigure(rate, burst)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, int, float, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._metrics = metrics_emitter
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self._rate
+
+    @property
+    def burst(self) -> float:
+        """Bucket capacity."""
+        return self._burst
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative during a backoff)."""
+        self._refill()
+        return self._tokens
+
+    @property
+    def waiting(self) -> int:
+        """Number of acquire() calls queued."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def reconfigure(self, rate: float, burst: Optional[float] = None) -> None:
+        """Change the refill rate and capacity, keeping the current fill."""
+        if rate <= 0:
+            raise ValueError(f"rate for {self.name} must be positive, got {rate}")
+        burst = float(burst) if burst else float(rate)
+        if burst < 1:
+            raise ValueError(f"burst for {self.name} must be at least 1, got {burst}")
+        self._rate = float(rate)
+        self._burst = burst
+        self._tokens = min(self._tokens, burst)
+
+    async def acquire(
+        self,
+        priority: Priority = Priority.METADATA,
+        tokens: float = 1.0,
+        resend: bool = False,
+    ) -> float:
+        """Take tokens, waiting until the bucket has them.
+
+        Args:
+            priority: Priority class; lower values are served first.
+            tokens: Tokens to take (capped at the burst capacity).
+            resend: Request is resent after a 429; served before first
+                    attempts of the same priority.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        tokens = min(tokens, self._burst)
+        self._refill()
+        if not self._waiters and self._tokens >= tokens:
+            self._tokens -= tokens
+            self._record(priority, 0.0)
+            return 0.0
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters, (int(priority), int(not resend), next(self._sequence), tokens, future)
+        )
+        started = time.monotonic()
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the caller was cancelled: give it back
+                self._tokens = min(self._burst, self._tokens + tokens)
+            self._wake()
+            raise
+
+        waited = time.monotonic() - started
+        self._record(priority, waited)
+        return waited
+
+    def backoff(self, seconds: float) -> None:
+        """Empty the bucket so no token is handed out for `seconds`.
+
+        Called after a 429 so queued requests and retries wait out the
+        server's Retry-After instead of failing again.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self._rate
+        self._wake()
+        if self._metrics:
+            self._metrics.record_rate_limit_backoff(self.name)
+            self._metrics.update_rate_limit_tokens(self.name, 0.0)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _wake(self) -> None:
+        """Grant tokens to queued waiters and re-arm the timer for the next."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._refill()
+        while self._waiters:
+            *_, needed, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._tokens < needed:
+                delay = (needed - self._tokens) / self._rate
+                self._timer = asyncio.get_running_loop().call_later(delay, self._wake)
+                return
+            heapq.heappop(self._waiters)
+            self._tokens -= needed
+            future.set_result(None)
+
+    def _record(self, priority: int, waited: float) -> None:
+        if self._metrics:
+            self._metrics.record_rate_limit_wait(
+                self.name, Priority(priority).name.lower(), waited * 1000
+            )
+            self._metrics.update_rate_limit_tokens(self.name, max(self._tokens, 0.0))
+
+
+class RateLimiterRegistry:
+    """Per-endpoint token buckets shared across integration clients.
+
+    Configured from the [rate_limits] section, one table per endpoint:
+
+        [rate_limits.clob]
+        rate = 100.0   # tokens per second
+        burst = 200    # capacity
+
+        [rate_limits.clob.orders]
+        rate = 50.0
+        burst = 100
+    """
+
+    def __init__(self, metrics_emitter: Optional["MetricsEmitter"] = None):
+        """Initialize an empty registry (no endpoint is limited).
+
+        Args:
+            metrics_emitter: Optional metrics emitter passed to every bucket.
+        """
+        self._buckets: dict[str, TokenBucket] = {}
+        self._resolved: dict[str, Optional[TokenBucket]] = {}
+        self._metrics = metrics_emitter
+        self._log = log.bind(component="rate_limiter")
+
+    @classmethod
+    def from_config(
+        cls,
+        config: "ConfigManager",
+        metrics_emitter: Optional["MetricsEmitter"] = None,
+        section: str = DEFAULT_SECTION,
+    ) -> "RateLimiterRegistry":
+        """Create a registry with the buckets configured under `section`."""
+        registry = cls(metrics_emitter)
+        registry.load(config, section)
+        return registry
+
+    @property
+    def endpoints(self) -> list[str]:
+        """Names of the configured endpoints."""
+        return sorted(self._buckets)
+
+    def set_metrics_emitter(self, metrics_emitter: Optional["MetricsEmitter"]) -> None:
+        """Attach a metrics emitter to this registry and its buckets."""
+        self._metrics = metrics_emitter
+        for bucket in self._buckets.values():
+            bucket._metrics = metrics_emitter
+
+    def load(self, config: "ConfigManager", section: str = DEFAULT_SECTION) -> None:
+        """(Re)configure buckets from a config section.
+
+        Existing buckets keep their fill and queued waiters; with
+        `enabled = false` in the section every bucket is removed.
+        """
+        limits = config.get_section(section)
+        if not limits.get("enabled", True):
+            self._buckets.clear()
+            self._resolved.clear()
+            self._log.info("rate_limits_disabled")
+            return
+
+        for endpoint, table in self._tables(limits):
+            self.configure(endpoint, float(table["rate"]), table.get("burst"))
+
+    def configure(
+        self,
+        endpoint: str,
+        rate: float,
+        burst: Optional[float] = None,
+    ) -> TokenBucket:
+        """Create or update the bucket for an endpoint.
+
+        Args:
+            endpoint: Dotted endpoint name, e.g. "clob.orders".
+            rate: Requests per second.
+            burst: Bucket capacity (defaults to `rate`).
+
+        Returns:
+            The endpoint's bucket.
+        """
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            bucket = TokenBucket(endpoint, rate, burst, self._metrics)
+            self._buckets[endpoint] = bucket
+            self._resolved.clear()
+        else:
+            bucket.reconfigure(rate, burst)
+        self._log.debug("rate_limit_configured", endpoint=endpoint, rate=rate, burst=bucket.burst)
+        return bucket
+
+    def bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        """Get the bucket limiting an endpoint (its own or its nearest parent's)."""
+        if endpoint not in self._resolved:
+            name = endpoint
+            bucket = self._buckets.get(name)
+            while bucket is None and "." in name:
+                name = name.rsplit(".", 1)[0]
+                bucket = self._buckets.get(name)
+            self._resolved[endpoint] = bucket
+        return self._resolved[endpoint]
+
+    async def acquire(
+        self,
+        endpoint: str,
+        priority: Priority = Priority.METADATA,
+        tokens: float = 1.0,
+        resend: bool = False,
+    ) -> float:
+        """Wait for budget to make a request to an endpoint.
+
+        Args:
+            endpoint: Dotted endpoint name.
+            priority: Priority class of the request.
+            tokens: Request cost in tokens.
+            resend: Request is resent after a 429.
+
+        Returns:
+            Seconds spent waiting (0 for unlimited endpoints).
+        """
+        bucket = self.bucket(endpoint)
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire(priority, tokens, resend)
+
+    def backoff(self, endpoint: str, seconds: float) -> None:
+        """Pause an endpoint's bucket after the server rate limited a request."""
+        bucket = self.bucket(endpoint)
+        if bucket is None:
+            return
+        self._log.warning("rate_limited_by_server", endpoint=endpoint, backoff_seconds=seconds)
+        bucket.backoff(seconds)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Fill level and queue length per configured endpoint."""
+        return {
+            name: {
+                "tokens": bucket.tokens,
+                "rate": bucket.rate,
+                "burst": bucket.burst,
+                "waiting": bucket.waiting,
+            }
+            for name, bucket in sorted(self._buckets.items())
+        }
+
+    @staticmethod
+    def _tables(limits: dict[str, Any], prefix: str = ""):
+        """Yield (endpoint, table) for every nested table with a rate."""
+        for key, value in limits.items():
+            if not isinstance(value, dict):
+                continue
+            endpoint = f"{prefix}{key}"
+            if "rate" in value:
+                yield endpoint, value
+            yield from RateLimiterRegistry._tables(value, f"{endpoint}.")
+
+
+# Process-wide registry used by clients that are not given one explicitly
+_registry = RateLimiterRegistry()
+
+
+def get_rate_limiter() -> RateLimiterRegistry:
+    """Get the process-wide rate limiter registry."""
+    return _registry
+
+
+def configure_rate_limits(
+    config: "ConfigManager",
+    metrics_emitter: Optional["MetricsEmitter"] = None,
+    section: str = DEFAULT_SECTION,
+) -> RateLimiterRegistry:
+    """Configure the process-wide registry from config.
+
+    Updates the shared registry in place, so clients created earlier pick
+    up the new limits.
+    """
+    _registry.set_metrics_emitter(metrics_emitter)
+    _registry.load(config, section)
+    return _registry
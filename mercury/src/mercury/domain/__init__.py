@@ -7,10 +7,17 @@ from mercury.domain.events import (
     TradeEvent,
 )
 from mercury.domain.market import Market, OrderBook, OrderBookLevel, Token
+from mercury.domain.market_batch import MarketBatch
 from mercury.domain.order import Order, OrderRequest, OrderResult, Fill, Position, OrderSide, OrderStatus
 from mercury.domain.orderbook import InMemoryOrderBook, MarketOrderBook, PriceLevel, SortedPriceLevels
 from mercury.domain.signal import TradingSignal, SignalType
-from mercury.domain.risk import RiskLimits, CircuitBreakerState, CircuitBreakerLevel
+from mercury.domain.risk import (
+    RiskLimits,
+    CircuitBreakerState,
+    CircuitBreakerLevel,
+    ThresholdCounter,
+)
+from mercury.domain.scenario import PortfolioScenarios, ScenarioResult
 
 __all__ = [
     # Event payloads for EventBus publishing
@@ -23,6 +30,7 @@ __all__ = [
     "OrderBook",
     "OrderBookLevel",
     "Token",
+    "MarketBatch",
     # Order models
     "Order",
     "OrderRequest",
@@ -38,6 +46,9 @@ __all__ = [
     "RiskLimits",
     "CircuitBreakerState",
     "CircuitBreakerLevel",
+    "ThresholdCounter",
+    "PortfolioScenarios",
+    "ScenarioResult",
     # Order book state management
     "InMemoryOrderBook",
     "MarketOrderBook",
@@ -0,0 +1,223 @@
+"""Columnar top-of-book state for batch strategy evaluation.
+
+MarketBatch keeps the best bid/ask prices and sizes of many markets in
+NumPy arrays, one row per market, with a dirty flag per row. Strategies
+implementing on_market_batch() can scan all changed markets with vectorized
+operations instead of being called once per order book event.
+"""
+
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+
+from mercury.domain.market import OrderBook, OrderBookLevel
+
+# Column order for the value matrix
+FIELDS = (
+    "yes_bid",
+    "yes_bid_size",
+    "yes_ask",
+    "yes_ask_size",
+    "no_bid",
+    "no_bid_size",
+    "no_ask",
+    "no_ask_size",
+)
+_COLUMN = {name: i for i, name in enumerate(FIELDS)}
+_NAN = float("nan")
+
+
+class MarketBatch:
+    """Top-of-book arrays for a set of markets.
+
+    Missing levels are stored as NaN, so comparisons against them are
+    always False. Column accessors return views over the populated rows.
+
+    Usage:
+        batch = MarketBatch()
+        batch.update(book)
+        rows = batch.dirty_rows()
+        combined = batch.yes_ask[rows] + batch.no_ask[rows]
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        """Initialize an empty batch.
+
+        Args:
+            capacity: Initial number of rows to allocate.
+        """
+        self._values = np.full((max(capacity, 1), len(FIELDS)), np.nan)
+        self._dirty = np.zeros(max(capacity, 1), dtype=bool)
+        self._market_ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._dirty_count = 0
+
+    def __len__(self) -> int:
+        """Number of markets tracked."""
+        return len(self._market_ids)
+
+    def __contains__(self, market_id: str) -> bool:
+        """Check if a market has a row."""
+        return market_id in self._rows
+
+    @property
+    def market_ids(self) -> list[str]:
+        """Market IDs indexed by row."""
+        return self._market_ids
+
+    @property
+    def dirty_count(self) -> int:
+        """Number of rows changed since the last clear_dirty()."""
+        return self._dirty_count
+
+    @property
+    def yes_bid(self) -> np.ndarray:
+        return self.column("yes_bid")
+
+    @property
+    def yes_bid_size(self) -> np.ndarray:
+        return self.column("yes_bid_size")
+
+    @property
+    def yes_ask(self) -> np.ndarray:
+        return self.column("yes_ask")
+
+    @property
+    def yes_ask_size(self) -> np.ndarray:
+        return self.column("yes_ask_size")
+
+    @property
+    def no_bid(self) -> np.ndarray:
+        return self.column("no_bid")
+
+    @property
+    def no_bid_size(self) -> np.ndarray:
+        return self.column("no_bid_size")
+
+    @property
+    def no_ask(self) -> np.ndarray:
+        return self.column("no_ask")
+
+    @property
+    def no_ask_size(self) -> np.ndarray:
+        return self.column("no_ask_size")
+
+    def column(self, name: str) -> np.ndarray:
+        """Get a view of one field across all tracked markets.
+
+        Args:
+            name: One of FIELDS.
+
+        Returns:
+            1-D float64 view indexed by row.
+        """
+        return self._values[: len(self._market_ids), _COLUMN[name]]
+
+    def row_of(self, market_id: str) -> Optional[int]:
+        """Get the row index of a market, or None if untracked."""
+        return self._rows.get(market_id)
+
+    def ensure_row(self, market_id: str) -> int:
+        """Get the row for a market, allocating one if needed.
+
+        Args:
+            market_id: Market condition ID.
+
+        Returns:
+            Row index.
+        """
+        row = self._rows.get(market_id)
+        if row is not None:
+            return row
+
+        row = len(self._market_ids)
+        if row >= self._values.shape[0]:
+            self._grow()
+        self._market_ids.append(market_id)
+        self._rows[market_id] = row
+        return row
+
+    def rows_for(self, market_ids: list[str]) -> np.ndarray:
+        """Get row indices for the tracked markets in market_ids."""
+        return np.array(
+            [self._rows[m] for m in market_ids if m in self._rows],
+            dtype=np.intp,
+        )
+
+    def update(self, book: OrderBook) -> int:
+        """Store the top of an order book and mark its row dirty.
+
+        Args:
+            book: Order book snapshot.
+
+        Returns:
+            Row index of the market.
+        """
+        row = self.ensure_row(book.market_id)
+        # Build the row in Python and assign once; per-element numpy writes
+        # cost more than the float conversions themselves.
+        values = []
+        for levels in (book.yes_bids, book.yes_asks, book.no_bids, book.no_asks):
+            if levels:
+                top = levels[0]
+                values.append(float(top.price))
+                values.append(float(top.size))
+            else:
+                values.append(_NAN)
+                values.append(_NAN)
+        self._values[row] = values
+
+        if not self._dirty[row]:
+            self._dirty[row] = True
+            self._dirty_count += 1
+        return row
+
+    def dirty_rows(self) -> np.ndarray:
+        """Get indices of rows changed since the last clear_dirty()."""
+        return np.flatnonzero(self._dirty[: len(self._market_ids)])
+
+    def clear_dirty(self) -> None:
+        """Mark all rows clean."""
+        self._dirty[:] = False
+        self._dirty_count = 0
+
+    def to_order_book(self, row: int) -> OrderBook:
+        """Rebuild a single-level OrderBook from a row.
+
+        Args:
+            row: Row index.
+
+        Returns:
+            OrderBook holding the stored top of book.
+        """
+        values = self._values[row]
+
+        def level(offset: int) -> list[OrderBookLevel]:
+            price = values[offset]
+            if np.isnan(price):
+                return []
+            return [
+                OrderBookLevel(
+                    price=Decimal(repr(float(price))),
+                    size=Decimal(repr(float(values[offset + 1]))),
+                )
+            ]
+
+        return OrderBook(
+            market_id=self._market_ids[row],
+            yes_bids=level(0),
+            yes_asks=level(2),
+            no_bids=level(4),
+            no_asks=level(6),
+        )
+
+    def _grow(self) -> None:
+        """Double row capacity."""
+        capacity = self._values.shape[0] * 2
+        values = np.full((capacity, len(FIELDS)), np.nan)
+        values[: self._values.shape[0]] = self._values
+        dirty = np.zeros(capacity, dtype=bool)
+        dirty[: self._dirty.shape[0]] = self._dirty
+        self._values = values
+        self._dirty = dirty
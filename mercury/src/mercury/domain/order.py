@@ -74,6 +74,8 @@ class Order:
     client_order_id: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+    # Order ID assigned by the exchange, once submitted
+    exchange_order_id: Optional[str] = None
 
     @property
     def remaining_size(self) -> Decimal:
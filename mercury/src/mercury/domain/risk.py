@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
 
 class CircuitBreakerState(str, Enum):
@@ -49,11 +49,110 @@ class CircuitBreakerState(str, Enum):
         """Check if any trading is allowed in this state."""
         return self != CircuitBreakerState.HALT
 
+    @property
+    def severity(self) -> int:
+        """Get ordering rank (NORMAL=0 ... HALT=3) for comparing states."""
+        return _SEVERITY[self]
+
+
+_SEVERITY = {
+    CircuitBreakerState.NORMAL: 0,
+    CircuitBreakerState.WARNING: 1,
+    CircuitBreakerState.CAUTION: 2,
+    CircuitBreakerState.HALT: 3,
+}
+
 
 # Keep CircuitBreakerLevel as an alias for backwards compatibility
 CircuitBreakerLevel = CircuitBreakerState
 
 
+Number = Union[int, float, Decimal]
+_INF = float("inf")
+
+
+class ThresholdCounter:
+    """Running circuit breaker input with O(1) threshold-crossing detection.
+
+    The value maps onto a CircuitBreakerState band: at or above the halt
+    threshold is HALT, at or above caution is CAUTION, at or above warning is
+    WARNING. Thresholds of 0 or below are disabled. The bounds of the current
+    band are cached, so an update that stays inside the band is two
+    comparisons and the caller only re-evaluates the breaker on a crossing.
+
+    Usage:
+        failures = ThresholdCounter(warning=3, caution=4, halt=5)
+        if failures.add(1):
+            # state changed, failures.state / failures.threshold are current
+            ...
+    """
+
+    def __init__(self, warning: Number = 0, caution: Number = 0, halt: Number = 0) -> None:
+        """Initialize the counter at zero.
+
+        Args:
+            warning: Value at which the input reaches WARNING (0 disables).
+            caution: Value at which the input reaches CAUTION (0 disables).
+            halt: Value at which the input reaches HALT (0 disables).
+        """
+        self._thresholds = [
+            (level, threshold)
+            for level, threshold in (
+                (CircuitBreakerState.WARNING, warning),
+                (CircuitBreakerState.CAUTION, caution),
+                (CircuitBreakerState.HALT, halt),
+            )
+            if threshold > 0
+        ]
+        self.value: Number = 0
+        self.state = CircuitBreakerState.NORMAL
+        self.threshold: Optional[Number] = None
+        self._low: Number = -_INF
+        self._high: Number = _INF
+        self._locate(0)
+
+    def update(self, value: Number) -> bool:
+        """Set the value.
+
+        Returns:
+            True if the value moved into a different state band.
+        """
+        self.value = value
+        if self._low <= value < self._high:
+            return False
+        old_state = self.state
+        self._locate(value)
+        return self.state != old_state
+
+    def add(self, delta: Number) -> bool:
+        """Add to the value. Returns True on a state change, as update()."""
+        return self.update(self.value + delta)
+
+    def reset(self) -> None:
+        """Return to zero and NORMAL."""
+        self.value = 0
+        self._locate(0)
+
+    def _locate(self, value: Number) -> None:
+        """Find the state band containing value and cache its bounds."""
+        state = CircuitBreakerState.NORMAL
+        threshold: Optional[Number] = None
+        low: Number = -_INF
+        high: Number = _INF
+        for level, limit in self._thresholds:
+            if value >= limit:
+                if level.severity > state.severity:
+                    state, threshold = level, limit
+                if limit > low:
+                    low = limit
+            elif limit < high:
+                high = limit
+        self.state = state
+        self.threshold = threshold
+        self._low = low
+        self._high = high
+
+
 @dataclass
 class CircuitBreakerInfo:
     """Detailed circuit breaker information including timing."""
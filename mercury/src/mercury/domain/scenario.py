@@ -0,0 +1,276 @@
+"""Scenario P&L for open binary-market positions.
+
+PortfolioScenarios keeps open positions in NumPy arrays, one row per market:
+YES shares, NO shares, YES cost and NO cost, plus an asset index. A binary
+market pays $1 per share of the winning outcome, so the P&L of a resolution
+is the payout of the winning side minus total cost.
+
+Markets on the same asset are assumed to resolve together, as the BTC, ETH
+and SOL 15-minute up/down markets of one window do: YES pays when the asset
+moves up. Markets with no known asset resolve independently and always
+contribute their own worst outcome.
+
+Two figures are computed:
+- worst_case: lowest P&L over every combination of asset moves. P&L is
+  additive across assets, so this is the sum of each asset's worse side and
+  needs no enumeration.
+- stress: lowest P&L when all assets move the same way, the correlated crypto
+  move that dominates 15-minute resolutions.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+# Column order for the value matrix
+FIELDS = ("yes_shares", "no_shares", "yes_cost", "no_cost")
+_YES, _NO, _YES_COST, _NO_COST = range(len(FIELDS))
+_NO_ASSET = -1
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    """Portfolio P&L under resolution scenarios, in USD."""
+
+    worst_case_pnl: float
+    stress_pnl: float
+    total_cost: float
+
+    @property
+    def worst_case_loss(self) -> float:
+        """Loss in the worst scenario (0 if every scenario is profitable)."""
+        return max(0.0, -self.worst_case_pnl)
+
+
+class PortfolioScenarios:
+    """Open positions as arrays with vectorized scenario P&L.
+
+    Usage:
+        scenarios = PortfolioScenarios()
+        scenarios.apply_fill("btc-15m", "YES", 40.0, 18.0, asset="BTC")
+        result = scenarios.evaluate()
+        result = scenarios.evaluate_with("eth-15m", 0.0, 20.0, 9.0, asset="ETH")
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        """Initialize an empty portfolio.
+
+        Args:
+            capacity: Initial number of rows to allocate.
+        """
+        self._values = np.zeros((max(capacity, 1), len(FIELDS)))
+        self._asset = np.full(max(capacity, 1), _NO_ASSET, dtype=np.intp)
+        self._market_ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._asset_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of markets with open positions."""
+        return len(self._market_ids)
+
+    def __contains__(self, market_id: str) -> bool:
+        return market_id in self._rows
+
+    @property
+    def assets(self) -> list[str]:
+        """Assets seen so far, in index order."""
+        return list(self._asset_ids)
+
+    def position(self, market_id: str) -> Optional[tuple[float, float, float]]:
+        """Get (yes_shares, no_shares, cost) for a market, or None."""
+        row = self._rows.get(market_id)
+        if row is None:
+            return None
+        yes, no, yes_cost, no_cost = self._values[row]
+        return float(yes), float(no), float(yes_cost + no_cost)
+
+    def copy(self) -> "PortfolioScenarios":
+        """Get an independent copy, e.g. to stage hypothetical fills."""
+        other = PortfolioScenarios.__new__(PortfolioScenarios)
+        other._values = self._values.copy()
+        other._asset = self._asset.copy()
+        other._market_ids = list(self._market_ids)
+        other._rows = dict(self._rows)
+        other._asset_ids = dict(self._asset_ids)
+        return other
+
+    def clear(self) -> None:
+        """Remove all positions."""
+        self._values[: len(self._market_ids)] = 0.0
+        self._asset[: len(self._market_ids)] = _NO_ASSET
+        self._market_ids.clear()
+        self._rows.clear()
+
+    def set_position(
+        self,
+        market_id: str,
+        yes_shares: float,
+        no_shares: float,
+        yes_cost: float,
+        no_cost: float,
+        asset: Optional[str] = None,
+    ) -> None:
+        """Replace a market's position, e.g. when loading persisted state."""
+        row = self._ensure_row(market_id, asset)
+        self._values[row] = (yes_shares, no_shares, yes_cost, no_cost)
+        self._drop_if_empty(market_id)
+
+    def apply_fill(
+        self,
+        market_id: str,
+        outcome: str,
+        shares: float,
+        cost: float,
+        asset: Optional[str] = None,
+    ) -> None:
+        """Add bought shares of one outcome.
+
+        Args:
+            market_id: Market identifier.
+            outcome: "YES" or "NO".
+            shares: Shares bought.
+            cost: USD paid, including fees.
+            asset: Underlying asset, if known.
+        """
+        row = self._ensure_row(market_id, asset)
+        if outcome.upper() == "NO":
+            self._values[row, _NO] += shares
+            self._values[row, _NO_COST] += cost
+        else:
+            self._values[row, _YES] += shares
+            self._values[row, _YES_COST] += cost
+
+    def reduce(self, market_id: str, outcome: str, shares: float) -> None:
+        """Remove sold shares of one outcome at their average cost."""
+        row = self._rows.get(market_id)
+        if row is None:
+            return
+        held, cost = (_NO, _NO_COST) if outcome.upper() == "NO" else (_YES, _YES_COST)
+        current = self._values[row, held]
+        if current <= 0:
+            return
+        fraction = min(1.0, shares / current)
+        self._values[row, held] -= current * fraction
+        self._values[row, cost] -= self._values[row, cost] * fraction
+        self._drop_if_empty(market_id)
+
+    def close(self, market_id: str, cost_basis: float) -> None:
+        """Remove cost basis from a market, scaling both sides proportionally."""
+        row = self._rows.get(market_id)
+        if row is None:
+            return
+        total = self._values[row, _YES_COST] + self._values[row, _NO_COST]
+        if total <= 0 or cost_basis >= total:
+            self._remove_row(market_id)
+            return
+        self._values[row] *= 1.0 - cost_basis / total
+
+    def evaluate(self) -> ScenarioResult:
+        """Compute worst-case and stress P&L for the current positions."""
+        return self.evaluate_with(None, 0.0, 0.0, 0.0)
+
+    def evaluate_with(
+        self,
+        market_id: Optional[str],
+        yes_shares: float,
+        no_shares: float,
+        cost: float,
+        asset: Optional[str] = None,
+    ) -> ScenarioResult:
+        """Compute scenario P&L as if an extra position were added.
+
+        The portfolio itself is not modified.
+
+        Args:
+            market_id: Market of the hypothetical position, or None.
+            yes_shares: Hypothetical YES shares.
+            no_shares: Hypothetical NO shares.
+            cost: Hypothetical cost in USD.
+            asset: Underlying asset, if known.
+
+        Returns:
+            ScenarioResult including the hypothetical position.
+        """
+        n = len(self._market_ids)
+        values = self._values[:n]
+        assets = self._asset[:n]
+
+        row = self._rows.get(market_id) if market_id is not None else None
+        asset_index = _NO_ASSET
+        if row is not None:
+            asset_index = int(assets[row])
+        if asset_index == _NO_ASSET and asset:
+            asset_index = self._asset_ids.get(asset.upper(), len(self._asset_ids))
+
+        num_assets = max(len(self._asset_ids), asset_index + 1)
+        known = assets != _NO_ASSET
+        up = np.bincount(assets[known], weights=values[known, _YES], minlength=num_assets)
+        down = np.bincount(assets[known], weights=values[known, _NO], minlength=num_assets)
+
+        unassigned = values[~known]
+        independent = float(np.minimum(unassigned[:, _YES], unassigned[:, _NO]).sum())
+        total_cost = float(values[:, _YES_COST].sum() + values[:, _NO_COST].sum()) + cost
+
+        if yes_shares or no_shares:
+            if asset_index != _NO_ASSET:
+                up[asset_index] += yes_shares
+                down[asset_index] += no_shares
+                if row is not None and not known[row]:
+                    # Existing row gains an asset: move it out of the independent sum
+                    independent -= min(values[row, _YES], values[row, _NO])
+                    up[asset_index] += values[row, _YES]
+                    down[asset_index] += values[row, _NO]
+            elif row is not None:
+                yes, no = values[row, _YES], values[row, _NO]
+                independent += min(yes + yes_shares, no + no_shares) - min(yes, no)
+            else:
+                independent += min(yes_shares, no_shares)
+
+        worst = float(np.minimum(up, down).sum()) + independent - total_cost
+        stress = min(float(up.sum()), float(down.sum())) + independent - total_cost
+        return ScenarioResult(worst_case_pnl=worst, stress_pnl=stress, total_cost=total_cost)
+
+    def _ensure_row(self, market_id: str, asset: Optional[str]) -> int:
+        """Get a market's row, adding it if needed, and record its asset."""
+        row = self._rows.get(market_id)
+        if row is None:
+            row = len(self._market_ids)
+            if row >= self._values.shape[0]:
+                self._grow()
+            self._market_ids.append(market_id)
+            self._rows[market_id] = row
+        if asset:
+            key = asset.upper()
+            index = self._asset_ids.setdefault(key, len(self._asset_ids))
+            self._asset[row] = index
+        return row
+
+    def _drop_if_empty(self, market_id: str) -> None:
+        row = self._rows[market_id]
+        if not np.any(self._values[row] > 1e-12):
+            self._remove_row(market_id)
+
+    def _remove_row(self, market_id: str) -> None:
+        """Remove a market by moving the last row into its place."""
+        row = self._rows.pop(market_id)
+        last = len(self._market_ids) - 1
+        if row != last:
+            moved = self._market_ids[last]
+            self._values[row] = self._values[last]
+            self._asset[row] = self._asset[last]
+            self._market_ids[row] = moved
+            self._rows[moved] = row
+        self._values[last] = 0.0
+        self._asset[last] = _NO_ASSET
+        self._market_ids.pop()
+
+    def _grow(self) -> None:
+        """Double row capacity."""
+        capacity = self._values.shape[0] * 2
+        values = np.zeros((capacity, len(FIELDS)))
+        values[: self._values.shape[0]] = self._values
+        asset = np.full(capacity, _NO_ASSET, dtype=np.intp)
+        asset[: self._asset.shape[0]] = self._asset
+        self._values = values
+        self._asset = asset
@@ -28,6 +28,19 @@ class SignalPriority(str, Enum):
     HIGH = "high"
     CRITICAL = "critical"  # Time-sensitive arbitrage
 
+    @property
+    def rank(self) -> int:
+        """Get sort rank; lower ranks are handled first."""
+        return _PRIORITY_RANKS[self]
+
+
+_PRIORITY_RANKS = {
+    SignalPriority.CRITICAL: 0,
+    SignalPriority.HIGH: 1,
+    SignalPriority.MEDIUM: 2,
+    SignalPriority.LOW: 3,
+}
+
 
 @dataclass
 class TradingSignal:
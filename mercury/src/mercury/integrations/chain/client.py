@@ -14,8 +14,13 @@ from typing import Optional
 
 import structlog
 
+from mercury.core.ratelimit import Priority, RateLimiterRegistry, get_rate_limiter
+
 log = structlog.get_logger()
 
+# Rate limit endpoint for RPC calls (mercury.core.ratelimit)
+RATE_LIMIT_ENDPOINT = "chain"
+
 # Polygon addresses (mainnet)
 USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"  # USDC.e on Polygon
 CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"  # Polymarket CTF
@@ -97,6 +102,7 @@ class PolygonClient:
         rpc_url: str,
         private_key: str,
         executor: Optional[ThreadPoolExecutor] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
     ):
         """Initialize the Polygon client.
 
@@ -104,10 +110,13 @@ class PolygonClient:
             rpc_url: Polygon RPC URL.
             private_key: Wallet private key for signing transactions.
             executor: Optional thread pool for async execution.
+            rate_limiter: Rate limiter registry for RPC calls (defaults to the
+                shared one, endpoint "chain").
         """
         self._rpc_url = rpc_url
         self._private_key = private_key
         self._executor = executor or ThreadPoolExecutor(max_workers=2)
+        self._rate_limiter = rate_limiter or get_rate_limiter()
         self._log = log.bind(component="polygon_client")
 
         self._w3 = None
@@ -179,7 +188,8 @@ class PolygonClient:
         await self.close()
 
     async def _run_sync(self, func, *args, **kwargs):
-        """Run a synchronous function in the thread pool."""
+        """Run a synchronous web3 call in the thread pool, within the RPC budget."""
+        await self._rate_limiter.acquire(RATE_LIMIT_ENDPOINT, Priority.METADATA)
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
             self._executor,
@@ -27,8 +27,13 @@ from tenacity import (
     wait_exponential,
 )
 
+from mercury.core.ratelimit import Priority, RateLimiterRegistry, get_rate_limiter
+
 log = structlog.get_logger()
 
+# Rate limit endpoint for RPC calls (mercury.core.ratelimit)
+RATE_LIMIT_ENDPOINT = "chain"
+
 
 # Polygon mainnet addresses
 CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"  # Conditional Tokens Framework
@@ -207,6 +212,7 @@ class CTFClient:
         executor: Optional[ThreadPoolExecutor] = None,
         gas_price_multiplier: float = 1.2,
         default_gas_limit: int = 300000,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
     ):
         """Initialize the CTF client.
 
@@ -218,6 +224,8 @@ class CTFClient:
             executor: Optional thread pool for async execution.
             gas_price_multiplier: Multiplier for gas price (default 1.2 = 20% buffer).
             default_gas_limit: Default gas limit for redemption transactions.
+            rate_limiter: Rate limiter registry for RPC calls (defaults to the
+                shared one, endpoint "chain").
         """
         self._rpc_url = rpc_url
         self._private_key = private_key
@@ -226,6 +234,7 @@ class CTFClient:
         self._executor = executor or ThreadPoolExecutor(max_workers=2)
         self._gas_price_multiplier = gas_price_multiplier
         self._default_gas_limit = default_gas_limit
+        self._rate_limiter = rate_limiter or get_rate_limiter()
         self._log = log.bind(component="ctf_client")
 
         # Web3 state (initialized on connect)
@@ -299,7 +308,8 @@ class CTFClient:
         await self.close()
 
     async def _run_sync(self, func, *args, **kwargs):
-        """Run a synchronous function in the thread pool."""
+        """Run a synchronous web3 call in the thread pool, within the RPC budget."""
+        await self._rate_limiter.acquire(RATE_LIMIT_ENDPOINT, Priority.METADATA)
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
             self._executor, lambda: func(*args, **kwargs)
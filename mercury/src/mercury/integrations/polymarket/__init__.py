@@ -30,6 +30,7 @@ from mercury.integrations.polymarket.clob import (
     CLOBClientError,
     OrderRejectedError,
     OrderTimeoutError,
+    RateLimitedError,
     InsufficientLiquidityError,
     InsufficientBalanceError,
     ArbitrageInvalidError,
@@ -76,6 +77,7 @@ __all__ = [
     "CLOBClientError",
     "OrderRejectedError",
     "OrderTimeoutError",
+    "RateLimitedError",
     "InsufficientLiquidityError",
     "InsufficientBalanceError",
     "ArbitrageInvalidError",
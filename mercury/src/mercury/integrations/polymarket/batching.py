@@ -0,0 +1,136 @@
+"""Cross-execution order batching for the CLOB batch endpoint.
+
+CLOBClient already posts the two legs of one arbitrage in a single POST
+/orders. When several markets signal within a few milliseconds (e.g. BTC,
+ETH and SOL at a rollover), each execution still makes its own call.
+
+OrderBatcher holds order posts for a short window and sends everything
+collected in as few batch requests as the exchange accepts. The orders of
+one execution always travel in the same request, and each caller gets back
+exactly its own slice of the response, so fill handling and unwinds stay
+per execution. A failed request fails every execution in it.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+import structlog
+
+if TYPE_CHECKING:
+    from mercury.services.metrics import MetricsEmitter
+
+log = structlog.get_logger()
+
+# Orders the exchange accepts in one POST /orders
+MAX_BATCH_ORDERS = 15
+
+BatchPost = Callable[[list[tuple[Any, str]]], Awaitable[Any]]
+
+
+class OrderBatcher:
+    """Coalesce concurrent order posts into batch requests.
+
+    Usage:
+        batcher = OrderBatcher(post_orders, window_seconds=0.002)
+        yes_result, no_result = await batcher.submit([(yes, "GTC"), (no, "GTC")])
+    """
+
+    def __init__(
+        self,
+        post: BatchPost,
+        window_seconds: float,
+        max_orders: int = MAX_BATCH_ORDERS,
+        metrics_emitter: Optional["MetricsEmitter"] = None,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            post: Coroutine posting (signed order, order type) pairs in one
+                request and returning the exchange's per-order results.
+            window_seconds: How long the first order waits for others.
+            max_orders: Orders per request; a full batch is sent at once.
+            metrics_emitter: Optional metrics emitter (executions per batch).
+        """
+        self._post = post
+        self._window = window_seconds
+        self._max_orders = max_orders
+        self._metrics = metrics_emitter
+        self._pending: list[tuple[list[tuple[Any, str]], asyncio.Future]] = []
+        self._pending_orders = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._log = log.bind(component="order_batcher")
+        self.requests = 0
+
+    @property
+    def window_seconds(self) -> float:
+        return self._window
+
+    async def submit(self, orders: list[tuple[Any, str]]) -> Any:
+        """Post one execution's orders with any others in the window.
+
+        Returns:
+            The response entries for these orders, in order (or the
+            response itself if the exchange returned an error object).
+        """
+        if len(orders) > self._max_orders:
+            raise ValueError(f"{len(orders)} orders exceed the batch limit of {self._max_orders}")
+
+        future = asyncio.get_running_loop().create_future()
+        if self._pending_orders + len(orders) > self._max_orders:
+            self.flush()
+        self._pending.append((orders, future))
+        self._pending_orders += len(orders)
+
+        if self._pending_orders >= self._max_orders or self._window <= 0:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._window, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Send everything pending now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending, self._pending_orders = self._pending, [], 0
+        task = asyncio.create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """Send anything pending and wait for requests in flight."""
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _send(self, batch: list[tuple[list[tuple[Any, str]], asyncio.Future]]) -> None:
+        self.requests += 1
+        if self._metrics:
+            self._metrics.record_order_batch(len(batch))
+        if len(batch) > 1:
+            self._log.debug(
+                "orders_batched",
+                executions=len(batch),
+                orders=sum(len(orders) for orders, _ in batch),
+            )
+
+        try:
+            response = await self._post([order for orders, _ in batch for order in orders])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        offset = 0
+        for orders, future in batch:
+            if isinstance(response, list):
+                result = response[offset:offset + len(orders)]
+            else:
+                result = response
+            offset += len(orders)
+            if not future.done():
+                future.set_result(result)
@@ -12,10 +12,10 @@ Ported from legacy/src/client/polymarket.py with:
 import asyncio
 import time
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from decimal import ROUND_DOWN, Decimal
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import structlog
 from tenacity import (
@@ -25,6 +25,9 @@ from tenacity import (
     wait_exponential,
 )
 
+from mercury.core.ratelimit import Priority, RateLimiterRegistry, get_rate_limiter
+from mercury.integrations.polymarket.batching import MAX_BATCH_ORDERS, OrderBatcher
+from mercury.integrations.polymarket.signing import OrderSigner, PresignedOrderCache
 from mercury.integrations.polymarket.types import (
     DualLegOrderResult,
     OrderBookData,
@@ -34,9 +37,15 @@ from mercury.integrations.polymarket.types import (
     OrderStatus,
     PolymarketSettings,
     PositionInfo,
+    TimeInForce,
     TokenSide,
 )
 
+if TYPE_CHECKING:
+    from mercury.integrations.polymarket.transport import AsyncCLOBTransport
+    from mercury.integrations.polymarket.user_channel import OrderStateIndex
+    from mercury.services.metrics import MetricsEmitter
+
 log = structlog.get_logger()
 
 # Retry configuration
@@ -54,6 +63,32 @@ MAX_DEPTH_CONSUMPTION = Decimal("0.70")  # Reject if consuming > 70% of depth
 # Order signing timeout
 ORDER_SIGN_TIMEOUT_SECONDS = 2.0
 
+# Pre-signed orders for armed markets
+PRICE_TICK = Decimal("0.01")
+MAX_ORDER_PRICE = Decimal("0.99")
+DEFAULT_ARM_LEVELS = 2
+DEFAULT_ARM_TTL_SECONDS = 5.0
+
+# Worst combined price (filled leg + hedge) at which a partial fill is hedged
+# rather than exited
+MAX_HEDGE_LOSS = Decimal("0.02")
+
+# Unwind signing batches allowed to run at once. Each signs its orders one
+# at a time, so unwinds hold at most this many signing workers and the rest
+# stay free for legs; pairs posted while every slot is busy go without.
+UNWIND_SIGN_SLOTS = 1
+
+# How long LIVE dual-leg orders are given to fill before the REST check
+LIVE_ORDER_WAIT_SECONDS = 2.0
+
+# Rate limit endpoints (mercury.core.ratelimit); unset ones use "clob"
+RATE_LIMIT_ENDPOINT = "clob"
+RATE_LIMIT_BOOK = "clob.book"
+RATE_LIMIT_ORDERS = "clob.orders"
+
+# Metadata requests made when preparing one token's order template
+TEMPLATE_LOOKUPS = 3
+
 
 # =============================================================================
 # Error Types
@@ -72,6 +107,12 @@ class ConnectionError(CLOBClientError):
     pass
 
 
+class RateLimitedError(ConnectionError):
+    """Request was still rate limited after waiting out Retry-After."""
+
+    pass
+
+
 class OrderRejectedError(CLOBClientError):
     """Order was rejected by the exchange."""
 
@@ -143,6 +184,23 @@ class SignedOrderPair:
     sign_duration_ms: int
 
 
+@dataclass
+class PrebuiltUnwind:
+    """Orders signed alongside a dual-leg pair, for one leg filling alone.
+
+    The hedge buys the other leg's token; the exit sells this leg back.
+    Either is None when it would not be taken (hedge over the loss limit)
+    or failed to sign.
+    """
+
+    shares: Decimal
+    hedge_token_id: str
+    hedge_price: Decimal
+    hedge_order: Optional[Any]
+    exit_price: Decimal
+    exit_order: Optional[Any]
+
+
 @dataclass
 class DualLegExecutionResult:
     """Internal result from dual-leg execution before converting to DualLegOrderResult."""
@@ -171,25 +229,97 @@ class CLOBClient:
     - Position and balance queries
 
     This client wraps the synchronous py-clob-client library with
-    asyncio support using a thread pool executor.
+    asyncio support using a thread pool executor. With
+    settings.async_transport, the hot endpoints (order post, batch post,
+    cancel, get orders, book) bypass the executor and go through a pooled
+    keep-alive AsyncCLOBTransport; signing still uses py-clob-client.
+
+    Every request first takes a token from the shared rate limiter:
+    order posts and cancels at Priority.ORDER, book fetches at
+    Priority.MARKET_DATA and everything else at Priority.METADATA.
     """
 
     def __init__(
         self,
         settings: PolymarketSettings,
         executor: Optional[ThreadPoolExecutor] = None,
+        order_index: Optional["OrderStateIndex"] = None,
+        metrics_emitter: Optional["MetricsEmitter"] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
     ):
         """Initialize the CLOB client.
 
         Args:
             settings: Polymarket connection settings including credentials.
             executor: Optional thread pool for async execution.
+            order_index: Optional order state fed by the user channel. When
+                         connected, LIVE orders are awaited on push updates
+                         instead of sleeping and polling get_orders.
+            metrics_emitter: Optional metrics emitter (order sign latency).
+            rate_limiter: Rate limiter registry (defaults to the shared one).
         """
         self._settings = settings
         self._executor = executor or ThreadPoolExecutor(max_workers=4)
         self._client = None  # py-clob-client ClobClient instance
         self._log = log.bind(component="clob_client")
         self._connected = False
+        self._order_index = order_index
+        self._transport: Optional["AsyncCLOBTransport"] = None
+        self._order_signer: Optional[OrderSigner] = None
+        self._metrics = metrics_emitter
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._presigned = PresignedOrderCache()
+        self._pair_sign_ms: Optional[float] = None  # EWMA of full pair signing
+        self._unwind_signs = 0  # Unwind signing batches running
+        self.unwinds_prebuilt = 0  # Pairs posted with unwinds being signed
+        self.unwinds_skipped = 0  # Pairs posted while every unwind slot was busy
+        self._batcher: Optional[OrderBatcher] = None
+        self.set_batch_window(settings.batch_window_ms / 1000.0)
+
+    @property
+    def settings(self) -> PolymarketSettings:
+        """Connection settings."""
+        return self._settings
+
+    @property
+    def order_index(self) -> Optional["OrderStateIndex"]:
+        """Order state index fed by the user channel, if attached."""
+        return self._order_index
+
+    def set_order_index(self, order_index: Optional["OrderStateIndex"]) -> None:
+        """Attach (or detach with None) a user channel order index."""
+        self._order_index = order_index
+
+    @property
+    def order_signer(self) -> Optional[OrderSigner]:
+        """Persistent signing pool, once connected."""
+        return self._order_signer
+
+    @property
+    def presigned(self) -> PresignedOrderCache:
+        """Orders signed ahead of signals for armed markets."""
+        return self._presigned
+
+    @property
+    def transport(self) -> Optional["AsyncCLOBTransport"]:
+        """Async HTTP transport for the hot endpoints, if enabled."""
+        return self._transport
+
+    @property
+    def batcher(self) -> Optional[OrderBatcher]:
+        """Cross-execution order batcher, if a batch window is set."""
+        return self._batcher
+
+    def set_batch_window(self, window_seconds: float) -> None:
+        """Hold dual-leg posts up to window_seconds to share batch requests.
+
+        0 posts each pair on its own as soon as it is signed.
+        """
+        self._batcher = (
+            OrderBatcher(self._post_orders, window_seconds, metrics_emitter=self._metrics)
+            if window_seconds > 0
+            else None
+        )
 
     async def connect(self) -> None:
         """Initialize the underlying CLOB client.
@@ -234,11 +364,36 @@ class CLOBClient:
         self._client = await asyncio.get_event_loop().run_in_executor(
             self._executor, create_client
         )
+
+        if self._settings.async_transport:
+            from mercury.integrations.polymarket.transport import AsyncCLOBTransport
+
+            self._transport = AsyncCLOBTransport(
+                self._settings.clob_url,
+                signer=self._client.signer,
+                creds=creds,
+                http2=self._settings.http2,
+                max_connections=self._settings.max_connections,
+                proxy=self._settings.http_proxy,
+                rate_limiter=self._rate_limiter,
+            )
+            await self._transport.open()
+
+        await self._get_order_signer().start()
+
         self._connected = True
         self._log.info("clob_client_connected", url=self._settings.clob_url)
 
     async def close(self) -> None:
         """Close the client and cleanup resources."""
+        if self._batcher is not None:
+            await self._batcher.close()
+        if self._transport is not None:
+            await self._transport.close()
+            self._transport = None
+        if self._order_signer is not None:
+            await self._order_signer.stop()
+            self._order_signer = None
         self._client = None
         self._connected = False
         self._log.info("clob_client_closed")
@@ -258,6 +413,128 @@ class CLOBClient:
             raise CLOBClientError("Client not connected. Call connect() first.")
         return self._client
 
+    def _get_order_signer(self) -> OrderSigner:
+        """Get the signing pool, creating it for the current client if needed."""
+        if self._order_signer is None:
+            self._order_signer = OrderSigner(
+                self._client,
+                workers=self._settings.sign_workers,
+                use_processes=self._settings.sign_processes,
+                metrics_emitter=self._metrics,
+            )
+        return self._order_signer
+
+    async def prepare_order_templates(self, token_ids: list[str]) -> int:
+        """Precompute order templates (tick size, neg-risk, fee rate) for tokens.
+
+        Called when a market is subscribed so that signing its orders only
+        fills in price, size and nonce.
+
+        Returns:
+            Number of templates prepared.
+        """
+        self._ensure_connected()
+        signer = self._get_order_signer()
+        missing = [t for t in dict.fromkeys(token_ids) if signer.template(t) is None]
+        if missing:
+            await self._throttle(tokens=TEMPLATE_LOOKUPS * len(missing))
+
+        prepared = 0
+        for token_id, result in zip(
+            token_ids,
+            await asyncio.gather(
+                *(signer.prepare(t) for t in token_ids), return_exceptions=True
+            ),
+        ):
+            if isinstance(result, Exception):
+                self._log.warning(
+                    "order_template_failed", token_id=token_id[:16], error=str(result)
+                )
+            else:
+                prepared += 1
+        return prepared
+
+    async def arm_market(
+        self,
+        yes_token_id: str,
+        no_token_id: str,
+        amount_usd: Decimal,
+        yes_price: Decimal,
+        no_price: Decimal,
+        levels: int = DEFAULT_ARM_LEVELS,
+        ttl_seconds: float = DEFAULT_ARM_TTL_SECONDS,
+        price_buffer_cents: Decimal = PRICE_BUFFER_CENTS,
+    ) -> int:
+        """Pre-sign the orders a dual-leg signal near these prices would send.
+
+        Each leg is signed at its quoted price and `levels` ticks either side,
+        with the same buffer, rounding and sizing as execute_dual_leg_order(),
+        so a signal for amount_usd at an armed price skips signing. Orders
+        already cached have their expiry extended instead of being re-signed.
+
+        Args:
+            yes_token_id: YES token ID.
+            no_token_id: NO token ID.
+            amount_usd: Signal size the orders are sized for.
+            yes_price: Current YES ask.
+            no_price: Current NO ask.
+            levels: Ticks either side of each quote to sign.
+            ttl_seconds: How long the signed orders stay usable.
+            price_buffer_cents: Buffer execute_dual_leg_order() will add.
+
+        Returns:
+            Number of orders newly signed.
+        """
+        self._ensure_connected()
+        half_usd = amount_usd / 2
+        preps: dict[tuple, PreparedOrder] = {}
+
+        for token_id, label, quote in (
+            (yes_token_id, "YES", yes_price),
+            (no_token_id, "NO", no_price),
+        ):
+            for offset in range(-levels, levels + 1):
+                price = min(quote + price_buffer_cents + offset * PRICE_TICK, MAX_ORDER_PRICE)
+                if price <= 0:
+                    continue
+                shares = (half_usd / price).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
+                if shares <= 0:
+                    continue
+                prep = self._prepare_order(token_id, label, shares, price)
+                key = (token_id, prep.price, prep.shares)
+                if key in preps or self._presigned.extend(*key, ttl_seconds):
+                    continue
+                preps[key] = prep
+
+        if preps:
+            signed = await self._get_order_signer().sign_all(
+                [prep.order_args for prep in preps.values()]
+            )
+            for key, order in zip(preps, signed):
+                self._presigned.put(*key, order, ttl_seconds)
+
+        if self._metrics:
+            self._metrics.update_presigned_orders(len(self._presigned))
+        self._log.debug(
+            "market_armed",
+            yes_token_id=yes_token_id[:16],
+            no_token_id=no_token_id[:16],
+            signed=len(preps),
+            cached=len(self._presigned),
+        )
+        return len(preps)
+
+    def disarm_market(self, yes_token_id: str, no_token_id: str) -> int:
+        """Drop pre-signed orders for a market's tokens.
+
+        Returns:
+            Number of orders dropped.
+        """
+        dropped = self._presigned.discard([yes_token_id, no_token_id])
+        if self._metrics:
+            self._metrics.update_presigned_orders(len(self._presigned))
+        return dropped
+
     async def _run_sync(self, func, *args, **kwargs):
         """Run a synchronous function in the thread pool."""
         loop = asyncio.get_event_loop()
@@ -265,6 +542,18 @@ class CLOBClient:
             self._executor, lambda: func(*args, **kwargs)
         )
 
+    async def _throttle(
+        self,
+        endpoint: str = RATE_LIMIT_ENDPOINT,
+        priority: Priority = Priority.METADATA,
+        tokens: float = 1.0,
+    ) -> None:
+        """Wait for rate limit budget before a py-clob-client request.
+
+        Requests through the async transport are throttled by the transport.
+        """
+        await self._rate_limiter.acquire(endpoint, priority, tokens)
+
     # =========================================================================
     # L0 Methods (No Auth)
     # =========================================================================
@@ -284,7 +573,11 @@ class CLOBClient:
             OrderBookData with current bids and asks.
         """
         client = self._ensure_connected()
-        raw_book = await self._run_sync(client.get_order_book, token_id)
+        if self._transport is not None:
+            raw_book = await self._transport.get_order_book(token_id)
+        else:
+            await self._throttle(RATE_LIMIT_BOOK, Priority.MARKET_DATA)
+            raw_book = await self._run_sync(client.get_order_book, token_id)
 
         # Parse the response (handles both dict and object formats)
         bids = self._parse_book_levels(
@@ -388,6 +681,7 @@ class CLOBClient:
             Dict with "balance" and "allowance" as Decimals.
         """
         client = self._ensure_connected()
+        await self._throttle()
         raw = await self._run_sync(client.get_balance_allowance)
 
         # Convert from 6 decimal places (USDC)
@@ -411,6 +705,7 @@ class CLOBClient:
             List of PositionInfo objects.
         """
         client = self._ensure_connected()
+        await self._throttle()
         raw = await self._run_sync(client.get_positions)
 
         positions = []
@@ -449,6 +744,9 @@ class CLOBClient:
             List of order dictionaries.
         """
         client = self._ensure_connected()
+        if self._transport is not None:
+            return await self._transport.get_orders()
+        await self._throttle()
         return await self._run_sync(client.get_orders)
 
     async def cancel_order(self, order_id: str) -> bool:
@@ -462,13 +760,40 @@ class CLOBClient:
         """
         client = self._ensure_connected()
         try:
-            await self._run_sync(client.cancel, order_id)
+            if self._transport is not None:
+                await self._transport.cancel(order_id)
+            else:
+                await self._throttle(RATE_LIMIT_ORDERS, Priority.ORDER)
+                await self._run_sync(client.cancel, order_id)
             self._log.info("order_cancelled", order_id=order_id)
             return True
         except Exception as e:
             self._log.warning("cancel_failed", order_id=order_id, error=str(e))
             return False
 
+    async def cancel_orders(self, order_ids: list[str]) -> list[str]:
+        """Cancel several orders in one request.
+
+        Args:
+            order_ids: The orders' IDs.
+
+        Returns:
+            IDs the exchange cancelled. The rest were already matched,
+            cancelled or unknown.
+        """
+        if not order_ids:
+            return []
+        client = self._ensure_connected()
+        if self._transport is not None:
+            response = await self._transport.cancel_orders(order_ids)
+        else:
+            await self._throttle(RATE_LIMIT_ORDERS, Priority.ORDER)
+            response = await self._run_sync(client.cancel_orders, list(order_ids))
+
+        cancelled = list(response.get("canceled", [])) if isinstance(response, dict) else []
+        self._log.info("orders_cancelled", requested=len(order_ids), cancelled=len(cancelled))
+        return cancelled
+
     async def cancel_all_orders(self) -> int:
         """Cancel all open orders.
 
@@ -501,6 +826,7 @@ class CLOBClient:
         amount_shares: Optional[Decimal] = None,
         price: Optional[Decimal] = None,
         timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        time_in_force: TimeInForce = TimeInForce.GTC,
     ) -> OrderResult:
         """Execute a single order.
 
@@ -513,6 +839,7 @@ class CLOBClient:
             amount_shares: Number of shares to trade.
             price: Limit price (if None, uses current best price + buffer).
             timeout_seconds: Maximum time to wait for fill.
+            time_in_force: GTC rests any remainder; FOK is all or nothing.
 
         Returns:
             OrderResult with execution details.
@@ -547,76 +874,184 @@ class CLOBClient:
             price=str(price),
         )
 
-        client = self._ensure_connected()
+        self._ensure_connected()
 
         try:
             # Create and post order
-            order = await self._run_sync(
-                client.create_order,
-                {
-                    "token_id": token_id,
-                    "price": float(price),
-                    "size": float(amount_shares),
-                    "side": side.value,
-                },
+            from py_clob_client.clob_types import OrderArgs
+
+            order = await self._get_order_signer().sign(
+                OrderArgs(
+                    token_id=token_id,
+                    price=float(price),
+                    size=float(amount_shares),
+                    side=side.value,
+                )
             )
+            return await self._post_signed_order(
+                order, token_id, side, amount_shares, price, time_in_force, start_time
+            )
+
+        except Exception as e:
+            self._log.error(
+                "order_failed",
+                token_id=token_id,
+                side=side.value,
+                error=str(e),
+            )
+            raise OrderRejectedError(f"Order failed: {e}") from e
 
-            response = await self._run_sync(client.post_order, order)
-            response_time = time.time() * 1000
+    async def _post_signed_order(
+        self,
+        order: Any,
+        token_id: str,
+        side: OrderSide,
+        amount_shares: Decimal,
+        price: Decimal,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        start_time: Optional[float] = None,
+    ) -> OrderResult:
+        """Post an already signed order and parse the exchange's response."""
+        from py_clob_client.clob_types import OrderType
 
-            # Parse response
-            if isinstance(response, dict):
-                order_id = response.get("orderID", response.get("id", ""))
-                status_str = response.get("status", "LIVE")
-            else:
-                order_id = getattr(response, "orderID", getattr(response, "id", ""))
-                status_str = getattr(response, "status", "LIVE")
+        client = self._ensure_connected()
+        if start_time is None:
+            start_time = time.time() * 1000
 
-            status = (
-                OrderStatus(status_str)
-                if status_str in OrderStatus.__members__
-                else OrderStatus.LIVE
+        if self._transport is not None:
+            response = await self._transport.post_order(order, time_in_force.value)
+        else:
+            await self._throttle(RATE_LIMIT_ORDERS, Priority.ORDER)
+            response = await self._run_sync(
+                client.post_order, order, getattr(OrderType, time_in_force.value)
             )
+        response_time = time.time() * 1000
 
-            # Check for immediate fill
-            filled_size = Decimal("0")
-            filled_cost = Decimal("0")
+        result = self._order_result(
+            response, token_id, side, amount_shares, price, start_time, response_time
+        )
 
-            if status in (OrderStatus.MATCHED, OrderStatus.FILLED):
-                filled_size = amount_shares
-                filled_cost = amount_shares * price
+        self._log.info(
+            "order_executed",
+            order_id=result.order_id,
+            status=result.status.value,
+            filled_size=str(result.filled_size),
+            latency_ms=result.latency_ms,
+        )
 
-            result = OrderResult(
-                order_id=order_id,
-                token_id=token_id,
-                side=side,
-                status=status,
-                requested_price=price,
-                requested_size=amount_shares,
-                filled_size=filled_size,
-                filled_cost=filled_cost,
-                submit_time_ms=start_time,
-                response_time_ms=response_time,
-            )
+        return result
 
-            self._log.info(
-                "order_executed",
-                order_id=order_id,
-                status=status.value,
-                filled_size=str(filled_size),
-                latency_ms=result.latency_ms,
-            )
+    @staticmethod
+    def _order_result(
+        response: Any,
+        token_id: str,
+        side: OrderSide,
+        amount_shares: Decimal,
+        price: Decimal,
+        start_time: Optional[float],
+        response_time: Optional[float],
+    ) -> OrderResult:
+        """Parse an order post response into an OrderResult."""
+        if isinstance(response, dict):
+            order_id = response.get("orderID", response.get("id", ""))
+            status_str = response.get("status", "LIVE")
+        else:
+            order_id = getattr(response, "orderID", getattr(response, "id", ""))
+            status_str = getattr(response, "status", "LIVE")
+
+        status = (
+            OrderStatus(status_str)
+            if status_str in OrderStatus.__members__
+            else OrderStatus.LIVE
+        )
 
-            return result
+        # Check for immediate fill
+        filled_size = Decimal("0")
+        filled_cost = Decimal("0")
 
+        if status in (OrderStatus.MATCHED, OrderStatus.FILLED):
+            filled_size = amount_shares
+            filled_cost = amount_shares * price
+
+        return OrderResult(
+            order_id=order_id,
+            token_id=token_id,
+            side=side,
+            status=status,
+            requested_price=price,
+            requested_size=amount_shares,
+            filled_size=filled_size,
+            filled_cost=filled_cost,
+            submit_time_ms=start_time,
+            response_time_ms=response_time,
+        )
+
+    async def post_limit_orders(
+        self,
+        orders: list[tuple[str, OrderSide, Decimal, Decimal]],
+        time_in_force: TimeInForce = TimeInForce.GTC,
+    ) -> list[Optional[OrderResult]]:
+        """Sign and post several limit orders in as few requests as allowed.
+
+        All orders are signed in one call to the signing pool, then posted
+        MAX_BATCH_ORDERS per POST /orders, the requests concurrently.
+
+        Args:
+            orders: (token_id, side, price, shares) per order.
+            time_in_force: Applied to every order.
+
+        Returns:
+            One result per order, in order; None where the exchange refused
+            the order or its request failed.
+        """
+        if not orders:
+            return []
+        self._ensure_connected()
+        start_time = time.time() * 1000
+
+        try:
+            signed = await self._get_order_signer().sign_all([
+                self._order_args(token_id, price, shares, side)
+                for token_id, side, price, shares in orders
+            ])
         except Exception as e:
-            self._log.error(
-                "order_failed",
-                token_id=token_id,
-                side=side.value,
-                error=str(e),
-            )
-            raise OrderRejectedError(f"Order failed: {e}") from e
+            raise OrderSigningError(f"Order signing failed: {e}") from e
+
+        chunks = [
+            list(range(i, min(i + MAX_BATCH_ORDERS, len(orders))))
+            for i in range(0, len(orders), MAX_BATCH_ORDERS)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self._post_orders([(signed[i], time_in_force.value) for i in chunk])
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        response_time = time.time() * 1000
+
+        results: list[Optional[OrderResult]] = [None] * len(orders)
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, BaseException) or not isinstance(response, list):
+                self._log.warning(
+                    "limit_order_batch_failed", orders=len(chunk), error=str(response)
+                )
+                continue
+            for i, entry in zip(chunk, response):
+                if not isinstance(entry, dict) or not self._order_id(entry) or entry.get("error"):
+                    continue
+                token_id, side, price, shares = orders[i]
+                results[i] = self._order_result(
+                    entry, token_id, side, shares, price, start_time, response_time
+                )
+
+        self._log.info(
+            "limit_orders_posted",
+            orders=len(orders),
+            requests=len(chunks),
+            accepted=sum(1 for r in results if r is not None),
+        )
+        return results
 
     # =========================================================================
     # Dual-Leg Order Execution (Refactored)
@@ -634,6 +1069,7 @@ class CLOBClient:
         handle_partial_fills: bool = True,
         max_slippage_cents: Decimal = Decimal("2.0"),
         timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        prebuild_unwind: bool = False,
     ) -> DualLegOrderResult:
         """Execute a dual-leg arbitrage order (YES + NO) with parallel execution.
 
@@ -655,6 +1091,9 @@ class CLOBClient:
             handle_partial_fills: Whether to attempt rebalancing on partial fills.
             max_slippage_cents: Maximum slippage for partial fill rebalancing.
             timeout_seconds: Maximum time to wait for execution.
+            prebuild_unwind: Sign the hedge and exit orders for each leg while
+                the pair is in flight (when an unwind signing slot is free), so
+                a partial fill is unwound without fetching a book or signing.
 
         Returns:
             DualLegOrderResult with both leg results.
@@ -683,13 +1122,13 @@ class CLOBClient:
             yes_price = (yes_book.best_ask or Decimal("0.5")) + price_buffer_cents
         else:
             yes_price = yes_price + price_buffer_cents
-        yes_price = min(yes_price, Decimal("0.99"))
+        yes_price = min(yes_price, MAX_ORDER_PRICE)
 
         if no_price is None:
             no_price = (no_book.best_ask or Decimal("0.5")) + price_buffer_cents
         else:
             no_price = no_price + price_buffer_cents
-        no_price = min(no_price, Decimal("0.99"))
+        no_price = min(no_price, MAX_ORDER_PRICE)
 
         # Step 3: Validate arbitrage opportunity
         self._validate_arbitrage(yes_price, no_price)
@@ -712,51 +1151,75 @@ class CLOBClient:
         # Step 7: Sign orders in parallel
         signed_pair = await self._sign_orders_parallel(yes_prep, no_prep)
 
-        # Step 8: Submit batch order
-        execution_result = await self._submit_batch_order(
-            signed_pair, timeout_seconds
-        )
-
-        # Step 9: Handle results
-        execution_time = time.time() * 1000 - start_time
-
-        if execution_result.yes_filled and execution_result.no_filled:
-            # Both filled - success!
-            return self._create_success_result(
-                execution_result, market_id, pre_yes_depth, pre_no_depth, execution_time
+        # Step 8: Submit batch order, signing the unwinds while it is in flight
+        unwind_task = None
+        if prebuild_unwind and handle_partial_fills:
+            if self._unwind_signs < UNWIND_SIGN_SLOTS:
+                self._unwind_signs += 1
+                unwind_task = asyncio.create_task(
+                    self._sign_unwinds(yes_prep, no_prep, max_slippage_cents)
+                )
+                unwind_task.add_done_callback(self._release_unwind_slot)
+            if self._metrics:
+                self._metrics.record_unwind_presign(unwind_task is not None)
+            if unwind_task is not None:
+                self.unwinds_prebuilt += 1
+            else:
+                self.unwinds_skipped += 1
+        try:
+            execution_result = await self._submit_batch_order(
+                signed_pair, timeout_seconds
             )
 
-        # Step 10: Handle partial fills
-        if handle_partial_fills and (
-            execution_result.yes_filled or execution_result.no_filled
-        ):
-            rebalance_result = await self._handle_partial_fill(
-                execution_result,
-                yes_token_id,
-                no_token_id,
-                yes_price,
-                no_price,
-                max_slippage_cents,
-            )
+            # Step 9: Handle results
+            execution_time = time.time() * 1000 - start_time
+
+            if execution_result.yes_filled and execution_result.no_filled:
+                # Both filled - success!
+                return self._create_success_result(
+                    execution_result, market_id, pre_yes_depth, pre_no_depth, execution_time
+                )
 
-            if rebalance_result.get("action") == "hedge_completed":
-                # Successfully rebalanced
-                return self._create_rebalanced_result(
+            # Step 10: Handle partial fills
+            rebalance_result = None
+            if handle_partial_fills and (
+                execution_result.yes_filled or execution_result.no_filled
+            ):
+                unwinds = await unwind_task if unwind_task is not None else {}
+                rebalance_result = await self._handle_partial_fill(
                     execution_result,
-                    rebalance_result,
-                    market_id,
-                    pre_yes_depth,
-                    pre_no_depth,
-                    execution_time,
+                    yes_token_id,
+                    no_token_id,
+                    yes_price,
+                    no_price,
+                    max_slippage_cents,
+                    unwinds,
                 )
 
+                if rebalance_result.get("action") == "hedge_completed":
+                    # Successfully rebalanced
+                    return self._create_rebalanced_result(
+                        execution_result,
+                        rebalance_result,
+                        market_id,
+                        pre_yes_depth,
+                        pre_no_depth,
+                        execution_time,
+                    )
+        finally:
+            if unwind_task is not None and not unwind_task.done():
+                unwind_task.cancel()
+
         # Cancel any remaining live orders
         await self._cancel_live_orders(execution_result)
 
         # Return partial fill result
-        return self._create_partial_result(
+        result = self._create_partial_result(
             execution_result, market_id, pre_yes_depth, pre_no_depth, execution_time
         )
+        if rebalance_result is not None:
+            result = replace(result, rebalance_action=rebalance_result.get("action"))
+        return result
 
     def _validate_arbitrage(
         self, yes_price: Decimal, no_price: Decimal
@@ -834,31 +1297,38 @@ class CLOBClient:
         Returns:
             PreparedOrder ready for signing.
         """
-        from py_clob_client.clob_types import OrderArgs
-
         # Ensure price has 2 decimal places
         price = price.quantize(Decimal("0.01"), rounding=ROUND_DOWN)
 
         # Ensure shares produces clean maker_amount
         shares = self._adjust_shares_for_precision(shares, price)
 
-        order_args = OrderArgs(
-            token_id=token_id,
-            price=float(price),
-            size=float(shares),
-            side="BUY",
-        )
-
         return PreparedOrder(
             token_id=token_id,
             label=label,
-            order_args=order_args,
+            order_args=self._order_args(token_id, price, shares, OrderSide.BUY),
             shares=shares,
             price=price,
             original_price=price,
             start_time_ms=int(time.time() * 1000),
         )
 
+    def _order_args(
+        self, token_id: str, price: Decimal, shares: Decimal, side: OrderSide
+    ) -> Any:
+        """Build order args, from the token's template when it has one."""
+        from py_clob_client.clob_types import OrderArgs
+
+        template = self._order_signer.template(token_id) if self._order_signer else None
+        if template is not None:
+            return template.order_args(float(price), float(shares), side=side.value)
+        return OrderArgs(
+            token_id=token_id,
+            price=float(price),
+            size=float(shares),
+            side=side.value,
+        )
+
     def _adjust_shares_for_precision(
         self, shares: Decimal, price: Decimal
     ) -> Decimal:
@@ -886,9 +1356,10 @@ class CLOBClient:
     async def _sign_orders_parallel(
         self, yes_prep: PreparedOrder, no_prep: PreparedOrder
     ) -> SignedOrderPair:
-        """Sign both orders in parallel using ThreadPoolExecutor.
+        """Sign both orders concurrently on the persistent signing pool.
 
-        This overlaps the CPU-bound cryptographic signing operations.
+        Orders pre-signed by arm_market() for the same token, price and size
+        are used instead; when both legs are cached nothing is signed.
 
         Args:
             yes_prep: Prepared YES order.
@@ -900,27 +1371,56 @@ class CLOBClient:
         Raises:
             OrderSigningError if signing fails.
         """
-        from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-
-        client = self._ensure_connected()
+        self._ensure_connected()
         sign_start_ms = int(time.time() * 1000)
 
-        def sign_order(order_args):
-            return client.create_order(order_args)
+        signed_yes = self._presigned.take(yes_prep.token_id, yes_prep.price, yes_prep.shares)
+        signed_no = self._presigned.take(no_prep.token_id, no_prep.price, no_prep.shares)
+        hit = signed_yes is not None and signed_no is not None
+        self._presigned.record(hit)
+
+        if hit:
+            saved_ms = self._pair_sign_ms or 0.0
+            if self._metrics:
+                self._metrics.record_presigned_lookup(True, saved_ms)
+                self._metrics.update_presigned_orders(len(self._presigned))
+            self._log.info("orders_presigned", saved_ms=round(saved_ms, 1))
+            return SignedOrderPair(
+                yes_order=signed_yes,
+                no_order=signed_no,
+                yes_prep=yes_prep,
+                no_prep=no_prep,
+                sign_duration_ms=0,
+            )
 
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            yes_future = executor.submit(sign_order, yes_prep.order_args)
-            no_future = executor.submit(sign_order, no_prep.order_args)
+        pending = [
+            prep
+            for prep, cached in ((yes_prep, signed_yes), (no_prep, signed_no))
+            if cached is None
+        ]
+        try:
+            signed = await asyncio.wait_for(
+                self._get_order_signer().sign_all([prep.order_args for prep in pending]),
+                timeout=ORDER_SIGN_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            raise OrderSigningError("Order signing timed out")
+        except Exception as e:
+            raise OrderSigningError(f"Order signing failed: {e}") from e
 
-            try:
-                signed_yes = yes_future.result(timeout=ORDER_SIGN_TIMEOUT_SECONDS)
-                signed_no = no_future.result(timeout=ORDER_SIGN_TIMEOUT_SECONDS)
-            except FuturesTimeoutError:
-                raise OrderSigningError("Order signing timed out")
-            except Exception as e:
-                raise OrderSigningError(f"Order signing failed: {e}") from e
+        if signed_yes is None:
+            signed_yes = signed.pop(0)
+        if signed_no is None:
+            signed_no = signed.pop(0)
 
         sign_duration_ms = int(time.time() * 1000) - sign_start_ms
+        if len(pending) == 2:
+            self._pair_sign_ms = (
+                sign_duration_ms if self._pair_sign_ms is None
+                else 0.8 * self._pair_sign_ms + 0.2 * sign_duration_ms
+            )
+        if self._metrics:
+            self._metrics.record_presigned_lookup(False)
         self._log.info("orders_signed", duration_ms=sign_duration_ms)
 
         return SignedOrderPair(
@@ -931,6 +1431,67 @@ class CLOBClient:
             sign_duration_ms=sign_duration_ms,
         )
 
+    def _release_unwind_slot(self, task: asyncio.Task) -> None:
+        """Free the unwind signing slot held by a finished or cancelled task."""
+        self._unwind_signs -= 1
+
+    async def _sign_unwinds(
+        self,
+        yes_prep: PreparedOrder,
+        no_prep: PreparedOrder,
+        max_slippage_cents: Decimal,
+    ) -> dict[str, PrebuiltUnwind]:
+        """Sign the orders that would unwind each leg filling alone.
+
+        For each leg: a BUY of the other token at its limit plus the
+        slippage (only if that stays within MAX_HEDGE_LOSS of $1.00), and a
+        SELL of the leg itself at its limit minus the slippage, both for
+        the leg's full size. Orders are signed one at a time in one of the
+        UNWIND_SIGN_SLOTS, so they never take more than one signing worker.
+
+        Returns:
+            PrebuiltUnwind by the token ID of the leg it unwinds; empty if
+            signing failed (rebalancing then signs from scratch).
+        """
+        offset = max_slippage_cents / Decimal("100")
+        unwinds: dict[str, PrebuiltUnwind] = {}
+        pending: list[tuple[PrebuiltUnwind, str, Any]] = []
+
+        for filled, other in ((yes_prep, no_prep), (no_prep, yes_prep)):
+            unwind = PrebuiltUnwind(
+                shares=filled.shares,
+                hedge_token_id=other.token_id,
+                hedge_price=min(other.price + offset, MAX_ORDER_PRICE).quantize(PRICE_TICK),
+                hedge_order=None,
+                exit_price=max(filled.price - offset, PRICE_TICK).quantize(PRICE_TICK),
+                exit_order=None,
+            )
+            unwinds[filled.token_id] = unwind
+            if filled.price + unwind.hedge_price <= Decimal("1") + MAX_HEDGE_LOSS:
+                pending.append((unwind, "hedge_order", self._order_args(
+                    other.token_id, unwind.hedge_price, unwind.shares, OrderSide.BUY
+                )))
+            pending.append((unwind, "exit_order", self._order_args(
+                filled.token_id, unwind.exit_price, unwind.shares, OrderSide.SELL
+            )))
+
+        sign_start = time.perf_counter()
+        signer = self._get_order_signer()
+        try:
+            signed = [await signer.sign(args) for _, _, args in pending]
+        except Exception as e:
+            self._log.warning("unwind_presign_failed", error=str(e))
+            return {}
+
+        for (unwind, attr, _), order in zip(pending, signed):
+            setattr(unwind, attr, order)
+        self._log.debug(
+            "unwinds_presigned",
+            orders=len(signed),
+            duration_ms=round((time.perf_counter() - sign_start) * 1000, 1),
+        )
+        return unwinds
+
     async def _submit_batch_order(
         self,
         signed_pair: SignedOrderPair,
@@ -938,7 +1499,9 @@ class CLOBClient:
     ) -> DualLegExecutionResult:
         """Submit both orders in a single HTTP call using batch API.
 
-        This eliminates one round-trip latency (~100-250ms savings).
+        This eliminates one round-trip latency (~100-250ms savings). With a
+        batch window set, the pair shares its request with other executions
+        posting in the same window and gets back just its own two results.
 
         Args:
             signed_pair: Signed order pair.
@@ -950,22 +1513,22 @@ class CLOBClient:
         Raises:
             BatchOrderError if submission fails.
         """
-        from py_clob_client.clob_types import OrderType, PostOrdersArgs
+        from py_clob_client.clob_types import OrderType
 
-        client = self._ensure_connected()
+        self._ensure_connected()
         post_start_ms = int(time.time() * 1000)
 
+        orders = [
+            (signed_pair.yes_order, OrderType.GTC),
+            (signed_pair.no_order, OrderType.GTC),
+        ]
+        if self._batcher is not None:
+            post = self._batcher.submit(orders)
+        else:
+            post = self._post_orders(orders)
+
         try:
-            batch_result = await asyncio.wait_for(
-                self._run_sync(
-                    client.post_orders,
-                    [
-                        PostOrdersArgs(order=signed_pair.yes_order, orderType=OrderType.GTC),
-                        PostOrdersArgs(order=signed_pair.no_order, orderType=OrderType.GTC),
-                    ],
-                ),
-                timeout=timeout_seconds,
-            )
+            batch_result = await asyncio.wait_for(post, timeout=timeout_seconds)
         except asyncio.TimeoutError:
             raise OrderTimeoutError("Batch order posting timed out")
         except Exception as e:
@@ -1022,6 +1585,24 @@ class CLOBClient:
             execution_time_ms=post_duration_ms,
         )
 
+    async def _post_orders(self, orders: list[tuple[Any, Any]]) -> Any:
+        """Post (signed order, order type) pairs in one batch request."""
+        from py_clob_client.clob_types import PostOrdersArgs
+
+        client = self._ensure_connected()
+        if self._transport is not None:
+            return await self._transport.post_orders(orders)
+        await self._throttle(RATE_LIMIT_ORDERS, Priority.ORDER)
+        return await self._run_sync(
+            client.post_orders,
+            [PostOrdersArgs(order=order, orderType=order_type) for order, order_type in orders],
+        )
+
+    @staticmethod
+    def _order_id(result: dict) -> str:
+        """Order ID from an order post response ("orderID" on the exchange)."""
+        return result.get("orderID") or result.get("id") or result.get("order_id") or ""
+
     def _parse_batch_result(self, batch_result) -> tuple[dict, dict]:
         """Parse batch order result into individual order results."""
         if isinstance(batch_result, list):
@@ -1051,6 +1632,11 @@ class CLOBClient:
     ) -> tuple[bool, bool, Decimal, Decimal]:
         """Wait briefly for LIVE orders to fill.
 
+        With a connected user channel the wait ends as soon as both orders
+        are reported done; get_orders is only queried for legs that are still
+        open after LIVE_ORDER_WAIT_SECONDS. Without one, this sleeps for
+        LIVE_ORDER_WAIT_SECONDS and then polls.
+
         Args:
             yes_result: YES order result.
             no_result: NO order result.
@@ -1066,24 +1652,91 @@ class CLOBClient:
         if yes_status != "LIVE" and no_status != "LIVE":
             return yes_filled, no_filled, Decimal("0"), Decimal("0")
 
-        self._log.info(
-            "waiting_for_live_orders",
-            yes_status=yes_status,
-            no_status=no_status,
-            wait_seconds=2.0,
+        yes_size_matched = Decimal("0")
+        no_size_matched = Decimal("0")
+        index = self._order_index
+
+        if index is not None and index.connected:
+            self._log.info(
+                "awaiting_live_order_updates",
+                yes_status=yes_status,
+                no_status=no_status,
+                timeout_seconds=LIVE_ORDER_WAIT_SECONDS,
+            )
+            yes_order, no_order = await asyncio.gather(
+                self._await_order_update(yes_result, yes_filled),
+                self._await_order_update(no_result, no_filled),
+            )
+            if yes_order is not None:
+                yes_size_matched = yes_order.size_matched
+                if yes_order.is_filled and not yes_filled:
+                    yes_filled = True
+                    yes_result["status"] = yes_order.status
+                    self._log.info("yes_filled_on_update", status=yes_order.status)
+            if no_order is not None:
+                no_size_matched = no_order.size_matched
+                if no_order.is_filled and not no_filled:
+                    no_filled = True
+                    no_result["status"] = no_order.status
+                    self._log.info("no_filled_on_update", status=no_order.status)
+
+            yes_open = not yes_filled and not (yes_order is not None and yes_order.is_done)
+            no_open = not no_filled and not (no_order is not None and no_order.is_done)
+            if not yes_open and not no_open:
+                return yes_filled, no_filled, yes_size_matched, no_size_matched
+        else:
+            self._log.info(
+                "waiting_for_live_orders",
+                yes_status=yes_status,
+                no_status=no_status,
+                wait_seconds=LIVE_ORDER_WAIT_SECONDS,
+            )
+            await asyncio.sleep(LIVE_ORDER_WAIT_SECONDS)
+
+        yes_filled, no_filled = await self._poll_live_orders(
+            yes_result, no_result, yes_filled, no_filled
         )
+        return yes_filled, no_filled, yes_size_matched, no_size_matched
 
-        await asyncio.sleep(2.0)
+    async def _await_order_update(self, result: dict, filled: bool):
+        """Wait on the order index until an order is done or the wait expires.
+
+        Returns:
+            The order's TrackedOrder, or None if it was never reported.
+        """
+        order_id = self._order_id(result)
+        if not order_id:
+            return None
+        prep = result.get("_prep")
+        if prep is not None:
+            self._order_index.expect(order_id, prep.shares)
+        if filled:
+            return self._order_index.get(order_id)
+        return await self._order_index.wait_until_done(order_id, LIVE_ORDER_WAIT_SECONDS)
+
+    async def _poll_live_orders(
+        self,
+        yes_result: dict,
+        no_result: dict,
+        yes_filled: bool,
+        no_filled: bool,
+    ) -> tuple[bool, bool]:
+        """Check LIVE orders against get_orders.
 
+        Returns:
+            Updated (yes_filled, no_filled).
+        """
         client = self._ensure_connected()
-        yes_size_matched = Decimal("0")
-        no_size_matched = Decimal("0")
 
         try:
-            orders = await self._run_sync(client.get_orders)
+            if self._transport is not None:
+                orders = await self._transport.get_orders(priority=Priority.ORDER)
+            else:
+                await self._throttle(priority=Priority.ORDER)
+                orders = await self._run_sync(client.get_orders)
 
-            yes_order_id = yes_result.get("id") or yes_result.get("order_id")
-            no_order_id = no_result.get("id") or no_result.get("order_id")
+            yes_order_id = self._order_id(yes_result)
+            no_order_id = self._order_id(no_result)
 
             for order in orders:
                 order_id = order.get("id") if isinstance(order, dict) else getattr(order, "id", None)
@@ -1106,7 +1759,7 @@ class CLOBClient:
         except Exception as e:
             self._log.warning("failed_to_check_order_status", error=str(e))
 
-        return yes_filled, no_filled, yes_size_matched, no_size_matched
+        return yes_filled, no_filled
 
     async def _handle_partial_fill(
         self,
@@ -1116,6 +1769,7 @@ class CLOBClient:
         yes_price: Decimal,
         no_price: Decimal,
         max_slippage_cents: Decimal,
+        unwinds: Optional[dict[str, PrebuiltUnwind]] = None,
     ) -> dict:
         """Handle a partial fill by trying to complete the hedge.
 
@@ -1126,10 +1780,12 @@ class CLOBClient:
             yes_price: YES price.
             no_price: NO price.
             max_slippage_cents: Maximum slippage for rebalancing.
+            unwinds: Pre-signed unwind orders by the token they unwind.
 
         Returns:
-            Dict with "action" and details.
+            Dict with "action" and details, including "time_to_flat_ms".
         """
+        detected = time.perf_counter()
         filled_leg = "YES" if execution_result.yes_filled else "NO"
         filled_token_id = yes_token_id if execution_result.yes_filled else no_token_id
         unfilled_token_id = no_token_id if execution_result.yes_filled else yes_token_id
@@ -1147,14 +1803,30 @@ class CLOBClient:
             filled_shares=str(filled_shares),
         )
 
-        return await self.rebalance_partial_fill(
+        prebuilt = (unwinds or {}).get(filled_token_id)
+        result = await self.rebalance_partial_fill(
             filled_token_id=filled_token_id,
             unfilled_token_id=unfilled_token_id,
             filled_shares=filled_shares,
             filled_price=filled_price,
             unfilled_price=unfilled_price,
             max_slippage_cents=max_slippage_cents,
+            prebuilt=prebuilt,
+        )
+
+        result["time_to_flat_ms"] = (time.perf_counter() - detected) * 1000
+        used_prebuilt = prebuilt is not None and prebuilt.shares == filled_shares
+        if self._metrics:
+            self._metrics.record_unwind_time_to_flat(
+                result["time_to_flat_ms"], result["action"], used_prebuilt
+            )
+        self._log.info(
+            "partial_fill_unwound",
+            action=result["action"],
+            prebuilt=used_prebuilt,
+            time_to_flat_ms=round(result["time_to_flat_ms"], 1),
         )
+        return result
 
     async def _cancel_live_orders(
         self, execution_result: DualLegExecutionResult
@@ -1164,12 +1836,12 @@ class CLOBClient:
         no_status = execution_result.no_result.get("status", "").upper()
 
         if yes_status == "LIVE":
-            yes_order_id = execution_result.yes_result.get("id") or execution_result.yes_result.get("order_id")
+            yes_order_id = self._order_id(execution_result.yes_result)
             if yes_order_id:
                 await self.cancel_order(yes_order_id)
 
         if no_status == "LIVE":
-            no_order_id = execution_result.no_result.get("id") or execution_result.no_result.get("order_id")
+            no_order_id = self._order_id(execution_result.no_result)
             if no_order_id:
                 await self.cancel_order(no_order_id)
 
@@ -1186,7 +1858,7 @@ class CLOBClient:
         no_prep = execution_result.no_result.get("_prep")
 
         yes_order_result = OrderResult(
-            order_id=execution_result.yes_result.get("id", ""),
+            order_id=self._order_id(execution_result.yes_result),
             token_id=yes_prep.token_id if yes_prep else "",
             side=OrderSide.BUY,
             status=OrderStatus.FILLED,
@@ -1197,7 +1869,7 @@ class CLOBClient:
         )
 
         no_order_result = OrderResult(
-            order_id=execution_result.no_result.get("id", ""),
+            order_id=self._order_id(execution_result.no_result),
             token_id=no_prep.token_id if no_prep else "",
             side=OrderSide.BUY,
             status=OrderStatus.FILLED,
@@ -1228,9 +1900,10 @@ class CLOBClient:
     ) -> DualLegOrderResult:
         """Create a DualLegOrderResult after successful rebalancing."""
         # This is similar to success result but with rebalanced data
-        return self._create_success_result(
+        result = self._create_success_result(
             execution_result, market_id, pre_yes_depth, pre_no_depth, execution_time
         )
+        return replace(result, rebalance_action=rebalance_result.get("action"))
 
     def _create_partial_result(
         self,
@@ -1245,7 +1918,7 @@ class CLOBClient:
         no_prep = execution_result.no_result.get("_prep")
 
         yes_order_result = OrderResult(
-            order_id=execution_result.yes_result.get("id", ""),
+            order_id=self._order_id(execution_result.yes_result),
             token_id=yes_prep.token_id if yes_prep else "",
             side=OrderSide.BUY,
             status=OrderStatus.FILLED if execution_result.yes_filled else OrderStatus.CANCELLED,
@@ -1260,7 +1933,7 @@ class CLOBClient:
         )
 
         no_order_result = OrderResult(
-            order_id=execution_result.no_result.get("id", ""),
+            order_id=self._order_id(execution_result.no_result),
             token_id=no_prep.token_id if no_prep else "",
             side=OrderSide.BUY,
             status=OrderStatus.FILLED if execution_result.no_filled else OrderStatus.CANCELLED,
@@ -1296,6 +1969,7 @@ class CLOBClient:
         filled_price: Decimal,
         unfilled_price: Decimal,
         max_slippage_cents: Decimal = Decimal("2.0"),
+        prebuilt: Optional[PrebuiltUnwind] = None,
     ) -> dict:
         """Attempt to rebalance a partial fill.
 
@@ -1303,6 +1977,10 @@ class CLOBClient:
         1. Try to complete the hedge by buying the unfilled side
         2. If that fails, exit the filled position
 
+        Pre-signed unwind orders for the filled size are posted as they are:
+        the hedge fill-or-kill at its pre-set price, without checking the
+        book first. Orders signed for a different size are not used.
+
         Args:
             filled_token_id: Token ID of the filled leg.
             unfilled_token_id: Token ID of the unfilled leg.
@@ -1310,10 +1988,14 @@ class CLOBClient:
             filled_price: Price at which filled.
             unfilled_price: Expected price for unfilled side.
             max_slippage_cents: Maximum additional slippage to accept.
+            prebuilt: Unwind orders signed alongside the original pair.
 
         Returns:
             Dict with "action" (hedge_completed, exited, failed) and details.
         """
+        if prebuilt is not None and prebuilt.shares != filled_shares:
+            prebuilt = None
+
         self._log.info(
             "rebalancing_partial_fill",
             filled_token=filled_token_id[:16],
@@ -1325,77 +2007,105 @@ class CLOBClient:
 
         # Step 1: Try to complete the hedge
         try:
-            # Get current order book for unfilled side
-            unfilled_book = await self.get_order_book(unfilled_token_id)
-
-            if unfilled_book.best_ask is not None:
-                best_ask = unfilled_book.best_ask
-                ask_size = unfilled_book.best_ask_size
+            hedge_result = None
+            if prebuilt is not None:
+                hedge_price = prebuilt.hedge_price
+                if prebuilt.hedge_order is not None:
+                    hedge_result = await self._post_signed_order(
+                        prebuilt.hedge_order,
+                        unfilled_token_id,
+                        OrderSide.BUY,
+                        filled_shares,
+                        hedge_price,
+                        TimeInForce.FOK,
+                    )
+            else:
+                # Get current order book for unfilled side
+                unfilled_book = await self.get_order_book(unfilled_token_id)
 
-                # Calculate hedge price with slippage
-                hedge_price = min(
-                    best_ask + (max_slippage_cents / Decimal("100")),
-                    Decimal("0.99"),
-                )
+                if unfilled_book.best_ask is not None:
+                    best_ask = unfilled_book.best_ask
+                    ask_size = unfilled_book.best_ask_size
 
-                # Check if hedge is still profitable
-                total_cost_if_hedged = filled_price + hedge_price
-                potential_profit = Decimal("1.0") - total_cost_if_hedged
+                    # Calculate hedge price with slippage
+                    hedge_price = min(
+                        best_ask + (max_slippage_cents / Decimal("100")),
+                        Decimal("0.99"),
+                    )
 
-                self._log.info(
-                    "checking_hedge_profitability",
-                    best_ask=str(best_ask),
-                    hedge_price=str(hedge_price),
-                    total_cost=str(total_cost_if_hedged),
-                    potential_profit=str(potential_profit),
-                )
+                    # Check if hedge is still profitable
+                    total_cost_if_hedged = filled_price + hedge_price
+                    potential_profit = Decimal("1.0") - total_cost_if_hedged
 
-                # Allow 2 cent loss and need 50% liquidity
-                if potential_profit >= Decimal("-0.02") and ask_size >= filled_shares * Decimal("0.5"):
-                    hedge_result = await self.execute_order(
-                        unfilled_token_id,
-                        OrderSide.BUY,
-                        amount_shares=filled_shares,
-                        price=hedge_price,
+                    self._log.info(
+                        "checking_hedge_profitability",
+                        best_ask=str(best_ask),
+                        hedge_price=str(hedge_price),
+                        total_cost=str(total_cost_if_hedged),
+                        potential_profit=str(potential_profit),
                     )
 
-                    if hedge_result.status in (OrderStatus.MATCHED, OrderStatus.FILLED):
-                        hedge_cost = filled_shares * hedge_price
-                        total_cost = filled_cost + hedge_cost
-                        expected_profit = filled_shares - total_cost
-
-                        self._log.info(
-                            "hedge_completed",
-                            order_id=hedge_result.order_id,
-                            hedge_cost=str(hedge_cost),
-                            total_cost=str(total_cost),
-                            expected_profit=str(expected_profit),
+                    # Allow 2 cent loss and need 50% liquidity
+                    if (
+                        potential_profit >= -MAX_HEDGE_LOSS
+                        and ask_size >= filled_shares * Decimal("0.5")
+                    ):
+                        hedge_result = await self.execute_order(
+                            unfilled_token_id,
+                            OrderSide.BUY,
+                            amount_shares=filled_shares,
+                            price=hedge_price,
                         )
 
-                        return {
-                            "action": "hedge_completed",
-                            "order": hedge_result,
-                            "filled_shares": filled_shares,
-                            "hedge_cost": hedge_cost,
-                            "total_cost": total_cost,
-                            "expected_profit": expected_profit,
-                        }
+            if hedge_result is not None and hedge_result.status in (
+                OrderStatus.MATCHED, OrderStatus.FILLED
+            ):
+                hedge_cost = filled_shares * hedge_price
+                total_cost = filled_cost + hedge_cost
+                expected_profit = filled_shares - total_cost
+
+                self._log.info(
+                    "hedge_completed",
+                    order_id=hedge_result.order_id,
+                    hedge_cost=str(hedge_cost),
+                    total_cost=str(total_cost),
+                    expected_profit=str(expected_profit),
+                )
+
+                return {
+                    "action": "hedge_completed",
+                    "order": hedge_result,
+                    "filled_shares": filled_shares,
+                    "hedge_cost": hedge_cost,
+                    "total_cost": total_cost,
+                    "expected_profit": expected_profit,
+                }
 
         except Exception as e:
             self._log.warning("hedge_attempt_failed", error=str(e))
 
         # Step 2: Exit the filled position
         try:
-            exit_price = max(
-                filled_price - (max_slippage_cents / Decimal("100")),
-                Decimal("0.01"),
-            )
-            exit_result = await self.execute_order(
-                filled_token_id,
-                OrderSide.SELL,
-                amount_shares=filled_shares,
-                price=exit_price,
-            )
+            if prebuilt is not None and prebuilt.exit_order is not None:
+                exit_price = prebuilt.exit_price
+                exit_result = await self._post_signed_order(
+                    prebuilt.exit_order,
+                    filled_token_id,
+                    OrderSide.SELL,
+                    filled_shares,
+                    exit_price,
+                )
+            else:
+                exit_price = max(
+                    filled_price - (max_slippage_cents / Decimal("100")),
+                    Decimal("0.01"),
+                )
+                exit_result = await self.execute_order(
+                    filled_token_id,
+                    OrderSide.SELL,
+                    amount_shares=filled_shares,
+                    price=exit_price,
+                )
 
             if exit_result.status in (OrderStatus.MATCHED, OrderStatus.FILLED):
                 exit_proceeds = filled_shares * exit_price
@@ -7,6 +7,7 @@ Features:
 - Async HTTP client with connection pooling
 - Exponential backoff retries for transient failures
 - TTL-based market metadata caching to reduce API calls
+- Shared rate limiter budget ("gamma" endpoint), paused on 429 responses
 - Type-safe data models (MarketInfo, Market15Min)
 """
 
@@ -26,6 +27,7 @@ from tenacity import (
     wait_exponential,
 )
 
+from mercury.core.ratelimit import Priority, RateLimiterRegistry, get_rate_limiter
 from mercury.integrations.polymarket.types import (
     Market15Min,
     MarketInfo,
@@ -42,6 +44,10 @@ RETRY_WAIT_MAX = 10
 # Default cache TTL in seconds
 DEFAULT_CACHE_TTL = 60.0
 
+# Rate limit endpoint (mercury.core.ratelimit)
+RATE_LIMIT_ENDPOINT = "gamma"
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
 
 @dataclass
 class CacheEntry:
@@ -183,6 +189,7 @@ class GammaClient:
         settings: PolymarketSettings,
         timeout: float = 30.0,
         cache_ttl: float = DEFAULT_CACHE_TTL,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
     ):
         """Initialize the Gamma client.
 
@@ -190,6 +197,7 @@ class GammaClient:
             settings: Polymarket connection settings.
             timeout: HTTP request timeout in seconds.
             cache_ttl: TTL for cached market metadata in seconds.
+            rate_limiter: Rate limiter registry (defaults to the shared one).
         """
         self._base_url = settings.gamma_url.rstrip("/")
         self._timeout = timeout
@@ -197,6 +205,7 @@ class GammaClient:
         self._client: Optional[httpx.AsyncClient] = None
         self._log = log.bind(component="gamma_client")
         self._cache = MarketCache(ttl_seconds=cache_ttl)
+        self._rate_limiter = rate_limiter or get_rate_limiter()
 
     async def connect(self) -> None:
         """Initialize the HTTP client."""
@@ -212,6 +221,7 @@ class GammaClient:
             timeout=self._timeout,
             transport=transport,
             headers={"Accept": "application/json"},
+            event_hooks={"request": [self._throttle], "response": [self._on_response]},
         )
         self._log.info("gamma_client_connected", base_url=self._base_url)
 
@@ -231,6 +241,19 @@ class GammaClient:
         """Async context manager exit."""
         await self.close()
 
+    async def _throttle(self, request: httpx.Request) -> None:
+        """Wait for rate limit budget before each request (retries included)."""
+        await self._rate_limiter.acquire(RATE_LIMIT_ENDPOINT, Priority.METADATA)
+
+    async def _on_response(self, response: httpx.Response) -> None:
+        """Pause the endpoint when the server rate limits us."""
+        if response.status_code == 429:
+            try:
+                retry_after = float(response.headers.get("Retry-After", ""))
+            except ValueError:
+                retry_after = DEFAULT_RETRY_AFTER_SECONDS
+            self._rate_limiter.backoff(RATE_LIMIT_ENDPOINT, retry_after)
+
     def _ensure_connected(self) -> httpx.AsyncClient:
         """Ensure client is connected and return it."""
         if self._client is None:
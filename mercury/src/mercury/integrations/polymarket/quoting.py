@@ -0,0 +1,450 @@
+"""Requoting of resting GTC orders by diffing desired against resting quotes.
+
+The CLOB has no amend: changing a resting order means a cancel and a new
+post, two round trips, and the new order joins the back of its level. A
+market maker that requotes that way on every tick pays both costs for every
+order, including the ones whose price did not change.
+
+QuoteManager keeps an index of our resting orders by market, token, side
+and price. requote() takes the full set of quotes wanted for a market and
+sends only the difference:
+
+- A level whose resting size already matches (within size_tolerance) is
+  left alone and keeps its queue position.
+- A level that should grow gets one more order for the increase; the
+  orders already there keep their place.
+- A level that should shrink cancels its newest orders first, and reposts
+  only what is then missing.
+- Levels no longer wanted are cancelled; new levels are posted.
+
+Cancels go out in one DELETE /orders and posts in as few POST /orders as
+the exchange accepts. Cancels are sent first, so a quote moving onto the
+other side's old price cannot trade against our own order.
+
+One requote per market is in flight at a time. Requotes arriving meanwhile
+(e.g. while the order endpoint is rate limited) replace each other, and the
+next pass applies only the latest: callers whose quotes were superseded are
+answered with the result of the pass that applied the newer state.
+
+Fills are read from the client's OrderStateIndex (user channel or simulator
+pushes) before each diff, so filled size is not reposted blindly and no
+request is made to learn it.
+
+Usage:
+    quotes = QuoteManager(clob, order_index=user_channel.orders)
+    await quotes.requote(market_id, [
+        Quote(yes_token, OrderSide.BUY, Decimal("0.47"), Decimal("100")),
+        Quote(yes_token, OrderSide.SELL, Decimal("0.53"), Decimal("100")),
+    ])
+"""
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING, Optional, Union
+
+import structlog
+
+from mercury.integrations.polymarket.types import OrderResult, OrderSide, OrderStatus
+
+if TYPE_CHECKING:
+    from mercury.integrations.polymarket.clob import CLOBClient
+    from mercury.integrations.polymarket.simulator import SimulatedExchange
+    from mercury.integrations.polymarket.user_channel import OrderStateIndex
+    from mercury.services.metrics import MetricsEmitter
+
+log = structlog.get_logger()
+
+ZERO = Decimal("0")
+
+# (token_id, side, price)
+Level = tuple[str, OrderSide, Decimal]
+
+
+@dataclass(frozen=True)
+class Quote:
+    """A resting limit order we want on the book."""
+
+    token_id: str
+    side: OrderSide
+    price: Decimal
+    size: Decimal  # Shares
+
+    @property
+    def level(self) -> Level:
+        return (self.token_id, self.side, self.price)
+
+
+@dataclass
+class RestingOrder:
+    """One of our GTC orders resting on the book."""
+
+    order_id: str
+    market_id: str
+    token_id: str
+    side: OrderSide
+    price: Decimal
+    size: Decimal
+    size_matched: Decimal = ZERO
+    posted_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def level(self) -> Level:
+        return (self.token_id, self.side, self.price)
+
+    @property
+    def remaining(self) -> Decimal:
+        return max(self.size - self.size_matched, ZERO)
+
+
+class RestingOrderIndex:
+    """Our resting orders by order ID and by market and price level.
+
+    Orders within a level are kept oldest first, which is their queue order
+    at the exchange.
+    """
+
+    def __init__(self) -> None:
+        self._orders: dict[str, RestingOrder] = {}
+        self._levels: dict[str, dict[Level, list[RestingOrder]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._orders
+
+    def get(self, order_id: str) -> Optional[RestingOrder]:
+        return self._orders.get(order_id)
+
+    def add(self, order: RestingOrder) -> None:
+        self.remove(order.order_id)
+        self._orders[order.order_id] = order
+        self._levels.setdefault(order.market_id, {}).setdefault(order.level, []).append(order)
+
+    def remove(self, order_id: str) -> Optional[RestingOrder]:
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            return None
+        levels = self._levels[order.market_id]
+        level = levels[order.level]
+        level.remove(order)
+        if not level:
+            del levels[order.level]
+        if not levels:
+            del self._levels[order.market_id]
+        return order
+
+    def levels(self, market_id: str) -> dict[Level, list[RestingOrder]]:
+        """Resting orders of a market by level (a live view; do not mutate)."""
+        return self._levels.get(market_id, {})
+
+    def orders(self, market_id: Optional[str] = None) -> list[RestingOrder]:
+        """Resting orders, of one market or all."""
+        if market_id is None:
+            return list(self._orders.values())
+        return [o for level in self.levels(market_id).values() for o in level]
+
+    def markets(self) -> list[str]:
+        return list(self._levels)
+
+
+@dataclass
+class QuoteDiff:
+    """Cancels and posts that turn the resting orders into the desired quotes."""
+
+    cancels: list[RestingOrder] = field(default_factory=list)
+    posts: list[Quote] = field(default_factory=list)
+    kept: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.cancels and not self.posts
+
+
+def diff_quotes(
+    desired: list[Quote],
+    resting: dict[Level, list[RestingOrder]],
+    size_tolerance: Decimal = ZERO,
+) -> QuoteDiff:
+    """Work out the fewest cancels and posts to reach the desired quotes.
+
+    Quotes for the same level are summed. Levels within size_tolerance of
+    their desired size are left as they are.
+
+    Args:
+        desired: Quotes wanted for the market.
+        resting: Resting orders of the market by level, oldest first.
+        size_tolerance: Size difference (shares) not worth a requote.
+
+    Returns:
+        QuoteDiff; kept counts resting orders left untouched.
+    """
+    wanted: dict[Level, Decimal] = {}
+    for quote in desired:
+        if quote.size > 0:
+            wanted[quote.level] = wanted.get(quote.level, ZERO) + quote.size
+
+    diff = QuoteDiff()
+    for level, orders in resting.items():
+        if level not in wanted:
+            diff.cancels.extend(orders)
+
+    for level, size in wanted.items():
+        orders = list(resting.get(level, ()))
+        total = sum((o.remaining for o in orders), ZERO)
+        if abs(size - total) > size_tolerance:
+            # Shrink from the back of the queue, keeping the oldest orders
+            while orders and total - size > size_tolerance:
+                order = orders.pop()
+                diff.cancels.append(order)
+                total -= order.remaining
+            if size - total > size_tolerance:
+                token_id, side, price = level
+                diff.posts.append(Quote(token_id, side, price, size - total))
+        diff.kept += len(orders)
+
+    return diff
+
+
+@dataclass
+class RequoteResult:
+    """Outcome of applying one desired state for a market."""
+
+    market_id: str
+    cancelled: list[str] = field(default_factory=list)
+    posted: list[RestingOrder] = field(default_factory=list)
+    filled: list[OrderResult] = field(default_factory=list)
+    failed: list[Quote] = field(default_factory=list)
+    kept: int = 0
+    coalesced: int = 0  # Earlier desired states skipped in favour of this one
+
+
+@dataclass
+class _MarketQuotes:
+    """Requote state of one market."""
+
+    desired: Optional[list[Quote]] = None
+    generation: int = 0
+    applied_generation: int = 0
+    applied_at: float = 0.0
+    waiters: list[tuple[int, asyncio.Future]] = field(default_factory=list)
+    task: Optional[asyncio.Task] = None
+
+
+class QuoteManager:
+    """Keep each market's resting GTC orders in line with its desired quotes.
+
+    Usage:
+        quotes = QuoteManager(clob, order_index=clob.order_index)
+        result = await quotes.requote(market_id, desired)
+        await quotes.cancel_market(market_id)
+        await quotes.close()
+    """
+
+    def __init__(
+        self,
+        client: Union["CLOBClient", "SimulatedExchange"],
+        order_index: Optional["OrderStateIndex"] = None,
+        size_tolerance: Decimal = ZERO,
+        min_interval_seconds: float = 0.0,
+        dry_run: bool = False,
+        metrics_emitter: Optional["MetricsEmitter"] = None,
+    ):
+        """Initialize the manager.
+
+        Args:
+            client: CLOBClient or SimulatedExchange orders are sent through.
+            order_index: Order updates used to learn fills without a request.
+            size_tolerance: Size difference (shares) not worth a requote.
+            min_interval_seconds: Minimum time between passes for one
+                market; requotes arriving sooner coalesce (0 = none).
+            dry_run: Apply diffs to the index without sending anything.
+            metrics_emitter: Optional MetricsEmitter for requote counts.
+        """
+        self._client = client
+        self._order_index = order_index
+        self._size_tolerance = size_tolerance
+        self._min_interval = min_interval_seconds
+        self._dry_run = dry_run
+        self._metrics = metrics_emitter
+        self._resting = RestingOrderIndex()
+        self._markets: dict[str, _MarketQuotes] = {}
+        self._ids = itertools.count(1)
+        self._log = log.bind(component="quote_manager")
+
+    @property
+    def resting(self) -> RestingOrderIndex:
+        """Our resting orders as last known."""
+        return self._resting
+
+    async def requote(self, market_id: str, quotes: list[Quote]) -> RequoteResult:
+        """Make a market's resting orders match the given quotes.
+
+        Args:
+            market_id: Market the quotes belong to.
+            quotes: Every quote wanted for the market; resting orders not
+                    covered are cancelled.
+
+        Returns:
+            Result of the pass that applied these quotes, or a later state
+            that superseded them.
+        """
+        state = self._markets.setdefault(market_id, _MarketQuotes())
+        state.desired = list(quotes)
+        state.generation += 1
+        future = asyncio.get_running_loop().create_future()
+        state.waiters.append((state.generation, future))
+        if state.task is None:
+            state.task = asyncio.create_task(self._run(market_id, state))
+        return await asyncio.shield(future)
+
+    async def cancel_market(self, market_id: str) -> RequoteResult:
+        """Cancel every resting order of a market."""
+        return await self.requote(market_id, [])
+
+    async def close(self) -> None:
+        """Stop pending requotes. Resting orders are left as they are."""
+        for state in self._markets.values():
+            if state.task is not None:
+                state.task.cancel()
+                try:
+                    await state.task
+                except asyncio.CancelledError:
+                    pass
+            for _, future in state.waiters:
+                if not future.done():
+                    future.cancel()
+        self._markets.clear()
+
+    async def _run(self, market_id: str, state: _MarketQuotes) -> None:
+        """Apply the latest desired state until none is pending."""
+        try:
+            while state.desired is not None:
+                wait = state.applied_at + self._min_interval - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                desired, generation = state.desired, state.generation
+                state.desired = None
+                coalesced = generation - state.applied_generation - 1
+                state.applied_generation = generation
+
+                try:
+                    result = await self._apply(market_id, desired)
+                    result.coalesced = coalesced
+                    outcome: Union[RequoteResult, BaseException] = result
+                except Exception as e:
+                    self._log.warning("requote_failed", market_id=market_id, error=str(e))
+                    outcome = e
+                state.applied_at = time.monotonic()
+
+                if coalesced and self._metrics:
+                    self._metrics.record_requotes_coalesced(coalesced)
+                ready = [f for gen, f in state.waiters if gen <= generation]
+                state.waiters = [(gen, f) for gen, f in state.waiters if gen > generation]
+                for future in ready:
+                    if future.done():
+                        continue
+                    if isinstance(outcome, BaseException):
+                        future.set_exception(outcome)
+                    else:
+                        future.set_result(outcome)
+        finally:
+            state.task = None
+
+    async def _apply(self, market_id: str, desired: list[Quote]) -> RequoteResult:
+        """Diff one desired state against the book and send the difference."""
+        self._refresh(market_id)
+        diff = diff_quotes(desired, self._resting.levels(market_id), self._size_tolerance)
+        result = RequoteResult(market_id=market_id, kept=diff.kept)
+        if diff.is_empty:
+            return result
+
+        if diff.cancels:
+            result.cancelled = await self._cancel(diff.cancels)
+        if diff.posts:
+            await self._post(market_id, diff.posts, result)
+
+        if self._metrics:
+            self._metrics.record_requote(
+                cancelled=len(diff.cancels), posted=len(diff.posts), kept=diff.kept
+            )
+        self._log.debug(
+            "requoted",
+            market_id=market_id,
+            cancelled=len(result.cancelled),
+            posted=len(result.posted),
+            filled=len(result.filled),
+            failed=len(result.failed),
+            kept=result.kept,
+        )
+        return result
+
+    def _refresh(self, market_id: str) -> None:
+        """Apply pushed fills and cancellations to a market's resting orders."""
+        if self._order_index is None:
+            return
+        for order in self._resting.orders(market_id):
+            tracked = self._order_index.get(order.order_id)
+            if tracked is None:
+                continue
+            order.size_matched = max(order.size_matched, tracked.size_matched)
+            if tracked.is_done or order.remaining <= 0:
+                self._resting.remove(order.order_id)
+
+    async def _cancel(self, orders: list[RestingOrder]) -> list[str]:
+        """Cancel orders in one request and drop them from the index.
+
+        Orders the exchange did not cancel have already been matched or
+        cancelled, so they are dropped too. If the request fails, all stay
+        indexed and the next pass tries again.
+        """
+        order_ids = [o.order_id for o in orders]
+        cancelled = order_ids if self._dry_run else await self._client.cancel_orders(order_ids)
+        for order_id in order_ids:
+            self._resting.remove(order_id)
+        return cancelled
+
+    async def _post(self, market_id: str, quotes: list[Quote], result: RequoteResult) -> None:
+        """Post quotes in batches and index the ones left resting."""
+        if self._dry_run:
+            responses: list[Optional[OrderResult]] = [
+                OrderResult(
+                    order_id=f"dry-quote-{next(self._ids)}",
+                    token_id=q.token_id,
+                    side=q.side,
+                    status=OrderStatus.LIVE,
+                    requested_price=q.price,
+                    requested_size=q.size,
+                )
+                for q in quotes
+            ]
+        else:
+            responses = await self._client.post_limit_orders(
+                [(q.token_id, q.side, q.price, q.size) for q in quotes]
+            )
+
+        for quote, response in zip(quotes, responses):
+            if response is None or response.status in (
+                OrderStatus.CANCELLED, OrderStatus.EXPIRED
+            ):
+                result.failed.append(quote)
+                continue
+            if response.filled_size > 0:
+                result.filled.append(response)
+            if response.status != OrderStatus.LIVE:
+                continue
+            order = RestingOrder(
+                order_id=response.order_id,
+                market_id=market_id,
+                token_id=quote.token_id,
+                side=quote.side,
+                price=quote.price,
+                size=response.requested_size,
+                size_matched=response.filled_size,
+            )
+            self._resting.add(order)
+            result.posted.append(order)
@@ -0,0 +1,446 @@
+"""Persistent order signing pool with per-token order templates.
+
+py-clob-client's create_order() resolves tick size, neg-risk and fee rate for
+the token (HTTP calls on a cold cache), then builds a fresh py-order-utils
+builder whose signer parses the private key twice per order. Key parsing
+derives the public key and is about half of the ~12ms spent per order.
+
+OrderSigner keeps that work out of the hot path:
+- OrderTemplate holds the per-token fields, fetched once when a market is
+  subscribed, so only price, size and nonce change per order.
+- Workers keep warm builders (one per exchange contract) with the key parsed
+  once, and live for the lifetime of the client instead of one
+  ThreadPoolExecutor per dual-leg order.
+- Signing runs on threads by default. Signing is pure-Python ECDSA and holds
+  the GIL, so a process pool (use_processes=True) is what actually signs the
+  two legs in parallel on multi-core hosts; it costs pickling per order.
+
+Signed orders are identical to py-clob-client's, except for the random salt.
+
+PresignedOrderCache holds orders signed ahead of a signal for armed markets
+(see CLOBClient.arm_market), so a hit skips signing entirely.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+import structlog
+
+if TYPE_CHECKING:
+    from mercury.services.metrics import MetricsEmitter
+
+log = structlog.get_logger()
+
+DEFAULT_SIGN_WORKERS = 2
+
+
+@dataclass(frozen=True)
+class OrderTemplate:
+    """Per-token order fields that do not change between orders."""
+
+    token_id: str
+    tick_size: str
+    neg_risk: bool = False
+    fee_rate_bps: int = 0
+
+    def order_args(self, price: float, size: float, side: str = "BUY") -> Any:
+        """Create py-clob-client OrderArgs for this token."""
+        from py_clob_client.clob_types import OrderArgs
+
+        return OrderArgs(
+            token_id=self.token_id,
+            price=price,
+            size=size,
+            side=side,
+            fee_rate_bps=self.fee_rate_bps,
+        )
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """Picklable inputs needed to rebuild an order builder in a worker."""
+
+    private_key: str
+    chain_id: int
+    funder: str
+    signature_type: int
+
+
+class _ParsedKeySigner:
+    """Drop-in for py-order-utils' Signer that reuses one parsed key."""
+
+    def __init__(self, account: Any):
+        from eth_account import Account
+
+        self.account = account
+        self._sign_hash = Account._sign_hash
+        self._key = account._key_obj
+
+    def address(self) -> str:
+        return self.account.address
+
+    def sign(self, struct_hash) -> str:
+        return self._sign_hash(struct_hash, self._key).signature.hex()
+
+
+class _WarmOrderBuilder:
+    """Builds and signs orders like py-clob-client's OrderBuilder.create_order.
+
+    The private key is parsed once and one py-order-utils builder is kept per
+    exchange contract (regular and neg-risk).
+    """
+
+    def __init__(self, key: SigningKey):
+        from eth_account import Account
+        from py_clob_client.order_builder.builder import OrderBuilder
+        from py_clob_client.signer import Signer
+
+        self._key = key
+        self._account = Account.from_key(key.private_key)
+        # Only used for get_order_amounts(), which is pure rounding logic
+        self._amounts = OrderBuilder(
+            Signer(key.private_key, key.chain_id), key.signature_type, key.funder
+        )
+        self._builders: dict[bool, Any] = {}
+
+    def sign(self, order_args: Any, template: OrderTemplate) -> Any:
+        from py_clob_client.order_builder.builder import ROUNDING_CONFIG
+        from py_clob_client.utilities import price_valid
+        from py_order_utils.model import OrderData
+
+        if not price_valid(order_args.price, template.tick_size):
+            raise ValueError(
+                f"price ({order_args.price}), min: {template.tick_size} - "
+                f"max: {1 - float(template.tick_size)}"
+            )
+
+        side, maker_amount, taker_amount = self._amounts.get_order_amounts(
+            order_args.side,
+            order_args.size,
+            order_args.price,
+            ROUNDING_CONFIG[template.tick_size],
+        )
+        data = OrderData(
+            maker=self._key.funder,
+            taker=order_args.taker,
+            tokenId=order_args.token_id,
+            makerAmount=str(maker_amount),
+            takerAmount=str(taker_amount),
+            side=side,
+            feeRateBps=str(template.fee_rate_bps),
+            nonce=str(order_args.nonce),
+            signer=self._account.address,
+            expiration=str(order_args.expiration),
+            signatureType=self._key.signature_type,
+        )
+        return self._builder(template.neg_risk).build_signed_order(data)
+
+    def _builder(self, neg_risk: bool) -> Any:
+        builder = self._builders.get(neg_risk)
+        if builder is None:
+            from py_clob_client.config import get_contract_config
+            from py_order_utils.builders import OrderBuilder
+
+            builder = OrderBuilder(
+                get_contract_config(self._key.chain_id, neg_risk).exchange,
+                self._key.chain_id,
+                _ParsedKeySigner(self._account),
+            )
+            self._builders[neg_risk] = builder
+        return builder
+
+
+# Per-process builder for the process pool
+_worker_builder: Optional[_WarmOrderBuilder] = None
+
+
+def _init_worker(key: SigningKey) -> None:
+    global _worker_builder
+    _worker_builder = _WarmOrderBuilder(key)
+
+
+def _sign_in_worker(order_args: Any, template: OrderTemplate) -> Any:
+    return _worker_builder.sign(order_args, template)
+
+
+def _warm_up() -> None:
+    """No-op used to start pool workers before the first order."""
+
+
+class OrderSigner:
+    """Long-lived signing workers with per-token order templates.
+
+    Usage:
+        signer = OrderSigner(clob_client)  # py-clob-client ClobClient
+        await signer.start()
+        await signer.prepare_all([yes_token_id, no_token_id])
+        signed_yes, signed_no = await signer.sign_all([yes_args, no_args])
+        await signer.stop()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        workers: int = DEFAULT_SIGN_WORKERS,
+        use_processes: bool = False,
+        metrics_emitter: Optional["MetricsEmitter"] = None,
+    ):
+        """Initialize the signer.
+
+        Args:
+            client: py-clob-client ClobClient (level 1 auth).
+            workers: Number of signing workers.
+            use_processes: Sign in a process pool instead of threads.
+            metrics_emitter: Optional metrics emitter for sign latency.
+        """
+        self._client = client
+        self._workers = max(workers, 1)
+        self._use_processes = use_processes
+        self._metrics = metrics_emitter
+        self._templates: dict[str, OrderTemplate] = {}
+        self._pending: dict[str, asyncio.Future] = {}
+        self._executor: Optional[Executor] = None
+        self._builder: Optional[_WarmOrderBuilder] = None
+        self._log = log.bind(component="order_signer")
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker pool is up."""
+        return self._executor is not None
+
+    @property
+    def templates(self) -> dict[str, OrderTemplate]:
+        """Prepared templates by token ID."""
+        return self._templates
+
+    def template(self, token_id: str) -> Optional[OrderTemplate]:
+        """Get the prepared template for a token, if any."""
+        return self._templates.get(token_id)
+
+    async def start(self) -> None:
+        """Start the workers and run one no-op on each to warm them up."""
+        if self._executor is not None:
+            return
+
+        if self._use_processes:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                initializer=_init_worker,
+                initargs=(self._signing_key(),),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="order-signer"
+            )
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self._executor, _warm_up) for _ in range(self._workers)
+        ))
+        self._log.info(
+            "order_signer_started", workers=self._workers, processes=self._use_processes
+        )
+
+    async def stop(self) -> None:
+        """Shut the workers down."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._log.info("order_signer_stopped")
+
+    async def prepare(self, token_id: str) -> OrderTemplate:
+        """Fetch and cache a token's tick size, neg-risk flag and fee rate."""
+        template = self._templates.get(token_id)
+        if template is not None:
+            return template
+        pending = self._pending.get(token_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        def fetch() -> OrderTemplate:
+            return OrderTemplate(
+                token_id=token_id,
+                tick_size=str(self._client.get_tick_size(token_id)),
+                neg_risk=bool(self._client.get_neg_risk(token_id)),
+                fee_rate_bps=int(self._client.get_fee_rate_bps(token_id) or 0),
+            )
+
+        # Metadata lookups are network I/O; keep them off the signing workers
+        future = asyncio.get_running_loop().run_in_executor(None, fetch)
+        self._pending[token_id] = future
+        try:
+            template = await future
+        finally:
+            self._pending.pop(token_id, None)
+        self._templates[token_id] = template
+        self._log.debug("order_template_prepared", token_id=token_id[:16])
+        return template
+
+    async def prepare_all(self, token_ids: Iterable[str]) -> list[OrderTemplate]:
+        """Prepare templates for several tokens concurrently."""
+        return list(await asyncio.gather(*(self.prepare(t) for t in token_ids)))
+
+    async def sign(self, order_args: Any) -> Any:
+        """Sign one order.
+
+        Tokens with a template are signed by the warm builders. Others go
+        through py-clob-client's create_order() in thread mode, or have their
+        template prepared first in process mode.
+        """
+        if self._executor is None:
+            await self.start()
+
+        template = self._templates.get(order_args.token_id)
+        if template is None and self._use_processes:
+            template = await self.prepare(order_args.token_id)
+
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        if template is None:
+            path = "cold"
+            signed = await loop.run_in_executor(
+                self._executor, self._client.create_order, order_args
+            )
+        elif self._use_processes:
+            path = "template"
+            signed = await loop.run_in_executor(
+                self._executor, _sign_in_worker, order_args, template
+            )
+        else:
+            path = "template"
+            signed = await loop.run_in_executor(
+                self._executor, self._warm_builder().sign, order_args, template
+            )
+
+        if self._metrics:
+            self._metrics.record_order_sign_latency((time.perf_counter() - start) * 1000, path)
+        return signed
+
+    def _signing_key(self) -> SigningKey:
+        builder = self._client.builder
+        return SigningKey(
+            private_key=builder.signer.private_key,
+            chain_id=builder.signer.get_chain_id(),
+            funder=builder.funder,
+            signature_type=builder.sig_type,
+        )
+
+    def _warm_builder(self) -> _WarmOrderBuilder:
+        """Get the thread-mode builder, creating it on first use."""
+        if self._builder is None:
+            self._builder = _WarmOrderBuilder(self._signing_key())
+        return self._builder
+
+    async def sign_all(self, orders: list[Any]) -> list[Any]:
+        """Sign several orders concurrently, preserving order."""
+        return list(await asyncio.gather(*(self.sign(args) for args in orders)))
+
+
+@dataclass
+class _PresignedOrder:
+    order: Any
+    expires_at: float
+
+
+class PresignedOrderCache:
+    """Signed orders prepared ahead of a signal, keyed by token, price and size.
+
+    A signed order carries a random salt and can be posted once, so take()
+    removes it. Entries expire after their TTL: an armed price that has not
+    been hit by then is stale.
+
+    Usage:
+        cache = PresignedOrderCache()
+        cache.put(token_id, Decimal("0.47"), Decimal("10.63"), signed, ttl_seconds=5)
+        signed = cache.take(token_id, Decimal("0.47"), Decimal("10.63"))
+    """
+
+    def __init__(self, max_orders: int = 512):
+        """Initialize the cache.
+
+        Args:
+            max_orders: Maximum cached orders; the soonest to expire are
+                dropped beyond this.
+        """
+        self._orders: dict[tuple[str, Decimal, Decimal], _PresignedOrder] = {}
+        self._max_orders = max_orders
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def extend(
+        self, token_id: str, price: Decimal, shares: Decimal, ttl_seconds: float
+    ) -> bool:
+        """Push back the expiry of a cached order.
+
+        Returns:
+            False if no unexpired order is cached for this key.
+        """
+        entry = self._orders.get((token_id, price, shares))
+        now = time.monotonic()
+        if entry is None or entry.expires_at <= now:
+            return False
+        entry.expires_at = max(entry.expires_at, now + ttl_seconds)
+        return True
+
+    def put(
+        self,
+        token_id: str,
+        price: Decimal,
+        shares: Decimal,
+        order: Any,
+        ttl_seconds: float,
+    ) -> None:
+        """Cache a signed order."""
+        self._orders[(token_id, price, shares)] = _PresignedOrder(
+            order, time.monotonic() + ttl_seconds
+        )
+        if len(self._orders) > self._max_orders:
+            self.purge_expired()
+            overflow = len(self._orders) - self._max_orders
+            if overflow > 0:
+                by_expiry = sorted(self._orders, key=lambda k: self._orders[k].expires_at)
+                for key in by_expiry[:overflow]:
+                    del self._orders[key]
+
+    def take(self, token_id: str, price: Decimal, shares: Decimal) -> Optional[Any]:
+        """Remove and return a cached order, or None if missing or expired."""
+        entry = self._orders.pop((token_id, price, shares), None)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return None
+        return entry.order
+
+    def record(self, hit: bool) -> None:
+        """Count a lookup for hit_rate."""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def discard(self, token_ids: Iterable[str]) -> int:
+        """Drop every order for the given tokens. Returns the number dropped."""
+        tokens = set(token_ids)
+        keys = [key for key in self._orders if key[0] in tokens]
+        for key in keys:
+            del self._orders[key]
+        return len(keys)
+
+    def purge_expired(self) -> int:
+        """Drop expired orders. Returns the number dropped."""
+        now = time.monotonic()
+        expired = [key for key, entry in self._orders.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._orders[key]
+        return len(expired)
@@ -0,0 +1,624 @@
+"""Simulated matching exchange for dry-run execution.
+
+SimulatedExchange stands in for CLOBClient in ExecutionEngine and matches
+our orders against the live InMemoryOrderBook depth kept by
+MarketDataService, instead of assuming every order fills instantly at its
+limit price:
+
+- Marketable size takes resting liquidity level by level up to the limit
+  price, at each level's price. FOK orders are killed unless they fill
+  completely; GTC orders keep the unfilled remainder on the book.
+- Each request is delayed by a sample from a LatencyModel, so the book can
+  move between decision and match just as it does live.
+- Depth we took stays taken until the feed changes that level, so
+  back-to-back orders don't fill against the same displayed size.
+- Resting orders join the back of their price level. The feed carries no
+  trades, so size leaving our level is counted against the queue ahead
+  first and only fills us once that queue is gone. A resting order also
+  fills at its own price if the other side crosses it, or if its level
+  disappears while worse prices remain (it was traded through).
+
+Order state is pushed into an OrderStateIndex exactly like the user channel
+does, so the engine's FOK/GTC handling, order.* events and the partial fill
+rebalance and unwind paths run unchanged.
+
+Usage:
+    exchange = SimulatedExchange.from_config(config, market_data.get_token_order_book)
+    engine = ExecutionEngine(config, event_bus, simulator=exchange)
+"""
+
+import asyncio
+import itertools
+import math
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import ROUND_DOWN, Decimal
+from typing import TYPE_CHECKING, Callable, Optional
+
+import structlog
+
+from mercury.integrations.polymarket.clob import (
+    DEFAULT_TIMEOUT_SECONDS,
+    MAX_ORDER_PRICE,
+    PRICE_BUFFER_CENTS,
+    ArbitrageInvalidError,
+    CLOBClient,
+    InsufficientLiquidityError,
+    OrderRejectedError,
+)
+from mercury.integrations.polymarket.types import (
+    DualLegOrderResult,
+    OrderResult,
+    OrderSide,
+    OrderStatus,
+    TimeInForce,
+)
+from mercury.integrations.polymarket.user_channel import OrderStateIndex
+
+if TYPE_CHECKING:
+    from mercury.core.config import ConfigManager
+    from mercury.domain.orderbook import InMemoryOrderBook, PriceLevel, SortedPriceLevels
+
+log = structlog.get_logger()
+
+ZERO = Decimal("0")
+SHARE_STEP = Decimal("0.01")
+
+# Looks up the current book for a token (e.g. MarketDataService.get_token_order_book)
+BookSource = Callable[[str], Optional["InMemoryOrderBook"]]
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Distribution of one-way exchange latency.
+
+    Attributes:
+        distribution: "fixed", "uniform" (mean +/- jitter), "normal"
+            (standard deviation jitter, clipped at 0) or "lognormal"
+            (mean and standard deviation jitter; a long right tail).
+        mean_ms: Mean latency in milliseconds.
+        jitter_ms: Spread in milliseconds.
+    """
+
+    distribution: str = "lognormal"
+    mean_ms: float = 0.0
+    jitter_ms: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"latency distribution must be one of {LATENCY_DISTRIBUTIONS}, "
+                f"got {self.distribution!r}"
+            )
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.mean_ms <= 0:
+            return 0.0
+        if self.jitter_ms <= 0 or self.distribution == "fixed":
+            ms = self.mean_ms
+        elif self.distribution == "uniform":
+            ms = rng.uniform(self.mean_ms - self.jitter_ms, self.mean_ms + self.jitter_ms)
+        elif self.distribution == "normal":
+            ms = rng.gauss(self.mean_ms, self.jitter_ms)
+        else:
+            sigma = math.sqrt(math.log1p((self.jitter_ms / self.mean_ms) ** 2))
+            ms = rng.lognormvariate(math.log(self.mean_ms) - sigma * sigma / 2, sigma)
+        return max(ms, 0.0) / 1000
+
+
+@dataclass
+class SimulatedOrder:
+    """An order held by the simulated exchange."""
+
+    order_id: str
+    token_id: str
+    side: OrderSide
+    price: Decimal
+    size: Decimal
+    time_in_force: TimeInForce
+    status: OrderStatus = OrderStatus.LIVE
+    size_matched: Decimal = ZERO
+    cost: Decimal = ZERO
+    # Displayed size at our price ahead of us, and the level size last seen
+    queue_ahead: Decimal = ZERO
+    level_size: Decimal = ZERO
+
+    @property
+    def remaining(self) -> Decimal:
+        """Unfilled size."""
+        return self.size - self.size_matched
+
+    def to_dict(self) -> dict:
+        """Format as a get_open_orders() entry."""
+        return {
+            "id": self.order_id,
+            "asset_id": self.token_id,
+            "side": self.side.value,
+            "price": str(self.price),
+            "original_size": str(self.size),
+            "size_matched": str(self.size_matched),
+            "order_type": self.time_in_force.value,
+            "status": self.status.value,
+        }
+
+
+class SimulatedExchange:
+    """Matching engine over live order book depth, shaped like CLOBClient.
+
+    Implements the CLOBClient calls ExecutionEngine makes: execute_order,
+    execute_dual_leg_order, rebalance_partial_fill, get_open_orders,
+    cancel_order and cancel_all_orders.
+    """
+
+    def __init__(
+        self,
+        book_source: BookSource,
+        latency: Optional[LatencyModel] = None,
+        match_interval: float = 0.1,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize the exchange.
+
+        Args:
+            book_source: Returns the current book for a token, or None.
+            latency: Latency applied to each order and cancel request.
+            match_interval: Seconds between re-matching resting orders
+                against the book (0 to only match on demand).
+            seed: Seed for latency sampling, for reproducible runs.
+        """
+        self._book_source = book_source
+        self._latency = latency or LatencyModel()
+        self._match_interval = match_interval
+        self._rng = random.Random(seed)
+        self._index = OrderStateIndex()
+        self._orders: dict[str, SimulatedOrder] = {}
+        self._resting: dict[str, SimulatedOrder] = {}
+        # token_id -> (book, {("bid"/"ask", price): (level size when taken, size taken)})
+        self._consumed: dict[str, tuple["InMemoryOrderBook", dict]] = {}
+        self._ids = itertools.count(1)
+        self._match_task: Optional[asyncio.Task] = None
+        self._connected = False
+        self._log = log.bind(component="simulated_exchange")
+
+    @classmethod
+    def from_config(
+        cls,
+        config: "ConfigManager",
+        book_source: BookSource,
+    ) -> "SimulatedExchange":
+        """Create an exchange from the [execution.simulator] settings."""
+        seed = config.get_int("execution.simulator.seed", 0)
+        return cls(
+            book_source,
+            latency=LatencyModel(
+                distribution=config.get("execution.simulator.latency_distribution", "lognormal"),
+                mean_ms=config.get_float("execution.simulator.latency_mean_ms", 25.0),
+                jitter_ms=config.get_float("execution.simulator.latency_jitter_ms", 15.0),
+            ),
+            match_interval=config.get_int("execution.simulator.match_interval_ms", 100) / 1000,
+            seed=seed or None,
+        )
+
+    @property
+    def orders(self) -> OrderStateIndex:
+        """Order state index updated on every fill and cancel."""
+        return self._index
+
+    def get_order(self, order_id: str) -> Optional[SimulatedOrder]:
+        """Get an order by ID."""
+        return self._orders.get(order_id)
+
+    async def connect(self) -> None:
+        """Start matching resting orders in the background."""
+        self._connected = True
+        self._index.connected = True
+        if self._match_interval > 0 and self._match_task is None:
+            self._match_task = asyncio.create_task(self._match_loop())
+
+    async def close(self) -> None:
+        """Stop background matching."""
+        self._connected = False
+        self._index.connected = False
+        if self._match_task is not None:
+            self._match_task.cancel()
+            try:
+                await self._match_task
+            except asyncio.CancelledError:
+                pass
+            self._match_task = None
+
+    async def get_order_book(self, token_id: str) -> "InMemoryOrderBook":
+        """Get the current book for a token."""
+        book = self._book_source(token_id)
+        if book is None:
+            raise OrderRejectedError(f"No order book for token {token_id[:16]}")
+        return book
+
+    # =========================================================================
+    # Orders
+    # =========================================================================
+
+    async def execute_order(
+        self,
+        token_id: str,
+        side: OrderSide,
+        amount_usd: Optional[Decimal] = None,
+        amount_shares: Optional[Decimal] = None,
+        price: Optional[Decimal] = None,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+    ) -> OrderResult:
+        """Submit an order and match it after the sampled latency.
+
+        Takes the same arguments as CLOBClient.execute_order.
+
+        Returns:
+            OrderResult with the immediate fill. FILLED when completely
+            matched, LIVE when a GTC remainder rests, CANCELLED when a FOK
+            order was killed.
+        """
+        start_time = time.time() * 1000
+
+        if price is None:
+            book = await self.get_order_book(token_id)
+            if side == OrderSide.BUY:
+                price = (book.best_ask or Decimal("0.5")) + PRICE_BUFFER_CENTS
+            else:
+                price = (book.best_bid or Decimal("0.5")) - PRICE_BUFFER_CENTS
+
+        if amount_shares is None:
+            if amount_usd is None:
+                raise ValueError("Either amount_usd or amount_shares must be provided")
+            amount_shares = amount_usd / price
+
+        order = SimulatedOrder(
+            order_id=f"sim-{next(self._ids)}",
+            token_id=token_id,
+            side=side,
+            price=price.quantize(SHARE_STEP),
+            size=amount_shares.quantize(SHARE_STEP, rounding=ROUND_DOWN),
+            time_in_force=time_in_force,
+        )
+        self._orders[order.order_id] = order
+
+        await asyncio.sleep(self._latency.sample(self._rng))
+        self._submit(order)
+
+        return self._result(order, start_time)
+
+    async def execute_dual_leg_order(
+        self,
+        yes_token_id: str,
+        no_token_id: str,
+        amount_usd: Decimal,
+        yes_price: Optional[Decimal] = None,
+        no_price: Optional[Decimal] = None,
+        price_buffer_cents: Decimal = PRICE_BUFFER_CENTS,
+        check_liquidity: bool = True,
+        handle_partial_fills: bool = True,
+        max_slippage_cents: Decimal = Decimal("2.0"),
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        prebuild_unwind: bool = False,
+    ) -> DualLegOrderResult:
+        """Submit both legs of an arbitrage concurrently.
+
+        Mirrors CLOBClient.execute_dual_leg_order: prices get the buffer
+        and are capped, both legs go in as GTC and any unfilled remainder
+        is cancelled. Partial fills are returned as they are, for the
+        caller to rebalance through rebalance_partial_fill(); nothing is
+        signed here, so prebuild_unwind has no effect.
+        """
+        start_time = time.time() * 1000
+
+        yes_book, no_book = await asyncio.gather(
+            self.get_order_book(yes_token_id),
+            self.get_order_book(no_token_id),
+        )
+        pre_yes_depth = yes_book.total_ask_size(3)
+        pre_no_depth = no_book.total_ask_size(3)
+
+        if yes_price is None:
+            yes_price = yes_book.best_ask or Decimal("0.5")
+        if no_price is None:
+            no_price = no_book.best_ask or Decimal("0.5")
+        yes_price = min(yes_price + price_buffer_cents, MAX_ORDER_PRICE)
+        no_price = min(no_price + price_buffer_cents, MAX_ORDER_PRICE)
+        if yes_price + no_price >= Decimal("1.0"):
+            raise ArbitrageInvalidError(
+                f"Arbitrage invalid: prices sum to ${yes_price + no_price:.2f} >= $1.00"
+            )
+        if check_liquidity and (yes_book.best_ask is None or no_book.best_ask is None):
+            raise InsufficientLiquidityError("Missing liquidity on one or both sides")
+
+        half_usd = amount_usd / 2
+        yes_result, no_result = await asyncio.gather(
+            self.execute_order(yes_token_id, OrderSide.BUY, amount_usd=half_usd, price=yes_price),
+            self.execute_order(no_token_id, OrderSide.BUY, amount_usd=half_usd, price=no_price),
+        )
+
+        results = []
+        for result in (yes_result, no_result):
+            if result.status == OrderStatus.LIVE:
+                await self.cancel_order(result.order_id)
+                result = self._result(self._orders[result.order_id], result.submit_time_ms)
+            results.append(result)
+
+        return DualLegOrderResult(
+            yes_result=results[0],
+            no_result=results[1],
+            market_id=f"{yes_token_id[:8]}...",
+            timestamp=datetime.now(timezone.utc),
+            pre_execution_yes_depth=pre_yes_depth,
+            pre_execution_no_depth=pre_no_depth,
+            execution_time_ms=time.time() * 1000 - start_time,
+        )
+
+    # Same hedge-or-exit strategy as the live client, against simulated fills
+    rebalance_partial_fill = CLOBClient.rebalance_partial_fill
+
+    async def get_open_orders(self) -> list[dict]:
+        """Get resting orders."""
+        return [order.to_dict() for order in self._resting.values()]
+
+    async def cancel_order(self, order_id: str) -> bool:
+        """Cancel a resting order after the sampled latency.
+
+        Returns:
+            True if the order was still resting.
+        """
+        await asyncio.sleep(self._latency.sample(self._rng))
+        order = self._resting.pop(order_id, None)
+        if order is None:
+            return False
+        order.status = OrderStatus.CANCELLED
+        self._publish(order, "CANCELLATION")
+        return True
+
+    async def cancel_orders(self, order_ids: list[str]) -> list[str]:
+        """Cancel several resting orders in one simulated request.
+
+        Returns:
+            IDs of the orders that were still resting.
+        """
+        await asyncio.sleep(self._latency.sample(self._rng))
+        cancelled = []
+        for order_id in order_ids:
+            order = self._resting.pop(order_id, None)
+            if order is None:
+                continue
+            order.status = OrderStatus.CANCELLED
+            self._publish(order, "CANCELLATION")
+            cancelled.append(order_id)
+        return cancelled
+
+    async def post_limit_orders(
+        self,
+        orders: list[tuple[str, OrderSide, Decimal, Decimal]],
+        time_in_force: TimeInForce = TimeInForce.GTC,
+    ) -> list[Optional[OrderResult]]:
+        """Submit several limit orders in one simulated request.
+
+        Takes the same arguments as CLOBClient.post_limit_orders.
+        """
+        start_time = time.time() * 1000
+        submitted = []
+        for token_id, side, price, shares in orders:
+            order = SimulatedOrder(
+                order_id=f"sim-{next(self._ids)}",
+                token_id=token_id,
+                side=side,
+                price=price.quantize(SHARE_STEP),
+                size=shares.quantize(SHARE_STEP, rounding=ROUND_DOWN),
+                time_in_force=time_in_force,
+            )
+            self._orders[order.order_id] = order
+            submitted.append(order)
+
+        await asyncio.sleep(self._latency.sample(self._rng))
+        for order in submitted:
+            self._submit(order)
+        return [self._result(order, start_time) for order in submitted]
+
+    async def cancel_all_orders(self) -> int:
+        """Cancel every resting order.
+
+        Returns:
+            Number of orders cancelled.
+        """
+        cancelled = 0
+        for order_id in list(self._resting):
+            if await self.cancel_order(order_id):
+                cancelled += 1
+        return cancelled
+
+    # =========================================================================
+    # Matching
+    # =========================================================================
+
+    def match_resting(self) -> int:
+        """Match resting orders against the current books.
+
+        Called periodically after connect(); tests call it directly after
+        changing a book.
+
+        Returns:
+            Number of orders that received fills.
+        """
+        filled = 0
+        for order in list(self._resting.values()):
+            book = self._book_source(order.token_id)
+            if book is None:
+                continue
+            before = order.size_matched
+            # Liquidity that now crosses us trades with us, at our price
+            self._take(order, book, maker=True)
+            self._advance_queue(order, book)
+            if order.size_matched > before:
+                filled += 1
+                if order.remaining <= 0:
+                    order.status = OrderStatus.FILLED
+                    del self._resting[order.order_id]
+                self._publish(order)
+        return filled
+
+    def _submit(self, order: SimulatedOrder) -> None:
+        """Match a new order and rest, fill or kill it."""
+        book = self._book_source(order.token_id)
+        if book is None:
+            order.status = OrderStatus.CANCELLED
+        elif order.time_in_force == TimeInForce.FOK and self._fillable(order, book) < order.size:
+            order.status = OrderStatus.CANCELLED
+        else:
+            self._take(order, book, maker=False)
+            if order.remaining <= 0:
+                order.status = OrderStatus.FILLED
+            else:
+                level = self._own_levels(order, book).get(order.price)
+                order.level_size = level.size if level else ZERO
+                order.queue_ahead = order.level_size
+                self._resting[order.order_id] = order
+
+        self._log.debug(
+            "simulated_order",
+            order_id=order.order_id,
+            token_id=order.token_id[:16],
+            side=order.side.value,
+            price=str(order.price),
+            size=str(order.size),
+            matched=str(order.size_matched),
+            status=order.status.value,
+        )
+        self._publish(
+            order, "CANCELLATION" if order.status == OrderStatus.CANCELLED else "PLACEMENT"
+        )
+
+    def _fillable(self, order: SimulatedOrder, book: "InMemoryOrderBook") -> Decimal:
+        """Size available to an order at or better than its price."""
+        total = ZERO
+        side, levels = self._opposite(order, book)
+        taken = self._taken(order.token_id, book)
+        for level in levels:
+            if not self._crosses(order, level.price):
+                break
+            total += self._available(taken, side, level)
+            if total >= order.remaining:
+                break
+        return total
+
+    def _take(self, order: SimulatedOrder, book: "InMemoryOrderBook", maker: bool) -> None:
+        """Fill an order against crossing liquidity, best price first."""
+        side, levels = self._opposite(order, book)
+        taken = self._taken(order.token_id, book)
+        for level in levels:
+            if order.remaining <= 0 or not self._crosses(order, level.price):
+                break
+            size = min(order.remaining, self._available(taken, side, level))
+            if size <= 0:
+                continue
+            seen, used = taken.get((side, level.price), (None, ZERO))
+            if seen != level.size:
+                used = ZERO
+            taken[(side, level.price)] = (level.size, used + size)
+            order.size_matched += size
+            order.cost += size * (order.price if maker else level.price)
+
+    def _advance_queue(self, order: SimulatedOrder, book: "InMemoryOrderBook") -> None:
+        """Count size that left our price level against the queue, then us.
+
+        A level that disappears while worse prices remain on our side was
+        traded through, which fills us completely.
+        """
+        levels = self._own_levels(order, book)
+        level = levels.get(order.price)
+        size = level.size if level else ZERO
+        left = order.level_size - size
+        order.level_size = size
+        if left <= 0 or order.remaining <= 0:
+            return
+        if (
+            level is None
+            and levels.best_price is not None
+            and self._crosses(order, levels.best_price)
+        ):
+            fill = order.remaining
+        else:
+            ahead = min(order.queue_ahead, left)
+            order.queue_ahead -= ahead
+            fill = min(left - ahead, order.remaining)
+        if fill > 0:
+            order.size_matched += fill
+            order.cost += fill * order.price
+
+    def _taken(self, token_id: str, book: "InMemoryOrderBook") -> dict:
+        """Size taken per level of a token's book; reset when the book is replaced."""
+        entry = self._consumed.get(token_id)
+        if entry is None or entry[0] is not book:
+            entry = (book, {})
+            self._consumed[token_id] = entry
+        return entry[1]
+
+    @staticmethod
+    def _available(taken: dict, side: str, level: "PriceLevel") -> Decimal:
+        """Level size minus what we already took, until the feed updates it."""
+        seen, used = taken.get((side, level.price), (None, ZERO))
+        if seen != level.size:
+            return level.size
+        return max(level.size - used, ZERO)
+
+    @staticmethod
+    def _crosses(order: SimulatedOrder, price: Decimal) -> bool:
+        if order.side == OrderSide.BUY:
+            return price <= order.price
+        return price >= order.price
+
+    @staticmethod
+    def _opposite(
+        order: SimulatedOrder, book: "InMemoryOrderBook"
+    ) -> tuple[str, "SortedPriceLevels"]:
+        if order.side == OrderSide.BUY:
+            return "ask", book.asks
+        return "bid", book.bids
+
+    @staticmethod
+    def _own_levels(order: SimulatedOrder, book: "InMemoryOrderBook") -> "SortedPriceLevels":
+        return book.bids if order.side == OrderSide.BUY else book.asks
+
+    def _publish(self, order: SimulatedOrder, update_type: str = "UPDATE") -> None:
+        """Push the order's state as a user channel order update."""
+        self._index.apply({
+            "event_type": "order",
+            "id": order.order_id,
+            "type": update_type,
+            "status": order.status.value,
+            "original_size": str(order.size),
+            "size_matched": str(order.size_matched),
+        })
+
+    def _result(self, order: SimulatedOrder, submit_time_ms: Optional[float]) -> OrderResult:
+        return OrderResult(
+            order_id=order.order_id,
+            token_id=order.token_id,
+            side=order.side,
+            status=order.status,
+            requested_price=order.price,
+            requested_size=order.size,
+            filled_size=order.size_matched,
+            filled_cost=order.cost,
+            updated_at=datetime.now(timezone.utc),
+            submit_time_ms=submit_time_ms,
+            response_time_ms=time.time() * 1000,
+        )
+
+    async def _match_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._match_interval)
+            if self._resting:
+                try:
+                    self.match_resting()
+                except Exception as e:
+                    self._log.warning("simulated_match_error", error=str(e))
@@ -0,0 +1,434 @@
+"""Local stand-in for the Polymarket CLOB REST API.
+
+LocalCLOBServer serves the endpoints AsyncCLOBTransport and py-clob-client
+use for trading from an in-process aiohttp server, so tests and benchmarks
+can point PolymarketSettings.clob_url at it instead of the exchange:
+
+    GET    /book?token_id=   order book from set_book()
+    GET    /data/orders      resting orders, paginated by next_cursor
+    POST   /order            one signed order
+    POST   /orders           batch of up to 15 signed orders
+    DELETE /order            cancel {"orderID": ...}
+    DELETE /orders           cancel [order_id, ...]
+    GET    /tick-size, /neg-risk, /fee-rate
+                             market metadata py-clob-client reads when signing
+
+Orders that cross the stored book are MATCHED, others rest as LIVE. Pass
+order_handler to replace that decision. Authenticated endpoints only check
+that the POLY_API_KEY header is present; signatures are not verified.
+
+To exercise the client under less friendly conditions, every response can
+be delayed by a LatencyModel sample, order endpoints can fail at a seeded
+error_rate (or a specific path can be told to fail_next), and per-path
+rate_limits answer excess requests with 429 and a Retry-After header, as
+the exchange does.
+
+Every request is recorded, along with the client connections it arrived
+on, so tests can assert on keep-alive reuse.
+"""
+
+import asyncio
+import itertools
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+import structlog
+from aiohttp import web
+
+from mercury.integrations.polymarket.batching import MAX_BATCH_ORDERS
+from mercury.integrations.polymarket.simulator import LatencyModel
+from mercury.integrations.polymarket.transport import (
+    BATCH_ORDERS_PATH,
+    END_CURSOR,
+    FIRST_CURSOR,
+    ORDER_PATH,
+)
+
+log = structlog.get_logger()
+
+# Header py-clob-client's L2 auth sets on every authenticated request
+API_KEY_HEADER = "POLY_API_KEY"
+
+DEFAULT_PAGE_SIZE = 100
+
+# Endpoints error_rate applies to
+ORDER_PATHS = frozenset({ORDER_PATH, BATCH_ORDERS_PATH})
+
+
+@dataclass
+class RecordedRequest:
+    """A request received by the stand-in."""
+
+    method: str
+    path: str
+    peer: Any
+    body: Any = None
+
+
+@dataclass
+class StandinOrder:
+    """An order accepted by the stand-in."""
+
+    order_id: str
+    token_id: str
+    side: str
+    price: Decimal
+    size: Decimal
+    order_type: str
+    status: str
+    size_matched: Decimal = Decimal("0")
+    raw: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """Format as a /data/orders entry."""
+        return {
+            "id": self.order_id,
+            "asset_id": self.token_id,
+            "side": self.side,
+            "price": str(self.price),
+            "original_size": str(self.size),
+            "size_matched": str(self.size_matched),
+            "order_type": self.order_type,
+            "status": self.status,
+        }
+
+
+OrderHandler = Callable[[StandinOrder], str]
+
+
+class _Throttle:
+    """Token bucket that rejects rather than waits."""
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token; return 0 on success or the seconds until one is free."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class LocalCLOBServer:
+    """In-process HTTP stand-in for the CLOB trading endpoints.
+
+    Usage:
+        async with LocalCLOBServer() as server:
+            server.set_book("tok", bids=[("0.44", "100")], asks=[("0.46", "100")])
+            transport = AsyncCLOBTransport(server.url, signer=signer, creds=creds)
+            ...
+
+        # 20ms median round trip, 2% failed order posts, 50 posts/s
+        LocalCLOBServer(
+            latency=LatencyModel("lognormal", mean_ms=20.0, jitter_ms=10.0),
+            error_rate=0.02,
+            rate_limits={"/order": 50.0},
+            seed=1,
+        )
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        order_handler: Optional[OrderHandler] = None,
+        tick_size: str = "0.01",
+        latency: Optional[LatencyModel] = None,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        rate_limits: Optional[dict[str, float]] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize the stand-in.
+
+        Args:
+            host: Host to bind to.
+            port: Port to listen on (0 picks a free port).
+            page_size: Orders per /data/orders page.
+            order_handler: Optional callable returning the status ("LIVE",
+                "MATCHED", ...) for each accepted order.
+            tick_size: Minimum tick size reported for every token.
+            latency: Delay added before every response (none by default).
+            error_rate: Fraction of order posts and cancels that fail.
+            error_status: HTTP status returned for those failures.
+            rate_limits: Requests per second allowed per path; the bucket
+                holds one second of requests.
+            seed: Seed for latency and error sampling.
+        """
+        self._host = host
+        self._port = port
+        self._page_size = page_size
+        self._order_handler = order_handler or self._match_against_book
+        self._tick_size = tick_size
+        self._books: dict[str, dict] = {}
+        self._orders: dict[str, StandinOrder] = {}
+        self._ids = itertools.count(1)
+        self._latency = latency or LatencyModel()
+        self._error_rate = error_rate
+        self._error_status = error_status
+        self._throttles = {path: _Throttle(rate) for path, rate in (rate_limits or {}).items()}
+        self._forced_errors: dict[str, list[int]] = defaultdict(list)
+        self._rng = random.Random(seed)
+        self.injected_errors = 0
+        self.throttled = 0
+        self._runner: Optional[web.AppRunner] = None
+        self.requests: list[RecordedRequest] = []
+        self._log = log.bind(component="clob_standin")
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as clob_url."""
+        return f"http://{self._host}:{self._port}"
+
+    @property
+    def orders(self) -> dict[str, StandinOrder]:
+        """Accepted orders by order ID."""
+        return self._orders
+
+    @property
+    def connections(self) -> set:
+        """Distinct client connections (peer addresses) seen so far."""
+        return {r.peer for r in self.requests}
+
+    def set_book(
+        self,
+        token_id: str,
+        bids: list[tuple[str, str]] = (),
+        asks: list[tuple[str, str]] = (),
+    ) -> None:
+        """Set the order book for a token from (price, size) pairs."""
+        self._books[token_id] = {
+            "asset_id": token_id,
+            "market": "",
+            "bids": [{"price": str(p), "size": str(s)} for p, s in bids],
+            "asks": [{"price": str(p), "size": str(s)} for p, s in asks],
+            "hash": "",
+            "timestamp": "0",
+        }
+
+    def fail_next(self, path: str, status: int = 500, count: int = 1) -> None:
+        """Answer the next `count` requests to `path` with `status`."""
+        self._forced_errors[path].extend([status] * count)
+
+    async def start(self) -> None:
+        """Start serving."""
+        app = web.Application(middlewares=[self._conditions])
+        app.router.add_get("/book", self._handle_book)
+        app.router.add_get("/data/orders", self._handle_get_orders)
+        app.router.add_post("/order", self._handle_post_order)
+        app.router.add_post("/orders", self._handle_post_orders)
+        app.router.add_delete("/order", self._handle_cancel)
+        app.router.add_delete("/orders", self._handle_cancel_orders)
+        app.router.add_get("/tick-size", self._handle_market_info)
+        app.router.add_get("/neg-risk", self._handle_market_info)
+        app.router.add_get("/fee-rate", self._handle_market_info)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+        self._log.info("clob_standin_started", url=self.url)
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+            self._log.info("clob_standin_stopped")
+
+    async def __aenter__(self) -> "LocalCLOBServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    # =========================================================================
+    # Handlers
+    # =========================================================================
+
+    async def _handle_book(self, request: web.Request) -> web.Response:
+        await self._record(request)
+        book = self._books.get(request.query.get("token_id", ""))
+        if book is None:
+            return web.json_response({"error": "No orderbook exists"}, status=404)
+        return web.json_response(book)
+
+    async def _handle_market_info(self, request: web.Request) -> web.Response:
+        await self._record(request)
+        return web.json_response({
+            "minimum_tick_size": self._tick_size,
+            "neg_risk": False,
+            "base_fee": 0,
+        })
+
+    async def _handle_get_orders(self, request: web.Request) -> web.Response:
+        await self._record(request)
+        if not self._authorized(request):
+            return self._unauthorized()
+        cursor = request.query.get("next_cursor", FIRST_CURSOR)
+        offset = 0 if cursor == FIRST_CURSOR else int(cursor)
+        live = [o for o in self._orders.values() if o.status == "LIVE"]
+        page = live[offset:offset + self._page_size]
+        end = offset + self._page_size
+        return web.json_response({
+            "data": [o.to_dict() for o in page],
+            "next_cursor": str(end) if end < len(live) else END_CURSOR,
+        })
+
+    async def _handle_post_order(self, request: web.Request) -> web.Response:
+        body = await self._record(request)
+        if not self._authorized(request):
+            return self._unauthorized()
+        return web.json_response(self._accept(body))
+
+    async def _handle_post_orders(self, request: web.Request) -> web.Response:
+        body = await self._record(request)
+        if not self._authorized(request):
+            return self._unauthorized()
+        if len(body) > MAX_BATCH_ORDERS:
+            return web.json_response(
+                {"error": f"Too many orders in payload, max allowed: {MAX_BATCH_ORDERS}"},
+                status=400,
+            )
+        return web.json_response([self._accept(item) for item in body])
+
+    async def _handle_cancel(self, request: web.Request) -> web.Response:
+        body = await self._record(request)
+        if not self._authorized(request):
+            return self._unauthorized()
+        return web.json_response(self._cancel([body.get("orderID")]))
+
+    async def _handle_cancel_orders(self, request: web.Request) -> web.Response:
+        body = await self._record(request)
+        if not self._authorized(request):
+            return self._unauthorized()
+        return web.json_response(self._cancel(body))
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    @web.middleware
+    async def _conditions(self, request: web.Request, handler) -> web.StreamResponse:
+        """Apply latency, rate limits and injected errors before a handler."""
+        delay = self._latency.sample(self._rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        throttle = self._throttles.get(request.path)
+        if throttle is not None:
+            retry_after = throttle.take()
+            if retry_after:
+                self.throttled += 1
+                await self._record(request)
+                return web.json_response(
+                    {"error": "Too Many Requests"},
+                    status=429,
+                    headers={"Retry-After": f"{retry_after:.3f}"},
+                )
+
+        status = self._injected_status(request)
+        if status:
+            self.injected_errors += 1
+            await self._record(request)
+            return web.json_response({"error": "injected failure"}, status=status)
+
+        return await handler(request)
+
+    def _injected_status(self, request: web.Request) -> int:
+        forced = self._forced_errors.get(request.path)
+        if forced:
+            return forced.pop(0)
+        if (
+            self._error_rate
+            and request.path in ORDER_PATHS
+            and request.method in ("POST", "DELETE")
+            and self._rng.random() < self._error_rate
+        ):
+            return self._error_status
+        return 0
+
+    async def _record(self, request: web.Request) -> Any:
+        body = await request.json() if request.can_read_body else None
+        peer = request.transport.get_extra_info("peername") if request.transport else None
+        self.requests.append(RecordedRequest(request.method, request.path, peer, body))
+        return body
+
+    def _authorized(self, request: web.Request) -> bool:
+        return bool(request.headers.get(API_KEY_HEADER))
+
+    def _unauthorized(self) -> web.Response:
+        return web.json_response({"error": "Unauthorized/Invalid api key"}, status=401)
+
+    def _accept(self, body: dict) -> dict:
+        """Accept a posted order and return the exchange's response shape."""
+        signed = body.get("order", {})
+        maker = Decimal(str(signed.get("makerAmount", "0")))
+        taker = Decimal(str(signed.get("takerAmount", "0")))
+        side = signed.get("side", "BUY")
+        # BUY pays USDC (maker) for shares (taker); SELL is the reverse
+        shares, usdc = (taker, maker) if side == "BUY" else (maker, taker)
+        price = (usdc / shares).quantize(Decimal("0.0001")) if shares else Decimal("0")
+
+        order = StandinOrder(
+            order_id=f"0x{next(self._ids):064x}",
+            token_id=str(signed.get("tokenId", "")),
+            side=side,
+            price=price,
+            size=shares / Decimal(10**6),
+            order_type=body.get("orderType", "GTC"),
+            status="LIVE",
+            raw=body,
+        )
+        order.status = self._order_handler(order)
+        if order.status == "MATCHED":
+            order.size_matched = order.size
+        elif order.status == "LIVE" and order.order_type == "FOK":
+            order.status = "CANCELLED"
+        self._orders[order.order_id] = order
+
+        return {
+            "success": order.status != "CANCELLED",
+            "errorMsg": "" if order.status != "CANCELLED" else "order couldn't be fully filled",
+            "orderID": order.order_id,
+            "status": order.status,
+            "size_matched": str(order.size_matched),
+        }
+
+    def _match_against_book(self, order: StandinOrder) -> str:
+        """Default handler: MATCHED if the order crosses the best opposite level."""
+        book = self._books.get(order.token_id)
+        if book is None:
+            return "LIVE"
+        if order.side == "BUY":
+            prices = [Decimal(level["price"]) for level in book["asks"]]
+            crosses = bool(prices) and min(prices) <= order.price
+        else:
+            prices = [Decimal(level["price"]) for level in book["bids"]]
+            crosses = bool(prices) and max(prices) >= order.price
+        return "MATCHED" if crosses else "LIVE"
+
+    def _cancel(self, order_ids: list[str]) -> dict:
+        canceled, not_canceled = [], {}
+        for order_id in order_ids:
+            order = self._orders.get(order_id)
+            if order is None or order.status != "LIVE":
+                not_canceled[order_id] = "order can't be found - already canceled or matched"
+                continue
+            order.status = "CANCELLED"
+            canceled.append(order_id)
+        return {"canceled": canceled, "not_canceled": not_canceled}
@@ -0,0 +1,375 @@
+"""Native asyncio HTTP transport for the hot CLOB endpoints.
+
+py-clob-client is synchronous: every call goes through a thread pool and the
+library's own HTTP session. AsyncCLOBTransport sends the latency-critical
+requests (order book, get orders, order post, batch post, cancel) from the
+event loop over one pooled httpx.AsyncClient, so connections stay open
+between submissions and concurrency is not capped by the executor size.
+
+Signing is unchanged: orders are still built and signed by py-clob-client,
+and L2 request headers come from its create_level_2_headers(), fed with the
+exact bytes that are sent.
+
+Each request takes a token from the shared rate limiter first (order posts
+and cancels from "clob.orders", books from "clob.book", the rest from
+"clob"); a 429 response pauses that endpoint for its Retry-After and the
+request is sent again once the pause is over, up to rate_limit_retries
+times, so a rate-limited order post is delayed rather than rejected.
+"""
+
+import asyncio
+import json
+from typing import Any, Optional
+
+import httpx
+import structlog
+
+from mercury.core.ratelimit import Priority, RateLimiterRegistry, get_rate_limiter
+from mercury.integrations.polymarket.clob import (
+    RATE_LIMIT_BOOK,
+    RATE_LIMIT_ENDPOINT,
+    RATE_LIMIT_ORDERS,
+    CLOBClientError,
+    ConnectionError,
+    OrderRejectedError,
+    RateLimitedError,
+)
+
+log = structlog.get_logger()
+
+# CLOB REST paths (py_clob_client.endpoints)
+BOOK_PATH = "/book"
+ORDERS_PATH = "/data/orders"
+ORDER_PATH = "/order"
+BATCH_ORDERS_PATH = "/orders"
+
+# Pagination cursors used by /data/orders
+FIRST_CURSOR = "MA=="
+END_CURSOR = "LTE="
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 10.0
+
+# Rate limit endpoint and default priority per path
+RATE_LIMITS = {
+    BOOK_PATH: (RATE_LIMIT_BOOK, Priority.MARKET_DATA),
+    ORDER_PATH: (RATE_LIMIT_ORDERS, Priority.ORDER),
+    BATCH_ORDERS_PATH: (RATE_LIMIT_ORDERS, Priority.ORDER),
+}
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+DEFAULT_RATE_LIMIT_RETRIES = 3
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Seconds to back off from a 429 response's Retry-After header."""
+    try:
+        return max(float(response.headers.get("Retry-After", "")), 0.0)
+    except ValueError:
+        return DEFAULT_RETRY_AFTER_SECONDS
+
+
+def _compact(body: Any) -> str:
+    """Serialize a body the way py-clob-client signs it."""
+    return json.dumps(body, separators=(",", ":"), ensure_ascii=False)
+
+
+class AsyncCLOBTransport:
+    """Pooled keep-alive HTTP client for CLOB order and book requests.
+
+    Usage:
+        transport = AsyncCLOBTransport(host, signer=client.signer, creds=client.creds)
+        await transport.open()
+        book = await transport.get_order_book(token_id)
+        result = await transport.post_orders([(signed_yes, "GTC"), (signed_no, "GTC")])
+        await transport.close()
+    """
+
+    def __init__(
+        self,
+        host: str,
+        signer: Any = None,
+        creds: Any = None,
+        http2: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+        timeout: float = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        proxy: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
+        rate_limit_retries: int = DEFAULT_RATE_LIMIT_RETRIES,
+    ):
+        """Initialize the transport.
+
+        Args:
+            host: CLOB base URL.
+            signer: py-clob-client Signer (wallet address for L2 headers).
+            creds: py-clob-client ApiCreds. Required for authenticated endpoints.
+            http2: Negotiate HTTP/2 (needs the h2 package).
+            max_connections: Connection pool size; also the keep-alive pool size.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            timeout: Request timeout in seconds.
+            proxy: Optional HTTP proxy URL.
+            transport: Optional httpx transport, e.g. for tests.
+            rate_limiter: Rate limiter registry (defaults to the shared one).
+            rate_limit_retries: Times a 429 response is retried after its
+                                Retry-After before RateLimitedError is raised.
+        """
+        self._host = host.rstrip("/")
+        self._signer = signer
+        self._creds = creds
+        self._http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = timeout
+        self._proxy = proxy
+        self._transport = transport
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._rate_limit_retries = rate_limit_retries
+        # Retry-After pauses for endpoints the rate limiter has no bucket for
+        self._resume_at: dict[str, float] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._log = log.bind(component="clob_transport")
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the connection pool is open."""
+        return self._client is not None
+
+    @property
+    def http2(self) -> bool:
+        """Whether HTTP/2 is negotiated."""
+        return self._http2
+
+    async def open(self) -> None:
+        """Open the connection pool."""
+        if self._client is not None:
+            return
+
+        transport = self._transport
+        if transport is None and self._proxy:
+            transport = httpx.AsyncHTTPTransport(
+                proxy=self._proxy, http2=self._http2, limits=self._limits
+            )
+
+        self._client = httpx.AsyncClient(
+            base_url=self._host,
+            http2=self._http2,
+            limits=self._limits,
+            timeout=self._timeout,
+            transport=transport,
+            headers={"Accept": "application/json", "Content-Type": "application/json"},
+        )
+        self._log.info("clob_transport_opened", host=self._host, http2=self._http2)
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._log.info("clob_transport_closed")
+
+    async def __aenter__(self) -> "AsyncCLOBTransport":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    # =========================================================================
+    # Endpoints
+    # =========================================================================
+
+    async def get_order_book(self, token_id: str) -> dict:
+        """Get the raw order book for a token (no auth)."""
+        return await self._request("GET", BOOK_PATH, params={"token_id": token_id})
+
+    async def get_orders(self, priority: Priority = Priority.METADATA) -> list[dict]:
+        """Get all open orders for the API key, following pagination.
+
+        Args:
+            priority: Rate limit priority (ORDER when checking fills).
+        """
+        headers = self._l2_headers("GET", ORDERS_PATH)
+        results: list[dict] = []
+        cursor = FIRST_CURSOR
+        while cursor != END_CURSOR:
+            page = await self._request(
+                "GET",
+                ORDERS_PATH,
+                headers=headers,
+                params={"next_cursor": cursor},
+                priority=priority,
+            )
+            results += page.get("data", [])
+            cursor = page.get("next_cursor") or END_CURSOR
+        return results
+
+    async def post_order(
+        self,
+        order: Any,
+        order_type: str = "GTC",
+        post_only: bool = False,
+    ) -> dict:
+        """Post one signed order.
+
+        Args:
+            order: Signed order from py-clob-client create_order().
+            order_type: "GTC", "FOK", "GTD" or "FAK".
+            post_only: Reject instead of taking liquidity.
+        """
+        body = self._order_body(order, order_type, post_only)
+        return await self._signed_request("POST", ORDER_PATH, body)
+
+    async def post_orders(self, orders: list[tuple[Any, str]]) -> list[dict]:
+        """Post several signed orders in one request.
+
+        Args:
+            orders: (signed_order, order_type) pairs.
+
+        Returns:
+            One result per order, in order.
+        """
+        body = [self._order_body(order, order_type) for order, order_type in orders]
+        return await self._signed_request("POST", BATCH_ORDERS_PATH, body)
+
+    async def cancel(self, order_id: str) -> dict:
+        """Cancel one order."""
+        return await self._signed_request("DELETE", ORDER_PATH, {"orderID": order_id})
+
+    async def cancel_orders(self, order_ids: list[str]) -> dict:
+        """Cancel several orders in one request."""
+        return await self._signed_request("DELETE", BATCH_ORDERS_PATH, list(order_ids))
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _order_body(self, order: Any, order_type: str, post_only: bool = False) -> dict:
+        """Build the JSON body with py-clob-client's order_to_json()."""
+        self._require_creds()
+        from py_clob_client.utilities import order_to_json
+
+        return order_to_json(
+            order, self._creds.api_key, getattr(order_type, "value", order_type), post_only
+        )
+
+    def _require_creds(self) -> None:
+        if self._creds is None or self._signer is None:
+            raise CLOBClientError("API credentials required for authenticated CLOB requests")
+
+    def _l2_headers(self, method: str, path: str, serialized_body: Optional[str] = None) -> dict:
+        """Create L2 auth headers with py-clob-client's signing."""
+        self._require_creds()
+        from py_clob_client.clob_types import RequestArgs
+        from py_clob_client.headers.headers import create_level_2_headers
+
+        request_args = RequestArgs(
+            method=method,
+            request_path=path,
+            body=None,
+            serialized_body=serialized_body,
+        )
+        return create_level_2_headers(self._signer, self._creds, request_args)
+
+    async def _signed_request(self, method: str, path: str, body: Any) -> Any:
+        """Send a body with L2 headers signed over its exact bytes."""
+        serialized = _compact(body)
+        headers = self._l2_headers(method, path, serialized)
+        return await self._request(method, path, headers=headers, content=serialized)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        content: Optional[str] = None,
+        priority: Optional[Priority] = None,
+    ) -> Any:
+        """Send a request on the pooled client and decode the JSON response.
+
+        Waits for rate limit budget first; `priority` overrides the path's
+        default priority class. A 429 pauses the endpoint for its Retry-After
+        and the request is resent when budget is available again.
+
+        Raises:
+            ConnectionError: On transport errors and timeouts (retryable).
+            RateLimitedError: When still rate limited after all retries.
+            OrderRejectedError: On 4xx responses to order posts.
+            CLOBClientError: On other error responses.
+        """
+        if self._client is None:
+            raise CLOBClientError("Transport not open. Call open() first.")
+
+        endpoint, default_priority = RATE_LIMITS.get(
+            path, (RATE_LIMIT_ENDPOINT, Priority.METADATA)
+        )
+        if priority is None:
+            priority = default_priority
+
+        for attempt in range(self._rate_limit_retries + 1):
+            await self._rate_limiter.acquire(endpoint, priority, resend=attempt > 0)
+            await self._wait_for_pause(endpoint)
+
+            try:
+                response = await self._client.request(
+                    method, path, headers=headers, params=params, content=content
+                )
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                raise ConnectionError(f"{method} {path} failed: {e}") from e
+
+            if response.status_code != 429:
+                break
+
+            retry_after = _retry_after(response)
+            self._rate_limiter.backoff(endpoint, retry_after)
+            if attempt == self._rate_limit_retries:
+                raise RateLimitedError(
+                    f"{method} {path} -> 429 after {attempt + 1} attempts: "
+                    f"{response.text[:200]}"
+                )
+            self._log.debug(
+                "clob_request_rate_limited",
+                method=method,
+                path=path,
+                attempt=attempt + 1,
+                retry_after=retry_after,
+            )
+            if self._rate_limiter.bucket(endpoint) is None:
+                # No bucket to hold the next acquire() back
+                await self._wait_for_pause(endpoint, self._pause(endpoint, retry_after))
+
+        if response.status_code >= 400:
+            detail = response.text[:200]
+            if response.status_code < 500 and method == "POST":
+                raise OrderRejectedError(f"{method} {path} -> {response.status_code}: {detail}")
+            raise CLOBClientError(f"{method} {path} -> {response.status_code}: {detail}")
+
+        if not response.content:
+            return {}
+        return response.json()
+
+    def _pause(self, endpoint: str, seconds: float) -> float:
+        """Hold an unlimited endpoint after a 429 and return this request's slot.
+
+        Pauses stack like a bucket backoff: requests throttled together are
+        resent one Retry-After apart instead of all at once.
+        """
+        now = asyncio.get_running_loop().time()
+        resume_at = max(self._resume_at.get(endpoint, now), now) + seconds
+        self._resume_at[endpoint] = resume_at
+        return resume_at
+
+    async def _wait_for_pause(self, endpoint: str, until: Optional[float] = None) -> None:
+        """Sleep until a 429 pause on an unlimited endpoint is over."""
+        if until is None:
+            until = self._resume_at.get(endpoint)
+            if until is None:
+                return
+        delay = until - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
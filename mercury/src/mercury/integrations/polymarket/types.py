@@ -57,8 +57,18 @@ class PolymarketSettings:
         clob_url: CLOB HTTP API base URL.
         gamma_url: Gamma API base URL for market discovery.
         ws_url: WebSocket URL for real-time market data.
+        user_ws_url: WebSocket URL for authenticated order and trade updates.
         polygon_rpc_url: Polygon RPC URL for chain interactions.
         http_proxy: Optional HTTP proxy for routing requests.
+        async_transport: Send order, cancel, get-orders and book requests
+            over a pooled asyncio HTTP client instead of py-clob-client's
+            synchronous session.
+        http2: Negotiate HTTP/2 on the async transport.
+        max_connections: Async transport connection pool size.
+        sign_workers: Persistent order signing workers.
+        sign_processes: Sign in a process pool instead of threads.
+        batch_window_ms: Hold dual-leg order posts this long so executions
+            signing together share batch requests (0 posts each at once).
     """
 
     private_key: str
@@ -72,10 +82,20 @@ class PolymarketSettings:
     clob_url: str = "https://clob.polymarket.com/"
     gamma_url: str = "https://gamma-api.polymarket.com"
     ws_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+    user_ws_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
     polygon_rpc_url: str = "https://polygon-rpc.com"
 
     http_proxy: Optional[str] = None
 
+    async_transport: bool = True
+    http2: bool = False
+    max_connections: int = 20
+
+    sign_workers: int = 2
+    sign_processes: bool = False
+
+    batch_window_ms: float = 0.0
+
 
 @dataclass(frozen=True)
 class MarketInfo:
@@ -344,6 +364,10 @@ class DualLegOrderResult:
     # Total execution time
     execution_time_ms: Optional[float] = None
 
+    # How the client already rebalanced a partial fill ("hedge_completed",
+    # "exited", "failed"); None if it did not
+    rebalance_action: Optional[str] = None
+
     @property
     def both_filled(self) -> bool:
         """Whether both legs completely filled."""
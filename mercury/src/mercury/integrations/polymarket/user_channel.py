@@ -0,0 +1,467 @@
+"""Polymarket authenticated user channel for order and trade updates.
+
+The user channel pushes updates for orders placed with our API key:
+
+    {"event_type": "order", "id": "0x...", "type": "PLACEMENT" | "UPDATE" |
+     "CANCELLATION", "original_size": "10", "size_matched": "4", ...}
+
+    {"event_type": "trade", "id": "...", "status": "MATCHED" | "MINED" |
+     "CONFIRMED" | "FAILED", "taker_order_id": "0x...", "size": "10",
+     "maker_orders": [{"order_id": "0x...", "matched_amount": "10"}], ...}
+
+Updates feed an OrderStateIndex, so code that used to sleep and then scan
+get_orders can await the push instead. The REST poll stays as the fallback
+when no update arrives in time or the channel is disconnected.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Optional
+
+import structlog
+import websockets
+from websockets.exceptions import ConnectionClosed, WebSocketException
+
+from mercury.core.events import EventBus
+from mercury.core.lifecycle import BaseComponent, HealthCheckResult, HealthStatus
+from mercury.integrations.polymarket.types import PolymarketSettings
+
+log = structlog.get_logger()
+
+# Connection parameters
+PING_INTERVAL = 10.0  # Server drops connections without a text PING
+RECONNECT_MIN_WAIT = 1.0
+RECONNECT_MAX_WAIT = 60.0
+MAX_TRACKED_ORDERS = 10_000
+
+_FILLED_STATUSES = ("MATCHED", "FILLED")
+_CLOSED_STATUSES = ("CANCELLED", "EXPIRED")
+
+
+@dataclass
+class TrackedOrder:
+    """Latest known state of one of our orders."""
+
+    order_id: str
+    status: str = "LIVE"
+    original_size: Decimal = Decimal("0")
+    size_matched: Decimal = Decimal("0")
+    updated_at: float = field(default_factory=time.time)
+    # Matched amount per trade ID, so repeated trade statuses count once
+    trades: dict[str, Decimal] = field(default_factory=dict)
+
+    @property
+    def is_filled(self) -> bool:
+        """Whether the order is completely matched."""
+        if self.status in _FILLED_STATUSES:
+            return True
+        return self.original_size > 0 and self.size_matched >= self.original_size
+
+    @property
+    def is_done(self) -> bool:
+        """Whether the order will receive no further fills."""
+        return self.is_filled or self.status in _CLOSED_STATUSES
+
+
+class OrderStateIndex:
+    """In-memory order state keyed by exchange order ID.
+
+    Waiters are futures resolved on the next update for their order, so a
+    fill is observed as soon as the push arrives. Updates for orders nobody
+    is waiting on are kept too: the push can beat the post_order response.
+
+    Usage:
+        index = OrderStateIndex()
+        index.expect(order_id, shares)
+        order = await index.wait_until_done(order_id, timeout=2.0)
+    """
+
+    def __init__(self, max_orders: int = MAX_TRACKED_ORDERS) -> None:
+        """Initialize an empty index.
+
+        Args:
+            max_orders: Orders kept before the oldest are evicted.
+        """
+        self._orders: OrderedDict[str, TrackedOrder] = OrderedDict()
+        self._waiters: dict[str, list[asyncio.Future]] = {}
+        self._max_orders = max_orders
+        # Set by the user channel while its connection is up
+        self.connected = False
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def get(self, order_id: str) -> Optional[TrackedOrder]:
+        """Get the latest state of an order, if any update was seen."""
+        return self._orders.get(order_id)
+
+    def expect(self, order_id: str, size: Decimal) -> TrackedOrder:
+        """Record the requested size of an order we just posted.
+
+        Trade updates carry matched amounts only; knowing the size lets
+        them complete an order without a separate order update.
+        """
+        order = self._track(order_id)
+        if order.original_size <= 0:
+            order.original_size = size
+        return order
+
+    def apply(self, message: dict[str, Any]) -> list[str]:
+        """Apply one user channel message.
+
+        Args:
+            message: Decoded "order" or "trade" event.
+
+        Returns:
+            IDs of orders whose state changed.
+        """
+        event_type = str(message.get("event_type") or "").lower()
+        if event_type == "order":
+            changed = self._apply_order(message)
+        elif event_type == "trade":
+            changed = self._apply_trade(message)
+        else:
+            return []
+
+        for order_id in changed:
+            self._notify(order_id)
+        self._evict()
+        return changed
+
+    async def wait_for_update(self, order_id: str, timeout: float) -> Optional[TrackedOrder]:
+        """Wait for the next update of an order.
+
+        Returns:
+            The updated order, or None on timeout.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(order_id, []).append(future)
+        try:
+            return await asyncio.wait_for(future, timeout=max(timeout, 0.0))
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters = self._waiters.get(order_id)
+            if waiters is not None:
+                if future in waiters:
+                    waiters.remove(future)
+                if not waiters:
+                    del self._waiters[order_id]
+
+    async def wait_until_done(self, order_id: str, timeout: float) -> Optional[TrackedOrder]:
+        """Wait until an order is filled, cancelled or expired.
+
+        Returns:
+            The order's latest state (done or not), or None if no update
+            was ever seen for it.
+        """
+        deadline = time.monotonic() + timeout
+        order = self._orders.get(order_id)
+        while order is None or not order.is_done:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            updated = await self.wait_for_update(order_id, remaining)
+            if updated is None:
+                break
+            order = updated
+        return order
+
+    def _track(self, order_id: str) -> TrackedOrder:
+        order = self._orders.get(order_id)
+        if order is None:
+            order = TrackedOrder(order_id=order_id)
+            self._orders[order_id] = order
+        else:
+            self._orders.move_to_end(order_id)
+        return order
+
+    def _apply_order(self, message: dict[str, Any]) -> list[str]:
+        order_id = str(message.get("id") or message.get("order_id") or "")
+        if not order_id:
+            return []
+
+        order = self._track(order_id)
+        if message.get("original_size") is not None:
+            order.original_size = Decimal(str(message["original_size"]))
+        if message.get("size_matched") is not None:
+            order.size_matched = max(order.size_matched, Decimal(str(message["size_matched"])))
+
+        update_type = str(message.get("type") or "").upper()
+        status = str(message.get("status") or "").upper()
+        if update_type == "CANCELLATION":
+            order.status = "CANCELLED"
+        elif status:
+            order.status = status
+        if order.status == "LIVE" and order.is_filled:
+            order.status = "MATCHED"
+
+        order.updated_at = time.time()
+        return [order_id]
+
+    def _apply_trade(self, message: dict[str, Any]) -> list[str]:
+        if str(message.get("status") or "").upper() == "FAILED":
+            return []
+
+        trade_id = str(message.get("id") or "")
+        matches: list[tuple[str, Any]] = []
+        taker_id = message.get("taker_order_id")
+        if taker_id:
+            matches.append((str(taker_id), message.get("size")))
+        for maker in message.get("maker_orders") or []:
+            if isinstance(maker, dict) and maker.get("order_id"):
+                matches.append((str(maker["order_id"]), maker.get("matched_amount")))
+
+        changed = []
+        for order_id, amount in matches:
+            # Counterparty orders are tracked too; they are never awaited
+            # and age out through eviction
+            if amount is None:
+                continue
+            order = self._track(order_id)
+            if trade_id in order.trades:
+                continue
+            order.trades[trade_id] = Decimal(str(amount))
+            order.size_matched = max(order.size_matched, sum(order.trades.values(), Decimal("0")))
+            if order.status == "LIVE" and order.is_filled:
+                order.status = "MATCHED"
+            order.updated_at = time.time()
+            changed.append(order_id)
+        return changed
+
+    def _notify(self, order_id: str) -> None:
+        order = self._orders.get(order_id)
+        for future in self._waiters.pop(order_id, []):
+            if not future.done():
+                future.set_result(order)
+
+    def _evict(self) -> None:
+        """Drop the least recently updated orders beyond max_orders."""
+        while len(self._orders) > self._max_orders:
+            order_id, _ = self._orders.popitem(last=False)
+            self._waiters.pop(order_id, None)
+
+
+class PolymarketUserChannel(BaseComponent):
+    """Authenticated WebSocket subscription to our order and trade updates.
+
+    This component:
+    - Connects to the user channel with the CLOB API credentials
+    - Feeds order and trade updates into an OrderStateIndex
+    - Keeps the connection alive with text PINGs
+    - Reconnects with exponential backoff; index.connected is False while down
+
+    Event channels published:
+    - clob.user.connected - Connection established
+    - clob.user.disconnected - Connection lost
+    """
+
+    def __init__(
+        self,
+        settings: PolymarketSettings,
+        event_bus: EventBus,
+        index: Optional[OrderStateIndex] = None,
+    ):
+        """Initialize the user channel.
+
+        Args:
+            settings: Polymarket settings with API credentials.
+            event_bus: EventBus for connection events.
+            index: Order index to feed; a new one is created if not provided.
+        """
+        super().__init__()
+        self._settings = settings
+        self._ws_url = settings.user_ws_url
+        self._event_bus = event_bus
+        self._index = index or OrderStateIndex()
+        self._log = log.bind(component="polymarket_user_ws")
+
+        self._ws: Optional[websockets.WebSocketClientProtocol] = None
+        self._reconnect_delay: float = RECONNECT_MIN_WAIT
+        self._reconnect_count = 0
+        self._messages_received = 0
+        self._should_run = False
+
+        self._message_task: Optional[asyncio.Task] = None
+        self._ping_task: Optional[asyncio.Task] = None
+
+    @property
+    def orders(self) -> OrderStateIndex:
+        """Order state index fed by this channel."""
+        return self._index
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether currently connected."""
+        return self._ws is not None and self._ws.open
+
+    async def start(self) -> None:
+        """Start receiving order and trade updates."""
+        if self._should_run:
+            return
+
+        self._should_run = True
+        self._start_time = time.time()
+        self._log.info("starting_user_channel", url=self._ws_url)
+
+        self._message_task = asyncio.create_task(self._message_loop())
+        self._ping_task = asyncio.create_task(self._ping_loop())
+
+    async def stop(self) -> None:
+        """Stop the user channel."""
+        self._should_run = False
+        self._log.info("stopping_user_channel")
+
+        for task in [self._message_task, self._ping_task]:
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        await self._disconnect()
+
+    async def health_check(self) -> HealthCheckResult:
+        """Check user channel health."""
+        details = {
+            "tracked_orders": len(self._index),
+            "messages_received": self._messages_received,
+            "reconnects": self._reconnect_count,
+        }
+        if not self._should_run:
+            return HealthCheckResult(
+                status=HealthStatus.UNHEALTHY,
+                message="User channel not running",
+                details=details,
+            )
+        if not self.is_connected:
+            return HealthCheckResult(
+                status=HealthStatus.DEGRADED,
+                message="User channel disconnected, fills tracked by polling",
+                details=details,
+            )
+        return HealthCheckResult(
+            status=HealthStatus.HEALTHY,
+            message="Receiving order updates",
+            details=details,
+        )
+
+    async def _message_loop(self) -> None:
+        """Receive messages with auto-reconnect."""
+        while self._should_run:
+            try:
+                await self._connect()
+                await self._receive_messages()
+            except asyncio.CancelledError:
+                break
+            except ConnectionClosed as e:
+                self._log.warning("user_channel_closed", code=e.code, reason=e.reason)
+                await self._handle_disconnect()
+            except WebSocketException as e:
+                self._log.warning("user_channel_error", error=str(e))
+                await self._handle_disconnect()
+            except Exception as e:
+                self._log.error("user_channel_unexpected_error", error=str(e))
+                await self._handle_disconnect()
+
+    async def _ping_loop(self) -> None:
+        """Send text PINGs to keep the connection open."""
+        while self._should_run:
+            await asyncio.sleep(PING_INTERVAL)
+            if self.is_connected:
+                try:
+                    await self._ws.send("PING")
+                except Exception as e:
+                    self._log.debug("user_channel_ping_failed", error=str(e))
+
+    async def _connect(self) -> None:
+        """Connect and authenticate."""
+        if self.is_connected:
+            return
+
+        self._log.info("connecting_user_channel", url=self._ws_url)
+        self._ws = await websockets.connect(self._ws_url, close_timeout=5.0)
+        await self._ws.send(json.dumps(self._subscribe_message()))
+
+        self._index.connected = True
+        self._reconnect_delay = RECONNECT_MIN_WAIT
+        self._log.info("user_channel_connected")
+
+        await self._event_bus.publish("clob.user.connected", {
+            "timestamp": time.time(),
+            "reconnect_count": self._reconnect_count,
+        })
+
+    def _subscribe_message(self) -> dict[str, Any]:
+        """Build the authenticated subscription for all of our markets."""
+        return {
+            "type": "user",
+            "markets": [],
+            "auth": {
+                "apiKey": self._settings.api_key,
+                "secret": self._settings.api_secret,
+                "passphrase": self._settings.api_passphrase,
+            },
+        }
+
+    async def _disconnect(self) -> None:
+        """Close the connection."""
+        self._index.connected = False
+        if self._ws is not None:
+            try:
+                await self._ws.close()
+            except Exception:
+                pass
+            self._ws = None
+
+    async def _handle_disconnect(self) -> None:
+        """Handle disconnection with exponential backoff."""
+        await self._disconnect()
+        self._reconnect_count += 1
+
+        await self._event_bus.publish("clob.user.disconnected", {
+            "timestamp": time.time(),
+            "reconnect_count": self._reconnect_count,
+        })
+
+        if self._should_run:
+            self._log.info("user_channel_reconnecting", delay=self._reconnect_delay)
+            await asyncio.sleep(self._reconnect_delay)
+            self._reconnect_delay = min(self._reconnect_delay * 2, RECONNECT_MAX_WAIT)
+
+    async def _receive_messages(self) -> None:
+        """Feed received messages into the index."""
+        if self._ws is None:
+            return
+
+        async for raw_message in self._ws:
+            self._messages_received += 1
+            try:
+                self._process_message(raw_message)
+            except Exception as e:
+                self._log.warning("user_message_processing_error", error=str(e))
+
+    def _process_message(self, raw: str) -> None:
+        """Parse a raw message (single event or batch) into the index."""
+        if raw in ("PONG", "pong"):
+            return
+
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+
+        for message in data if isinstance(data, list) else [data]:
+            if isinstance(message, dict):
+                changed = self._index.apply(message)
+                if changed:
+                    self._log.debug(
+                        "order_update_received",
+                        event_type=message.get("event_type"),
+                        order_ids=changed,
+                    )
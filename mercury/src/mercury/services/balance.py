@@ -0,0 +1,373 @@
+"""Balance Ledger - in-memory USDC balance and allowance for pre-trade checks.
+
+This service:
+- Seeds balance and allowance from the CLOB (falling back to the wallet's
+  on-chain USDC balance) when it starts
+- Holds funds for orders in flight, so checks see money already committed
+- Debits fills against their hold and releases the remainder when an order
+  is cancelled, rejected or expires
+- Credits sell proceeds and settlement claims (settlement.claimed)
+- Reconciles against the exchange every reconcile_interval_seconds in the
+  background; drift is reported as a metric and the ledger adopts the
+  exchange's values when drift exceeds drift_tolerance_usd
+
+Every check (available, can_afford, hold) is arithmetic on in-memory
+Decimals; no I/O runs on the signal or order path. Until the first seed
+succeeds nothing is known about the balance and checks pass, leaving the
+exchange to reject as before.
+
+Unwind proceeds of a one-legged fill are not reported back to the engine;
+the next reconcile picks them up.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Optional
+
+import structlog
+
+from mercury.core.config import ConfigManager
+from mercury.core.events import EventBus
+from mercury.core.lifecycle import BaseComponent, HealthCheckResult
+
+if TYPE_CHECKING:
+    from mercury.integrations.chain.client import PolygonClient
+    from mercury.integrations.polymarket.clob import CLOBClient
+    from mercury.services.metrics import MetricsEmitter
+
+log = structlog.get_logger()
+
+ZERO = Decimal("0")
+
+
+@dataclass
+class _Hold:
+    """Funds held for one order or execution."""
+
+    amount: Decimal
+    spent: Decimal = ZERO
+
+    @property
+    def remaining(self) -> Decimal:
+        return max(self.amount - self.spent, ZERO)
+
+
+class BalanceLedger(BaseComponent):
+    """Locally tracked USDC balance and allowance.
+
+    Usage:
+        ledger = BalanceLedger(config, event_bus, clob_client=clob)
+        await ledger.start()
+        if ledger.hold(trade_id, Decimal("25")):
+            ...submit...
+            ledger.fill(trade_id, cost)
+            ledger.release(trade_id)
+
+    Event channels subscribed:
+    - settlement.claimed - Redemption proceeds credited to the balance
+    """
+
+    DEFAULT_RECONCILE_INTERVAL_SECONDS = 60.0
+    DEFAULT_DRIFT_TOLERANCE_USD = 0.01
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        event_bus: Optional[EventBus] = None,
+        clob_client: Optional["CLOBClient"] = None,
+        chain_client: Optional["PolygonClient"] = None,
+        metrics_emitter: Optional["MetricsEmitter"] = None,
+    ):
+        """Initialize the ledger.
+
+        Args:
+            config: Configuration manager.
+            event_bus: Optional EventBus for settlement credits.
+            clob_client: CLOB client for balance and allowance.
+            chain_client: Optional Polygon client, used for the balance when
+                          the CLOB is not given or cannot be reached.
+            metrics_emitter: Optional MetricsEmitter for balance and drift.
+        """
+        super().__init__()
+        self._config = config
+        self._event_bus = event_bus
+        self._clob = clob_client
+        self._chain = chain_client
+        self._metrics = metrics_emitter
+        self._log = log.bind(component="balance_ledger")
+
+        self._reconcile_interval = config.get_float(
+            "balance.reconcile_interval_seconds", self.DEFAULT_RECONCILE_INTERVAL_SECONDS
+        )
+        self._drift_tolerance = Decimal(str(config.get_float(
+            "balance.drift_tolerance_usd", self.DEFAULT_DRIFT_TOLERANCE_USD
+        )))
+        self._reconcile_task: Optional[asyncio.Task[None]] = None
+
+        self._balance = ZERO
+        self._allowance = ZERO
+        self._holds: dict[str, _Hold] = {}
+        self._held = ZERO
+        self._seeded = False
+        # Running total of local balance changes, so a reconcile can tell
+        # which changes landed while its fetch was in flight
+        self._net_change = ZERO
+        self._last_drift = ZERO
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def _do_start(self) -> None:
+        """Seed the ledger and start background reconciliation."""
+        if self._event_bus is not None:
+            await self._event_bus.subscribe("settlement.claimed", self._on_settlement_claimed)
+
+        await self.seed()
+        if self._reconcile_interval > 0 and (self._clob is not None or self._chain is not None):
+            self._reconcile_task = asyncio.create_task(self._reconcile_loop())
+
+        self._log.info(
+            "balance_ledger_started",
+            seeded=self._seeded,
+            balance=str(self._balance),
+            allowance=str(self._allowance),
+        )
+
+    async def _do_stop(self) -> None:
+        """Stop background reconciliation."""
+        if self._reconcile_task is not None:
+            self._reconcile_task.cancel()
+            try:
+                await self._reconcile_task
+            except asyncio.CancelledError:
+                pass
+            self._reconcile_task = None
+        self._log.info("balance_ledger_stopped", holds=len(self._holds))
+
+    async def _do_health_check(self) -> HealthCheckResult:
+        """Report ledger state; unseeded is degraded, not unhealthy."""
+        details = {
+            "balance": str(self._balance),
+            "allowance": str(self._allowance),
+            "held": str(self._held),
+            "available": str(self.available),
+            "drift": str(self._last_drift),
+        }
+        if not self._seeded:
+            return HealthCheckResult.degraded("Balance not yet fetched", **details)
+        return HealthCheckResult.healthy("Balance tracked", **details)
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def is_seeded(self) -> bool:
+        """Whether balance and allowance have been fetched at least once."""
+        return self._seeded
+
+    @property
+    def balance(self) -> Decimal:
+        """USDC balance after local fills and credits."""
+        return self._balance
+
+    @property
+    def allowance(self) -> Decimal:
+        """USDC allowance after local fills."""
+        return self._allowance
+
+    @property
+    def held(self) -> Decimal:
+        """Funds held for orders in flight and not yet spent."""
+        return self._held
+
+    @property
+    def available(self) -> Decimal:
+        """Funds free for new orders: min(balance, allowance) less holds."""
+        return max(min(self._balance, self._allowance) - self._held, ZERO)
+
+    @property
+    def last_drift(self) -> Decimal:
+        """Drift found by the last reconcile."""
+        return self._last_drift
+
+    # =========================================================================
+    # Order lifecycle (no I/O)
+    # =========================================================================
+
+    def can_afford(self, amount: Decimal) -> bool:
+        """Whether amount is available; always True before the first seed."""
+        return not self._seeded or amount <= self.available
+
+    def hold(self, key: str, amount: Decimal) -> bool:
+        """Hold funds for an order or execution about to be submitted.
+
+        Args:
+            key: Order or trade ID the hold belongs to.
+            amount: USD to hold.
+
+        Returns:
+            False (and nothing held) if the amount is not available.
+        """
+        if not self.can_afford(amount):
+            self._log.info(
+                "balance_hold_refused",
+                key=key,
+                amount=str(amount),
+                available=str(self.available),
+            )
+            return False
+        self.release(key)
+        self._holds[key] = _Hold(amount)
+        self._held += amount
+        self._update_metrics()
+        return True
+
+    def fill(self, key: str, cost: Decimal) -> None:
+        """Debit a buy's cumulative filled cost against its hold.
+
+        Repeated calls with a growing cost debit only the increase, so
+        partial fill updates can be applied as they arrive.
+
+        Args:
+            key: Order or trade ID the hold belongs to.
+            cost: Total USD spent by the order so far.
+        """
+        hold = self._holds.get(key)
+        spent = hold.spent if hold is not None else ZERO
+        delta = cost - spent
+        if delta <= 0:
+            return
+        if hold is not None:
+            self._held -= min(delta, hold.remaining)
+            hold.spent = cost
+        self._apply(-delta)
+        self._allowance -= delta
+        self._update_metrics()
+
+    def credit(self, amount: Decimal) -> None:
+        """Credit sell proceeds or settlement to the balance."""
+        if amount <= 0:
+            return
+        self._apply(amount)
+        self._update_metrics()
+
+    def release(self, key: str) -> Decimal:
+        """Release what is left of a hold (order done, cancelled or rejected).
+
+        Returns:
+            USD released.
+        """
+        hold = self._holds.pop(key, None)
+        if hold is None:
+            return ZERO
+        remaining = hold.remaining
+        self._held = max(self._held - remaining, ZERO)
+        self._update_metrics()
+        return remaining
+
+    def _apply(self, amount: Decimal) -> None:
+        self._balance += amount
+        self._net_change += amount
+
+    # =========================================================================
+    # Seeding and reconciliation
+    # =========================================================================
+
+    async def _fetch(self) -> tuple[Decimal, Optional[Decimal]]:
+        """Fetch (balance, allowance) from the CLOB, else the chain.
+
+        The chain has no CLOB allowance; None keeps the ledger's value.
+        """
+        if self._clob is not None:
+            try:
+                raw = await self._clob.get_balance()
+                return Decimal(str(raw["balance"])), Decimal(str(raw["allowance"]))
+            except Exception as e:
+                if self._chain is None:
+                    raise
+                self._log.warning("clob_balance_fetch_failed", error=str(e))
+        if self._chain is None:
+            raise RuntimeError("No CLOB or chain client to fetch the balance from")
+        return await self._chain.get_usdc_balance(), None
+
+    async def seed(self) -> bool:
+        """Load balance and allowance from the exchange.
+
+        Returns:
+            True if the ledger is seeded.
+        """
+        if self._clob is None and self._chain is None:
+            return False
+        try:
+            await self.reconcile()
+        except Exception as e:
+            self._log.warning("balance_ledger_seed_failed", error=str(e))
+        return self._seeded
+
+    async def reconcile(self) -> Decimal:
+        """Compare the ledger with the exchange and correct drift.
+
+        Local changes applied while the fetch was in flight are carried over
+        onto the fetched balance before comparing. Drift is reported as a
+        metric on every run; the ledger adopts the exchange's values only
+        when drift exceeds the tolerance (or on the first fetch).
+
+        Returns:
+            Balance drift in USD.
+        """
+        net_before = self._net_change
+        balance, allowance = await self._fetch()
+        expected = balance + (self._net_change - net_before)
+
+        if not self._seeded:
+            drift = ZERO
+        else:
+            drift = abs(self._balance - expected)
+        self._last_drift = drift
+        if self._metrics:
+            self._metrics.update_balance_drift(drift)
+
+        if not self._seeded or drift > self._drift_tolerance:
+            if self._seeded:
+                self._log.warning(
+                    "balance_ledger_drift",
+                    drift=str(drift),
+                    ledger_balance=str(self._balance),
+                    exchange_balance=str(expected),
+                )
+            self._balance = expected
+            if allowance is not None:
+                self._allowance = allowance + (self._net_change - net_before)
+            elif not self._seeded:
+                self._allowance = expected
+            self._seeded = True
+            self._update_metrics()
+
+        return drift
+
+    async def _reconcile_loop(self) -> None:
+        """Background task that reconciles the ledger periodically."""
+        while True:
+            try:
+                await asyncio.sleep(self._reconcile_interval)
+                await self.reconcile()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._log.warning("balance_reconcile_failed", error=str(e))
+
+    async def _on_settlement_claimed(self, data: dict) -> None:
+        """Credit redemption proceeds."""
+        if data.get("dry_run"):
+            return
+        try:
+            self.credit(Decimal(str(data.get("proceeds", 0))))
+        except Exception as e:
+            self._log.error("settlement_credit_error", error=str(e), data=data)
+
+    def _update_metrics(self) -> None:
+        if self._metrics:
+            self._metrics.update_balance(self.available, self._held)
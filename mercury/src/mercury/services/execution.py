@@ -6,17 +6,26 @@ This service:
 - Manages order lifecycle (submit, fill, cancel)
 - Tracks execution latency and slippage
 - Manages order queue with priority
-- Limits concurrent executions
+- Coalesces pending signals per market and signal type (latest wins)
+- Limits concurrent executions, one at a time per market
+- Awaits fills on user channel push updates, polling REST only as a fallback
+- Matches dry-run orders against live book depth when given a SimulatedExchange
+- Holds and debits funds on a BalanceLedger, refusing live orders it cannot
+  cover before anything is sent
+- Requotes resting GTC orders by diffing desired quotes against the resting
+  ones (QuoteManager), sending only the cancels and posts that differ
 """
 
 import asyncio
+import heapq
+import itertools
 import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import structlog
 
@@ -37,18 +46,63 @@ from mercury.domain.order import (
     ExecutionLatency,
 )
 from mercury.domain.signal import ApprovedSignal, SignalType, SignalPriority
-from mercury.integrations.polymarket.clob import CLOBClient, InsufficientLiquidityError
+from mercury.integrations.polymarket.clob import (
+    CLOBClient,
+    InsufficientBalanceError,
+    InsufficientLiquidityError,
+)
+from mercury.integrations.polymarket.quoting import Quote, QuoteManager, RequoteResult
+from mercury.integrations.polymarket.simulator import SimulatedExchange
 from mercury.integrations.polymarket.types import (
     DualLegOrderResult,
     OrderResult,
     OrderSide,
     OrderStatus,
     PolymarketSettings,
+    TimeInForce,
+)
+from mercury.integrations.polymarket.user_channel import (
+    OrderStateIndex,
+    PolymarketUserChannel,
+    TrackedOrder,
 )
+from mercury.services.metrics import MetricsEmitter
+
+if TYPE_CHECKING:
+    from mercury.services.balance import BalanceLedger
 
 log = structlog.get_logger()
 
 
+_PRIORITY_ORDER = {
+    SignalPriority.CRITICAL: 0,
+    SignalPriority.HIGH: 1,
+    SignalPriority.MEDIUM: 2,
+    SignalPriority.LOW: 3,
+}
+
+
+def _coalesce_key(signal_data: dict[str, Any]) -> Optional[tuple[str, str]]:
+    """Get the (market_id, signal_type) key of signal data, if it has both."""
+    market_id = signal_data.get("market_id")
+    signal_type = signal_data.get("signal_type")
+    if not market_id or not signal_type:
+        return None
+    return (market_id, str(signal_type).upper())
+
+
+def _execution_key(signal_data: dict[str, Any]) -> Optional[str]:
+    """Get the market (or token pair) a signal's execution is serialized on."""
+    market_id = signal_data.get("market_id")
+    if market_id:
+        return market_id
+    yes_token_id = signal_data.get("yes_token_id")
+    no_token_id = signal_data.get("no_token_id")
+    if yes_token_id and no_token_id:
+        return f"{yes_token_id}:{no_token_id}"
+    return None
+
+
 class QueuedSignalStatus(str, Enum):
     """Status of a queued signal."""
 
@@ -58,6 +112,7 @@ class QueuedSignalStatus(str, Enum):
     FAILED = "failed"
     EXPIRED = "expired"
     CANCELLED = "cancelled"
+    SUPERSEDED = "superseded"
 
 
 @dataclass
@@ -80,20 +135,22 @@ class QueuedSignal:
     signal_received_at: Optional[datetime] = None
     # Latency tracker for full breakdown
     latency: Optional[ExecutionLatency] = None
+    # Set when a newer signal replaced this entry's data in place
+    refreshed_at: Optional[datetime] = None
+    superseded_count: int = 0
+
+    @property
+    def coalesce_key(self) -> Optional[tuple[str, str]]:
+        """(market_id, signal_type) used to coalesce pending signals."""
+        return _coalesce_key(self.signal_data)
 
     def __lt__(self, other: "QueuedSignal") -> bool:
         """Compare for priority queue ordering.
 
         Higher priority signals come first, then earlier queued signals.
         """
-        priority_order = {
-            SignalPriority.CRITICAL: 0,
-            SignalPriority.HIGH: 1,
-            SignalPriority.MEDIUM: 2,
-            SignalPriority.LOW: 3,
-        }
-        self_priority = priority_order.get(self.priority, 2)
-        other_priority = priority_order.get(other.priority, 2)
+        self_priority = _PRIORITY_ORDER.get(self.priority, 2)
+        other_priority = _PRIORITY_ORDER.get(other.priority, 2)
 
         if self_priority != other_priority:
             return self_priority < other_priority
@@ -144,13 +201,16 @@ class ExecutionEngine(BaseComponent):
     This service:
     1. Listens for approved signals from RiskManager
     2. Queues signals for execution with priority ordering
-    3. Manages concurrent execution limits
+    3. Runs at most one execution per market, and up to max_concurrent
+       across markets
     4. Executes orders via CLOBClient
     5. Handles dual-leg arbitrage atomically
     6. Publishes execution results to EventBus
 
     Event channels subscribed:
     - risk.approved.* - Approved signals to execute
+    - market.subscribed - Precompute order templates for the market's tokens
+    - market.orderbook.* - Arm markets near $1.00 combined ask for pre-signing
 
     Event channels published:
     - order.submitted - Order sent to exchange
@@ -159,6 +219,7 @@ class ExecutionEngine(BaseComponent):
     - position.opened - New position created
     - execution.complete - Execution finished
     - execution.queue.added - Signal added to queue
+    - execution.queue.superseded - Pending signal replaced by a newer one
     - execution.queue.started - Signal execution started
     """
 
@@ -166,12 +227,18 @@ class ExecutionEngine(BaseComponent):
     DEFAULT_MAX_CONCURRENT = 3
     DEFAULT_MAX_QUEUE_SIZE = 100
     DEFAULT_QUEUE_TIMEOUT_SECONDS = 60.0
+    DEFAULT_BATCH_WINDOW_MS = 2.0
+    DEFAULT_UNWIND_SLIPPAGE_CENTS = 2.0
 
     def __init__(
         self,
         config: ConfigManager,
         event_bus: EventBus,
         clob_client: Optional[CLOBClient] = None,
+        metrics_emitter: Optional[MetricsEmitter] = None,
+        user_channel: Optional[PolymarketUserChannel] = None,
+        simulator: Optional[SimulatedExchange] = None,
+        balance_ledger: Optional["BalanceLedger"] = None,
     ):
         """Initialize the execution engine.
 
@@ -179,10 +246,19 @@ class ExecutionEngine(BaseComponent):
             config: Configuration manager.
             event_bus: EventBus for events.
             clob_client: Optional pre-configured CLOB client.
+            metrics_emitter: Optional MetricsEmitter for queue metrics.
+            user_channel: Optional user channel for order/trade push updates.
+                          Built from the polymarket credentials when the CLOB
+                          client is built here and execution.user_channel_enabled.
+            simulator: Optional simulated exchange. In dry-run mode orders go
+                       to it instead of being filled instantly at their price.
+            balance_ledger: Optional BalanceLedger holding funds for live
+                            orders. Unused in dry-run mode.
         """
         super().__init__()
         self._config = config
         self._event_bus = event_bus
+        self._metrics = metrics_emitter
         self._log = log.bind(component="execution_engine")
 
         # CLOB client
@@ -192,14 +268,53 @@ class ExecutionEngine(BaseComponent):
                 api_key=config.get("polymarket.api_key", ""),
                 api_secret=config.get("polymarket.api_secret", ""),
                 api_passphrase=config.get("polymarket.api_passphrase", ""),
+                user_ws_url=config.get(
+                    "polymarket.user_ws_url",
+                    "wss://ws-subscriptions-clob.polymarket.com/ws/user",
+                ),
+                clob_url=config.get("polymarket.clob_url", "https://clob.polymarket.com/"),
+                async_transport=config.get_bool("polymarket.async_transport", True),
+                http2=config.get_bool("polymarket.http2", False),
+                max_connections=config.get_int("polymarket.max_connections", 20),
+                sign_workers=config.get_int("polymarket.sign_workers", 2),
+                sign_processes=config.get_bool("polymarket.sign_processes", False),
+                batch_window_ms=config.get_float(
+                    "execution.batch_window_ms", self.DEFAULT_BATCH_WINDOW_MS
+                ),
             )
-            clob_client = CLOBClient(settings)
+            if (
+                user_channel is None
+                and settings.api_key
+                and config.get_bool("execution.user_channel_enabled", True)
+            ):
+                user_channel = PolymarketUserChannel(settings, event_bus)
+            clob_client = CLOBClient(settings, metrics_emitter=metrics_emitter)
 
         self._clob = clob_client
+        self._user_channel = user_channel
+        if user_channel is not None:
+            clob_client.set_order_index(user_channel.orders)
 
         # Configuration
         self._dry_run = config.get_bool("mercury.dry_run", True)
         self._rebalance_enabled = config.get_bool("execution.rebalance_partial_fills", True)
+        self._prebuild_unwinds = config.get_bool("execution.prebuild_unwinds", True)
+        self._unwind_slippage_cents = Decimal(str(config.get_float(
+            "execution.unwind_slippage_cents", self.DEFAULT_UNWIND_SLIPPAGE_CENTS
+        )))
+
+        # Dry runs with a simulator take the live order path against it;
+        # without one, fills are faked at the requested price
+        self._simulator = simulator if self._dry_run else None
+        self._order_updates: Optional[OrderStateIndex] = (
+            user_channel.orders if user_channel is not None else None
+        )
+        if self._simulator is not None:
+            self._clob = self._simulator
+            self._order_updates = self._simulator.orders
+
+        # Dry runs spend nothing, so there is nothing to hold
+        self._balance_ledger = balance_ledger if not self._dry_run else None
 
         # Queue configuration
         self._max_concurrent = config.get_int(
@@ -211,6 +326,30 @@ class ExecutionEngine(BaseComponent):
         self._queue_timeout = config.get_float(
             "execution.queue_timeout_seconds", self.DEFAULT_QUEUE_TIMEOUT_SECONDS
         )
+        # A newer signal for the same market and signal type replaces a
+        # pending one in place instead of queueing behind it
+        self._coalesce_signals = config.get_bool("execution.coalesce_signals", True)
+        # At most one in-flight execution per market; a signal popped while its
+        # market is busy waits aside without holding a global permit
+        self._serialize_markets = config.get_bool("execution.serialize_markets", True)
+
+        # Speculative pre-signing: markets whose combined ask is within
+        # presign_arm_cents of $1.00 get orders for presign_size_usd signed
+        # in the background (0 disables)
+        self._presign_size_usd = Decimal(str(config.get_float("execution.presign_size_usd", 0.0)))
+        self._presign_arm_cents = Decimal(str(config.get_float("execution.presign_arm_cents", 3.0)))
+        self._presign_levels = config.get_int("execution.presign_levels", 2)
+        self._presign_ttl = config.get_float("execution.presign_ttl_seconds", 5.0)
+
+        # Resting quotes; without an exchange, diffs are applied in place
+        self._quotes = QuoteManager(
+            self._clob,
+            order_index=self._order_updates,
+            size_tolerance=Decimal(str(config.get_float("execution.requote_size_tolerance", 0.0))),
+            min_interval_seconds=config.get_float("execution.requote_min_interval_ms", 0.0) / 1000,
+            dry_run=self._fake_fills,
+            metrics_emitter=metrics_emitter,
+        )
 
         # State
         self._pending_orders: dict[str, OrderResult] = {}
@@ -222,15 +361,29 @@ class ExecutionEngine(BaseComponent):
             maxsize=self._max_queue_size
         )
         self._queue_items: dict[str, QueuedSignal] = {}  # Track queued items by ID
+        # Pending entries by (market_id, signal_type) for coalescing
+        self._pending_by_key: dict[tuple[str, str], QueuedSignal] = {}
         self._active_executions: dict[str, asyncio.Task] = {}  # Currently executing
         self._execution_semaphore: Optional[asyncio.Semaphore] = None
+        self._busy_markets: set[str] = set()  # Markets with an execution in flight
+        self._deferred: dict[str, list[QueuedSignal]] = {}  # market -> heap of waiting
+        self._deferred_count = 0
+        # Expiry deadline heap: (monotonic deadline, seq, signal_id, entry)
+        self._deadlines: list[tuple[float, int, str, QueuedSignal]] = []
+        self._deadline_seq = itertools.count()
+        self._expiry_timer: Optional[asyncio.TimerHandle] = None
         self._queue_processor_task: Optional[asyncio.Task] = None
+        self._template_tasks: set[asyncio.Task] = set()
+        self._market_tokens: dict[str, tuple[str, str]] = {}  # market_id -> (yes, no)
+        self._armed: dict[str, tuple[Decimal, Decimal]] = {}  # market_id -> armed asks
+        self._arm_tasks: dict[str, asyncio.Task] = {}
 
         # Metrics
         self._total_queued = 0
         self._total_executed = 0
         self._total_failed = 0
         self._total_expired = 0
+        self._total_superseded = 0
 
         # Latency tracking
         self._last_latency: Optional[ExecutionLatency] = None
@@ -251,12 +404,20 @@ class ExecutionEngine(BaseComponent):
         # Initialize semaphore for concurrent execution limits
         self._execution_semaphore = asyncio.Semaphore(self._max_concurrent)
 
-        # Connect to CLOB
+        # Connect to CLOB and the user channel for fill updates
         if not self._dry_run:
             await self._clob.connect()
+            if self._user_channel is not None:
+                await self._user_channel.start()
+        elif self._simulator is not None:
+            await self._simulator.connect()
 
         # Subscribe to approved signals
         await self._event_bus.subscribe("risk.approved.*", self._on_approved_signal)
+        if not self._dry_run:
+            await self._event_bus.subscribe("market.subscribed", self._on_market_subscribed)
+            if self._presign_size_usd > 0:
+                await self._event_bus.subscribe("market.orderbook.*", self._on_orderbook_snapshot)
 
         # Start queue processor
         self._queue_processor_task = asyncio.create_task(self._process_queue())
@@ -275,6 +436,12 @@ class ExecutionEngine(BaseComponent):
                 await self._queue_processor_task
             except asyncio.CancelledError:
                 pass
+        for task in [*self._template_tasks, *self._arm_tasks.values()]:
+            task.cancel()
+        await self._quotes.close()
+        if self._expiry_timer is not None:
+            self._expiry_timer.cancel()
+            self._expiry_timer = None
 
         # Wait for active executions to complete (with timeout)
         if self._active_executions:
@@ -293,11 +460,13 @@ class ExecutionEngine(BaseComponent):
                     task.cancel()
 
         # Cancel pending orders
-        if not self._dry_run and self._pending_orders:
+        if not self._fake_fills and self._pending_orders:
             self._log.info("cancelling_pending_orders", count=len(self._pending_orders))
             await self._clob.cancel_all_orders()
 
         # Close CLOB connection
+        if self._user_channel is not None:
+            await self._user_channel.stop()
         await self._clob.close()
 
         self._log.info(
@@ -309,7 +478,7 @@ class ExecutionEngine(BaseComponent):
 
     async def _do_health_check(self) -> HealthCheckResult:
         """Component-specific health check."""
-        queue_size = self._queue.qsize()
+        queue_size = self.get_queue_size()
         active_count = len(self._active_executions)
 
         details = {
@@ -322,7 +491,10 @@ class ExecutionEngine(BaseComponent):
             "total_executed": self._total_executed,
             "total_failed": self._total_failed,
             "total_expired": self._total_expired,
+            "total_superseded": self._total_superseded,
             "dry_run": self._dry_run,
+            "simulated": self._simulator is not None,
+            "user_channel_connected": self._fill_updates_live,
         }
 
         if self._dry_run:
@@ -376,14 +548,28 @@ class ExecutionEngine(BaseComponent):
         trade_id = f"trade-{uuid.uuid4().hex[:8]}"
         position_id = f"pos-{uuid.uuid4().hex[:8]}"
 
+        ledger = self._balance_ledger
+        if ledger is not None and not ledger.hold(trade_id, signal.target_size_usd):
+            return ExecutionResult(
+                success=False,
+                signal_id=signal.signal_id,
+                error=(
+                    f"Insufficient available balance: "
+                    f"${ledger.available:.2f} < ${signal.target_size_usd:.2f}"
+                ),
+                execution_time_ms=time.time() * 1000 - start_time,
+            )
+
         try:
-            if self._dry_run:
+            if self._fake_fills:
                 result = await self._execute_dry_run(signal, trade_id, position_id)
             elif signal.signal_type == SignalType.ARBITRAGE:
                 result = await self._execute_dual_leg(signal, trade_id, position_id)
             else:
                 result = await self._execute_single_leg(signal, trade_id, position_id)
 
+            if ledger is not None:
+                ledger.fill(trade_id, result.total_cost)
             result.execution_time_ms = time.time() * 1000 - start_time
 
             # Publish completion
@@ -406,6 +592,9 @@ class ExecutionEngine(BaseComponent):
                 error=str(e),
                 execution_time_ms=time.time() * 1000 - start_time,
             )
+        finally:
+            if ledger is not None:
+                ledger.release(trade_id)
 
     # =========================================================================
     # Single Order Execution (FOK/GTC Support)
@@ -477,6 +666,18 @@ class ExecutionEngine(BaseComponent):
         await self._emit_order_event("order.pending", order)
 
         try:
+            # Hold the cost of a buy; refused without a request to the exchange
+            ledger = self._balance_ledger
+            cost = order.requested_size * order.price
+            if (
+                ledger is not None
+                and order.side == DomainOrderSide.BUY
+                and not ledger.hold(order.order_id, cost)
+            ):
+                raise InsufficientBalanceError(
+                    f"Insufficient available balance: ${ledger.available:.2f} < ${cost:.2f}"
+                )
+
             # Submit order
             order = await self._submit_order(order, order_request)
 
@@ -551,7 +752,7 @@ class ExecutionEngine(BaseComponent):
 
         await self._emit_order_event("order.submitted", order)
 
-        if self._dry_run:
+        if self._fake_fills:
             # In dry-run mode, simulate immediate fill
             self._log.info("dry_run_order_submitted", order_id=order.order_id)
             return order
@@ -564,11 +765,17 @@ class ExecutionEngine(BaseComponent):
             side=clob_side,
             amount_shares=order_request.size,
             price=order_request.price,
+            time_in_force=(
+                TimeInForce.FOK if order_request.order_type == OrderType.FOK else TimeInForce.GTC
+            ),
         )
 
         # Update order with CLOB response
         if clob_result.order_id:
             # Keep our internal order_id but track exchange order_id in metadata
+            order.exchange_order_id = clob_result.order_id
+            if self._fill_updates_live:
+                self._order_updates.expect(clob_result.order_id, order.requested_size)
             self._log.info(
                 "order_submitted_to_clob",
                 internal_order_id=order.order_id,
@@ -594,7 +801,7 @@ class ExecutionEngine(BaseComponent):
         Returns:
             Updated order with final status.
         """
-        if self._dry_run:
+        if self._fake_fills:
             # Simulate immediate fill in dry-run mode
             order.filled_size = order.requested_size
             order.status = DomainOrderStatus.FILLED
@@ -603,20 +810,37 @@ class ExecutionEngine(BaseComponent):
             await self._emit_order_event("order.filled", order)
             return order
 
-        # Wait briefly for immediate fill
-        await asyncio.sleep(min(timeout, 2.0))
+        # Wait briefly for immediate fill, returning early on a push update
+        wait = min(timeout, 2.0)
+        if self._fill_updates_live and order.exchange_order_id:
+            tracked = await self._order_updates.wait_until_done(order.exchange_order_id, wait)
+            if tracked is not None and tracked.is_done:
+                if tracked.is_filled:
+                    order.filled_size = order.requested_size
+                    order.status = DomainOrderStatus.FILLED
+                    order.updated_at = datetime.now(timezone.utc)
+                    await self._emit_order_event("order.filled", order)
+                else:
+                    order.status = DomainOrderStatus.EXPIRED
+                    order.updated_at = datetime.now(timezone.utc)
+                    await self._emit_order_event("order.expired", order)
+                    self._log.info("fok_order_expired", order_id=order.order_id)
+                return order
+        else:
+            await asyncio.sleep(wait)
 
         # Check order status from CLOB
         try:
             open_orders = await self._clob.get_open_orders()
             order_still_open = any(
-                o.get("id") == order.order_id or o.get("client_order_id") == order.client_order_id
+                o.get("id") in (order.order_id, order.exchange_order_id)
+                or o.get("client_order_id") == order.client_order_id
                 for o in open_orders
             )
 
             if order_still_open:
                 # FOK not filled - cancel and mark as expired
-                await self._clob.cancel_order(order.order_id)
+                await self._clob.cancel_order(order.exchange_order_id or order.order_id)
                 order.status = DomainOrderStatus.EXPIRED
                 order.updated_at = datetime.now(timezone.utc)
 
@@ -647,7 +871,9 @@ class ExecutionEngine(BaseComponent):
         """Handle Good-Til-Cancelled order execution.
 
         GTC orders remain on the book until filled or explicitly cancelled.
-        This method waits for the order to fill (with polling) or times out.
+        This method waits for the order to fill or times out. With a connected
+        user channel it waits on push updates and checks open orders once at
+        the end; otherwise it polls open orders.
 
         Args:
             order: The submitted order.
@@ -656,7 +882,7 @@ class ExecutionEngine(BaseComponent):
         Returns:
             Updated order with final status.
         """
-        if self._dry_run:
+        if self._fake_fills:
             # Simulate fill in dry-run mode
             await asyncio.sleep(0.05)  # Small delay to simulate latency
             order.filled_size = order.requested_size
@@ -666,46 +892,20 @@ class ExecutionEngine(BaseComponent):
             await self._emit_order_event("order.filled", order)
             return order
 
-        start_time = time.time()
-        poll_interval = 0.5  # Poll every 500ms
-
-        while time.time() - start_time < timeout:
-            try:
-                open_orders = await self._clob.get_open_orders()
-                order_found = None
-
-                for o in open_orders:
-                    oid = o.get("id") if isinstance(o, dict) else getattr(o, "id", None)
-                    if oid == order.order_id:
-                        order_found = o
-                        break
-
-                if order_found is None:
-                    # Order no longer in open orders - assume filled
-                    order.filled_size = order.requested_size
-                    order.status = DomainOrderStatus.FILLED
-                    order.updated_at = datetime.now(timezone.utc)
+        if self._fill_updates_live and order.exchange_order_id:
+            if await self._await_gtc_updates(order, timeout):
+                return order
+            # No terminal update in time: fall back to a single REST check
+            if await self._poll_gtc_order(order):
+                return order
+        else:
+            start_time = time.time()
+            poll_interval = 0.5  # Poll every 500ms
 
-                    await self._emit_order_event("order.filled", order)
+            while time.time() - start_time < timeout:
+                if await self._poll_gtc_order(order):
                     return order
-
-                # Check for partial fills
-                if isinstance(order_found, dict):
-                    filled_size = Decimal(str(order_found.get("size_matched", 0) or 0))
-                else:
-                    filled_size = Decimal(str(getattr(order_found, "size_matched", 0) or 0))
-
-                if filled_size > order.filled_size:
-                    order.filled_size = filled_size
-                    order.status = DomainOrderStatus.PARTIALLY_FILLED
-                    order.updated_at = datetime.now(timezone.utc)
-
-                    await self._emit_order_event("order.partially_filled", order)
-
-            except Exception as e:
-                self._log.warning("gtc_poll_error", order_id=order.order_id, error=str(e))
-
-            await asyncio.sleep(poll_interval)
+                await asyncio.sleep(poll_interval)
 
         # Timeout reached - order still open, mark as open/partially filled
         if order.filled_size == Decimal("0"):
@@ -724,6 +924,149 @@ class ExecutionEngine(BaseComponent):
 
         return order
 
+    async def _poll_gtc_order(self, order: Order) -> bool:
+        """Check a GTC order against open orders on the CLOB.
+
+        Emits order.partially_filled / order.filled as appropriate.
+
+        Returns:
+            True if the order is finished (no longer open).
+        """
+        try:
+            open_orders = await self._clob.get_open_orders()
+            order_found = None
+
+            for o in open_orders:
+                oid = o.get("id") if isinstance(o, dict) else getattr(o, "id", None)
+                if oid in (order.order_id, order.exchange_order_id):
+                    order_found = o
+                    break
+
+            if order_found is None:
+                # Order no longer in open orders - assume filled
+                order.filled_size = order.requested_size
+                order.status = DomainOrderStatus.FILLED
+                order.updated_at = datetime.now(timezone.utc)
+
+                await self._emit_order_event("order.filled", order)
+                return True
+
+            # Check for partial fills
+            if isinstance(order_found, dict):
+                filled_size = Decimal(str(order_found.get("size_matched", 0) or 0))
+            else:
+                filled_size = Decimal(str(getattr(order_found, "size_matched", 0) or 0))
+
+            if filled_size >= order.requested_size:
+                order.filled_size = order.requested_size
+                order.status = DomainOrderStatus.FILLED
+                order.updated_at = datetime.now(timezone.utc)
+
+                await self._emit_order_event("order.filled", order)
+                return True
+
+            if filled_size > order.filled_size:
+                order.filled_size = filled_size
+                order.status = DomainOrderStatus.PARTIALLY_FILLED
+                order.updated_at = datetime.now(timezone.utc)
+
+                await self._emit_order_event("order.partially_filled", order)
+
+        except Exception as e:
+            self._log.warning("gtc_poll_error", order_id=order.order_id, error=str(e))
+
+        return False
+
+    async def _await_gtc_updates(self, order: Order, timeout: float) -> bool:
+        """Follow a GTC order through user channel updates.
+
+        Emits order.partially_filled on each increase of the matched size and
+        order.filled / order.cancelled when the order is done. Stops early if
+        the channel disconnects.
+
+        Returns:
+            True if the order finished within the timeout.
+        """
+        index = self._order_updates
+        deadline = time.monotonic() + timeout
+        tracked: Optional[TrackedOrder] = index.get(order.exchange_order_id)
+
+        while True:
+            if tracked is not None:
+                if await self._apply_tracked_order(order, tracked):
+                    return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not index.connected:
+                return False
+            tracked = await index.wait_for_update(order.exchange_order_id, remaining)
+
+    async def _apply_tracked_order(self, order: Order, tracked: TrackedOrder) -> bool:
+        """Apply a user channel update to an order.
+
+        Returns:
+            True if the order is finished.
+        """
+        # The index mutates the tracked order in place, so read it before
+        # any await: a later update must not mix with this one
+        is_filled = tracked.is_filled
+        size_matched = tracked.size_matched
+        is_done = tracked.is_done
+
+        if is_filled:
+            order.filled_size = order.requested_size
+            order.status = DomainOrderStatus.FILLED
+            order.updated_at = datetime.now(timezone.utc)
+            await self._emit_order_event("order.filled", order)
+            return True
+
+        if size_matched > order.filled_size:
+            order.filled_size = min(size_matched, order.requested_size)
+            order.status = DomainOrderStatus.PARTIALLY_FILLED
+            order.updated_at = datetime.now(timezone.utc)
+            await self._emit_order_event("order.partially_filled", order)
+            # The rest may have filled while the event was published
+            if tracked.is_filled:
+                return await self._apply_tracked_order(order, tracked)
+
+        if is_done:
+            order.status = DomainOrderStatus.CANCELLED
+            order.updated_at = datetime.now(timezone.utc)
+            await self._emit_order_event("order.cancelled", order)
+            return True
+
+        return False
+
+    @property
+    def _fill_updates_live(self) -> bool:
+        """Whether fills can be awaited on user channel updates."""
+        return self._order_updates is not None and self._order_updates.connected
+
+    @property
+    def quotes(self) -> QuoteManager:
+        """Resting quote manager."""
+        return self._quotes
+
+    async def requote(self, market_id: str, quotes: list[Quote]) -> RequoteResult:
+        """Bring a market's resting GTC orders in line with the given quotes.
+
+        Only levels that differ are cancelled or posted, in batches; levels
+        that match keep their queue position. Requotes for a market that
+        arrive while one is in flight coalesce to the latest.
+
+        Args:
+            market_id: Market the quotes belong to.
+            quotes: Every quote wanted for the market.
+
+        Returns:
+            RequoteResult of the pass that applied these quotes (or newer).
+        """
+        return await self._quotes.requote(market_id, quotes)
+
+    @property
+    def _fake_fills(self) -> bool:
+        """Whether orders are filled in place instead of sent to an exchange."""
+        return self._dry_run and self._simulator is None
+
     async def _emit_order_event(
         self,
         event_type: str,
@@ -757,6 +1100,9 @@ class ExecutionEngine(BaseComponent):
 
         await self._event_bus.publish(event_type, event_data)
 
+        if self._balance_ledger is not None:
+            self._update_balance(order)
+
         # Track open orders
         if event_type == "order.submitted" or order.status in (
             DomainOrderStatus.SUBMITTED,
@@ -781,6 +1127,29 @@ class ExecutionEngine(BaseComponent):
             status=order.status.value,
         )
 
+    def _update_balance(self, order: Order) -> None:
+        """Apply an order's fills to the balance ledger.
+
+        Buys debit their cumulative filled cost against the order's hold as
+        fills arrive; sells credit their proceeds once the order is done.
+        The rest of a hold is released on terminal states.
+        """
+        ledger = self._balance_ledger
+        filled_value = order.filled_size * order.price
+        terminal = order.status in (
+            DomainOrderStatus.FILLED,
+            DomainOrderStatus.CANCELLED,
+            DomainOrderStatus.REJECTED,
+            DomainOrderStatus.EXPIRED,
+        )
+        if order.side == DomainOrderSide.BUY:
+            ledger.fill(order.order_id, filled_value)
+        elif terminal and order.order_id in self._open_orders:
+            # Still tracked only until its first terminal event
+            ledger.credit(filled_value)
+        if terminal:
+            ledger.release(order.order_id)
+
     def _create_fills_from_order(self, order: Order) -> list[Fill]:
         """Create Fill objects from an order's filled size.
 
@@ -1005,6 +1374,7 @@ class ExecutionEngine(BaseComponent):
         Returns:
             DualLegResult indicating failure with unwind details.
         """
+        detected = time.perf_counter()
         await self._event_bus.publish("order.dual_leg.partial", {
             "filled_side": filled_side,
             "filled_order_id": filled_result.order.order_id,
@@ -1035,8 +1405,13 @@ class ExecutionEngine(BaseComponent):
             unwind_result = await self.execute_order(unwind_order, timeout=timeout)
 
             latency_ms = (time.time() - start_time) * 1000
+            unwound = (
+                unwind_result.success
+                and unwind_result.order.status == DomainOrderStatus.FILLED
+            )
+            self._record_time_to_flat(detected, "exited" if unwound else "failed")
 
-            if unwind_result.success and unwind_result.order.status == DomainOrderStatus.FILLED:
+            if unwound:
                 self._log.info(
                     "unwind_successful",
                     unwind_order_id=unwind_result.order.order_id,
@@ -1087,6 +1462,7 @@ class ExecutionEngine(BaseComponent):
 
         except Exception as e:
             latency_ms = (time.time() - start_time) * 1000
+            self._record_time_to_flat(detected, "failed")
             self._log.error("unwind_exception", error=str(e))
 
             await self._event_bus.publish("order.dual_leg.failed", {
@@ -1209,10 +1585,17 @@ class ExecutionEngine(BaseComponent):
                 amount_usd=signal.target_size_usd,
                 yes_price=signal.yes_price,
                 no_price=signal.no_price,
+                handle_partial_fills=self._rebalance_enabled,
+                max_slippage_cents=self._unwind_slippage_cents,
+                prebuild_unwind=self._prebuild_unwinds,
             )
 
-            # Handle partial fills
-            if result.has_partial_fill and self._rebalance_enabled:
+            # Handle partial fills the client left to us
+            if (
+                result.has_partial_fill
+                and self._rebalance_enabled
+                and result.rebalance_action is None
+            ):
                 self._log.warning("partial_fill_detected", trade_id=trade_id)
                 await self._handle_partial_fill(result, signal)
 
@@ -1332,28 +1715,128 @@ class ExecutionEngine(BaseComponent):
         result: DualLegOrderResult,
         signal: ExecutionSignal,
     ) -> None:
-        """Handle partial fill by attempting rebalance."""
-        if result.yes_result.filled_size > 0 and result.no_result.filled_size == 0:
-            # YES filled, NO didn't
+        """Handle partial fill by rebalancing the leg that filled more."""
+        detected = time.perf_counter()
+        excess = result.yes_result.filled_size - result.no_result.filled_size
+        if excess > 0:
+            # YES filled more than NO
             rebalance = await self._clob.rebalance_partial_fill(
                 filled_token_id=signal.yes_token_id,
                 unfilled_token_id=signal.no_token_id,
-                filled_shares=result.yes_result.filled_size,
+                filled_shares=excess,
                 filled_price=result.yes_result.requested_price,
                 unfilled_price=result.no_result.requested_price,
+                max_slippage_cents=self._unwind_slippage_cents,
             )
-            self._log.info("rebalance_result", action=rebalance.get("action"))
 
-        elif result.no_result.filled_size > 0 and result.yes_result.filled_size == 0:
-            # NO filled, YES didn't
+        elif excess < 0:
+            # NO filled more than YES
             rebalance = await self._clob.rebalance_partial_fill(
                 filled_token_id=signal.no_token_id,
                 unfilled_token_id=signal.yes_token_id,
-                filled_shares=result.no_result.filled_size,
+                filled_shares=-excess,
                 filled_price=result.no_result.requested_price,
                 unfilled_price=result.yes_result.requested_price,
+                max_slippage_cents=self._unwind_slippage_cents,
+            )
+        else:
+            return
+
+        self._log.info("rebalance_result", action=rebalance.get("action"))
+        self._record_time_to_flat(detected, rebalance.get("action", "failed"))
+
+    def _record_time_to_flat(self, detected: float, action: str) -> None:
+        """Record time from a one-legged fill being seen (perf_counter) to its unwind."""
+        if self._metrics:
+            self._metrics.record_unwind_time_to_flat(
+                (time.perf_counter() - detected) * 1000, action, prebuilt=False
+            )
+
+    async def _on_market_subscribed(self, data: dict) -> None:
+        """Precompute order templates for a newly subscribed market."""
+        token_ids = [t for t in (data.get("yes_token_id"), data.get("no_token_id")) if t]
+        if len(token_ids) != 2:
+            return
+        self._market_tokens[data.get("market_id", "")] = (token_ids[0], token_ids[1])
+        # Template lookups are HTTP calls; don't hold up the publisher
+        task = asyncio.create_task(self._clob.prepare_order_templates(token_ids))
+        self._template_tasks.add(task)
+        task.add_done_callback(self._template_tasks.discard)
+
+    async def _on_orderbook_snapshot(self, data: dict) -> None:
+        """Arm markets near the arbitrage threshold, disarm those that move away."""
+        market_id = data.get("market_id")
+        yes_ask, no_ask = data.get("yes_best_ask"), data.get("no_best_ask")
+        if not market_id or yes_ask is None or no_ask is None:
+            return
+
+        yes_ask, no_ask = Decimal(str(yes_ask)), Decimal(str(no_ask))
+        if yes_ask + no_ask <= Decimal("1") + self._presign_arm_cents / 100:
+            if self._armed.get(market_id) != (yes_ask, no_ask):
+                self.arm_market(market_id, yes_ask, no_ask)
+        elif market_id in self._armed:
+            self.disarm_market(market_id)
+
+    def arm_market(
+        self,
+        market_id: str,
+        yes_price: Decimal,
+        no_price: Decimal,
+        amount_usd: Optional[Decimal] = None,
+    ) -> bool:
+        """Pre-sign dual-leg orders for a market in the background.
+
+        A later signal for the same size at an armed price submits without
+        signing. Re-arming while a previous arm is still signing is skipped.
+
+        Args:
+            market_id: Market to arm (its tokens come from market.subscribed).
+            yes_price: Current YES ask.
+            no_price: Current NO ask.
+            amount_usd: Signal size to sign for (default execution.presign_size_usd).
+
+        Returns:
+            True if arming was started.
+        """
+        tokens = self._market_tokens.get(market_id)
+        amount_usd = amount_usd or self._presign_size_usd
+        running = self._arm_tasks.get(market_id)
+        if tokens is None or amount_usd <= 0 or (running and not running.done()):
+            return False
+
+        self._armed[market_id] = (yes_price, no_price)
+        task = asyncio.create_task(self._arm(market_id, tokens, yes_price, no_price, amount_usd))
+        self._arm_tasks[market_id] = task
+        return True
+
+    def disarm_market(self, market_id: str) -> None:
+        """Drop a market's pre-signed orders."""
+        self._armed.pop(market_id, None)
+        tokens = self._market_tokens.get(market_id)
+        if tokens is not None:
+            self._clob.disarm_market(*tokens)
+
+    async def _arm(
+        self,
+        market_id: str,
+        tokens: tuple[str, str],
+        yes_price: Decimal,
+        no_price: Decimal,
+        amount_usd: Decimal,
+    ) -> None:
+        try:
+            await self._clob.arm_market(
+                tokens[0],
+                tokens[1],
+                amount_usd,
+                yes_price,
+                no_price,
+                levels=self._presign_levels,
+                ttl_seconds=self._presign_ttl,
             )
-            self._log.info("rebalance_result", action=rebalance.get("action"))
+        except Exception as e:
+            self._armed.pop(market_id, None)
+            self._log.warning("arm_market_failed", market_id=market_id, error=str(e))
 
     async def _on_approved_signal(self, data: dict) -> None:
         """Handle approved signal from RiskManager by queueing for execution."""
@@ -1387,8 +1870,14 @@ class ExecutionEngine(BaseComponent):
             priority: Execution priority.
             signal_received_at: When the signal was first received (for latency tracking).
 
+        If coalescing is enabled and a signal for the same market and signal
+        type is still pending, the new signal replaces it in place: it keeps
+        the pending entry's queue position but takes the new signal's ID,
+        prices and size. A newer signal with higher priority than the pending
+        one is queued at its own priority and the pending entry is dropped.
+
         Returns:
-            True if queued successfully, False if queue is full.
+            True if queued (or coalesced) successfully, False if queue is full.
         """
         if signal_id in self._queue_items:
             self._log.warning("signal_already_queued", signal_id=signal_id)
@@ -1398,6 +1887,15 @@ class ExecutionEngine(BaseComponent):
         now = datetime.now(timezone.utc)
         received_at = signal_received_at or now
 
+        if self._coalesce_signals:
+            pending = self._pending_by_key.get(_coalesce_key(signal_data))
+            if pending is not None and pending.status == QueuedSignalStatus.PENDING:
+                if _PRIORITY_ORDER.get(priority, 2) >= _PRIORITY_ORDER.get(pending.priority, 2):
+                    await self._supersede(pending, signal_id, signal_data, received_at, now)
+                    return True
+                # Outranks the pending entry: drop it and queue normally below
+                self._drop_superseded(pending, signal_id)
+
         # Initialize latency tracker
         latency = ExecutionLatency(
             signal_id=signal_id,
@@ -1414,21 +1912,28 @@ class ExecutionEngine(BaseComponent):
         )
 
         try:
+            # Deferred signals re-enter the queue, so they count against its size
+            if self.is_queue_full():
+                raise asyncio.QueueFull
             self._queue.put_nowait(queued_signal)
             self._queue_items[signal_id] = queued_signal
+            self._track_deadline(queued_signal)
+            key = queued_signal.coalesce_key
+            if key is not None:
+                self._pending_by_key[key] = queued_signal
             self._total_queued += 1
 
             self._log.info(
                 "signal_queued",
                 signal_id=signal_id,
                 priority=priority.value,
-                queue_size=self._queue.qsize(),
+                queue_size=self.get_queue_size(),
             )
 
             await self._event_bus.publish("execution.queue.added", {
                 "signal_id": signal_id,
                 "priority": priority.value,
-                "queue_size": self._queue.qsize(),
+                "queue_size": self.get_queue_size(),
                 "queued_at": queued_signal.queued_at.isoformat(),
                 "signal_received_at": received_at.isoformat(),
             })
@@ -1447,54 +1952,112 @@ class ExecutionEngine(BaseComponent):
             })
             return False
 
+    async def _supersede(
+        self,
+        pending: QueuedSignal,
+        signal_id: str,
+        signal_data: dict[str, Any],
+        received_at: datetime,
+        now: datetime,
+    ) -> None:
+        """Replace a pending queue entry's signal with a newer one.
+
+        The entry object stays in the priority queue, so its priority and
+        queued_at (and therefore its position) are unchanged. Expiry is
+        measured from the refresh.
+        """
+        old_signal_id = pending.signal_id
+        self._queue_items.pop(old_signal_id, None)
+
+        pending.signal_id = signal_id
+        pending.signal_data = signal_data
+        pending.signal_received_at = received_at
+        pending.refreshed_at = now
+        pending.superseded_count += 1
+        pending.latency = ExecutionLatency(
+            signal_id=signal_id,
+            signal_received_at=received_at,
+            queue_entered_at=now,
+        )
+        self._queue_items[signal_id] = pending
+        self._track_deadline(pending)
+        # Same queue entry: counted as a superseded signal, not a new entry
+        self._total_superseded += 1
+
+        market_id, signal_type = pending.coalesce_key
+        if self._metrics:
+            self._metrics.record_execution_signal_superseded(signal_type)
+
+        self._log.info(
+            "signal_superseded",
+            signal_id=signal_id,
+            superseded_signal_id=old_signal_id,
+            market_id=market_id,
+            superseded_count=pending.superseded_count,
+        )
+
+        await self._event_bus.publish("execution.queue.superseded", {
+            "signal_id": signal_id,
+            "superseded_signal_id": old_signal_id,
+            "market_id": market_id,
+            "signal_type": signal_type,
+            "queue_size": self.get_queue_size(),
+        })
+
+    def _drop_superseded(self, pending: QueuedSignal, signal_id: str) -> None:
+        """Retire a pending entry outranked by a newer signal for its key.
+
+        The entry stays in the priority queue and is discarded when popped.
+        """
+        pending.status = QueuedSignalStatus.SUPERSEDED
+        self._queue_items.pop(pending.signal_id, None)
+        self._release_coalesce_key(pending)
+        self._total_superseded += 1
+
+        market_id, signal_type = pending.coalesce_key
+        if self._metrics:
+            self._metrics.record_execution_signal_superseded(signal_type)
+        self._log.info(
+            "signal_superseded",
+            signal_id=signal_id,
+            superseded_signal_id=pending.signal_id,
+            market_id=market_id,
+            priority_raised=True,
+        )
+
+    def _release_coalesce_key(self, queued_signal: QueuedSignal) -> None:
+        """Stop routing newer signals into an entry that left the pending state."""
+        key = queued_signal.coalesce_key
+        if key is not None and self._pending_by_key.get(key) is queued_signal:
+            del self._pending_by_key[key]
+
     async def _process_queue(self) -> None:
         """Background task that processes the execution queue.
 
-        Continuously pulls signals from the queue and executes them,
-        respecting the concurrent execution limit.
+        Takes a global execution permit first and then the best queued
+        signal, so the signal started is the highest priority one at the
+        moment a permit frees up. A signal whose market already has an
+        execution in flight is set aside until that execution completes and
+        the permit goes to the next signal, so other markets keep running.
         """
         self._log.info("queue_processor_started")
 
         while self._should_run:
             try:
-                # Wait for a signal from the queue (with timeout for checking should_run)
-                try:
-                    queued_signal = await asyncio.wait_for(
-                        self._queue.get(),
-                        timeout=1.0,
-                    )
-                except asyncio.TimeoutError:
-                    # Check for expired signals periodically
-                    await self._cleanup_expired_signals()
-                    continue
-
-                # Check if signal has expired
-                if self._is_signal_expired(queued_signal):
-                    self._log.warning(
-                        "signal_expired_in_queue",
-                        signal_id=queued_signal.signal_id,
-                        queued_at=queued_signal.queued_at.isoformat(),
-                    )
-                    queued_signal.status = QueuedSignalStatus.EXPIRED
-                    self._total_expired += 1
-                    self._queue_items.pop(queued_signal.signal_id, None)
-                    self._queue.task_done()
-                    continue
-
-                # Acquire semaphore to limit concurrent executions
                 await self._execution_semaphore.acquire()
+                try:
+                    # Timeout so should_run is checked periodically
+                    queued_signal = await asyncio.wait_for(self._queue.get(), timeout=1.0)
+                except BaseException:
+                    self._execution_semaphore.release()
+                    raise
+                self._queue.task_done()
 
-                # Start execution task
-                task = asyncio.create_task(
-                    self._execute_queued_signal(queued_signal)
-                )
-                self._active_executions[queued_signal.signal_id] = task
-
-                # Add callback to release semaphore when done
-                task.add_done_callback(
-                    lambda t, sig_id=queued_signal.signal_id: self._on_execution_complete(sig_id)
-                )
+                if not self._dispatch(queued_signal):
+                    self._execution_semaphore.release()
 
+            except asyncio.TimeoutError:
+                continue
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -1503,33 +2066,121 @@ class ExecutionEngine(BaseComponent):
 
         self._log.info("queue_processor_stopped")
 
+    def _dispatch(self, queued_signal: QueuedSignal) -> bool:
+        """Start executing a dequeued signal, or discard or defer it.
+
+        Returns:
+            True if an execution was started (and holds a permit).
+        """
+        # Cancelled, superseded or expired while waiting in the queue
+        if queued_signal.status != QueuedSignalStatus.PENDING:
+            return False
+
+        if self._is_signal_expired(queued_signal):
+            self._expire(queued_signal)
+            return False
+
+        market = _execution_key(queued_signal.signal_data) if self._serialize_markets else None
+        if market is not None and market in self._busy_markets:
+            # Stays pending (and coalescable) until the market is free
+            heapq.heappush(self._deferred.setdefault(market, []), queued_signal)
+            self._deferred_count += 1
+            self._log.debug(
+                "signal_deferred",
+                signal_id=queued_signal.signal_id,
+                market_id=market,
+            )
+            return False
+
+        self._release_coalesce_key(queued_signal)
+        if market is not None:
+            self._busy_markets.add(market)
+
+        task = asyncio.create_task(self._execute_queued_signal(queued_signal))
+        self._active_executions[queued_signal.signal_id] = task
+
+        # Release the permit and the market when done
+        task.add_done_callback(
+            lambda t, sig_id=queued_signal.signal_id, market=market: (
+                self._on_execution_complete(sig_id, market)
+            )
+        )
+        return True
+
     def _is_signal_expired(self, queued_signal: QueuedSignal) -> bool:
         """Check if a queued signal has expired."""
-        age_seconds = (datetime.now(timezone.utc) - queued_signal.queued_at).total_seconds()
+        started = queued_signal.refreshed_at or queued_signal.queued_at
+        age_seconds = (datetime.now(timezone.utc) - started).total_seconds()
         return age_seconds > self._queue_timeout
 
-    async def _cleanup_expired_signals(self) -> None:
-        """Remove expired signals from tracking."""
-        expired_ids = []
-        for signal_id, queued_signal in self._queue_items.items():
-            if queued_signal.status == QueuedSignalStatus.PENDING and self._is_signal_expired(queued_signal):
-                expired_ids.append(signal_id)
+    def _expire(self, queued_signal: QueuedSignal) -> None:
+        """Mark a pending signal expired; its queue entry is discarded when popped."""
+        self._log.warning(
+            "signal_expired_in_queue",
+            signal_id=queued_signal.signal_id,
+            queued_at=queued_signal.queued_at.isoformat(),
+        )
+        queued_signal.status = QueuedSignalStatus.EXPIRED
+        self._queue_items.pop(queued_signal.signal_id, None)
+        self._release_coalesce_key(queued_signal)
+        self._total_expired += 1
+
+    def _track_deadline(self, queued_signal: QueuedSignal) -> None:
+        """Schedule a queued (or refreshed) signal's expiry."""
+        deadline = time.monotonic() + self._queue_timeout
+        heapq.heappush(
+            self._deadlines,
+            (deadline, next(self._deadline_seq), queued_signal.signal_id, queued_signal),
+        )
+        # Deadlines only grow, so a pending timer already fires first
+        if self._expiry_timer is None:
+            self._schedule_expiry()
+
+    def _schedule_expiry(self) -> None:
+        """Arm one timer for the earliest deadline."""
+        if self._expiry_timer is not None:
+            self._expiry_timer.cancel()
+            self._expiry_timer = None
+        if self._deadlines:
+            delay = max(self._deadlines[0][0] - time.monotonic(), 0.0)
+            self._expiry_timer = asyncio.get_running_loop().call_later(
+                delay, self._expire_due
+            )
 
-        for signal_id in expired_ids:
-            self._queue_items.pop(signal_id, None)
-            self._total_expired += 1
-            self._log.debug("cleaned_expired_signal", signal_id=signal_id)
+    def _expire_due(self) -> None:
+        """Expire signals whose deadline has passed.
 
-    def _on_execution_complete(self, signal_id: str) -> None:
-        """Callback when an execution task completes."""
+        Heap entries for signals that were executed, cancelled or refreshed
+        since (a refresh pushes a new deadline under the new signal ID) are
+        dropped without a scan of the queue.
+        """
+        self._expiry_timer = None
+        now = time.monotonic()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, signal_id, queued_signal = heapq.heappop(self._deadlines)
+            if (
+                queued_signal.status == QueuedSignalStatus.PENDING
+                and queued_signal.signal_id == signal_id
+            ):
+                self._expire(queued_signal)
+        self._schedule_expiry()
+
+    def _on_execution_complete(self, signal_id: str, market: Optional[str] = None) -> None:
+        """Callback when an execution task completes.
+
+        Releases the global permit and the market, and puts signals that
+        were waiting for the market back into the queue in priority order.
+        """
         self._active_executions.pop(signal_id, None)
         self._queue_items.pop(signal_id, None)
+        if market is not None:
+            self._busy_markets.discard(market)
+            for queued_signal in self._deferred.pop(market, []):
+                self._deferred_count -= 1
+                if queued_signal.status == QueuedSignalStatus.PENDING:
+                    self._queue.put_nowait(queued_signal)
         if self._execution_semaphore:
             self._execution_semaphore.release()
-        try:
-            self._queue.task_done()
-        except ValueError:
-            pass  # task_done called too many times
 
     async def _execute_queued_signal(self, queued_signal: QueuedSignal) -> ExecutionResult:
         """Execute a signal from the queue with detailed latency tracking."""
@@ -1706,7 +2357,7 @@ class ExecutionEngine(BaseComponent):
         # Check if order is tracked
         order = self._open_orders.get(order_id)
 
-        if self._dry_run:
+        if self._fake_fills:
             # In dry-run mode, simulate successful cancellation
             self._log.info("dry_run_cancel", order_id=order_id)
 
@@ -1864,8 +2515,11 @@ class ExecutionEngine(BaseComponent):
     # =========================================================================
 
     def get_queue_size(self) -> int:
-        """Get the current number of signals in the queue."""
-        return self._queue.qsize()
+        """Get the current number of signals in the queue.
+
+        Includes signals waiting for their market's in-flight execution.
+        """
+        return self._queue.qsize() + self._deferred_count
 
     def get_active_execution_count(self) -> int:
         """Get the number of currently executing signals."""
@@ -1878,8 +2532,10 @@ class ExecutionEngine(BaseComponent):
             Dictionary with queue metrics.
         """
         return {
-            "queue_size": self._queue.qsize(),
+            "queue_size": self.get_queue_size(),
+            "deferred_signals": self._deferred_count,
             "active_executions": len(self._active_executions),
+            "markets_in_flight": len(self._busy_markets),
             "max_concurrent": self._max_concurrent,
             "max_queue_size": self._max_queue_size,
             "queue_timeout_seconds": self._queue_timeout,
@@ -1887,6 +2543,7 @@ class ExecutionEngine(BaseComponent):
             "total_executed": self._total_executed,
             "total_failed": self._total_failed,
             "total_expired": self._total_expired,
+            "total_superseded": self._total_superseded,
         }
 
     def get_queued_signals(self) -> list[dict[str, Any]]:
@@ -1929,6 +2586,7 @@ class ExecutionEngine(BaseComponent):
 
         queued_signal.status = QueuedSignalStatus.CANCELLED
         self._queue_items.pop(signal_id, None)
+        self._release_coalesce_key(queued_signal)
 
         self._log.info("signal_cancelled", signal_id=signal_id)
         await self._event_bus.publish("execution.queue.cancelled", {
@@ -1939,7 +2597,7 @@ class ExecutionEngine(BaseComponent):
 
     def is_queue_full(self) -> bool:
         """Check if the queue is at capacity."""
-        return self._queue.qsize() >= self._max_queue_size
+        return self.get_queue_size() >= self._max_queue_size
 
     @property
     def last_latency_ms(self) -> Optional[float]:
@@ -129,6 +129,7 @@ class MarketDataService(BaseComponent):
     Event channels published:
     - market.orderbook.{market_id} - Order book snapshots
     - market.stale.{market_id} - Stale data alerts
+    - market.subscribed - Market subscribed (market_id and token IDs)
     - market.data.connected - Service connected
     - market.data.disconnected - Service disconnected
     """
@@ -373,6 +374,12 @@ class MarketDataService(BaseComponent):
             lambda data, tid=no_token_id: self._on_book_update(tid, data)
         )
 
+        await self._event_bus.publish("market.subscribed", {
+            "market_id": market_id,
+            "yes_token_id": str(yes_token_id),
+            "no_token_id": str(no_token_id),
+        })
+
         self._log.info(
             "market_subscribed",
             market_id=market_id,
@@ -463,6 +470,25 @@ class MarketDataService(BaseComponent):
         market_book = self.get_market_order_book(market_id)
         return market_book.no_book if market_book else None
 
+    def get_token_order_book(self, token_id: str) -> Optional[InMemoryOrderBook]:
+        """Get the order book for a YES or NO token.
+
+        Args:
+            token_id: Token ID.
+
+        Returns:
+            InMemoryOrderBook for the token or None if its market is not subscribed.
+        """
+        market_id = self._token_to_market.get(token_id)
+        market_book = self.get_market_order_book(market_id) if market_id else None
+        if market_book is None:
+            return None
+        if token_id == market_book.yes_book.token_id:
+            return market_book.yes_book
+        if token_id == market_book.no_book.token_id:
+            return market_book.no_book
+        return None
+
     def get_best_prices(self, market_id: str) -> Optional[tuple[Decimal, Decimal]]:
         """Get best bid/ask for YES side.
 
@@ -107,6 +107,32 @@ class MetricsEmitter:
             registry=self._registry,
         )
 
+        self._risk_exposure_drift = Gauge(
+            "mercury_risk_exposure_drift_usd",
+            "Difference between the risk exposure ledger and persisted positions",
+            registry=self._registry,
+        )
+
+        self._risk_scenario_pnl = Gauge(
+            "mercury_risk_scenario_pnl_usd",
+            "Portfolio P&L if open positions resolved in the given scenario",
+            ["scenario"],
+            registry=self._registry,
+        )
+
+        self._balance_usd = Gauge(
+            "mercury_balance_usd",
+            "USDC tracked by the balance ledger",
+            ["state"],
+            registry=self._registry,
+        )
+
+        self._balance_drift = Gauge(
+            "mercury_balance_drift_usd",
+            "Difference between the balance ledger and the exchange at the last reconcile",
+            registry=self._registry,
+        )
+
         # Latency histograms
         self._order_latency = Histogram(
             "mercury_order_latency_seconds",
@@ -251,6 +277,154 @@ class MetricsEmitter:
             registry=self._registry,
         )
 
+        # Strategy evaluation metrics (per market update, per strategy)
+        self._strategy_evaluation_time = Histogram(
+            "mercury_strategy_evaluation_seconds",
+            "Time for a strategy to evaluate one market update",
+            ["strategy"],
+            buckets=[0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.010, 0.025, 0.050, 0.100],
+            registry=self._registry,
+        )
+
+        self._strategy_overruns = Counter(
+            "mercury_strategy_overrun_total",
+            "Strategy evaluations dropped for exceeding their time budget",
+            ["strategy"],
+            registry=self._registry,
+        )
+        self._strategy_skips = Counter(
+            "mercury_strategy_skipped_total",
+            "Strategy invocations skipped because declared inputs did not change",
+            ["strategy"],
+            registry=self._registry,
+        )
+
+        # Per-market strategy engine actors
+        self._strategy_mailbox_depth = Gauge(
+            "mercury_strategy_mailbox_depth",
+            "Pending market updates in a strategy engine market actor",
+            ["market_id"],
+            registry=self._registry,
+        )
+        self._strategy_mailbox_lag = Histogram(
+            "mercury_strategy_mailbox_lag_seconds",
+            "Time a market update waited in its actor mailbox",
+            ["market_id"],
+            buckets=[0.0001, 0.0005, 0.001, 0.005, 0.010, 0.025, 0.050, 0.100, 0.250, 1.0],
+            registry=self._registry,
+        )
+
+        self._execution_superseded = Counter(
+            "mercury_execution_signals_superseded_total",
+            "Pending execution signals replaced in place by a newer signal",
+            ["signal_type"],
+            registry=self._registry,
+        )
+
+        # Order signing (template: warm builder; cold: py-clob-client create_order)
+        self._order_sign_time = Histogram(
+            "mercury_order_sign_seconds",
+            "Time to sign one order in the signing pool",
+            ["path"],
+            buckets=[0.001, 0.0025, 0.005, 0.0075, 0.010, 0.015, 0.025, 0.050, 0.100, 0.250],
+            registry=self._registry,
+        )
+
+        # Pre-signed orders for armed markets
+        self._presigned_lookups = Counter(
+            "mercury_presigned_lookups_total",
+            "Dual-leg signings served from pre-signed orders (hit) or signed inline (miss)",
+            ["result"],
+            registry=self._registry,
+        )
+        self._presign_saved = Counter(
+            "mercury_presign_latency_saved_seconds_total",
+            "Estimated signing time skipped by pre-signed order hits",
+            registry=self._registry,
+        )
+        self._presigned_orders = Gauge(
+            "mercury_presigned_orders",
+            "Pre-signed orders currently cached",
+            registry=self._registry,
+        )
+
+        # Dual-leg posts from concurrent executions sharing one batch request
+        self._order_batch_executions = Histogram(
+            "mercury_order_batch_executions",
+            "Executions whose orders were posted together in one batch request",
+            buckets=[1, 2, 3, 4, 5, 6, 7],
+            registry=self._registry,
+        )
+
+        # Requoting of resting orders
+        self._requote_orders = Counter(
+            "mercury_requote_orders_total",
+            "Resting orders cancelled, posted or kept by requotes",
+            ["action"],
+            registry=self._registry,
+        )
+
+        self._requotes_coalesced = Counter(
+            "mercury_requotes_coalesced_total",
+            "Desired quote states replaced by a newer one before being applied",
+            registry=self._registry,
+        )
+
+        # Partial fill unwinds
+        self._unwind_time_to_flat = Histogram(
+            "mercury_unwind_time_to_flat_seconds",
+            "Time from detecting a one-legged fill to hedging or exiting it",
+            ["action", "prebuilt"],
+            buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+            registry=self._registry,
+        )
+        self._unwind_presigns = Counter(
+            "mercury_unwind_presigns_total",
+            "Dual-leg pairs posted with unwinds pre-signed (true) or without a free slot (false)",
+            ["prebuilt"],
+            registry=self._registry,
+        )
+
+        # Shared rate limiter (token bucket per API endpoint)
+        self._rate_limit_tokens = Gauge(
+            "mercury_rate_limit_tokens",
+            "Tokens left in an endpoint's rate limit bucket",
+            ["endpoint"],
+            registry=self._registry,
+        )
+        self._rate_limit_wait = Histogram(
+            "mercury_rate_limit_wait_seconds",
+            "Time a request waited for rate limit budget",
+            ["endpoint", "priority"],
+            buckets=[0.0, 0.005, 0.010, 0.025, 0.050, 0.100, 0.250, 0.500, 1.0, 2.5, 5.0],
+            registry=self._registry,
+        )
+        self._rate_limit_backoffs = Counter(
+            "mercury_rate_limit_backoffs_total",
+            "Server rate limit responses (429) that paused an endpoint",
+            ["endpoint"],
+            registry=self._registry,
+        )
+
+        # StateStore write-behind group commit
+        self._state_store_queue_depth = Gauge(
+            "mercury_state_store_write_queue_depth",
+            "StateStore writes queued for the next group commit",
+            registry=self._registry,
+        )
+        self._state_store_flush_time = Histogram(
+            "mercury_state_store_flush_seconds",
+            "Time to commit one batch of queued StateStore writes",
+            buckets=[0.0005, 0.001, 0.0025, 0.005, 0.010, 0.025, 0.050, 0.100, 0.250, 1.0],
+            registry=self._registry,
+        )
+        self._state_store_flush_rows = Histogram(
+            "mercury_state_store_flush_rows",
+            "StateStore writes committed per batch",
+            buckets=[1, 2, 5, 10, 25, 50, 100, 250, 500, 1000],
+            registry=self._registry,
+        )
+
         # Counters for latency target tracking
         self._execution_within_target = Counter(
             "mercury_execution_within_target_total",
@@ -367,6 +541,42 @@ class MetricsEmitter:
         """
         self._circuit_breaker_level.set(level)
 
+    def update_risk_exposure_drift(self, drift: Decimal) -> None:
+        """Update exposure ledger drift found by the last reconciliation.
+
+        Args:
+            drift: Absolute drift in USD
+        """
+        self._risk_exposure_drift.set(float(drift))
+
+    def update_risk_scenario_pnl(self, worst_case: float, stress: float) -> None:
+        """Update portfolio P&L under resolution scenarios.
+
+        Args:
+            worst_case: P&L under the worst combination of asset moves
+            stress: P&L under the worst correlated (all assets same way) move
+        """
+        self._risk_scenario_pnl.labels(scenario="worst_case").set(worst_case)
+        self._risk_scenario_pnl.labels(scenario="stress").set(stress)
+
+    def update_balance(self, available: Decimal, held: Decimal) -> None:
+        """Update balance ledger funds.
+
+        Args:
+            available: USD free for new orders
+            held: USD held for orders in flight
+        """
+        self._balance_usd.labels(state="available").set(float(available))
+        self._balance_usd.labels(state="held").set(float(held))
+
+    def update_balance_drift(self, drift: Decimal) -> None:
+        """Update balance ledger drift found by the last reconcile.
+
+        Args:
+            drift: Absolute drift in USD
+        """
+        self._balance_drift.set(float(drift))
+
     def update_uptime(self, seconds: float) -> None:
         """Update uptime gauge.
 
@@ -468,6 +678,157 @@ class MetricsEmitter:
         if total_time_ms is not None:
             self.record_execution_total_time(total_time_ms)
 
+    def record_order_sign_latency(self, latency_ms: float, path: str = "template") -> None:
+        """Record the time to sign one order.
+
+        Args:
+            latency_ms: Signing time in milliseconds
+            path: "template" (prepared token) or "cold" (py-clob-client)
+        """
+        self._order_sign_time.labels(path=path).observe(latency_ms / 1000.0)
+
+    def record_presigned_lookup(self, hit: bool, saved_ms: float = 0.0) -> None:
+        """Record whether a dual-leg order used pre-signed orders.
+
+        Args:
+            hit: Both legs were pre-signed
+            saved_ms: Estimated signing time skipped, in milliseconds
+        """
+        self._presigned_lookups.labels(result="hit" if hit else "miss").inc()
+        if saved_ms > 0:
+            self._presign_saved.inc(saved_ms / 1000.0)
+
+    def update_presigned_orders(self, count: int) -> None:
+        """Update the number of cached pre-signed orders."""
+        self._presigned_orders.set(count)
+
+    def record_order_batch(self, executions: int) -> None:
+        """Record how many executions shared one batch order request."""
+        self._order_batch_executions.observe(executions)
+
+    def record_requote(self, cancelled: int, posted: int, kept: int) -> None:
+        """Record the orders one requote cancelled, posted and left resting."""
+        self._requote_orders.labels(action="cancel").inc(cancelled)
+        self._requote_orders.labels(action="post").inc(posted)
+        self._requote_orders.labels(action="keep").inc(kept)
+
+    def record_requotes_coalesced(self, count: int) -> None:
+        """Record desired quote states skipped for a newer one."""
+        self._requotes_coalesced.inc(count)
+
+    def update_state_store_queue_depth(self, depth: int) -> None:
+        """Update the number of StateStore writes awaiting commit."""
+        self._state_store_queue_depth.set(depth)
+
+    def record_state_store_flush(self, latency_ms: float, rows: int) -> None:
+        """Record one group commit of queued StateStore writes.
+
+        Args:
+            latency_ms: Time to execute and commit the batch in milliseconds
+            rows: Writes in the batch
+        """
+        self._state_store_flush_time.observe(latency_ms / 1000.0)
+        self._state_store_flush_rows.observe(rows)
+
+    def record_unwind_time_to_flat(self, latency_ms: float, action: str, prebuilt: bool) -> None:
+        """Record how long a partial fill took to unwind.
+
+        Args:
+            latency_ms: Time from detection to the unwind result in milliseconds
+            action: Rebalance outcome ("hedge_completed", "exited", "failed")
+            prebuilt: Whether unwind orders signed with the pair were used
+        """
+        self._unwind_time_to_flat.labels(
+            action=action, prebuilt="true" if prebuilt else "false"
+        ).observe(latency_ms / 1000.0)
+
+    def record_unwind_presign(self, prebuilt: bool) -> None:
+        """Record whether a posted pair had its unwinds signed ahead."""
+        self._unwind_presigns.labels(prebuilt="true" if prebuilt else "false").inc()
+
+    def record_rate_limit_wait(self, endpoint: str, priority: str, wait_ms: float) -> None:
+        """Record how long a request waited for rate limit budget.
+
+        Args:
+            endpoint: Rate limit endpoint (e.g. "clob.orders")
+            priority: Priority class ("order", "market_data", "metadata")
+            wait_ms: Wait in milliseconds (0 when a token was available)
+        """
+        self._rate_limit_wait.labels(endpoint=endpoint, priority=priority).observe(
+            wait_ms / 1000.0
+        )
+
+    def update_rate_limit_tokens(self, endpoint: str, tokens: float) -> None:
+        """Update the tokens left in an endpoint's bucket."""
+        self._rate_limit_tokens.labels(endpoint=endpoint).set(tokens)
+
+    def record_rate_limit_backoff(self, endpoint: str) -> None:
+        """Record a 429 response that paused an endpoint."""
+        self._rate_limit_backoffs.labels(endpoint=endpoint).inc()
+
+    def record_execution_signal_superseded(self, signal_type: str) -> None:
+        """Record a pending signal replaced by a newer one for its market.
+
+        Args:
+            signal_type: Signal type of the coalesced entry
+        """
+        self._execution_superseded.labels(signal_type=signal_type).inc()
+
+    def record_strategy_evaluation_time(self, strategy: str, latency_ms: float) -> None:
+        """Record how long a strategy took to evaluate a market update.
+
+        Args:
+            strategy: Strategy name
+            latency_ms: Evaluation time in milliseconds
+        """
+        self._strategy_evaluation_time.labels(strategy=strategy).observe(latency_ms / 1000.0)
+
+    def record_strategy_overrun(self, strategy: str) -> None:
+        """Record a strategy evaluation that exceeded its time budget.
+
+        Args:
+            strategy: Strategy name
+        """
+        self._strategy_overruns.labels(strategy=strategy).inc()
+
+    def update_strategy_mailbox_depth(self, market_id: str, depth: int) -> None:
+        """Update pending updates in a market actor mailbox.
+
+        Args:
+            market_id: Market identifier
+            depth: Number of queued updates
+        """
+        self._strategy_mailbox_depth.labels(market_id=market_id).set(depth)
+
+    def record_strategy_mailbox_lag(self, market_id: str, lag_ms: float) -> None:
+        """Record how long a market update waited before processing.
+
+        Args:
+            market_id: Market identifier
+            lag_ms: Queue wait in milliseconds
+        """
+        self._strategy_mailbox_lag.labels(market_id=market_id).observe(lag_ms / 1000.0)
+
+    def remove_strategy_mailbox(self, market_id: str) -> None:
+        """Drop mailbox metrics for a market whose actor was reclaimed.
+
+        Args:
+            market_id: Market identifier
+        """
+        for metric in (self._strategy_mailbox_depth, self._strategy_mailbox_lag):
+            try:
+                metric.remove(market_id)
+            except KeyError:
+                pass
+
+    def record_strategy_skipped(self, strategy: str) -> None:
+        """Record a strategy invocation skipped by its interest filter.
+
+        Args:
+            strategy: Strategy name
+        """
+        self._strategy_skips.labels(strategy=strategy).inc()
+
     def record_settlement_claimed(
         self,
         resolution: str,
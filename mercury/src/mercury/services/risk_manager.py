@@ -5,8 +5,10 @@ This service:
 - Tracks exposure and daily P&L
 - Manages 4-level circuit breaker state based on failures and losses
 - Publishes risk.circuit_breaker events on state changes
-- Approves or rejects signals via event bus
-- Enforces position limits via StateStore queries
+- Approves or rejects signals via event bus, optionally in batches
+- Keeps an in-memory exposure ledger (per market and per asset) so that
+  pre-trade checks are dictionary lookups with no I/O
+- Seeds the ledger from StateStore at startup and reconciles it periodically
 - Schedules automatic daily reset at configurable time
 
 Circuit Breaker Levels (ported from legacy/src/risk/circuit_breaker.py):
@@ -19,15 +21,46 @@ Position Limits:
 - max_position_size_usd: Maximum size for any single trade
 - max_unhedged_exposure_usd: Maximum total unhedged exposure across all markets
 - max_per_market_exposure_usd: Maximum exposure in a single market
+- max_scenario_loss_usd: Maximum worst-case loss across resolution outcomes
+  (0 disables); see mercury.domain.scenario
+
+Exposure Ledger:
+- Updated from order.filled (adds cost) and position.closed (removes cost basis)
+- Seeded from StateStore open positions when the manager starts
+- Reconciled against StateStore every exposure_reconcile_interval_seconds;
+  drift is reported as a metric. The ledger adopts the stored values only
+  with exposure_reconcile_adopt, when drift exceeds
+  exposure_drift_tolerance_usd and no fill or close has changed it for
+  exposure_reconcile_grace_seconds. Off by default: positions are not
+  persisted on every fill, so the stored values can lag the ledger
+
+Available Funds:
+- With a BalanceLedger, signals that spend funds are rejected when the
+  ledger's available balance cannot cover them, instead of at the exchange
+
+Batch Validation:
+- With batch_window_ms > 0, signals arriving within the window are validated
+  together by validate_batch(): ranked by priority then expected P&L, then
+  allocated the remaining per-market and unhedged headroom greedily, so a
+  burst cannot jointly exceed limits that each signal passes on its own
+- Approvals and rejections for a batch are published together
 
 Daily Loss Tracking:
 - Tracks realized P&L throughout the day
 - Trips circuit breaker at warning/caution/halt thresholds
 - Resets at configurable time (midnight UTC by default)
-- Publishes risk.daily_stats events with current P&L state
+- Publishes risk.daily_stats events with current P&L state, at most once
+  per daily_stats_interval_ms (the last update in a burst is always sent)
+
+Circuit Breaker Inputs:
+- Daily loss, drawdown from peak, consecutive failures and daily volume are
+  kept as ThresholdCounters. An update that stays within its current band
+  costs two comparisons; state and reasons are recomputed only when a
+  threshold is crossed, so risk.circuit_breaker fires only on transitions
 """
 
 import asyncio
+import time as _time
 from datetime import datetime, time, timedelta, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional, Tuple
@@ -38,11 +71,20 @@ from mercury.core.config import ConfigManager
 from mercury.core.events import EventBus
 from mercury.core.lifecycle import BaseComponent, HealthCheckResult, HealthStatus
 from mercury.domain.order import Fill
-from mercury.domain.risk import CircuitBreakerState, RiskLimits
-from mercury.domain.signal import ApprovedSignal, RejectedSignal, SignalType, TradingSignal
+from mercury.domain.risk import CircuitBreakerState, RiskLimits, ThresholdCounter
+from mercury.domain.scenario import PortfolioScenarios, ScenarioResult
+from mercury.domain.signal import (
+    ApprovedSignal,
+    RejectedSignal,
+    SignalPriority,
+    SignalType,
+    TradingSignal,
+)
 
 if TYPE_CHECKING:
-    from mercury.services.state_store import StateStore
+    from mercury.services.balance import BalanceLedger
+    from mercury.services.metrics import MetricsEmitter
+    from mercury.services.state_store import MarketExposure, StateStore
 
 log = structlog.get_logger()
 
@@ -73,19 +115,27 @@ class RiskManager(BaseComponent):
         config: ConfigManager,
         event_bus: EventBus,
         state_store: Optional["StateStore"] = None,
+        metrics_emitter: Optional["MetricsEmitter"] = None,
+        balance_ledger: Optional["BalanceLedger"] = None,
     ):
         """Initialize the risk manager.
 
         Args:
             config: Configuration manager.
             event_bus: EventBus for events.
-            state_store: Optional StateStore for querying current positions.
-                         If not provided, position limit checks will use in-memory tracking only.
+            state_store: Optional StateStore used to seed and reconcile the
+                         exposure ledger. If not provided, the ledger is built
+                         from fill events only.
+            metrics_emitter: Optional MetricsEmitter for ledger drift metrics.
+            balance_ledger: Optional BalanceLedger for the available funds
+                            check. If not provided, funds are not checked.
         """
         super().__init__()
         self._config = config
         self._event_bus = event_bus
         self._state_store = state_store
+        self._metrics = metrics_emitter
+        self._balance_ledger = balance_ledger
         self._log = log.bind(component="risk_manager")
 
         # Load limits from config
@@ -96,6 +146,11 @@ class RiskManager(BaseComponent):
             max_per_market_exposure_usd=self._get_decimal("risk.max_per_market_exposure_usd", Decimal("100")),
         )
 
+        # Scenario loss limit across resolution outcomes (0 disables the check)
+        self._max_scenario_loss = float(
+            self._get_decimal("risk.max_scenario_loss_usd", Decimal("0"))
+        )
+
         # Circuit breaker thresholds - 4 levels: NORMAL -> WARNING -> CAUTION -> HALT
         # Failure thresholds
         self._warning_failures = self._get_int("risk.circuit_breaker_warning_failures", 3)
@@ -107,6 +162,36 @@ class RiskManager(BaseComponent):
         self._caution_loss = self._get_decimal("risk.circuit_breaker_caution_loss", Decimal("75"))
         self._halt_loss = self._get_decimal("risk.circuit_breaker_halt_loss", Decimal("100"))
 
+        # Drawdown-from-peak and daily volume thresholds (in USD, 0 disables)
+        self._warning_drawdown = self._get_decimal(
+            "risk.circuit_breaker_warning_drawdown", Decimal("0")
+        )
+        self._caution_drawdown = self._get_decimal(
+            "risk.circuit_breaker_caution_drawdown", Decimal("0")
+        )
+        self._halt_drawdown = self._get_decimal("risk.circuit_breaker_halt_drawdown", Decimal("0"))
+        self._warning_volume = self._get_decimal(
+            "risk.circuit_breaker_warning_volume", Decimal("0")
+        )
+        self._caution_volume = self._get_decimal(
+            "risk.circuit_breaker_caution_volume", Decimal("0")
+        )
+        self._halt_volume = self._get_decimal("risk.circuit_breaker_halt_volume", Decimal("0"))
+
+        # Circuit breaker inputs with cached threshold bands
+        self._failure_counter = ThresholdCounter(
+            self._warning_failures, self._caution_failures, self._halt_failures
+        )
+        self._loss_counter = ThresholdCounter(
+            self._warning_loss, self._caution_loss, self._halt_loss
+        )
+        self._drawdown_counter = ThresholdCounter(
+            self._warning_drawdown, self._caution_drawdown, self._halt_drawdown
+        )
+        self._volume_counter = ThresholdCounter(
+            self._warning_volume, self._caution_volume, self._halt_volume
+        )
+
         # Cooldown and timing
         self._cooldown_minutes = self._get_int("risk.circuit_breaker_cooldown_minutes", 5)
         self._cooldown_duration = timedelta(minutes=self._cooldown_minutes)
@@ -118,6 +203,36 @@ class RiskManager(BaseComponent):
         )
         self._reset_task: Optional[asyncio.Task[None]] = None
 
+        # Exposure ledger reconciliation against StateStore (0 disables)
+        self._reconcile_interval = float(
+            self._get_decimal("risk.exposure_reconcile_interval_seconds", Decimal("60"))
+        )
+        self._drift_tolerance = self._get_decimal(
+            "risk.exposure_drift_tolerance_usd", Decimal("0.01")
+        )
+        # Report-only unless enabled; fills newer than the grace period may
+        # not be persisted yet, so the ledger is never rolled back over them
+        self._reconcile_adopt = bool(self._config.get("risk.exposure_reconcile_adopt", False))
+        self._reconcile_grace = float(
+            self._get_decimal("risk.exposure_reconcile_grace_seconds", Decimal("30"))
+        )
+        self._last_ledger_change: Optional[float] = None
+        self._reconcile_task: Optional[asyncio.Task[None]] = None
+        self._last_drift: Decimal = Decimal("0")
+
+        # Signal batching (0 window validates each signal as it arrives)
+        self._batch_window = float(self._get_decimal("risk.batch_window_ms", Decimal("0"))) / 1000.0
+        self._batch_max_signals = self._get_int("risk.batch_max_signals", 0)
+        self._pending_signals: List[TradingSignal] = []
+        self._batch_task: Optional[asyncio.Task[None]] = None
+
+        # risk.daily_stats rate limit (0 publishes on every P&L update)
+        self._stats_interval = float(
+            self._get_decimal("risk.daily_stats_interval_ms", Decimal("1000"))
+        ) / 1000.0
+        self._stats_task: Optional[asyncio.Task[None]] = None
+        self._last_stats_publish: float = float("-inf")
+
         # State tracking
         self._daily_pnl: Decimal = Decimal("0")
         self._daily_volume: Decimal = Decimal("0")
@@ -130,8 +245,14 @@ class RiskManager(BaseComponent):
         self._circuit_breaker_reasons: List[str] = []
         self._cooldown_until: Optional[datetime] = None
         self._last_reset: datetime = datetime.now(timezone.utc)
-        # Per-market exposure tracking (in-memory cache, updated from fills)
+        # Exposure ledger: per-market and per-asset cost, updated from fills
+        # and closes, seeded and reconciled from StateStore
         self._market_exposures: dict[str, Decimal] = {}
+        self._asset_exposures: dict[str, Decimal] = {}
+        self._market_assets: dict[str, str] = {}
+        # Open positions as arrays for scenario P&L, updated with the ledger
+        self._scenarios = PortfolioScenarios()
+        self._scenario_result: ScenarioResult = self._scenarios.evaluate()
         # Peak/max tracking for daily stats
         self._daily_peak_pnl: Decimal = Decimal("0")
         self._daily_max_drawdown: Decimal = Decimal("0")
@@ -224,6 +345,12 @@ class RiskManager(BaseComponent):
         await self._event_bus.subscribe("order.filled", self._on_order_filled)
         await self._event_bus.subscribe("position.closed", self._on_position_closed)
 
+        # Seed the exposure ledger from persisted open positions
+        if self._state_store is not None and self._state_store.is_connected:
+            await self._seed_exposures()
+            if self._reconcile_interval > 0:
+                self._reconcile_task = asyncio.create_task(self._exposure_reconcile_loop())
+
         # Start daily reset scheduler if enabled
         if self._daily_reset_enabled:
             self._reset_task = asyncio.create_task(self._daily_reset_scheduler())
@@ -237,6 +364,21 @@ class RiskManager(BaseComponent):
 
     async def _do_stop(self) -> None:
         """Stop the risk manager."""
+        if self._reconcile_task is not None:
+            self._reconcile_task.cancel()
+            try:
+                await self._reconcile_task
+            except asyncio.CancelledError:
+                pass
+            self._reconcile_task = None
+
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+            self._stats_task = None
+
+        # Validate signals still waiting for their batch window
+        await self._flush_signal_batch()
+
         # Cancel daily reset scheduler if running
         if self._reset_task is not None:
             self._reset_task.cancel()
@@ -273,6 +415,8 @@ class RiskManager(BaseComponent):
                 "daily_trades": self._daily_trades,
                 "circuit_breaker_state": self._circuit_breaker_state.value,
                 "current_exposure": str(self._current_exposure),
+                "exposure_drift": str(self._last_drift),
+                "scenario_worst_case_pnl": round(self._scenario_result.worst_case_pnl, 2),
             },
         )
 
@@ -284,10 +428,38 @@ class RiskManager(BaseComponent):
         2. Daily loss limit
         3. Per-trade position size limit (with WARNING state multiplier)
         4. Total unhedged exposure limit
-        5. Per-market exposure limit (queries StateStore if available)
+        5. Per-market exposure limit
+        6. Worst-case scenario loss limit, if configured
+        7. Available balance, if a balance ledger is configured
+
+        Exposure and balance checks read in-memory ledgers only; no I/O is
+        performed.
+
+        Args:
+            signal: Trading signal to validate.
+
+        Returns:
+            Tuple of (allowed, reason). Reason is None if allowed.
+        """
+        return self._check_limits(signal)
+
+    def _check_limits(
+        self,
+        signal: TradingSignal,
+        reserved_unhedged: Decimal = Decimal("0"),
+        reserved_market: Decimal = Decimal("0"),
+        scenarios: Optional[PortfolioScenarios] = None,
+        reserved_funds: Decimal = Decimal("0"),
+    ) -> Tuple[bool, Optional[str]]:
+        """Run the check_pre_trade checks with exposure already reserved.
 
         Args:
             signal: Trading signal to validate.
+            reserved_unhedged: Unhedged exposure approved earlier in a batch.
+            reserved_market: Exposure in the signal's market approved earlier in a batch.
+            scenarios: Positions to run the scenario check against; defaults
+                       to the live portfolio.
+            reserved_funds: Funds spent by signals approved earlier in a batch.
 
         Returns:
             Tuple of (allowed, reason). Reason is None if allowed.
@@ -320,78 +492,228 @@ class RiskManager(BaseComponent):
 
         # Check total unhedged exposure for non-arbitrage signals
         if signal.signal_type != SignalType.ARBITRAGE:
-            # Get current unhedged exposure from StateStore if available, else use in-memory tracking
-            total_unhedged = await self._get_total_unhedged_exposure()
-            new_exposure = total_unhedged + signal.target_size_usd
+            new_exposure = self._unhedged_exposure + reserved_unhedged + signal.target_size_usd
             if new_exposure > self._limits.max_unhedged_exposure_usd:
                 return False, f"Unhedged exposure would exceed limit: ${new_exposure:.2f} > ${self._limits.max_unhedged_exposure_usd:.2f}"
 
         # Check per-market exposure limit
-        market_exposure = await self._get_market_exposure(signal.market_id)
-        new_market_exposure = market_exposure + signal.target_size_usd
+        new_market_exposure = (
+            self._market_exposures.get(signal.market_id, Decimal("0"))
+            + reserved_market
+            + signal.target_size_usd
+        )
         if new_market_exposure > self._limits.max_per_market_exposure_usd:
             return False, f"Per-market exposure would exceed limit for {signal.market_id}: ${new_market_exposure:.2f} > ${self._limits.max_per_market_exposure_usd:.2f}"
 
+        # Check worst-case loss across resolution outcomes
+        if self._max_scenario_loss > 0:
+            position = self._signal_position(signal)
+            if position is not None:
+                yes_shares, no_shares, yes_cost, no_cost = position
+                result = (scenarios or self._scenarios).evaluate_with(
+                    signal.market_id,
+                    yes_shares,
+                    no_shares,
+                    yes_cost + no_cost,
+                    asset=self._signal_asset(signal),
+                )
+                if result.worst_case_loss > self._max_scenario_loss:
+                    return False, (
+                        f"Scenario worst-case loss would exceed limit: "
+                        f"${result.worst_case_loss:.2f} > ${self._max_scenario_loss:.2f}"
+                    )
+
+        # Check available funds
+        if self._balance_ledger is not None and self._spends_funds(signal):
+            needed = reserved_funds + signal.target_size_usd
+            if not self._balance_ledger.can_afford(needed):
+                return False, (
+                    f"Insufficient available balance: "
+                    f"${self._balance_ledger.available:.2f} < ${needed:.2f}"
+                )
+
         return True, None
 
-    async def _get_total_unhedged_exposure(self) -> Decimal:
-        """Get total unhedged exposure across all markets.
+    @staticmethod
+    def _spends_funds(signal: TradingSignal) -> bool:
+        """Whether a signal buys shares (and so needs available balance)."""
+        return signal.signal_type in (
+            SignalType.BUY_YES, SignalType.BUY_NO, SignalType.ARBITRAGE
+        )
 
-        Queries StateStore for open positions if available, otherwise
-        uses in-memory tracking.
+    def _signal_asset(self, signal: TradingSignal) -> Optional[str]:
+        """Get the underlying asset of a signal's market, if known."""
+        asset = signal.metadata.get("asset") or self._market_assets.get(signal.market_id)
+        return str(asset).upper() if asset else None
 
-        Returns:
-            Total unhedged exposure in USD.
+    @staticmethod
+    def _signal_position(signal: TradingSignal) -> Optional[Tuple[float, float, float, float]]:
+        """Get (yes_shares, no_shares, yes_cost, no_cost) a signal would buy.
+
+        Arbitrage buys equal YES and NO shares; directional signals buy one
+        side. Returns None for signals that do not open positions.
         """
-        if self._state_store is not None and self._state_store.is_connected:
-            try:
-                positions = await self._state_store.get_open_positions()
-                # Sum up exposure from non-hedged positions
-                # For arbitrage positions (both YES and NO), exposure is hedged
-                # For single-sided positions, the full cost is unhedged exposure
-                total = Decimal("0")
-                for position in positions:
-                    # Position cost basis is size * entry_price
-                    total += position.size * position.entry_price
-                return total
-            except Exception as e:
-                self._log.warning(
-                    "failed_to_query_positions_for_exposure",
-                    error=str(e),
-                    fallback="in-memory",
-                )
-                return self._unhedged_exposure
-        return self._unhedged_exposure
+        size = float(signal.target_size_usd)
+        yes_price = float(signal.yes_price)
+        no_price = float(signal.no_price)
+        if signal.signal_type == SignalType.ARBITRAGE and yes_price + no_price > 0:
+            shares = size / (yes_price + no_price)
+            return shares, shares, shares * yes_price, shares * no_price
+        if signal.signal_type == SignalType.BUY_YES and yes_price > 0:
+            return size / yes_price, 0.0, size, 0.0
+        if signal.signal_type == SignalType.BUY_NO and no_price > 0:
+            return 0.0, size / no_price, 0.0, size
+        return None
+
+    def _update_scenario_risk(self) -> None:
+        """Re-evaluate scenario P&L for the current portfolio and export it."""
+        self._scenario_result = self._scenarios.evaluate()
+        if self._metrics:
+            self._metrics.update_risk_scenario_pnl(
+                self._scenario_result.worst_case_pnl,
+                self._scenario_result.stress_pnl,
+            )
 
-    async def _get_market_exposure(self, market_id: str) -> Decimal:
-        """Get current exposure in a specific market.
+    def get_market_exposure(self, market_id: str) -> Decimal:
+        """Get ledger exposure in a market.
 
-        Queries StateStore for open positions in the market if available,
-        otherwise uses in-memory tracking.
+        Args:
+            market_id: Market to look up.
+
+        Returns:
+            Open cost in USD for the market.
+        """
+        return self._market_exposures.get(market_id, Decimal("0"))
+
+    def get_asset_exposure(self, asset: str) -> Decimal:
+        """Get ledger exposure across all markets of an asset.
 
         Args:
-            market_id: The market to check exposure for.
+            asset: Underlying asset, e.g. "BTC".
 
         Returns:
-            Current exposure in USD for the market.
+            Open cost in USD for markets on the asset.
         """
-        if self._state_store is not None and self._state_store.is_connected:
+        return self._asset_exposures.get(asset.upper(), Decimal("0"))
+
+    def _add_market_exposure(self, market_id: str, amount: Decimal) -> None:
+        """Apply a cost change to a market and its asset, dropping zeroed entries."""
+        if not market_id:
+            return
+        new_value = max(Decimal("0"), self._market_exposures.get(market_id, Decimal("0")) + amount)
+        if new_value == Decimal("0"):
+            self._market_exposures.pop(market_id, None)
+        else:
+            self._market_exposures[market_id] = new_value
+
+        asset = self._market_assets.get(market_id)
+        if asset:
+            new_asset_value = max(
+                Decimal("0"), self._asset_exposures.get(asset, Decimal("0")) + amount
+            )
+            if new_asset_value == Decimal("0"):
+                self._asset_exposures.pop(asset, None)
+            else:
+                self._asset_exposures[asset] = new_asset_value
+
+    def _load_exposures(self, exposures: List["MarketExposure"]) -> None:
+        """Replace the exposure ledger with aggregated StateStore values."""
+        self._market_exposures = {}
+        self._asset_exposures = {}
+        self._scenarios.clear()
+        for exposure in exposures:
+            if exposure.asset:
+                self._market_assets[exposure.market_id] = exposure.asset.upper()
+            self._add_market_exposure(exposure.market_id, exposure.total_cost)
+            self._scenarios.set_position(
+                exposure.market_id,
+                float(exposure.yes_size),
+                float(exposure.no_size),
+                float(exposure.yes_cost),
+                float(exposure.no_cost),
+                asset=exposure.asset,
+            )
+        self._current_exposure = sum(
+            (exposure.total_cost for exposure in exposures), Decimal("0")
+        )
+        self._unhedged_exposure = sum(
+            (exposure.unhedged_cost for exposure in exposures), Decimal("0")
+        )
+        self._update_scenario_risk()
+
+    async def _seed_exposures(self) -> None:
+        """Load the exposure ledger from StateStore open positions."""
+        if self._state_store is None or not self._state_store.is_connected:
+            return
+        try:
+            self._load_exposures(await self._state_store.get_open_exposures())
+            self._log.info(
+                "exposure_ledger_seeded",
+                current_exposure=str(self._current_exposure),
+                unhedged_exposure=str(self._unhedged_exposure),
+                markets=len(self._market_exposures),
+            )
+        except Exception as e:
+            self._log.warning("exposure_ledger_seed_failed", error=str(e))
+
+    async def reconcile_exposure(self) -> Decimal:
+        """Compare the exposure ledger with StateStore and report drift.
+
+        Drift is the sum of absolute per-market differences plus the
+        unhedged difference. It is reported as a metric on every run. With
+        exposure_reconcile_adopt, the ledger adopts the stored values when
+        drift exceeds the configured tolerance and no fill or close has
+        changed the ledger within the grace period.
+
+        Returns:
+            Drift in USD, or 0 if no StateStore is connected.
+        """
+        if self._state_store is None or not self._state_store.is_connected:
+            return Decimal("0")
+
+        exposures = await self._state_store.get_open_exposures()
+        stored = {exposure.market_id: exposure.total_cost for exposure in exposures}
+        stored_unhedged = sum((exposure.unhedged_cost for exposure in exposures), Decimal("0"))
+
+        drift = abs(self._unhedged_exposure - stored_unhedged)
+        for market_id in stored.keys() | self._market_exposures.keys():
+            drift += abs(
+                self._market_exposures.get(market_id, Decimal("0"))
+                - stored.get(market_id, Decimal("0"))
+            )
+
+        self._last_drift = drift
+        if self._metrics:
+            self._metrics.update_risk_exposure_drift(drift)
+
+        if drift > self._drift_tolerance:
+            settled = (
+                self._last_ledger_change is None
+                or _time.monotonic() - self._last_ledger_change >= self._reconcile_grace
+            )
+            adopt = self._reconcile_adopt and settled
+            self._log.warning(
+                "exposure_ledger_drift",
+                drift=str(drift),
+                ledger_exposure=str(self._current_exposure),
+                stored_exposure=str(sum(stored.values(), Decimal("0"))),
+                adopted=adopt,
+            )
+            if adopt:
+                self._load_exposures(exposures)
+
+        return drift
+
+    async def _exposure_reconcile_loop(self) -> None:
+        """Background task that reconciles the exposure ledger periodically."""
+        while True:
             try:
-                positions = await self._state_store.get_open_positions(market_id=market_id)
-                # Sum up all position values for this market
-                total = Decimal("0")
-                for position in positions:
-                    total += position.size * position.entry_price
-                return total
+                await asyncio.sleep(self._reconcile_interval)
+                await self.reconcile_exposure()
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                self._log.warning(
-                    "failed_to_query_positions_for_market_exposure",
-                    market_id=market_id,
-                    error=str(e),
-                    fallback="in-memory",
-                )
-                return self._market_exposures.get(market_id, Decimal("0"))
-        return self._market_exposures.get(market_id, Decimal("0"))
+                self._log.warning("exposure_reconcile_failed", error=str(e))
 
     async def validate_signal(self, signal: TradingSignal) -> Optional[ApprovedSignal]:
         """Validate and potentially approve a trading signal.
@@ -410,21 +732,9 @@ class RiskManager(BaseComponent):
                 signal_id=signal.signal_id,
                 reason=reason,
             )
-
-            rejected = RejectedSignal(
-                signal=signal,
-                rejection_reason=reason or "Unknown reason",
-            )
-
-            await self._event_bus.publish(
-                f"risk.rejected.{signal.signal_id}",
-                {
-                    "signal_id": signal.signal_id,
-                    "reason": reason,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                },
+            await self._publish_rejected(
+                RejectedSignal(signal=signal, rejection_reason=reason or "Unknown reason")
             )
-
             return None
 
         # Create approved signal
@@ -439,7 +749,86 @@ class RiskManager(BaseComponent):
             approved_size=str(approved.approved_size_usd),
         )
 
-        # Publish approved signal
+        await self._publish_approved(approved)
+        return approved
+
+    async def validate_batch(
+        self, signals: List[TradingSignal]
+    ) -> Tuple[List[ApprovedSignal], List[RejectedSignal]]:
+        """Validate a burst of signals against shared headroom.
+
+        Signals are ranked by priority, then expected P&L, and checked in
+        that order. Each approval reserves its size against its market,
+        against available funds if it buys and, for non-arbitrage signals,
+        against total unhedged exposure, so later signals see the headroom
+        that remains. All approvals and rejections are published together
+        once the batch is decided.
+
+        Args:
+            signals: Signals to validate.
+
+        Returns:
+            Tuple of (approved, rejected), approved in allocation order.
+        """
+        ranked = sorted(signals, key=lambda s: (s.priority.rank, -s.expected_pnl))
+
+        approved: List[ApprovedSignal] = []
+        rejected: List[RejectedSignal] = []
+        reserved_unhedged = Decimal("0")
+        reserved_funds = Decimal("0")
+        reserved_markets: dict[str, Decimal] = {}
+        # Approved positions are staged on a copy so the scenario check sees them
+        staged = self._scenarios.copy() if self._max_scenario_loss > 0 else None
+
+        for signal in ranked:
+            allowed, reason = self._check_limits(
+                signal,
+                reserved_unhedged=reserved_unhedged,
+                reserved_market=reserved_markets.get(signal.market_id, Decimal("0")),
+                scenarios=staged,
+                reserved_funds=reserved_funds,
+            )
+            if not allowed:
+                rejected.append(
+                    RejectedSignal(signal=signal, rejection_reason=reason or "Unknown reason")
+                )
+                continue
+
+            approved.append(ApprovedSignal(signal=signal, approved_size_usd=signal.target_size_usd))
+            if signal.signal_type == SignalType.CLOSE_POSITION:
+                continue
+            reserved_markets[signal.market_id] = (
+                reserved_markets.get(signal.market_id, Decimal("0")) + signal.target_size_usd
+            )
+            if signal.signal_type != SignalType.ARBITRAGE:
+                reserved_unhedged += signal.target_size_usd
+            if self._spends_funds(signal):
+                reserved_funds += signal.target_size_usd
+            position = self._signal_position(signal) if staged is not None else None
+            if position is not None:
+                yes_shares, no_shares, yes_cost, no_cost = position
+                asset = self._signal_asset(signal)
+                staged.apply_fill(signal.market_id, "YES", yes_shares, yes_cost, asset=asset)
+                staged.apply_fill(signal.market_id, "NO", no_shares, no_cost, asset=asset)
+
+        self._log.info(
+            "signal_batch_validated",
+            signals=len(signals),
+            approved=len(approved),
+            rejected=len(rejected),
+            approved_size=str(sum((a.approved_size_usd for a in approved), Decimal("0"))),
+        )
+
+        await asyncio.gather(
+            *(self._publish_approved(a) for a in approved),
+            *(self._publish_rejected(r) for r in rejected),
+        )
+
+        return approved, rejected
+
+    async def _publish_approved(self, approved: ApprovedSignal) -> None:
+        """Publish risk.approved.{signal_id} for an approved signal."""
+        signal = approved.signal
         await self._event_bus.publish(
             f"risk.approved.{signal.signal_id}",
             {
@@ -453,7 +842,16 @@ class RiskManager(BaseComponent):
             },
         )
 
-        return approved
+    async def _publish_rejected(self, rejected: RejectedSignal) -> None:
+        """Publish risk.rejected.{signal_id} for a rejected signal."""
+        await self._event_bus.publish(
+            f"risk.rejected.{rejected.signal.signal_id}",
+            {
+                "signal_id": rejected.signal.signal_id,
+                "reason": rejected.rejection_reason,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
 
     def record_fill(self, fill: Fill) -> None:
         """Record a fill for exposure tracking.
@@ -462,7 +860,7 @@ class RiskManager(BaseComponent):
         - Daily trade count
         - Daily volume
         - Current total exposure
-        - Per-market exposure
+        - Per-market and per-asset exposure
 
         Args:
             fill: The fill to record.
@@ -470,10 +868,12 @@ class RiskManager(BaseComponent):
         self._daily_trades += 1
         self._daily_volume += fill.cost
         self._current_exposure += fill.cost
+        self._last_ledger_change = _time.monotonic()
+        if self._volume_counter.update(self._daily_volume):
+            self._update_circuit_breaker_state()
 
         # Track per-market exposure
-        current_market_exposure = self._market_exposures.get(fill.market_id, Decimal("0"))
-        self._market_exposures[fill.market_id] = current_market_exposure + fill.cost
+        self._add_market_exposure(fill.market_id, fill.cost)
 
         self._log.debug(
             "fill_recorded",
@@ -481,7 +881,7 @@ class RiskManager(BaseComponent):
             market_id=fill.market_id,
             cost=str(fill.cost),
             current_exposure=str(self._current_exposure),
-            market_exposure=str(self._market_exposures[fill.market_id]),
+            market_exposure=str(self._market_exposures.get(fill.market_id, Decimal("0"))),
         )
 
     def record_pnl(self, pnl: Decimal) -> None:
@@ -513,8 +913,11 @@ class RiskManager(BaseComponent):
             max_drawdown=str(self._daily_max_drawdown),
         )
 
-        # Update circuit breaker based on loss
-        self._update_circuit_breaker_for_loss()
+        # Re-evaluate the circuit breaker only when a loss or drawdown threshold is crossed
+        loss_crossed = self._loss_counter.update(-self._daily_pnl)
+        drawdown_crossed = self._drawdown_counter.update(drawdown)
+        if loss_crossed or drawdown_crossed:
+            self._update_circuit_breaker_state()
 
         # Publish daily stats event asynchronously
         self._publish_daily_stats_event()
@@ -525,59 +928,45 @@ class RiskManager(BaseComponent):
         Consecutive failures trigger circuit breaker state changes.
         """
         self._consecutive_failures += 1
-        self._update_circuit_breaker_state()
+        if self._failure_counter.update(self._consecutive_failures):
+            self._update_circuit_breaker_state()
 
     def record_success(self) -> None:
         """Record a successful trade, resetting consecutive failure count."""
         if self._consecutive_failures > 0:
             self._consecutive_failures = 0
             # Recompute state - may recover from WARNING to NORMAL if losses permit
-            self._update_circuit_breaker_state()
+            if self._failure_counter.update(0):
+                self._update_circuit_breaker_state()
 
     def _compute_circuit_breaker_state(self) -> Tuple[CircuitBreakerState, List[str]]:
-        """Compute circuit breaker state based on failures and loss.
+        """Compute circuit breaker state from the threshold counters.
 
         Returns:
             Tuple of (state, reasons) where reasons explain why the state was set.
         """
-        reasons: List[str] = []
-
-        # Determine state from failures
-        failure_state = CircuitBreakerState.NORMAL
-        if self._consecutive_failures >= self._halt_failures:
-            failure_state = CircuitBreakerState.HALT
-            reasons.append(f"Consecutive failures: {self._consecutive_failures} >= {self._halt_failures}")
-        elif self._consecutive_failures >= self._caution_failures:
-            failure_state = CircuitBreakerState.CAUTION
-            reasons.append(f"Consecutive failures: {self._consecutive_failures} >= {self._caution_failures}")
-        elif self._consecutive_failures >= self._warning_failures:
-            failure_state = CircuitBreakerState.WARNING
-            reasons.append(f"Consecutive failures: {self._consecutive_failures} >= {self._warning_failures}")
-
-        # Determine state from loss
-        loss = -self._daily_pnl
-        loss_state = CircuitBreakerState.NORMAL
-        if loss >= self._halt_loss:
-            loss_state = CircuitBreakerState.HALT
-            reasons.append(f"Daily loss: ${loss:.2f} >= ${self._halt_loss}")
-        elif loss >= self._caution_loss:
-            loss_state = CircuitBreakerState.CAUTION
-            reasons.append(f"Daily loss: ${loss:.2f} >= ${self._caution_loss}")
-        elif loss >= self._warning_loss:
-            loss_state = CircuitBreakerState.WARNING
-            reasons.append(f"Daily loss: ${loss:.2f} >= ${self._warning_loss}")
-
-        # Take the more severe state
-        state_order = [
-            CircuitBreakerState.NORMAL,
-            CircuitBreakerState.WARNING,
-            CircuitBreakerState.CAUTION,
-            CircuitBreakerState.HALT,
-        ]
-        failure_idx = state_order.index(failure_state)
-        loss_idx = state_order.index(loss_state)
-        final_state = state_order[max(failure_idx, loss_idx)]
+        self._failure_counter.update(self._consecutive_failures)
+        self._loss_counter.update(-self._daily_pnl)
 
+        reasons: List[str] = []
+        failures = self._failure_counter
+        if failures.threshold is not None:
+            reasons.append(f"Consecutive failures: {failures.value} >= {failures.threshold}")
+        loss = self._loss_counter
+        if loss.threshold is not None:
+            reasons.append(f"Daily loss: ${loss.value:.2f} >= ${loss.threshold}")
+        drawdown = self._drawdown_counter
+        if drawdown.threshold is not None:
+            reasons.append(f"Drawdown from peak: ${drawdown.value:.2f} >= ${drawdown.threshold}")
+        volume = self._volume_counter
+        if volume.threshold is not None:
+            reasons.append(f"Daily volume: ${volume.value:.2f} >= ${volume.threshold}")
+
+        # Take the most severe state
+        final_state = max(
+            (failures.state, loss.state, drawdown.state, volume.state),
+            key=lambda state: state.severity,
+        )
         return final_state, reasons
 
     def _update_circuit_breaker_state(self) -> None:
@@ -606,13 +995,7 @@ class RiskManager(BaseComponent):
 
         # Only trip to higher (more severe) levels, never downgrade via trip
         # (recovery happens through reset_daily or manual reset)
-        state_order = [
-            CircuitBreakerState.NORMAL,
-            CircuitBreakerState.WARNING,
-            CircuitBreakerState.CAUTION,
-            CircuitBreakerState.HALT,
-        ]
-        if state_order.index(level) <= state_order.index(old_state):
+        if level.severity <= old_state.severity:
             return
 
         now = datetime.now(timezone.utc)
@@ -677,18 +1060,37 @@ class RiskManager(BaseComponent):
     def _publish_daily_stats_event(self) -> None:
         """Publish risk.daily_stats event with current P&L metrics.
 
-        This is called after each P&L update to provide real-time tracking.
-        The event is published asynchronously (fire and forget).
+        This is called after each P&L update. Publishes are rate limited to
+        one per daily_stats_interval_ms: the first update publishes at once,
+        later ones share a single pending publish at the end of the interval.
+        The event reads state when it is sent, so it always carries the
+        latest update. The event is published asynchronously (fire and forget).
         """
+        if self._stats_task is not None and not self._stats_task.done():
+            return
+
         try:
             loop = asyncio.get_running_loop()
-            loop.create_task(self._async_publish_daily_stats())
         except RuntimeError:
             # No event loop running (e.g., in sync tests) - skip publishing
-            pass
+            return
+
+        delay = max(0.0, self._last_stats_publish + self._stats_interval - loop.time())
+        self._stats_task = loop.create_task(self._async_publish_daily_stats(delay))
+
+    async def _async_publish_daily_stats(self, delay: float = 0.0) -> None:
+        """Async implementation of daily stats event publishing.
+
+        Args:
+            delay: Seconds to wait before reading state and publishing.
+        """
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        # Updates from here on schedule the next publish
+        self._stats_task = None
+        self._last_stats_publish = asyncio.get_running_loop().time()
 
-    async def _async_publish_daily_stats(self) -> None:
-        """Async implementation of daily stats event publishing."""
         try:
             # Calculate loss percentage relative to limit
             loss_pct = Decimal("0")
@@ -785,8 +1187,9 @@ class RiskManager(BaseComponent):
                     "final_circuit_breaker_state": self._circuit_breaker_state.value,
                 }
 
-                # Do the reset
+                # Do the reset; open positions carry over into the new day
                 self.reset_daily()
+                await self._seed_exposures()
 
                 # Publish daily reset event
                 await self._event_bus.publish(
@@ -850,7 +1253,17 @@ class RiskManager(BaseComponent):
         self._current_exposure = Decimal("0")
         self._unhedged_exposure = Decimal("0")
         self._market_exposures = {}
+        self._asset_exposures = {}
+        self._scenarios.clear()
+        self._scenario_result = self._scenarios.evaluate()
         self._consecutive_failures = 0
+        for counter in (
+            self._failure_counter,
+            self._loss_counter,
+            self._drawdown_counter,
+            self._volume_counter,
+        ):
+            counter.reset()
         self._circuit_breaker_state = CircuitBreakerState.NORMAL
         self._circuit_breaker_triggered_at = None
         self._circuit_breaker_reasons = []
@@ -929,6 +1342,21 @@ class RiskManager(BaseComponent):
         """Get per-market exposure snapshot (copy)."""
         return self._market_exposures.copy()
 
+    @property
+    def asset_exposures(self) -> dict[str, Decimal]:
+        """Get per-asset exposure snapshot (copy)."""
+        return self._asset_exposures.copy()
+
+    @property
+    def scenario_risk(self) -> ScenarioResult:
+        """Get worst-case and stress P&L as of the last fill or close."""
+        return self._scenario_result
+
+    @property
+    def exposure_drift(self) -> Decimal:
+        """Get drift found by the last ledger reconciliation."""
+        return self._last_drift
+
     @property
     def limits(self) -> RiskLimits:
         """Get configured risk limits."""
@@ -981,13 +1409,43 @@ class RiskManager(BaseComponent):
                 yes_price=Decimal(str(data.get("yes_price", 0))),
                 no_price=Decimal(str(data.get("no_price", 0))),
                 confidence=data.get("confidence", 0.5),
+                priority=SignalPriority(data.get("priority", SignalPriority.MEDIUM.value)),
+                expected_pnl=Decimal(str(data.get("expected_pnl", 0))),
                 metadata=data.get("metadata", {}),
             )
 
-            await self.validate_signal(signal)
+            if self._batch_window <= 0:
+                await self.validate_signal(signal)
+                return
+
+            self._pending_signals.append(signal)
+            if self._batch_max_signals and len(self._pending_signals) >= self._batch_max_signals:
+                await self._flush_signal_batch()
+            elif self._batch_task is None:
+                self._batch_task = asyncio.create_task(self._batch_window_timer())
         except Exception as e:
             self._log.error("signal_processing_error", error=str(e), data=data)
 
+    async def _batch_window_timer(self) -> None:
+        """Validate the pending batch once the batch window has elapsed."""
+        await asyncio.sleep(self._batch_window)
+        self._batch_task = None
+        await self._flush_signal_batch()
+
+    async def _flush_signal_batch(self) -> None:
+        """Validate all pending signals as one batch."""
+        if self._batch_task is not None and self._batch_task is not asyncio.current_task():
+            self._batch_task.cancel()
+        self._batch_task = None
+
+        signals, self._pending_signals = self._pending_signals, []
+        if not signals:
+            return
+        try:
+            await self.validate_batch(signals)
+        except Exception as e:
+            self._log.error("signal_batch_error", error=str(e), signals=len(signals))
+
     async def _on_order_filled(self, data: dict) -> None:
         """Handle order filled event from event bus.
 
@@ -1008,6 +1466,7 @@ class RiskManager(BaseComponent):
         - price: Fill price
         - fee: Optional fee amount
         - signal_type: Optional - ARBITRAGE means hedged, else unhedged
+        - asset: Optional - underlying asset for per-asset exposure
         - cost: Optional - pre-computed cost, else computed from size * price + fee
         """
         try:
@@ -1027,9 +1486,27 @@ class RiskManager(BaseComponent):
                 cost=Decimal(str(data["cost"])) if "cost" in data else None,
             )
 
+            asset = data.get("asset")
+            if asset and fill.market_id:
+                self._market_assets[fill.market_id] = str(asset).upper()
+
             # Record the fill (updates daily stats and per-market exposure)
             self.record_fill(fill)
 
+            # Update scenario positions and re-evaluate worst-case P&L
+            outcome = fill.outcome or fill.side
+            if fill.side == "SELL":
+                self._scenarios.reduce(fill.market_id, outcome, float(fill.size))
+            elif fill.market_id:
+                self._scenarios.apply_fill(
+                    fill.market_id,
+                    outcome,
+                    float(fill.size),
+                    float(fill.cost),
+                    asset=self._market_assets.get(fill.market_id),
+                )
+            self._update_scenario_risk()
+
             # Update unhedged exposure based on signal type
             # Arbitrage trades are hedged (both YES and NO), so no unhedged exposure change
             # Directional trades add to unhedged exposure
@@ -1099,15 +1576,13 @@ class RiskManager(BaseComponent):
 
             # Reduce current total exposure
             self._current_exposure = max(Decimal("0"), self._current_exposure - cost_basis)
+            self._last_ledger_change = _time.monotonic()
 
-            # Reduce per-market exposure
-            if market_id and market_id in self._market_exposures:
-                current_market_exposure = self._market_exposures[market_id]
-                new_market_exposure = max(Decimal("0"), current_market_exposure - cost_basis)
-                if new_market_exposure == Decimal("0"):
-                    del self._market_exposures[market_id]
-                else:
-                    self._market_exposures[market_id] = new_market_exposure
+            # Reduce per-market and per-asset exposure
+            if market_id in self._market_exposures:
+                self._add_market_exposure(market_id, -cost_basis)
+            self._scenarios.close(market_id, float(cost_basis))
+            self._update_scenario_risk()
 
             # Reduce unhedged exposure for non-arbitrage positions
             is_hedged = data.get("is_hedged", False)
@@ -6,6 +6,8 @@ This service:
 - Tracks daily statistics
 - Uses connection pooling for concurrent access
 - Supports schema migrations
+- Optionally queues writes and group-commits them in the background
+  (database.write_behind), so bursts of fills share one transaction
 
 Ported schema from legacy/src/persistence.py includes:
 - trades: Enhanced with execution tracking, liquidity context, hedge ratio
@@ -19,11 +21,12 @@ Ported schema from legacy/src/persistence.py includes:
 """
 
 import asyncio
+import time
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
 import aiosqlite
 import structlog
@@ -31,6 +34,9 @@ import structlog
 from mercury.core.config import ConfigManager
 from mercury.core.events import EventBus
 
+if TYPE_CHECKING:
+    from mercury.services.metrics import MetricsEmitter
+
 log = structlog.get_logger()
 
 # Schema version - increment when base schema changes
@@ -380,6 +386,38 @@ class Position:
             return (self.entry_price - current_price) * self.size
 
 
+@dataclass
+class MarketExposure:
+    """Open position cost aggregated per market and side.
+
+    Hedged cost is the part of the position where YES and NO shares pair
+    off and pay $1 whatever the outcome; the remainder is unhedged.
+    """
+
+    market_id: str
+    asset: Optional[str] = None
+    yes_size: Decimal = Decimal("0")
+    yes_cost: Decimal = Decimal("0")
+    no_size: Decimal = Decimal("0")
+    no_cost: Decimal = Decimal("0")
+
+    @property
+    def total_cost(self) -> Decimal:
+        """Get total cost basis of open positions in the market."""
+        return self.yes_cost + self.no_cost
+
+    @property
+    def unhedged_cost(self) -> Decimal:
+        """Get cost basis of shares not matched by the opposite side."""
+        paired = min(self.yes_size, self.no_size)
+        unhedged = Decimal("0")
+        if self.yes_size > paired:
+            unhedged += self.yes_cost * (self.yes_size - paired) / self.yes_size
+        if self.no_size > paired:
+            unhedged += self.no_cost * (self.no_size - paired) / self.no_size
+        return unhedged
+
+
 @dataclass
 class PositionResult:
     """Result of closing a position."""
@@ -571,26 +609,32 @@ class SettlementQueueEntry:
 
 
 class ConnectionPool:
-    """Simple connection pool for concurrent SQLite access.
-
-    aiosqlite connections are not thread-safe by default. This pool
-    manages a single connection with a lock to serialize access,
-    which is the recommended approach for SQLite.
-
-    For higher concurrency, consider using WAL mode (already enabled)
-    which allows concurrent reads while writes are serialized.
+    """Connection pool for concurrent SQLite access.
+
+    SQLite allows one writer at a time, so the pool has a single writer
+    connection and a lock to serialize writes through it. In WAL mode
+    readers don't block the writer or each other, so the pool also opens
+    `readers` read-only connections; acquire_reader() hands them out in
+    turn, without taking the lock. Each aiosqlite connection runs on its
+    own thread, so a slow report on a reader doesn't queue behind (or
+    delay) writes on the writer.
+
+    With no readers, or for an in-memory database (which other connections
+    cannot see), acquire_reader() returns the writer.
     """
 
-    def __init__(self, db_path: str, pool_size: int = 1):
+    def __init__(self, db_path: str, readers: int = 0):
         """Initialize connection pool.
 
         Args:
             db_path: Path to SQLite database file.
-            pool_size: Number of connections (currently always 1 for SQLite).
+            readers: Read-only connections opened besides the writer.
         """
         self._db_path = db_path
-        self._pool_size = pool_size
+        self._readers_wanted = 0 if db_path == ":memory:" else max(readers, 0)
         self._connection: Optional[aiosqlite.Connection] = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._next_reader = 0
         self._lock = asyncio.Lock()
         self._connected = False
 
@@ -611,11 +655,21 @@ class ConnectionPool:
             await self._connection.execute("PRAGMA synchronous=NORMAL")
             await self._connection.execute("PRAGMA busy_timeout=5000")
 
+            for _ in range(self._readers_wanted):
+                reader = await aiosqlite.connect(self._db_path)
+                reader.row_factory = aiosqlite.Row
+                await reader.execute("PRAGMA query_only=ON")
+                await reader.execute("PRAGMA busy_timeout=5000")
+                self._readers.append(reader)
+
             self._connected = True
 
     async def close(self) -> None:
         """Close all connections."""
         async with self._lock:
+            for reader in self._readers:
+                await reader.close()
+            self._readers = []
             if self._connection:
                 await self._connection.close()
                 self._connection = None
@@ -639,12 +693,267 @@ class ConnectionPool:
             raise RuntimeError("Connection pool not connected")
         return self._connection
 
+    async def acquire_reader(self) -> aiosqlite.Connection:
+        """Acquire a read-only connection, round robin over the readers.
+
+        Returns:
+            Database connection for queries (the writer if there are no readers).
+
+        Raises:
+            RuntimeError: If pool is not connected.
+        """
+        if not self._readers:
+            return await self.acquire()
+        reader = self._readers[self._next_reader % len(self._readers)]
+        self._next_reader += 1
+        return reader
+
+    @property
+    def reader_count(self) -> int:
+        """Number of open read-only connections."""
+        return len(self._readers)
+
     @property
     def lock(self) -> asyncio.Lock:
         """Get the connection lock for write operations."""
         return self._lock
 
 
+@dataclass
+class _PendingWrite:
+    """A queued statement; sql is None for a flush barrier."""
+
+    sql: Optional[str]
+    params: Sequence[Any] = ()
+    # Resolved once committed (with the row ID if want_rowid)
+    future: Optional[asyncio.Future] = None
+    want_rowid: bool = False
+
+
+class WriteBehindQueue:
+    """Group commit for StateStore writes.
+
+    Writes are queued in memory and committed by a background flusher in
+    one transaction every flush_interval_ms, or as soon as max_rows are
+    queued. Consecutive writes of the same statement are sent with one
+    executemany(). Order is preserved.
+
+    A write that must be on disk before its caller continues asks for a
+    future and awaits it, which flushes the queue at once instead of at the
+    interval; flush() waits for everything queued so far. If a batch fails,
+    it is rolled back and replayed one statement at a time, so one bad row
+    only loses itself; its future gets the exception, and rows nobody
+    awaits are logged.
+
+    Usage:
+        queue = WriteBehindQueue(pool, flush_interval_ms=50, max_rows=500)
+        queue.start()
+        queue.submit("INSERT ...", params)
+        await queue.submit("INSERT ...", params, wait=True)
+        await queue.close()
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        flush_interval_ms: float,
+        max_rows: int,
+        metrics_emitter: Optional["MetricsEmitter"] = None,
+    ):
+        """Initialize the queue.
+
+        Args:
+            pool: Connection pool to commit through.
+            flush_interval_ms: Longest a write waits for others to join it.
+            max_rows: Queued writes that trigger an immediate flush.
+            metrics_emitter: Optional MetricsEmitter for depth and flush latency.
+        """
+        self._pool = pool
+        self._interval = flush_interval_ms / 1000
+        self._max_rows = max(max_rows, 1)
+        self._metrics = metrics_emitter
+        self._pending: list[_PendingWrite] = []
+        self._has_rows = asyncio.Event()
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._flushing = False
+        self._closing = False
+        self._log = log.bind(component="write_behind")
+
+    @property
+    def depth(self) -> int:
+        """Writes queued and not yet being flushed."""
+        return len(self._pending)
+
+    @property
+    def idle(self) -> bool:
+        """Whether nothing is queued or being flushed."""
+        return not self._pending and not self._flushing
+
+    def start(self) -> None:
+        """Start the background flusher."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Commit whatever is still queued and stop the flusher."""
+        self._closing = True
+        self._has_rows.set()
+        self._full.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        while self._pending:
+            await self._flush_batch()
+
+    def submit(
+        self,
+        sql: str,
+        params: Sequence[Any] = (),
+        wait: bool = False,
+        want_rowid: bool = False,
+    ) -> Optional[asyncio.Future]:
+        """Queue a write.
+
+        Args:
+            sql: Statement to execute.
+            params: Statement parameters.
+            wait: Return a future resolved once the write is committed.
+            want_rowid: Resolve the future with the inserted row ID.
+
+        Returns:
+            The future if wait or want_rowid, else None.
+        """
+        if not (wait or want_rowid):
+            self._enqueue(_PendingWrite(sql, params))
+            return None
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(_PendingWrite(sql, params, future, want_rowid))
+        # Someone is waiting on this write; don't hold it for the interval
+        self._full.set()
+        return future
+
+    async def flush(self) -> None:
+        """Commit everything queued so far, without waiting for the interval."""
+        if self.idle:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(_PendingWrite(None, future=future))
+        self._full.set()
+        await future
+
+    def _enqueue(self, write: _PendingWrite) -> None:
+        self._pending.append(write)
+        self._has_rows.set()
+        if len(self._pending) >= self._max_rows:
+            self._full.set()
+        if self._metrics:
+            self._metrics.update_state_store_queue_depth(len(self._pending))
+
+    async def _run(self) -> None:
+        """Flush every interval once something is queued, until closed."""
+        while not (self._closing and not self._pending):
+            await self._has_rows.wait()
+            if not self._full.is_set():
+                try:
+                    await asyncio.wait_for(self._full.wait(), self._interval)
+                except asyncio.TimeoutError:
+                    pass
+            await self._flush_batch()
+
+    async def _flush_batch(self) -> None:
+        """Commit the queued writes in one transaction."""
+        batch, self._pending = self._pending, []
+        self._has_rows.clear()
+        self._full.clear()
+        if not batch:
+            return
+
+        start = time.perf_counter()
+        self._flushing = True
+        try:
+            conn = await self._pool.acquire()
+            async with self._pool.lock:
+                try:
+                    results = await self._execute(conn, batch)
+                    await conn.commit()
+                except Exception as e:
+                    await conn.rollback()
+                    self._log.warning(
+                        "write_behind_batch_failed", rows=len(batch), error=str(e)
+                    )
+                    results = await self._replay(conn, batch)
+        except Exception as e:
+            # No connection: the batch is lost, so tell whoever is waiting
+            self._log.error("write_behind_flush_failed", rows=len(batch), error=str(e))
+            results = [e] * len(batch)
+        finally:
+            self._flushing = False
+
+        for write, result in zip(batch, results):
+            if write.future is None or write.future.done():
+                continue
+            if isinstance(result, Exception):
+                write.future.set_exception(result)
+            else:
+                write.future.set_result(result if write.want_rowid else None)
+
+        rows = sum(1 for write in batch if write.sql is not None)
+        if self._metrics:
+            self._metrics.record_state_store_flush((time.perf_counter() - start) * 1000, rows)
+            self._metrics.update_state_store_queue_depth(len(self._pending))
+
+    @staticmethod
+    async def _execute(conn: aiosqlite.Connection, batch: list[_PendingWrite]) -> list[Any]:
+        """Execute a batch, consecutive runs of one statement via executemany."""
+        results: list[Any] = [None] * len(batch)
+        i = 0
+        while i < len(batch):
+            write = batch[i]
+            if write.sql is None:
+                i += 1
+            elif write.want_rowid:
+                cursor = await conn.execute(write.sql, write.params)
+                results[i] = cursor.lastrowid or 0
+                i += 1
+            else:
+                end = i + 1
+                while (
+                    end < len(batch)
+                    and batch[end].sql == write.sql
+                    and not batch[end].want_rowid
+                ):
+                    end += 1
+                if end - i == 1:
+                    await conn.execute(write.sql, write.params)
+                else:
+                    await conn.executemany(write.sql, [w.params for w in batch[i:end]])
+                i = end
+        return results
+
+    async def _replay(self, conn: aiosqlite.Connection, batch: list[_PendingWrite]) -> list[Any]:
+        """Commit a failed batch statement by statement."""
+        results: list[Any] = []
+        for write in batch:
+            if write.sql is None:
+                results.append(None)
+                continue
+            try:
+                cursor = await conn.execute(write.sql, write.params)
+                await conn.commit()
+                results.append(cursor.lastrowid or 0)
+            except Exception as e:
+                await conn.rollback()
+                if write.future is None:
+                    self._log.error(
+                        "write_behind_row_failed",
+                        statement=" ".join(write.sql.split()[:3]),
+                        error=str(e),
+                    )
+                results.append(e)
+        return results
+
+
 class MigrationRunner:
     """Handles database schema migrations.
 
@@ -750,13 +1059,26 @@ class StateStore:
 
     Uses connection pooling for concurrent access with proper locking
     for write operations. Supports schema migrations.
+
+    Queries run on the pool's read-only connections (database.read_connections),
+    so reports and health checks don't wait behind trading writes.
+
+    With database.write_behind, the frequent writes (trades, positions,
+    fills, telemetry, daily stats) are queued and group-committed by a
+    WriteBehindQueue instead of each committing on its own. Reads flush
+    the queue first, so they always see earlier writes.
     """
 
+    DEFAULT_READ_CONNECTIONS = 2
+    DEFAULT_FLUSH_INTERVAL_MS = 50.0
+    DEFAULT_FLUSH_MAX_ROWS = 500
+
     def __init__(
         self,
         db_path: Optional[str] = None,
         config: Optional[ConfigManager] = None,
         event_bus: Optional[EventBus] = None,
+        metrics_emitter: Optional["MetricsEmitter"] = None,
     ):
         """Initialize the state store.
 
@@ -764,6 +1086,7 @@ class StateStore:
             db_path: Direct path to database file (takes precedence).
             config: Configuration manager for default settings.
             event_bus: Optional EventBus for event subscription.
+            metrics_emitter: Optional MetricsEmitter for write queue metrics.
         """
         self._config = config
         self._event_bus = event_bus
@@ -777,10 +1100,25 @@ class StateStore:
         else:
             self._db_path = "./data/mercury.db"
 
-        self._pool = ConnectionPool(self._db_path)
+        readers = self.DEFAULT_READ_CONNECTIONS
+        if config:
+            readers = config.get_int("database.read_connections", readers)
+        self._pool = ConnectionPool(self._db_path, readers=readers)
         self._migration_runner = MigrationRunner(self._pool)
         self._start_time: Optional[float] = None
 
+        # Write-behind group commit (off unless configured)
+        self._writes: Optional[WriteBehindQueue] = None
+        if config and config.get_bool("database.write_behind", False):
+            self._writes = WriteBehindQueue(
+                self._pool,
+                flush_interval_ms=config.get_float(
+                    "database.flush_interval_ms", self.DEFAULT_FLUSH_INTERVAL_MS
+                ),
+                max_rows=config.get_int("database.flush_max_rows", self.DEFAULT_FLUSH_MAX_ROWS),
+                metrics_emitter=metrics_emitter,
+            )
+
     @property
     def is_connected(self) -> bool:
         """Check if database is connected."""
@@ -788,8 +1126,6 @@ class StateStore:
 
     async def connect(self) -> None:
         """Connect to database and run migrations."""
-        import time
-
         self._start_time = time.time()
         self._log.info("connecting_state_store", db_path=str(self._db_path))
 
@@ -806,6 +1142,9 @@ class StateStore:
         if applied:
             self._log.info("migrations_applied", versions=applied)
 
+        if self._writes is not None:
+            self._writes.start()
+
         # Subscribe to events
         if self._event_bus:
             await self._event_bus.subscribe("order.filled", self._on_order_filled)
@@ -815,17 +1154,69 @@ class StateStore:
         self._log.info("state_store_connected")
 
     async def close(self) -> None:
-        """Close database connection."""
+        """Commit queued writes and close database connection."""
+        if self._writes is not None:
+            await self._writes.close()
         await self._pool.close()
         self._log.info("state_store_closed")
 
+    @property
+    def write_queue_depth(self) -> int:
+        """Writes queued for the next group commit (0 without write-behind)."""
+        return self._writes.depth if self._writes is not None else 0
+
+    async def flush(self) -> None:
+        """Wait until every write issued so far is committed."""
+        if self._writes is not None:
+            await self._writes.flush()
+
+    async def _acquire(self) -> aiosqlite.Connection:
+        """Get the writer connection, after committing queued writes."""
+        if self._writes is not None and not self._writes.idle:
+            await self._writes.flush()
+        return await self._pool.acquire()
+
+    async def _acquire_reader(self) -> aiosqlite.Connection:
+        """Get a read-only connection, after committing queued writes."""
+        if self._writes is not None and not self._writes.idle:
+            await self._writes.flush()
+        return await self._pool.acquire_reader()
+
+    async def _write(self, sql: str, params: Sequence[Any], durable: bool = False) -> None:
+        """Execute and commit a write, or queue it with write-behind.
+
+        Args:
+            sql: Statement to execute.
+            params: Statement parameters.
+            durable: With write-behind, wait for the write's batch to commit.
+        """
+        if self._writes is None:
+            conn = await self._pool.acquire()
+            async with self._pool.lock:
+                await conn.execute(sql, params)
+                await conn.commit()
+            return
+        future = self._writes.submit(sql, params, wait=durable)
+        if future is not None:
+            await future
+
+    async def _insert(self, sql: str, params: Sequence[Any]) -> int:
+        """Execute and commit an insert, returning its row ID."""
+        if self._writes is None:
+            conn = await self._pool.acquire()
+            async with self._pool.lock:
+                cursor = await conn.execute(sql, params)
+                await conn.commit()
+                return cursor.lastrowid or 0
+        return await self._writes.submit(sql, params, want_rowid=True)
+
     async def _get_tables(self) -> list[str]:
         """Get list of tables in the database.
 
         Returns:
             List of table names.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         tables = []
         async with conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table'"
@@ -844,64 +1235,68 @@ class StateStore:
 
     # ============ Trade Operations ============
 
-    async def save_trade(self, trade: Trade) -> None:
-        """Save a trade record."""
-        conn = await self._pool.acquire()
-        async with self._pool.lock:
-            await conn.execute(
-                """
-                INSERT OR REPLACE INTO trades
-                (trade_id, market_id, strategy, side, size, price, cost,
-                 status, timestamp, filled_size, avg_fill_price, fee, updated_at,
-                 condition_id, asset, yes_price, no_price, yes_cost, no_cost,
-                 spread, expected_profit, actual_profit, market_end_time, market_slug,
-                 dry_run, yes_shares, no_shares, hedge_ratio, execution_status,
-                 yes_order_status, no_order_status, yes_liquidity_at_price,
-                 no_liquidity_at_price, yes_book_depth_total, no_book_depth_total,
-                 resolved_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    trade.trade_id,
-                    trade.market_id,
-                    trade.strategy,
-                    trade.side,
-                    float(trade.size),
-                    float(trade.price),
-                    float(trade.cost),
-                    trade.status,
-                    trade.timestamp,
-                    float(trade.filled_size),
-                    float(trade.avg_fill_price) if trade.avg_fill_price else None,
-                    float(trade.fee),
-                    datetime.now(timezone.utc),
-                    trade.condition_id,
-                    trade.asset,
-                    float(trade.yes_price) if trade.yes_price else None,
-                    float(trade.no_price) if trade.no_price else None,
-                    float(trade.yes_cost) if trade.yes_cost else None,
-                    float(trade.no_cost) if trade.no_cost else None,
-                    float(trade.spread) if trade.spread else None,
-                    float(trade.expected_profit) if trade.expected_profit else None,
-                    float(trade.actual_profit) if trade.actual_profit else None,
-                    trade.market_end_time,
-                    trade.market_slug,
-                    trade.dry_run,
-                    float(trade.yes_shares) if trade.yes_shares else None,
-                    float(trade.no_shares) if trade.no_shares else None,
-                    float(trade.hedge_ratio) if trade.hedge_ratio else None,
-                    trade.execution_status,
-                    trade.yes_order_status,
-                    trade.no_order_status,
-                    float(trade.yes_liquidity_at_price) if trade.yes_liquidity_at_price else None,
-                    float(trade.no_liquidity_at_price) if trade.no_liquidity_at_price else None,
-                    float(trade.yes_book_depth_total) if trade.yes_book_depth_total else None,
-                    float(trade.no_book_depth_total) if trade.no_book_depth_total else None,
-                    trade.resolved_at,
-                ),
-            )
-            await conn.commit()
+    async def save_trade(self, trade: Trade, durable: bool = False) -> None:
+        """Save a trade record.
+
+        Args:
+            trade: Trade to save.
+            durable: Wait until the write is committed, when writes are
+                     queued (database.write_behind).
+        """
+        await self._write(
+            """
+            INSERT OR REPLACE INTO trades
+            (trade_id, market_id, strategy, side, size, price, cost,
+             status, timestamp, filled_size, avg_fill_price, fee, updated_at,
+             condition_id, asset, yes_price, no_price, yes_cost, no_cost,
+             spread, expected_profit, actual_profit, market_end_time, market_slug,
+             dry_run, yes_shares, no_shares, hedge_ratio, execution_status,
+             yes_order_status, no_order_status, yes_liquidity_at_price,
+             no_liquidity_at_price, yes_book_depth_total, no_book_depth_total,
+             resolved_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                trade.trade_id,
+                trade.market_id,
+                trade.strategy,
+                trade.side,
+                float(trade.size),
+                float(trade.price),
+                float(trade.cost),
+                trade.status,
+                trade.timestamp,
+                float(trade.filled_size),
+                float(trade.avg_fill_price) if trade.avg_fill_price else None,
+                float(trade.fee),
+                datetime.now(timezone.utc),
+                trade.condition_id,
+                trade.asset,
+                float(trade.yes_price) if trade.yes_price else None,
+                float(trade.no_price) if trade.no_price else None,
+                float(trade.yes_cost) if trade.yes_cost else None,
+                float(trade.no_cost) if trade.no_cost else None,
+                float(trade.spread) if trade.spread else None,
+                float(trade.expected_profit) if trade.expected_profit else None,
+                float(trade.actual_profit) if trade.actual_profit else None,
+                trade.market_end_time,
+                trade.market_slug,
+                trade.dry_run,
+                float(trade.yes_shares) if trade.yes_shares else None,
+                float(trade.no_shares) if trade.no_shares else None,
+                float(trade.hedge_ratio) if trade.hedge_ratio else None,
+                trade.execution_status,
+                trade.yes_order_status,
+                trade.no_order_status,
+                float(trade.yes_liquidity_at_price) if trade.yes_liquidity_at_price else None,
+                float(trade.no_liquidity_at_price) if trade.no_liquidity_at_price else None,
+                float(trade.yes_book_depth_total) if trade.yes_book_depth_total else None,
+                float(trade.no_book_depth_total) if trade.no_book_depth_total else None,
+                trade.resolved_at,
+            ),
+            durable=durable,
+        )
 
         self._log.debug(
             "trade_saved",
@@ -911,7 +1306,7 @@ class StateStore:
 
     async def get_trade(self, trade_id: str) -> Optional[Trade]:
         """Get a trade by ID."""
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         async with conn.execute(
             "SELECT * FROM trades WHERE trade_id = ?", (trade_id,)
         ) as cursor:
@@ -944,7 +1339,7 @@ class StateStore:
         Returns:
             List of trades ordered by timestamp descending.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         query = "SELECT * FROM trades WHERE 1=1"
         params: list[Any] = []
@@ -1029,7 +1424,7 @@ class StateStore:
             return None
 
         # Get fills for this trade
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         fills = []
         async with conn.execute(
             "SELECT * FROM fills WHERE trade_id = ? ORDER BY timestamp ASC",
@@ -1073,7 +1468,7 @@ class StateStore:
             actual_profit: Actual profit/loss.
             status: New status (default 'resolved').
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         async with self._pool.lock:
             await conn.execute(
                 """
@@ -1143,42 +1538,42 @@ class StateStore:
 
     # ============ Position Operations ============
 
-    async def save_position(self, position: Position) -> None:
+    async def save_position(self, position: Position, durable: bool = False) -> None:
         """Save a position.
 
         Persists all position fields including entry price, size, and P&L tracking.
 
         Args:
             position: Position to save.
+            durable: Wait until the write is committed, when writes are
+                     queued (database.write_behind).
         """
-        conn = await self._pool.acquire()
-        async with self._pool.lock:
-            await conn.execute(
-                """
-                INSERT OR REPLACE INTO positions
-                (position_id, market_id, strategy, side, size, entry_price,
-                 status, opened_at, closed_at, exit_price, realized_pnl,
-                 unrealized_pnl, current_price, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    position.position_id,
-                    position.market_id,
-                    position.strategy,
-                    position.side,
-                    float(position.size),
-                    float(position.entry_price),
-                    position.status,
-                    position.opened_at,
-                    position.closed_at,
-                    float(position.exit_price) if position.exit_price else None,
-                    float(position.realized_pnl) if position.realized_pnl else None,
-                    float(position.unrealized_pnl) if position.unrealized_pnl else None,
-                    float(position.current_price) if position.current_price else None,
-                    datetime.now(timezone.utc),
-                ),
-            )
-            await conn.commit()
+        await self._write(
+            """
+            INSERT OR REPLACE INTO positions
+            (position_id, market_id, strategy, side, size, entry_price,
+             status, opened_at, closed_at, exit_price, realized_pnl,
+             unrealized_pnl, current_price, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                position.position_id,
+                position.market_id,
+                position.strategy,
+                position.side,
+                float(position.size),
+                float(position.entry_price),
+                position.status,
+                position.opened_at,
+                position.closed_at,
+                float(position.exit_price) if position.exit_price else None,
+                float(position.realized_pnl) if position.realized_pnl else None,
+                float(position.unrealized_pnl) if position.unrealized_pnl else None,
+                float(position.current_price) if position.current_price else None,
+                datetime.now(timezone.utc),
+            ),
+            durable=durable,
+        )
 
         self._log.debug(
             "position_saved",
@@ -1190,7 +1585,7 @@ class StateStore:
 
     async def get_position(self, position_id: str) -> Optional[Position]:
         """Get a position by ID."""
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         async with conn.execute(
             "SELECT * FROM positions WHERE position_id = ?", (position_id,)
         ) as cursor:
@@ -1215,7 +1610,7 @@ class StateStore:
         Returns:
             List of open positions.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         query = "SELECT * FROM positions WHERE status = 'open'"
         params: list[Any] = []
@@ -1237,6 +1632,50 @@ class StateStore:
 
         return positions
 
+    async def get_open_exposures(self) -> list[MarketExposure]:
+        """Get open position cost aggregated per market.
+
+        The asset for each market is taken from its recorded trades, when
+        one was recorded.
+
+        Returns:
+            One MarketExposure per market with open positions.
+        """
+        conn = await self._acquire_reader()
+
+        exposures = []
+        async with conn.execute(
+            """
+            SELECT
+                p.market_id,
+                (SELECT t.asset FROM trades t
+                 WHERE t.market_id = p.market_id AND t.asset IS NOT NULL
+                 LIMIT 1) as asset,
+                COALESCE(SUM(CASE WHEN UPPER(p.side) = 'YES' THEN p.size END), 0) as yes_size,
+                COALESCE(
+                    SUM(CASE WHEN UPPER(p.side) = 'YES' THEN p.size * p.entry_price END), 0
+                ) as yes_cost,
+                COALESCE(SUM(CASE WHEN UPPER(p.side) = 'NO' THEN p.size END), 0) as no_size,
+                COALESCE(
+                    SUM(CASE WHEN UPPER(p.side) = 'NO' THEN p.size * p.entry_price END), 0
+                ) as no_cost
+            FROM positions p
+            WHERE p.status = 'open'
+            GROUP BY p.market_id
+            """
+        ) as cursor:
+            async for row in cursor:
+                exposures.append(MarketExposure(
+                    market_id=row["market_id"],
+                    asset=row["asset"],
+                    yes_size=Decimal(str(row["yes_size"])),
+                    yes_cost=Decimal(str(row["yes_cost"])),
+                    no_size=Decimal(str(row["no_size"])),
+                    no_cost=Decimal(str(row["no_cost"])),
+                ))
+
+        return exposures
+
     async def close_position(
         self,
         position_id: str,
@@ -1248,7 +1687,7 @@ class StateStore:
             position_id: Position to close.
             result: Result of closing (exit price, realized PnL).
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         async with self._pool.lock:
             await conn.execute(
                 """
@@ -1282,6 +1721,7 @@ class StateStore:
         position_id: str,
         current_price: Decimal,
         unrealized_pnl: Optional[Decimal] = None,
+        durable: bool = False,
     ) -> None:
         """Update a position's unrealized P&L based on current price.
 
@@ -1294,9 +1734,9 @@ class StateStore:
             position_id: Position to update.
             current_price: Current market price.
             unrealized_pnl: Pre-calculated unrealized P&L (optional).
+            durable: Wait until the write is committed, when writes are
+                     queued (database.write_behind).
         """
-        conn = await self._pool.acquire()
-
         # If unrealized_pnl not provided, calculate it
         if unrealized_pnl is None:
             position = await self.get_position(position_id)
@@ -1309,23 +1749,22 @@ class StateStore:
                 )
                 return
 
-        async with self._pool.lock:
-            await conn.execute(
-                """
-                UPDATE positions
-                SET unrealized_pnl = ?,
-                    current_price = ?,
-                    updated_at = ?
-                WHERE position_id = ?
-                """,
-                (
-                    float(unrealized_pnl),
-                    float(current_price),
-                    datetime.now(timezone.utc),
-                    position_id,
-                ),
-            )
-            await conn.commit()
+        await self._write(
+            """
+            UPDATE positions
+            SET unrealized_pnl = ?,
+                current_price = ?,
+                updated_at = ?
+            WHERE position_id = ?
+            """,
+            (
+                float(unrealized_pnl),
+                float(current_price),
+                datetime.now(timezone.utc),
+                position_id,
+            ),
+            durable=durable,
+        )
 
         self._log.debug(
             "position_unrealized_pnl_updated",
@@ -1354,7 +1793,7 @@ class StateStore:
         Returns:
             List of positions ordered by opened_at descending.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         query = "SELECT * FROM positions WHERE 1=1"
         params: list[Any] = []
@@ -1397,7 +1836,7 @@ class StateStore:
             - total_realized_pnl: Sum of realized P&L for closed positions
             - total_exposure: Sum of cost basis for open positions
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         async with conn.execute(
             """
@@ -1474,7 +1913,7 @@ class StateStore:
             asset: Asset symbol.
             market_end_time: When the market resolves.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         entry_cost = float(position.size * position.entry_price)
         async with self._pool.lock:
             await conn.execute(
@@ -1519,7 +1958,7 @@ class StateStore:
         Returns:
             List of positions that can be claimed.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         now = datetime.now(timezone.utc).isoformat()
 
         query = """
@@ -1571,7 +2010,7 @@ class StateStore:
             proceeds: Settlement proceeds received.
             profit: Calculated profit (optional).
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         async with self._pool.lock:
             await conn.execute(
                 """
@@ -1616,7 +2055,7 @@ class StateStore:
         Returns:
             The new claim_attempts count after incrementing.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         async with self._pool.lock:
             await conn.execute(
                 """
@@ -1644,7 +2083,7 @@ class StateStore:
         Returns:
             Dict with queue statistics.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         async with conn.execute(
             """
             SELECT
@@ -1676,7 +2115,7 @@ class StateStore:
         Returns:
             List of SettlementQueueEntry objects for failed claims.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         query = """
             SELECT *
@@ -1713,7 +2152,7 @@ class StateStore:
         Returns:
             SettlementQueueEntry or None if not found.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         async with conn.execute(
             "SELECT * FROM settlement_queue WHERE position_id = ?",
@@ -1742,7 +2181,7 @@ class StateStore:
         Returns:
             List of SettlementQueueEntry objects.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         query = "SELECT * FROM settlement_queue WHERE 1=1"
         params: list[Any] = []
@@ -1813,7 +2252,7 @@ class StateStore:
             position_id: Position ID to mark as failed.
             reason: Reason for the failure.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         async with self._pool.lock:
             await conn.execute(
                 """
@@ -1847,7 +2286,7 @@ class StateStore:
         Returns:
             True if entry was found and reset, False otherwise.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         async with self._pool.lock:
             cursor = await conn.execute(
                 """
@@ -1887,7 +2326,7 @@ class StateStore:
         Returns:
             List of SettlementQueueEntry objects with relevant fields for display.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         query = "SELECT * FROM settlement_queue"
         params: list[Any] = []
@@ -1927,7 +2366,7 @@ class StateStore:
         Returns:
             Number of deleted records.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
 
         async with self._pool.lock:
@@ -1967,7 +2406,7 @@ class StateStore:
         Returns:
             List of SettlementQueueEntry objects for the condition.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         entries = []
         async with conn.execute(
@@ -1990,7 +2429,7 @@ class StateStore:
         Returns:
             DailyStats for the requested date.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         target_date = for_date or date.today()
 
         async with conn.execute(
@@ -2030,7 +2469,7 @@ class StateStore:
         Args:
             stats: Updated stats to save.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         async with self._pool.lock:
             await conn.execute(
                 """
@@ -2089,6 +2528,7 @@ class StateStore:
         exposure: Decimal = Decimal("0"),
         opportunities_detected: int = 0,
         opportunities_executed: int = 0,
+        durable: bool = False,
     ) -> None:
         """Increment daily statistics.
 
@@ -2104,37 +2544,39 @@ class StateStore:
             exposure: Exposure to add.
             opportunities_detected: Opportunities detected to add.
             opportunities_executed: Opportunities executed to add.
+            durable: Wait until the write is committed, when writes are
+                     queued (database.write_behind).
         """
         target_date = (for_date or date.today()).isoformat()
-        conn = await self._pool.acquire()
 
-        async with self._pool.lock:
-            await conn.execute(
-                """
-                INSERT INTO daily_stats
-                (date, trade_count, volume_usd, realized_pnl, positions_opened, positions_closed,
-                 wins, losses, exposure, opportunities_detected, opportunities_executed)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    trade_count = trade_count + excluded.trade_count,
-                    volume_usd = volume_usd + excluded.volume_usd,
-                    realized_pnl = realized_pnl + excluded.realized_pnl,
-                    positions_opened = positions_opened + excluded.positions_opened,
-                    positions_closed = positions_closed + excluded.positions_closed,
-                    wins = COALESCE(wins, 0) + excluded.wins,
-                    losses = COALESCE(losses, 0) + excluded.losses,
-                    exposure = COALESCE(exposure, 0) + excluded.exposure,
-                    opportunities_detected = COALESCE(opportunities_detected, 0) + excluded.opportunities_detected,
-                    opportunities_executed = COALESCE(opportunities_executed, 0) + excluded.opportunities_executed,
-                    updated_at = CURRENT_TIMESTAMP
-                """,
-                (
-                    target_date, trades, float(volume), float(realized_pnl),
-                    positions_opened, positions_closed, wins, losses, float(exposure),
-                    opportunities_detected, opportunities_executed,
-                ),
-            )
-            await conn.commit()
+        await self._write(
+            """
+            INSERT INTO daily_stats
+            (date, trade_count, volume_usd, realized_pnl, positions_opened, positions_closed,
+             wins, losses, exposure, opportunities_detected, opportunities_executed)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(date) DO UPDATE SET
+                trade_count = trade_count + excluded.trade_count,
+                volume_usd = volume_usd + excluded.volume_usd,
+                realized_pnl = realized_pnl + excluded.realized_pnl,
+                positions_opened = positions_opened + excluded.positions_opened,
+                positions_closed = positions_closed + excluded.positions_closed,
+                wins = COALESCE(wins, 0) + excluded.wins,
+                losses = COALESCE(losses, 0) + excluded.losses,
+                exposure = COALESCE(exposure, 0) + excluded.exposure,
+                opportunities_detected =
+                    COALESCE(opportunities_detected, 0) + excluded.opportunities_detected,
+                opportunities_executed =
+                    COALESCE(opportunities_executed, 0) + excluded.opportunities_executed,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            (
+                target_date, trades, float(volume), float(realized_pnl),
+                positions_opened, positions_closed, wins, losses, float(exposure),
+                opportunities_detected, opportunities_executed,
+            ),
+            durable=durable,
+        )
 
     async def aggregate_daily_stats(self, for_date: Optional[date] = None) -> DailyStats:
         """Aggregate daily statistics from trades and positions.
@@ -2157,7 +2599,7 @@ class StateStore:
             Aggregated DailyStats for the date.
         """
         target_date = for_date or date.today()
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         # Get trades for the target date
         # Use SQLite's date() function to compare just the date portion
@@ -2289,6 +2731,7 @@ class StateStore:
         size: Decimal,
         price: Decimal,
         fee: Decimal = Decimal("0"),
+        durable: bool = False,
     ) -> None:
         """Save a fill record for slippage analysis.
 
@@ -2301,18 +2744,18 @@ class StateStore:
             size: Fill size.
             price: Fill price.
             fee: Fee paid.
+            durable: Wait until the write is committed, when writes are
+                     queued (database.write_behind).
         """
-        conn = await self._pool.acquire()
-        async with self._pool.lock:
-            await conn.execute(
-                """
-                INSERT OR REPLACE INTO fills
-                (fill_id, trade_id, order_id, token_id, side, size, price, fee)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (fill_id, trade_id, order_id, token_id, side, float(size), float(price), float(fee)),
-            )
-            await conn.commit()
+        await self._write(
+            """
+            INSERT OR REPLACE INTO fills
+            (fill_id, trade_id, order_id, token_id, side, size, price, fee)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (fill_id, trade_id, order_id, token_id, side, float(size), float(price), float(fee)),
+            durable=durable,
+        )
 
     # ============ Fill Records (Detailed) ============
 
@@ -2323,7 +2766,8 @@ class StateStore:
             record: FillRecord to save.
 
         Returns:
-            ID of the inserted record.
+            ID of the inserted record. With write-behind, this waits for the
+            record's batch to commit.
         """
         # Calculate ratios if not provided
         fill_ratio = record.fill_ratio
@@ -2334,31 +2778,27 @@ class StateStore:
         if persistence_ratio is None and record.pre_fill_depth > 0:
             persistence_ratio = record.filled_size / record.pre_fill_depth
 
-        conn = await self._pool.acquire()
-        async with self._pool.lock:
-            cursor = await conn.execute(
-                """
-                INSERT INTO fill_records
-                (token_id, condition_id, asset, side, intended_size, filled_size,
-                 intended_price, actual_avg_price, time_to_fill_ms, slippage,
-                 pre_fill_depth, post_fill_depth, order_type, order_id,
-                 fill_ratio, persistence_ratio)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    record.token_id, record.condition_id, record.asset, record.side,
-                    float(record.intended_size), float(record.filled_size),
-                    float(record.intended_price), float(record.actual_avg_price),
-                    record.time_to_fill_ms, float(record.slippage),
-                    float(record.pre_fill_depth),
-                    float(record.post_fill_depth) if record.post_fill_depth else None,
-                    record.order_type, record.order_id,
-                    float(fill_ratio) if fill_ratio else None,
-                    float(persistence_ratio) if persistence_ratio else None,
-                ),
-            )
-            await conn.commit()
-            return cursor.lastrowid or 0
+        return await self._insert(
+            """
+            INSERT INTO fill_records
+            (token_id, condition_id, asset, side, intended_size, filled_size,
+             intended_price, actual_avg_price, time_to_fill_ms, slippage,
+             pre_fill_depth, post_fill_depth, order_type, order_id,
+             fill_ratio, persistence_ratio)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                record.token_id, record.condition_id, record.asset, record.side,
+                float(record.intended_size), float(record.filled_size),
+                float(record.intended_price), float(record.actual_avg_price),
+                record.time_to_fill_ms, float(record.slippage),
+                float(record.pre_fill_depth),
+                float(record.post_fill_depth) if record.post_fill_depth else None,
+                record.order_type, record.order_id,
+                float(fill_ratio) if fill_ratio else None,
+                float(persistence_ratio) if persistence_ratio else None,
+            ),
+        )
 
     async def get_fill_records(
         self,
@@ -2378,7 +2818,7 @@ class StateStore:
         Returns:
             List of FillRecord objects.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         query = "SELECT * FROM fill_records WHERE 1=1"
         params: list[Any] = []
@@ -2443,7 +2883,7 @@ class StateStore:
         Returns:
             Dict with slippage statistics.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         query = """
             SELECT
@@ -2476,49 +2916,51 @@ class StateStore:
 
     # ============ Trade Telemetry ============
 
-    async def save_trade_telemetry(self, telemetry: TradeTelemetry) -> None:
+    async def save_trade_telemetry(
+        self, telemetry: TradeTelemetry, durable: bool = False
+    ) -> None:
         """Save trade telemetry data.
 
         Args:
             telemetry: TradeTelemetry to save.
+            durable: Wait until the write is committed, when writes are
+                     queued (database.write_behind).
         """
-        conn = await self._pool.acquire()
-        async with self._pool.lock:
-            await conn.execute(
-                """
-                INSERT OR REPLACE INTO trade_telemetry
-                (trade_id, opportunity_detected_at, opportunity_spread,
-                 opportunity_yes_price, opportunity_no_price,
-                 order_placed_at, order_filled_at, execution_latency_ms, fill_latency_ms,
-                 initial_yes_shares, initial_no_shares, initial_hedge_ratio,
-                 rebalance_started_at, rebalance_attempts, position_balanced_at,
-                 resolved_at, final_yes_shares, final_no_shares, final_hedge_ratio, actual_profit)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    telemetry.trade_id,
-                    telemetry.opportunity_detected_at,
-                    float(telemetry.opportunity_spread) if telemetry.opportunity_spread else None,
-                    float(telemetry.opportunity_yes_price) if telemetry.opportunity_yes_price else None,
-                    float(telemetry.opportunity_no_price) if telemetry.opportunity_no_price else None,
-                    telemetry.order_placed_at,
-                    telemetry.order_filled_at,
-                    float(telemetry.execution_latency_ms) if telemetry.execution_latency_ms else None,
-                    float(telemetry.fill_latency_ms) if telemetry.fill_latency_ms else None,
-                    float(telemetry.initial_yes_shares) if telemetry.initial_yes_shares else None,
-                    float(telemetry.initial_no_shares) if telemetry.initial_no_shares else None,
-                    float(telemetry.initial_hedge_ratio) if telemetry.initial_hedge_ratio else None,
-                    telemetry.rebalance_started_at,
-                    telemetry.rebalance_attempts,
-                    telemetry.position_balanced_at,
-                    telemetry.resolved_at,
-                    float(telemetry.final_yes_shares) if telemetry.final_yes_shares else None,
-                    float(telemetry.final_no_shares) if telemetry.final_no_shares else None,
-                    float(telemetry.final_hedge_ratio) if telemetry.final_hedge_ratio else None,
-                    float(telemetry.actual_profit) if telemetry.actual_profit else None,
-                ),
-            )
-            await conn.commit()
+        await self._write(
+            """
+            INSERT OR REPLACE INTO trade_telemetry
+            (trade_id, opportunity_detected_at, opportunity_spread,
+             opportunity_yes_price, opportunity_no_price,
+             order_placed_at, order_filled_at, execution_latency_ms, fill_latency_ms,
+             initial_yes_shares, initial_no_shares, initial_hedge_ratio,
+             rebalance_started_at, rebalance_attempts, position_balanced_at,
+             resolved_at, final_yes_shares, final_no_shares, final_hedge_ratio, actual_profit)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                telemetry.trade_id,
+                telemetry.opportunity_detected_at,
+                float(telemetry.opportunity_spread) if telemetry.opportunity_spread else None,
+                float(telemetry.opportunity_yes_price) if telemetry.opportunity_yes_price else None,
+                float(telemetry.opportunity_no_price) if telemetry.opportunity_no_price else None,
+                telemetry.order_placed_at,
+                telemetry.order_filled_at,
+                float(telemetry.execution_latency_ms) if telemetry.execution_latency_ms else None,
+                float(telemetry.fill_latency_ms) if telemetry.fill_latency_ms else None,
+                float(telemetry.initial_yes_shares) if telemetry.initial_yes_shares else None,
+                float(telemetry.initial_no_shares) if telemetry.initial_no_shares else None,
+                float(telemetry.initial_hedge_ratio) if telemetry.initial_hedge_ratio else None,
+                telemetry.rebalance_started_at,
+                telemetry.rebalance_attempts,
+                telemetry.position_balanced_at,
+                telemetry.resolved_at,
+                float(telemetry.final_yes_shares) if telemetry.final_yes_shares else None,
+                float(telemetry.final_no_shares) if telemetry.final_no_shares else None,
+                float(telemetry.final_hedge_ratio) if telemetry.final_hedge_ratio else None,
+                float(telemetry.actual_profit) if telemetry.actual_profit else None,
+            ),
+            durable=durable,
+        )
 
     async def get_trade_telemetry(self, trade_id: str) -> Optional[TradeTelemetry]:
         """Get telemetry for a specific trade.
@@ -2529,7 +2971,7 @@ class StateStore:
         Returns:
             TradeTelemetry or None.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         async with conn.execute(
             "SELECT * FROM trade_telemetry WHERE trade_id = ?", (trade_id,)
         ) as cursor:
@@ -2572,30 +3014,26 @@ class StateStore:
         Returns:
             ID of the inserted record.
         """
-        conn = await self._pool.acquire()
-        async with self._pool.lock:
-            cursor = await conn.execute(
-                """
-                INSERT INTO rebalance_trades
-                (trade_id, attempted_at, action, shares, price, status,
-                 filled_shares, profit, error, order_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    rebalance.trade_id,
-                    rebalance.attempted_at or datetime.now(timezone.utc),
-                    rebalance.action,
-                    float(rebalance.shares),
-                    float(rebalance.price),
-                    rebalance.status,
-                    float(rebalance.filled_shares),
-                    float(rebalance.profit),
-                    rebalance.error,
-                    rebalance.order_id,
-                ),
-            )
-            await conn.commit()
-            return cursor.lastrowid or 0
+        return await self._insert(
+            """
+            INSERT INTO rebalance_trades
+            (trade_id, attempted_at, action, shares, price, status,
+             filled_shares, profit, error, order_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                rebalance.trade_id,
+                rebalance.attempted_at or datetime.now(timezone.utc),
+                rebalance.action,
+                float(rebalance.shares),
+                float(rebalance.price),
+                rebalance.status,
+                float(rebalance.filled_shares),
+                float(rebalance.profit),
+                rebalance.error,
+                rebalance.order_id,
+            ),
+        )
 
     async def get_rebalance_trades(self, trade_id: str) -> list[RebalanceTrade]:
         """Get all rebalancing trades for a position.
@@ -2606,7 +3044,7 @@ class StateStore:
         Returns:
             List of RebalanceTrade records.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
 
         trades = []
         async with conn.execute(
@@ -2642,7 +3080,7 @@ class StateStore:
         Returns:
             CircuitBreakerState.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
         async with conn.execute(
@@ -2717,7 +3155,7 @@ class StateStore:
         Returns:
             Updated circuit breaker state.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
         async with self._pool.lock:
@@ -2794,7 +3232,7 @@ class StateStore:
         Args:
             reason: Reason for manual reset.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire()
         async with self._pool.lock:
             await conn.execute(
                 """
@@ -2818,7 +3256,7 @@ class StateStore:
         Returns:
             Total realized P&L.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         async with conn.execute(
             "SELECT COALESCE(SUM(pnl_amount), 0) as total FROM realized_pnl_ledger"
         ) as cursor:
@@ -2831,7 +3269,7 @@ class StateStore:
         Returns:
             Today's realized P&L.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         async with conn.execute(
             "SELECT COALESCE(SUM(pnl_amount), 0) as total FROM realized_pnl_ledger WHERE trade_date = ?",
@@ -2846,7 +3284,7 @@ class StateStore:
         Returns:
             Dict mapping pnl_type to total amount.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         result: dict[str, Decimal] = {}
         async with conn.execute(
             """
@@ -2868,7 +3306,7 @@ class StateStore:
         Returns:
             List of P&L entries for the day.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         target_date = for_date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
         entries = []
@@ -2928,7 +3366,7 @@ class StateStore:
         Returns:
             Dict with table names and their row counts.
         """
-        conn = await self._pool.acquire()
+        conn = await self._acquire_reader()
         tables = [
             "trades", "positions", "settlement_queue", "daily_stats",
             "fills", "fill_records", "trade_telemetry", "rebalance_trades",
@@ -2967,7 +3405,7 @@ class StateStore:
             }
 
         try:
-            conn = await self._pool.acquire()
+            conn = await self._acquire_reader()
             async with conn.execute("SELECT 1") as cursor:
                 await cursor.fetchone()
 
@@ -4,25 +4,48 @@ This service:
 - Loads and manages trading strategies
 - Routes market data to strategies
 - Collects and publishes trading signals
+- Evaluates strategies concurrently with per-strategy time budgets
+- Optionally batches updates for strategies implementing on_market_batch()
+- Skips strategies whose declared book inputs did not change
+- Optionally processes each market on its own actor task with a bounded mailbox
 - Supports runtime enable/disable via events and config hot-reload
 """
 
 import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional, Set
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set
 
+import numpy as np
 import structlog
 
 from mercury.core.config import ConfigManager
 from mercury.core.events import EventBus
 from mercury.core.lifecycle import BaseComponent, HealthCheckResult, HealthStatus
 from mercury.domain.market import OrderBook
+from mercury.domain.market_batch import MarketBatch
 from mercury.domain.signal import TradingSignal
-from mercury.strategies.base import BaseStrategy
+from mercury.services.metrics import MetricsEmitter
+from mercury.strategies.base import DEFAULT_DEPTH, BaseStrategy, BookInterest
 
 log = structlog.get_logger()
 
 
+@dataclass
+class MarketActor:
+    """Mailbox and worker task processing one market's updates in order."""
+
+    market_id: str
+    mailbox: deque = field(default_factory=deque)
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional[asyncio.Task] = None
+    processed: int = 0
+    conflated: int = 0
+    last_lag_ms: float = 0.0
+
+
 class StrategyEngine(BaseComponent):
     """Orchestrates trading strategy execution.
 
@@ -30,11 +53,36 @@ class StrategyEngine(BaseComponent):
     1. Loads enabled strategies from configuration
     2. Subscribes to market data for each strategy's markets
     3. Routes market data to appropriate strategies
-    4. Collects signals and publishes to EventBus
-    5. Syncs strategy enabled/disabled state on config hot-reload
+    4. Evaluates interested strategies concurrently, each within a time budget
+    5. Collects signals and publishes to EventBus
+    6. Syncs strategy enabled/disabled state on config hot-reload
+
+    A strategy that exceeds its evaluation budget has its signals for that
+    update dropped, so one slow strategy cannot delay the others or stall
+    the EventBus subscriber loop.
+
+    Batch evaluation is enabled by strategy_engine.batch_interval_ms and/or
+    strategy_engine.batch_max_dirty. Strategies that implement
+    on_market_batch() are then no longer called per event; instead the
+    engine records each update in a MarketBatch and calls the hook with the
+    changed rows on a fixed cadence, or as soon as the number of changed
+    markets reaches batch_max_dirty.
+
+    Strategies declaring an ``interest`` (see BookInterest) are only invoked
+    when the update changed one of their inputs relative to the previous
+    book for that market; skipped invocations are counted per strategy.
+
+    With strategy_engine.market_actors enabled, each subscribed market gets
+    its own actor task and bounded mailbox. Updates within a market are
+    processed in order; when the mailbox is full the oldest pending update
+    is dropped (latest wins), so a hot market cannot build an unbounded
+    backlog or hold up other markets. Actors are reclaimed by
+    unsubscribe_market().
 
     Event channels subscribed:
     - market.orderbook.* - Market data for strategies
+    - market.trade.* - Trades, for strategies interested in BookInterest.TRADES
+    - system.market.unsubscribe - Stop routing a market and reclaim its actor
     - system.strategy.enable - Enable a strategy at runtime
     - system.strategy.disable - Disable a strategy at runtime
 
@@ -44,20 +92,29 @@ class StrategyEngine(BaseComponent):
     - system.strategy.disabled - Published when a strategy is disabled
     """
 
+    # Default evaluation budget per strategy per market update
+    DEFAULT_EVALUATION_TIMEOUT_MS = 100.0
+
+    # Default pending updates per market actor before conflation
+    DEFAULT_MAILBOX_SIZE = 8
+
     def __init__(
         self,
         config: ConfigManager,
         event_bus: EventBus,
+        metrics_emitter: Optional[MetricsEmitter] = None,
     ):
         """Initialize the strategy engine.
 
         Args:
             config: Configuration manager.
             event_bus: EventBus for events.
+            metrics_emitter: Optional MetricsEmitter for evaluation metrics.
         """
         super().__init__()
         self._config = config
         self._event_bus = event_bus
+        self._metrics = metrics_emitter
         self._log = log.bind(component="strategy_engine")
 
         self._strategies: Dict[str, BaseStrategy] = {}
@@ -65,6 +122,57 @@ class StrategyEngine(BaseComponent):
         self._should_run = False
         self._config_reload_registered = False
 
+        # Evaluation budgets (seconds), resolved per strategy at registration
+        self._default_timeout = self._get_float(
+            "strategy_engine.evaluation_timeout_ms",
+            self.DEFAULT_EVALUATION_TIMEOUT_MS,
+        ) / 1000.0
+        self._strategy_timeouts: Dict[str, float] = {}
+
+        # Evaluation statistics
+        self._evaluation_counts: Dict[str, int] = {}
+        self._overrun_counts: Dict[str, int] = {}
+        self._skipped_counts: Dict[str, int] = {}
+
+        # Last book per market, for computing change masks
+        self._last_books: Dict[str, OrderBook] = {}
+
+        # Batch evaluation (disabled when both knobs are 0)
+        self._batch = MarketBatch()
+        self._batch_interval = self._get_float("strategy_engine.batch_interval_ms", 0.0) / 1000.0
+        self._batch_max_dirty = int(self._get_float("strategy_engine.batch_max_dirty", 0.0))
+        self._batch_enabled = self._batch_interval > 0 or self._batch_max_dirty > 0
+        self._batch_rows: Dict[str, np.ndarray] = {}
+        self._batch_task: Optional[asyncio.Task] = None
+
+        # Per-market actors (disabled = process updates inline)
+        self._market_actors = self._get_bool("strategy_engine.market_actors", False)
+        self._mailbox_size = max(
+            1, int(self._get_float("strategy_engine.mailbox_size", self.DEFAULT_MAILBOX_SIZE))
+        )
+        self._actors: Dict[str, MarketActor] = {}
+
+    def _get_float(self, key: str, default: float) -> float:
+        """Get a float config value, falling back to default when unset."""
+        value = self._config.get(key)
+        if value is None or value == "":
+            return default
+        return float(value)
+
+    def _get_bool(self, key: str, default: bool) -> bool:
+        """Get a bool config value, falling back to default when unset."""
+        value = self._config.get(key)
+        if value is None or value == "":
+            return default
+        if isinstance(value, str):
+            return value.lower() in ("true", "1", "yes", "on")
+        return bool(value)
+
+    @property
+    def batch(self) -> MarketBatch:
+        """Columnar top-of-book state used for batch evaluation."""
+        return self._batch
+
     @property
     def strategy_count(self) -> int:
         """Number of registered strategies."""
@@ -84,15 +192,22 @@ class StrategyEngine(BaseComponent):
         for name, strategy in self._strategies.items():
             try:
                 await strategy.start()
+                # Worker-process strategies only know their markets once started
+                self._map_markets(name, strategy)
                 self._log.info("strategy_started", name=name)
             except Exception as e:
                 self._log.error("strategy_start_failed", name=name, error=str(e))
 
         # Subscribe to events
         await self._event_bus.subscribe("market.orderbook.*", self._on_market_data)
+        await self._event_bus.subscribe("market.trade.*", self._on_trade)
+        await self._event_bus.subscribe("system.market.unsubscribe", self._on_unsubscribe_market)
         await self._event_bus.subscribe("system.strategy.enable", self._on_enable_strategy)
         await self._event_bus.subscribe("system.strategy.disable", self._on_disable_strategy)
 
+        if self._batch_interval > 0 and self._batch_task is None:
+            self._batch_task = asyncio.create_task(self._batch_loop())
+
         # Register config reload callback to sync strategy states
         if not self._config_reload_registered:
             self._config.register_reload_callback(self._on_config_reload)
@@ -113,6 +228,17 @@ class StrategyEngine(BaseComponent):
         """Stop the strategy engine."""
         self._should_run = False
 
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+            try:
+                await self._batch_task
+            except asyncio.CancelledError:
+                pass
+            self._batch_task = None
+
+        for market_id in list(self._actors):
+            await self._reclaim_actor(market_id)
+
         # Unregister config reload callback
         if self._config_reload_registered:
             self._config.unregister_reload_callback(self._on_config_reload)
@@ -170,12 +296,12 @@ class StrategyEngine(BaseComponent):
             return
 
         self._strategies[name] = strategy
+        self._strategy_timeouts[name] = self._get_float(
+            f"strategies.{name}.evaluation_timeout_ms",
+            self._default_timeout * 1000.0,
+        ) / 1000.0
 
-        # Map markets to strategy
-        for market_id in strategy.get_subscribed_markets():
-            if market_id not in self._market_to_strategies:
-                self._market_to_strategies[market_id] = set()
-            self._market_to_strategies[market_id].add(name)
+        self._map_markets(name, strategy)
 
         self._log.info(
             "strategy_registered",
@@ -183,6 +309,18 @@ class StrategyEngine(BaseComponent):
             markets=len(strategy.get_subscribed_markets()),
         )
 
+    def _map_markets(self, name: str, strategy: BaseStrategy) -> None:
+        """Route a strategy's subscribed markets to it."""
+        for market_id in strategy.get_subscribed_markets():
+            if market_id not in self._market_to_strategies:
+                self._market_to_strategies[market_id] = set()
+            self._market_to_strategies[market_id].add(name)
+
+        if self._uses_batch(strategy):
+            for market_id in strategy.get_subscribed_markets():
+                self._batch.ensure_row(market_id)
+            self._batch_rows[name] = self._batch.rows_for(strategy.get_subscribed_markets())
+
     def unregister_strategy(self, name: str) -> None:
         """Unregister a strategy.
 
@@ -193,6 +331,8 @@ class StrategyEngine(BaseComponent):
             return
 
         strategy = self._strategies.pop(name)
+        self._strategy_timeouts.pop(name, None)
+        self._batch_rows.pop(name, None)
 
         # Remove from market mappings
         for market_id in strategy.get_subscribed_markets():
@@ -201,10 +341,71 @@ class StrategyEngine(BaseComponent):
 
         self._log.info("strategy_unregistered", name=name)
 
+    async def unsubscribe_market(self, market_id: str) -> None:
+        """Stop routing a market to strategies and reclaim its actor.
+
+        Strategies that support unsubscribe_market() are unsubscribed too.
+
+        Args:
+            market_id: Market condition ID.
+        """
+        for name in self._market_to_strategies.pop(market_id, set()):
+            strategy = self._strategies.get(name)
+            unsubscribe = getattr(strategy, "unsubscribe_market", None)
+            if callable(unsubscribe):
+                unsubscribe(market_id)
+
+        self._last_books.pop(market_id, None)
+        await self._reclaim_actor(market_id)
+        self._log.info("market_unsubscribed", market_id=market_id)
+
+    def get_actor_stats(self) -> dict[str, dict[str, float]]:
+        """Get mailbox depth, lag and counts for each market actor.
+
+        Returns:
+            Dict mapping market ID to {"depth", "lag_ms", "processed", "conflated"}.
+        """
+        return {
+            market_id: {
+                "depth": len(actor.mailbox),
+                "lag_ms": actor.last_lag_ms,
+                "processed": actor.processed,
+                "conflated": actor.conflated,
+            }
+            for market_id, actor in self._actors.items()
+        }
+
     def get_strategy(self, name: str) -> Optional[BaseStrategy]:
         """Get a strategy by name."""
         return self._strategies.get(name)
 
+    def get_evaluation_timeout(self, name: str) -> float:
+        """Get the evaluation budget for a strategy in seconds.
+
+        Args:
+            name: Strategy name.
+
+        Returns:
+            Per-strategy budget, or the engine default if not registered.
+        """
+        return self._strategy_timeouts.get(name, self._default_timeout)
+
+    def get_evaluation_stats(self) -> dict[str, dict[str, int]]:
+        """Get per-strategy evaluation, overrun and skip counts.
+
+        Returns:
+            Dict mapping strategy name to
+            {"evaluations": n, "overruns": n, "skipped": n}.
+        """
+        return {
+            name: {
+                "evaluations": self._evaluation_counts.get(name, 0),
+                "overruns": self._overrun_counts.get(name, 0),
+                "skipped": self._skipped_counts.get(name, 0),
+            }
+            for name in self._strategies
+        }
+
     def is_strategy_enabled(self, name: str) -> bool:
         """Check if a strategy is enabled.
 
@@ -289,6 +490,81 @@ class StrategyEngine(BaseComponent):
 
     async def _on_market_data(self, data: dict) -> None:
         """Handle market data update."""
+        if not self._market_actors:
+            await self._process_market_data(data)
+            return
+
+        market_id = data.get("market_id")
+        if not market_id or not self._market_to_strategies.get(market_id):
+            return
+        self._enqueue(market_id, data)
+
+    def _enqueue(self, market_id: str, data: dict) -> None:
+        """Post an update to a market's actor, starting the actor if needed."""
+        actor = self._actors.get(market_id)
+        if actor is None:
+            actor = MarketActor(market_id=market_id)
+            actor.task = asyncio.create_task(self._run_actor(actor))
+            self._actors[market_id] = actor
+
+        if len(actor.mailbox) >= self._mailbox_size:
+            actor.mailbox.popleft()
+            actor.conflated += 1
+        actor.mailbox.append((data, time.perf_counter()))
+        actor.wakeup.set()
+
+        if self._metrics:
+            self._metrics.update_strategy_mailbox_depth(market_id, len(actor.mailbox))
+
+    async def _run_actor(self, actor: MarketActor) -> None:
+        """Process one market's mailbox in order until cancelled."""
+        while True:
+            if not actor.mailbox:
+                actor.wakeup.clear()
+                await actor.wakeup.wait()
+                continue
+
+            data, enqueued_at = actor.mailbox.popleft()
+            actor.last_lag_ms = (time.perf_counter() - enqueued_at) * 1000
+            if self._metrics:
+                self._metrics.update_strategy_mailbox_depth(actor.market_id, len(actor.mailbox))
+                self._metrics.record_strategy_mailbox_lag(actor.market_id, actor.last_lag_ms)
+
+            try:
+                await self._process_market_data(data)
+            except Exception as e:
+                self._log.error("market_actor_error", market_id=actor.market_id, error=str(e))
+            actor.processed += 1
+
+            # Yield so a busy market cannot monopolize the loop
+            await asyncio.sleep(0)
+
+    async def _reclaim_actor(self, market_id: str) -> None:
+        """Cancel a market's actor task and drop its pending updates."""
+        actor = self._actors.pop(market_id, None)
+        if actor is None:
+            return
+
+        if actor.task is not None:
+            actor.task.cancel()
+            if actor.task is not asyncio.current_task():
+                try:
+                    await actor.task
+                except asyncio.CancelledError:
+                    pass
+
+        if self._metrics:
+            self._metrics.remove_strategy_mailbox(market_id)
+        self._log.debug("market_actor_reclaimed", market_id=market_id, dropped=len(actor.mailbox))
+
+    async def _on_unsubscribe_market(self, data: dict) -> None:
+        """Handle market unsubscribe request from event bus."""
+        market_id = data.get("market_id")
+        if market_id:
+            await self.unsubscribe_market(market_id)
+
+    async def _process_market_data(self, data: dict) -> None:
+        """Build the order book for an update and evaluate strategies on it."""
         market_id = data.get("market_id")
         if not market_id:
             return
@@ -339,22 +615,248 @@ class StrategyEngine(BaseComponent):
             timestamp=datetime.utcnow(),
         )
 
-        # Route to each strategy
+        previous = self._last_books.get(market_id)
+        self._last_books[market_id] = book
+        changes = self._top_of_book_changes(previous, book)
+
+        if self._batch_enabled and changes:
+            self._batch.update(book)
+
+        # Evaluate interested per-event strategies concurrently
+        evaluations = []
         for name in strategy_names:
             strategy = self._strategies.get(name)
-            if strategy is None or not strategy.enabled:
+            if strategy is None or not strategy.enabled or name in self._batch_rows:
                 continue
+            if not self._inputs_changed(strategy, previous, book, changes):
+                self._record_skip(name)
+                continue
+            evaluations.append(self._evaluate_strategy(name, strategy, market_id, book))
+
+        if len(evaluations) == 1:
+            await evaluations[0]
+        elif evaluations:
+            await asyncio.gather(*evaluations)
+
+        if self._batch_max_dirty > 0 and self._batch.dirty_count >= self._batch_max_dirty:
+            await self.flush_batch()
+
+    async def _on_trade(self, data: dict) -> None:
+        """Re-evaluate strategies interested in trades on the last known book."""
+        market_id = data.get("market_id")
+        book = self._last_books.get(market_id) if market_id else None
+        if book is None:
+            return
+
+        evaluations = []
+        for name in self._market_to_strategies.get(market_id, set()):
+            strategy = self._strategies.get(name)
+            if strategy is None or not strategy.enabled or name in self._batch_rows:
+                continue
+            interest = getattr(strategy, "interest", None)
+            if interest is None or not interest & BookInterest.TRADES:
+                continue
+            evaluations.append(self._evaluate_strategy(name, strategy, market_id, book))
+
+        if evaluations:
+            await asyncio.gather(*evaluations)
+
+    @staticmethod
+    def _top_of_book_changes(
+        previous: Optional[OrderBook],
+        book: OrderBook,
+    ) -> BookInterest:
+        """Compute which best levels changed since the previous book.
+
+        Args:
+            previous: Previous book for the market, or None on first update.
+            book: New book.
 
+        Returns:
+            Mask of changed BookInterest side flags (ALL on first update).
+        """
+        if previous is None:
+            return BookInterest.ALL
+
+        changes = BookInterest.NONE
+        for flag, old, new in (
+            (BookInterest.YES_BID, previous.yes_bids, book.yes_bids),
+            (BookInterest.YES_ASK, previous.yes_asks, book.yes_asks),
+            (BookInterest.NO_BID, previous.no_bids, book.no_bids),
+            (BookInterest.NO_ASK, previous.no_asks, book.no_asks),
+        ):
+            if (old[0] if old else None) != (new[0] if new else None):
+                changes |= flag
+        return changes
+
+    @staticmethod
+    def _inputs_changed(
+        strategy: BaseStrategy,
+        previous: Optional[OrderBook],
+        book: OrderBook,
+        changes: BookInterest,
+    ) -> bool:
+        """Check whether an update touched any input the strategy declared.
+
+        Strategies without an ``interest`` attribute are always invoked.
+        """
+        interest = getattr(strategy, "interest", None)
+        if interest is None or previous is None:
+            return True
+        if interest & changes:
+            return True
+        if interest & BookInterest.DEPTH:
+            depth = getattr(strategy, "interest_depth", DEFAULT_DEPTH)
+            return any(
+                old[:depth] != new[:depth]
+                for old, new in (
+                    (previous.yes_bids, book.yes_bids),
+                    (previous.yes_asks, book.yes_asks),
+                    (previous.no_bids, book.no_bids),
+                    (previous.no_asks, book.no_asks),
+                )
+            )
+        return False
+
+    def _record_skip(self, name: str) -> None:
+        """Count a strategy invocation skipped by its interest filter."""
+        self._skipped_counts[name] = self._skipped_counts.get(name, 0) + 1
+        if self._metrics:
+            self._metrics.record_strategy_skipped(name)
+
+    def _uses_batch(self, strategy: BaseStrategy) -> bool:
+        """Check if a strategy is evaluated through on_market_batch()."""
+        return self._batch_enabled and callable(getattr(strategy, "on_market_batch", None))
+
+    async def _batch_loop(self) -> None:
+        """Flush changed markets to batch strategies on a fixed cadence."""
+        while self._should_run:
+            await asyncio.sleep(self._batch_interval)
             try:
-                async for signal in strategy.on_market_data(market_id, book):
-                    await self._publish_signal(name, signal)
+                await self.flush_batch()
             except Exception as e:
-                self._log.error(
-                    "strategy_error",
-                    strategy=name,
-                    market_id=market_id,
-                    error=str(e),
+                self._log.error("batch_flush_error", error=str(e))
+
+    async def flush_batch(self) -> None:
+        """Evaluate batch strategies on all markets changed since the last flush."""
+        if self._batch.dirty_count == 0:
+            return
+
+        dirty = self._batch.dirty_rows()
+        self._batch.clear_dirty()
+
+        evaluations = []
+        for name, strategy_rows in self._batch_rows.items():
+            strategy = self._strategies.get(name)
+            if strategy is None or not strategy.enabled:
+                continue
+            rows = np.intersect1d(dirty, strategy_rows, assume_unique=True)
+            if len(rows) == 0:
+                continue
+            evaluations.append(
+                self._run_evaluation(
+                    name, lambda s=strategy, r=rows: s.on_market_batch(self._batch, r)
                 )
+            )
+
+        if evaluations:
+            await asyncio.gather(*evaluations)
+
+    async def _evaluate_strategy(
+        self,
+        name: str,
+        strategy: BaseStrategy,
+        market_id: str,
+        book: OrderBook,
+    ) -> None:
+        """Run one strategy on a market update within its time budget.
+
+        Args:
+            name: Strategy name.
+            strategy: Strategy instance.
+            market_id: Market condition ID.
+            book: Order book snapshot for the update.
+        """
+        await self._run_evaluation(
+            name, lambda: strategy.on_market_data(market_id, book), market_id=market_id
+        )
+
+    async def _run_evaluation(
+        self,
+        name: str,
+        source: Callable[[], AsyncIterator[TradingSignal]],
+        market_id: Optional[str] = None,
+    ) -> None:
+        """Drain a strategy's signal generator within its time budget.
+
+        Signals are collected first and only published if the strategy
+        finishes within budget; an overrun drops the whole result. wait_for
+        can only cancel at an await, so a strategy doing synchronous work
+        can return late; elapsed time is checked again afterwards.
+
+        Args:
+            name: Strategy name.
+            source: Returns the strategy's on_market_data/on_market_batch generator.
+            market_id: Market condition ID, or None for a batch evaluation.
+        """
+        timeout = self._strategy_timeouts.get(name, self._default_timeout)
+        start = time.perf_counter()
+
+        try:
+            signals = await asyncio.wait_for(
+                self._collect_signals(source),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            self._record_evaluation(name, start)
+            self._record_overrun(name, market_id, timeout, dropped=0)
+            return
+        except Exception as e:
+            self._record_evaluation(name, start)
+            self._log.error(
+                "strategy_error",
+                strategy=name,
+                market_id=market_id,
+                error=str(e),
+            )
+            return
+
+        self._record_evaluation(name, start)
+        if time.perf_counter() - start > timeout:
+            self._record_overrun(name, market_id, timeout, dropped=len(signals))
+            return
+
+        for signal in signals:
+            await self._publish_signal(name, signal)
+
+    def _record_overrun(
+        self, name: str, market_id: Optional[str], timeout: float, dropped: int
+    ) -> None:
+        """Count an evaluation that exceeded its budget."""
+        self._overrun_counts[name] = self._overrun_counts.get(name, 0) + 1
+        if self._metrics:
+            self._metrics.record_strategy_overrun(name)
+        self._log.warning(
+            "strategy_overrun",
+            strategy=name,
+            market_id=market_id,
+            budget_ms=timeout * 1000,
+            dropped_signals=dropped,
+        )
+
+    async def _collect_signals(
+        self,
+        source: Callable[[], AsyncIterator[TradingSignal]],
+    ) -> list[TradingSignal]:
+        """Drain a strategy's signal generator for one update."""
+        return [signal async for signal in source()]
+
+    def _record_evaluation(self, name: str, start: float) -> None:
+        """Record evaluation count and latency for a strategy."""
+        self._evaluation_counts[name] = self._evaluation_counts.get(name, 0) + 1
+        if self._metrics:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._metrics.record_strategy_evaluation_time(name, elapsed_ms)
 
     async def _publish_signal(self, strategy_name: str, signal: TradingSignal) -> None:
         """Publish a trading signal to EventBus.
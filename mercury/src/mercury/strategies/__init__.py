@@ -1,7 +1,7 @@
 # Strategy Plugins
 # Trading strategy implementations
 
-from mercury.strategies.base import BaseStrategy
+from mercury.strategies.base import BaseStrategy, BookInterest
 from mercury.strategies.registry import StrategyRegistry
 
-__all__ = ["BaseStrategy", "StrategyRegistry"]
+__all__ = ["BaseStrategy", "BookInterest", "StrategyRegistry"]
@@ -4,12 +4,42 @@ Strategies implement this protocol to integrate with the StrategyEngine.
 """
 
 from abc import abstractmethod
+from enum import IntFlag
 from typing import AsyncIterator, Protocol, runtime_checkable
 
 from mercury.domain.market import OrderBook
 from mercury.domain.signal import TradingSignal
 
 
+class BookInterest(IntFlag):
+    """Order book inputs a strategy depends on.
+
+    Strategies may declare an ``interest`` attribute so the StrategyEngine
+    only invokes them when one of those inputs changed. YES_BID, YES_ASK,
+    NO_BID and NO_ASK cover the best level (price and size) of each side;
+    DEPTH covers levels up to the strategy's optional ``interest_depth``
+    (default DEFAULT_DEPTH); TRADES re-evaluates on market.trade.* events.
+    Strategies without an ``interest`` attribute are invoked on every update.
+    """
+
+    NONE = 0
+    YES_BID = 1
+    YES_ASK = 2
+    NO_BID = 4
+    NO_ASK = 8
+    DEPTH = 16
+    TRADES = 32
+
+    BIDS = YES_BID | NO_BID
+    ASKS = YES_ASK | NO_ASK
+    TOP_OF_BOOK = BIDS | ASKS
+    ALL = TOP_OF_BOOK | DEPTH | TRADES
+
+
+# Levels compared for BookInterest.DEPTH when a strategy sets no interest_depth
+DEFAULT_DEPTH = 5
+
+
 @runtime_checkable
 class BaseStrategy(Protocol):
     """Protocol that all trading strategies must implement.
@@ -19,6 +49,20 @@ class BaseStrategy(Protocol):
     - Emit trading signals as async generators
     - Are stateless with respect to execution (no order tracking)
     - Can be enabled/disabled at runtime
+
+    Strategies may additionally implement an optional batch hook:
+
+        async def on_market_batch(
+            self, batch: MarketBatch, rows: np.ndarray
+        ) -> AsyncIterator[TradingSignal]
+
+    When batch evaluation is enabled on the StrategyEngine, strategies with
+    this hook receive the columnar top-of-book state and the indices of
+    their changed markets, instead of one on_market_data() call per event.
+
+    Strategies may also declare ``interest: BookInterest`` (and optionally
+    ``interest_depth: int``) to be skipped on updates that do not touch
+    their inputs.
     """
 
     @property
@@ -31,6 +31,7 @@ class GabagoolConfig:
         gradual_entry_min_spread_cents: Minimum spread (cents) for gradual entry.
         min_hedge_ratio: Minimum hedge ratio for partial fills.
         critical_hedge_ratio: Hedge ratio below which to reject trades.
+        signal_cooldown_seconds: Minimum seconds between signals per market.
     """
 
     enabled: bool = True
@@ -46,6 +47,7 @@ class GabagoolConfig:
     gradual_entry_min_spread_cents: Decimal = Decimal("3.0")
     min_hedge_ratio: Decimal = Decimal("0.8")  # 80%
     critical_hedge_ratio: Decimal = Decimal("0.5")  # 50%
+    signal_cooldown_seconds: Decimal = Decimal("5")
 
     @classmethod
     def from_config(
@@ -110,6 +112,9 @@ class GabagoolConfig:
             critical_hedge_ratio=config.get_decimal(
                 f"{prefix}.critical_hedge_ratio", default=Decimal("0.5")
             ),
+            signal_cooldown_seconds=config.get_decimal(
+                f"{prefix}.signal_cooldown_seconds", default=Decimal("5")
+            ),
         )
 
     @property
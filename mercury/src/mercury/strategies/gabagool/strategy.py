@@ -13,18 +13,25 @@ The strategy:
 
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Callable, Optional
 
+import numpy as np
 import structlog
 
 from mercury.core.config import ConfigManager
 from mercury.domain.market import OrderBook
+from mercury.domain.market_batch import MarketBatch
 from mercury.domain.signal import SignalPriority, SignalType, TradingSignal
+from mercury.strategies.base import BookInterest
 from mercury.strategies.gabagool.config import GabagoolConfig
 
 log = structlog.get_logger()
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class GabagoolStrategy:
     """Gabagool asymmetric binary arbitrage strategy.
 
@@ -38,16 +45,22 @@ class GabagoolStrategy:
     with the StrategyEngine.
     """
 
+    # Only best YES/NO asks feed detection; bid-side changes and unchanged
+    # republishes are skipped by the StrategyEngine
+    interest = BookInterest.ASKS
+
     # Class-level defaults for protocol compliance (allows hasattr checks with __new__)
     _enabled: bool = True
     _running: bool = False
     _subscribed_markets: list = []
     _last_signal_time: dict = {}
+    _now = staticmethod(_utcnow)
 
     def __init__(
         self,
         config: ConfigManager,
         gabagool_config: Optional[GabagoolConfig] = None,
+        clock: Optional[Callable[[], datetime]] = None,
     ) -> None:
         """Initialize Gabagool strategy.
 
@@ -55,10 +68,13 @@ class GabagoolStrategy:
             config: ConfigManager for general configuration.
             gabagool_config: Optional pre-built GabagoolConfig. If not provided,
                            will be loaded from ConfigManager.
+            clock: Optional source of the current UTC time. Backtests pass
+                   the replay clock so cooldowns follow recorded time.
         """
         self._config = config
         self._gabagool_config = gabagool_config or GabagoolConfig.from_config_manager(config)
         self._log = log.bind(strategy="gabagool")
+        self._now = clock or _utcnow
 
         # Runtime state (instance-level, shadows class defaults)
         self._enabled = self._gabagool_config.enabled
@@ -67,7 +83,9 @@ class GabagoolStrategy:
 
         # Cooldown tracking to avoid duplicate signals
         self._last_signal_time: dict[str, datetime] = {}
-        self._signal_cooldown = timedelta(seconds=5)  # Min 5s between signals per market
+        self._signal_cooldown = timedelta(
+            seconds=float(self._gabagool_config.signal_cooldown_seconds)
+        )
 
     @property
     def name(self) -> str:
@@ -156,10 +174,57 @@ class GabagoolStrategy:
         if not self._enabled:
             return
 
+        signal = self._evaluate_book(market_id, book)
+        if signal is not None:
+            yield signal
+
+    async def on_market_batch(
+        self,
+        batch: MarketBatch,
+        rows: np.ndarray,
+    ) -> AsyncIterator[TradingSignal]:
+        """Process a batch of changed markets and yield trading signals.
+
+        Screens all rows for a spread above threshold with vectorized float
+        math, then runs the exact Decimal path of on_market_data() on the
+        few candidates that pass.
+
+        Args:
+            batch: Columnar top-of-book state.
+            rows: Row indices of this strategy's changed markets.
+
+        Yields:
+            TradingSignal for each trading opportunity detected.
+        """
+        if not self._enabled or len(rows) == 0:
+            return
+
+        yes = batch.yes_ask[rows]
+        no = batch.no_ask[rows]
+        # Small tolerance so float rounding never hides a threshold-level spread
+        min_spread = float(self._gabagool_config.min_spread_threshold) - 1e-9
+        candidates = rows[(yes > 0) & (no > 0) & (1.0 - (yes + no) >= min_spread)]
+
+        for row in candidates:
+            market_id = batch.market_ids[row]
+            signal = self._evaluate_book(market_id, batch.to_order_book(row))
+            if signal is not None:
+                yield signal
+
+    def _evaluate_book(self, market_id: str, book: OrderBook) -> Optional[TradingSignal]:
+        """Run detection, validation and sizing for one book.
+
+        Args:
+            market_id: The market's condition ID.
+            book: Order book snapshot.
+
+        Returns:
+            TradingSignal if the opportunity is actionable, None otherwise.
+        """
         # Detect arbitrage opportunity
         opportunity = self._detect_arbitrage(book)
         if opportunity is None:
-            return
+            return None
 
         # Validate opportunity against entry criteria
         validation_result = self._validate_opportunity(opportunity, market_id)
@@ -170,11 +235,11 @@ class GabagoolStrategy:
                 reason=validation_result.reason,
                 spread_cents=f"{opportunity.spread_cents:.1f}¢",
             )
-            return
+            return None
 
         # Check cooldown to avoid duplicate signals
         if self._is_on_cooldown(market_id):
-            return
+            return None
 
         # Calculate position sizes
         yes_amount, no_amount = self.calculate_position_sizes(
@@ -190,9 +255,9 @@ class GabagoolStrategy:
                 yes_price=str(opportunity.yes_price),
                 no_price=str(opportunity.no_price),
             )
-            return
+            return None
 
-        # Create and yield the trading signal
+        # Create the trading signal
         signal = self._create_signal(
             market_id=market_id,
             opportunity=opportunity,
@@ -201,7 +266,7 @@ class GabagoolStrategy:
         )
 
         # Update cooldown
-        self._last_signal_time[market_id] = datetime.now(timezone.utc)
+        self._last_signal_time[market_id] = self._now()
 
         self._log.info(
             "arbitrage_signal_generated",
@@ -214,7 +279,7 @@ class GabagoolStrategy:
             expected_pnl=str(signal.expected_pnl),
         )
 
-        yield signal
+        return signal
 
     def _detect_arbitrage(self, book: OrderBook) -> Optional["ArbitrageOpportunity"]:
         """Detect if an arbitrage opportunity exists.
@@ -251,7 +316,7 @@ class GabagoolStrategy:
             spread=spread,
             spread_cents=spread_cents,
             profit_percentage=profit_pct,
-            detected_at=datetime.now(timezone.utc),
+            detected_at=self._now(),
         )
 
     def _validate_opportunity(
@@ -306,7 +371,7 @@ class GabagoolStrategy:
         if last_time is None:
             return False
 
-        elapsed = datetime.now(timezone.utc) - last_time
+        elapsed = self._now() - last_time
         return elapsed < self._signal_cooldown
 
     def calculate_position_sizes(
@@ -429,7 +494,7 @@ class GabagoolStrategy:
         priority = self._determine_priority(opportunity.spread_cents)
 
         # Signal expires after 30 seconds (arbitrage is time-sensitive)
-        expires_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        expires_at = self._now() + timedelta(seconds=30)
 
         return TradingSignal(
             strategy_name=self.name,
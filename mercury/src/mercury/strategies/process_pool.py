@@ -0,0 +1,390 @@
+"""Process-pool execution tier for CPU-heavy strategies.
+
+Strategies registered as "heavy" run inside a dedicated worker process so
+their evaluation does not block the event loop. The parent keeps a
+ProcessPoolStrategy proxy that implements the BaseStrategy protocol, so the
+StrategyEngine drives it exactly like an in-process strategy and publishes
+the returned signals through the usual _publish_signal path.
+
+Order book snapshots cross the process boundary in a compact binary
+encoding (see encode_order_book) rather than as pickled domain objects.
+"""
+
+import asyncio
+import math
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, AsyncIterator, Callable, Optional
+
+import structlog
+
+from mercury.domain.market import OrderBook, OrderBookLevel
+from mercury.domain.signal import TradingSignal
+from mercury.strategies.base import DEFAULT_DEPTH, BookInterest
+
+log = structlog.get_logger()
+
+# Header: timestamp (epoch seconds, NaN if unset), tz-aware flag,
+# then level counts for yes_bids, yes_asks, no_bids, no_asks.
+_BOOK_HEADER = struct.Struct("<dB4H")
+
+
+def encode_order_book(book: OrderBook) -> bytes:
+    """Encode an order book snapshot into a compact binary payload.
+
+    Each level is packed as two float64 values (price, size). The market ID
+    is not included; it travels alongside the payload.
+
+    Args:
+        book: Order book to encode.
+
+    Returns:
+        Encoded bytes.
+    """
+    sides = (book.yes_bids, book.yes_asks, book.no_bids, book.no_asks)
+    if book.timestamp is None:
+        ts, aware = math.nan, 0
+    else:
+        ts, aware = book.timestamp.timestamp(), int(book.timestamp.tzinfo is not None)
+
+    values = [float(v) for side in sides for level in side for v in (level.price, level.size)]
+    header = _BOOK_HEADER.pack(ts, aware, *(len(side) for side in sides))
+    return header + struct.pack(f"<{len(values)}d", *values)
+
+
+def decode_order_book(market_id: str, payload: bytes) -> OrderBook:
+    """Decode a payload produced by encode_order_book.
+
+    Args:
+        market_id: Market the snapshot belongs to.
+        payload: Encoded bytes.
+
+    Returns:
+        Reconstructed OrderBook.
+    """
+    ts, aware, *counts = _BOOK_HEADER.unpack_from(payload)
+    values = struct.unpack_from(f"<{2 * sum(counts)}d", payload, _BOOK_HEADER.size)
+
+    sides: list[list[OrderBookLevel]] = []
+    offset = 0
+    for count in counts:
+        side = [
+            OrderBookLevel(
+                price=Decimal(repr(values[offset + 2 * i])),
+                size=Decimal(repr(values[offset + 2 * i + 1])),
+            )
+            for i in range(count)
+        ]
+        sides.append(side)
+        offset += 2 * count
+
+    if math.isnan(ts):
+        timestamp = None
+    elif aware:
+        timestamp = datetime.fromtimestamp(ts, tz=timezone.utc)
+    else:
+        timestamp = datetime.fromtimestamp(ts)
+
+    return OrderBook(
+        market_id=market_id,
+        yes_bids=sides[0],
+        yes_asks=sides[1],
+        no_bids=sides[2],
+        no_asks=sides[3],
+        timestamp=timestamp,
+    )
+
+
+# --- Worker process side -------------------------------------------------
+
+_worker_strategy: Any = None
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _init_worker(factory: Callable[..., Any], kwargs: dict[str, Any]) -> None:
+    """Build the strategy instance inside the worker process."""
+    global _worker_strategy, _worker_loop
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    _worker_strategy = factory(**kwargs)
+
+
+def _worker_describe() -> dict[str, Any]:
+    """Return the worker strategy's static attributes."""
+    return {
+        "name": _worker_strategy.name,
+        "enabled": _worker_strategy.enabled,
+        "markets": list(_worker_strategy.get_subscribed_markets()),
+        "interest": getattr(_worker_strategy, "interest", None),
+        "interest_depth": getattr(_worker_strategy, "interest_depth", DEFAULT_DEPTH),
+    }
+
+
+def _worker_call(method: str, *args: Any) -> None:
+    """Invoke a (sync or async) method on the worker strategy."""
+    func = getattr(_worker_strategy, method, None)
+    if func is None:
+        return
+    result = func(*args)
+    if asyncio.iscoroutine(result):
+        _worker_loop.run_until_complete(result)
+
+
+def _worker_on_market_data(market_id: str, payload: bytes) -> list[TradingSignal]:
+    """Run one strategy evaluation and collect its signals."""
+    book = decode_order_book(market_id, payload)
+
+    async def collect() -> list[TradingSignal]:
+        return [signal async for signal in _worker_strategy.on_market_data(market_id, book)]
+
+    return _worker_loop.run_until_complete(collect())
+
+
+# --- Parent process side -------------------------------------------------
+
+
+class ProcessPoolStrategy:
+    """BaseStrategy proxy that runs a strategy in a dedicated worker process.
+
+    Each heavy strategy gets a single-worker pool so its state lives in one
+    process and updates are evaluated in order. If the worker dies, the pool
+    is rebuilt, the strategy is re-created from its factory, and the
+    proxy's view of enabled state, subscriptions and running state is
+    replayed onto the new instance; an evaluation that found the worker
+    dead is retried once on the new one.
+
+    Construction does not wait for the worker. Its subscriptions and
+    interest are read by describe(), which start() awaits without blocking
+    the event loop; until then the proxy reports no markets and no
+    interest filter.
+
+    Usage:
+        strategy = ProcessPoolStrategy(MyHeavyStrategy, {"config": config}, name="heavy")
+        engine.register_strategy(strategy)
+        await engine.start()
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., Any],
+        kwargs: Optional[dict[str, Any]] = None,
+        mp_context: Any = None,
+        name: Optional[str] = None,
+    ) -> None:
+        """Initialize the proxy and create its worker pool.
+
+        Args:
+            factory: Picklable strategy class or factory function.
+            kwargs: Picklable constructor/factory arguments.
+            mp_context: Optional multiprocessing context for the pool.
+            name: Strategy name; taken from the worker instance by
+                  describe() if not given.
+        """
+        self._factory = factory
+        self._kwargs = kwargs or {}
+        self._mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._restart_lock = asyncio.Lock()
+        self._running = False
+        self._restarts = 0
+
+        self._spawn()
+        self._described = False
+        self._name: str = name or getattr(factory, "__name__", "process_pool_strategy")
+        self._named = name is not None
+        self._enabled = True
+        self._subscribed_markets: list[str] = []
+        # Mirrored so the engine's interest filter applies before shipping a book
+        self.interest: Optional[BookInterest] = None
+        self.interest_depth: int = DEFAULT_DEPTH
+        self._log = log.bind(component="process_pool_strategy", strategy=self._name)
+
+    @property
+    def name(self) -> str:
+        """Strategy name for identification."""
+        return self._name
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the strategy is currently enabled."""
+        return self._enabled
+
+    @property
+    def restart_count(self) -> int:
+        """Number of times the worker has been restarted after a crash."""
+        return self._restarts
+
+    async def describe(self) -> None:
+        """Read name, subscriptions and interest from the worker instance.
+
+        Runs once; calls forwarded before it (enable, subscribe_market) are
+        applied in the worker first, so its answer includes them.
+        """
+        if self._described or self._executor is None:
+            return
+        executor = self._executor
+        try:
+            info = await asyncio.get_running_loop().run_in_executor(
+                executor, _worker_describe
+            )
+        except BrokenProcessPool:
+            await self._restart(executor)
+            info = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _worker_describe
+            )
+        if not self._named:
+            self._name = info["name"]
+            self._log = log.bind(component="process_pool_strategy", strategy=self._name)
+        self._enabled = info["enabled"]
+        self._subscribed_markets = info["markets"]
+        self.interest = info["interest"]
+        self.interest_depth = info["interest_depth"]
+        self._described = True
+
+    async def start(self) -> None:
+        """Describe and start the strategy inside the worker."""
+        await self.describe()
+        self._running = True
+        await self._call("start")
+
+    async def stop(self) -> None:
+        """Stop the strategy and shut down the worker."""
+        self._running = False
+        try:
+            await self._call("stop")
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def enable(self) -> None:
+        """Enable the strategy at runtime."""
+        self._enabled = True
+        self._submit("enable")
+
+    def disable(self) -> None:
+        """Disable the strategy at runtime."""
+        self._enabled = False
+        self._submit("disable")
+
+    def get_subscribed_markets(self) -> list[str]:
+        """Return list of market IDs this strategy wants data for."""
+        return self._subscribed_markets
+
+    def subscribe_market(self, market_id: str) -> None:
+        """Add a market to the subscription list."""
+        if market_id not in self._subscribed_markets:
+            self._subscribed_markets.append(market_id)
+            self._submit("subscribe_market", market_id)
+
+    def unsubscribe_market(self, market_id: str) -> None:
+        """Remove a market from the subscription list."""
+        if market_id in self._subscribed_markets:
+            self._subscribed_markets.remove(market_id)
+            self._submit("unsubscribe_market", market_id)
+
+    async def on_market_data(
+        self,
+        market_id: str,
+        book: OrderBook,
+    ) -> AsyncIterator[TradingSignal]:
+        """Evaluate the book in the worker and yield the resulting signals."""
+        if not self._enabled:
+            return
+
+        payload = encode_order_book(book)
+        loop = asyncio.get_running_loop()
+        executor = self._executor
+        try:
+            signals = await loop.run_in_executor(
+                executor, _worker_on_market_data, market_id, payload
+            )
+        except BrokenProcessPool:
+            # The worker may have died before this update; retry it once
+            await self._restart(executor)
+            executor = self._executor
+            try:
+                signals = await loop.run_in_executor(
+                    executor, _worker_on_market_data, market_id, payload
+                )
+            except BrokenProcessPool:
+                self._log.error("strategy_worker_evaluation_dropped", market_id=market_id)
+                await self._restart(executor)
+                return
+
+        for signal in signals:
+            yield signal
+
+    def _spawn(self) -> None:
+        """Create a fresh single-worker pool running the strategy."""
+        self._executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self._factory, self._kwargs),
+        )
+
+    def _submit(self, method: str, *args: Any) -> None:
+        """Forward a sync call to the worker without waiting for it.
+
+        The pool has a single worker, so forwarded calls are applied in
+        order ahead of any later evaluation.
+        """
+        if self._executor is None:
+            return
+        try:
+            self._executor.submit(_worker_call, method, *args)
+        except BrokenProcessPool:
+            # Picked up by the next awaited call, which restarts the worker.
+            pass
+
+    async def _call(self, method: str, *args: Any) -> None:
+        """Invoke a strategy method in the worker and wait for it."""
+        executor = self._executor
+        if executor is None:
+            return
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                executor, _worker_call, method, *args
+            )
+        except BrokenProcessPool:
+            await self._restart(executor)
+
+    async def _restart(self, broken: Optional[ProcessPoolExecutor]) -> None:
+        """Replace a crashed worker and replay proxy state onto it.
+
+        Args:
+            broken: The executor observed as broken. If another caller has
+                already replaced it, this is a no-op.
+        """
+        async with self._restart_lock:
+            if self._executor is not broken:
+                return
+
+            self._restarts += 1
+            self._log.error("strategy_worker_crashed", restarts=self._restarts)
+
+            if broken is not None:
+                broken.shutdown(wait=False, cancel_futures=True)
+            self._spawn()
+
+            loop = asyncio.get_running_loop()
+            replay: list[tuple[Any, ...]] = [
+                ("enable",) if self._enabled else ("disable",),
+            ]
+            replay.extend(("subscribe_market", m) for m in self._subscribed_markets)
+            if self._running:
+                replay.append(("start",))
+
+            try:
+                for call in replay:
+                    await loop.run_in_executor(self._executor, _worker_call, *call)
+            except BrokenProcessPool:
+                # Leave the broken pool in place; the next call retries.
+                self._log.error("strategy_worker_restart_failed")
+                return
+
+            self._log.info("strategy_worker_restarted", restarts=self._restarts)
@@ -4,6 +4,7 @@ This module provides:
 - Auto-discovery of strategy classes in the strategies/ package
 - Manual registration of strategies
 - Config-based filtering of enabled strategies
+- Routing of CPU-heavy strategies to a worker process tier
 """
 
 import importlib
@@ -17,6 +18,7 @@ import structlog
 
 from mercury.core.config import ConfigManager
 from mercury.strategies.base import BaseStrategy
+from mercury.strategies.process_pool import ProcessPoolStrategy
 
 log = structlog.get_logger()
 
@@ -41,6 +43,10 @@ class StrategyRegistry:
     - strategies.<name>.enabled = true/false in TOML config
     - Environment variable: MERCURY_STRATEGIES_<NAME>_ENABLED
 
+    Strategies registered with heavy=True (or with
+    strategies.<name>.heavy = true in config) are instantiated inside a
+    dedicated worker process and wrapped in a ProcessPoolStrategy proxy.
+
     Usage:
         registry = StrategyRegistry(config)
 
@@ -63,6 +69,7 @@ class StrategyRegistry:
         self._config = config
         self._log = log.bind(component="strategy_registry")
         self._registry: dict[str, StrategyClass | StrategyFactory] = {}
+        self._heavy: set[str] = set()
         self._discovered = False
 
     @property
@@ -84,6 +91,7 @@ class StrategyRegistry:
         self,
         strategy: StrategyClass | StrategyFactory,
         name: str | None = None,
+        heavy: bool = False,
     ) -> None:
         """Register a strategy class or factory.
 
@@ -92,6 +100,8 @@ class StrategyRegistry:
             name: Optional name override. If not provided, uses:
                   - Class name in snake_case for classes
                   - Function name for factories
+            heavy: Run instances in a worker process. The strategy and its
+                   constructor arguments must be picklable.
         """
         # Determine the name
         if name is None:
@@ -110,7 +120,9 @@ class StrategyRegistry:
             return
 
         self._registry[name] = strategy
-        self._log.info("strategy_registered", name=name)
+        if heavy:
+            self._heavy.add(name)
+        self._log.info("strategy_registered", name=name, heavy=heavy)
 
     def unregister(self, name: str) -> bool:
         """Unregister a strategy by name.
@@ -125,6 +137,7 @@ class StrategyRegistry:
             return False
 
         del self._registry[name]
+        self._heavy.discard(name)
         self._log.info("strategy_unregistered", name=name)
         return True
 
@@ -150,6 +163,27 @@ class StrategyRegistry:
         """
         return self._config.get_bool(f"strategies.{name}.enabled", default=False)
 
+    def is_heavy(self, name: str) -> bool:
+        """Check if a strategy runs in the worker process tier.
+
+        Args:
+            name: Strategy name.
+
+        Returns:
+            True if declared heavy at registration or in config.
+        """
+        if name in self._heavy:
+            return True
+        return self._config.get_bool(f"strategies.{name}.heavy", default=False) is True
+
+    def get_heavy_names(self) -> list[str]:
+        """Get names of all registered strategies that run in worker processes.
+
+        Returns:
+            List of heavy strategy names.
+        """
+        return [name for name in self._registry if self.is_heavy(name)]
+
     def get_enabled_names(self) -> list[str]:
         """Get names of all registered and enabled strategies.
 
@@ -185,7 +219,8 @@ class StrategyRegistry:
             **kwargs: Arguments to pass to the constructor/factory.
 
         Returns:
-            Strategy instance or None if not found.
+            Strategy instance or None if not found. Heavy strategies are
+            returned as a ProcessPoolStrategy proxy.
         """
         strategy_cls = self._registry.get(name)
         if strategy_cls is None:
@@ -193,8 +228,11 @@ class StrategyRegistry:
             return None
 
         try:
-            instance = strategy_cls(**kwargs)
-            self._log.info("strategy_instantiated", name=name)
+            if self.is_heavy(name):
+                instance = ProcessPoolStrategy(strategy_cls, kwargs, name=name)
+            else:
+                instance = strategy_cls(**kwargs)
+            self._log.info("strategy_instantiated", name=name, heavy=self.is_heavy(name))
             return instance
         except Exception as e:
             self._log.error(
@@ -314,6 +352,7 @@ class StrategyRegistry:
         skip_suffixes = [
             ".base",
             ".registry",
+            ".process_pool",
             ".__init__",
         ]
 
@@ -405,6 +444,7 @@ class StrategyRegistry:
     def clear(self) -> None:
         """Clear all registered strategies."""
         self._registry.clear()
+        self._heavy.clear()
         self._discovered = False
         self._log.info("registry_cleared")
 
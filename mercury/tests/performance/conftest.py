@@ -22,3 +22,56 @@ def performance_config():
         "max_memory_growth_mb": 50,
         "test_duration_seconds": 3,
     }
+
+
+class MockEventBus:
+    """In-memory event bus for load testing without Redis dependency."""
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, list] = {}
+        self._published_events: list[tuple[str, dict]] = []
+        self._publish_count = 0
+
+    async def publish(self, channel: str, event: dict) -> None:
+        """Publish event and dispatch to handlers."""
+        self._published_events.append((channel, event))
+        self._publish_count += 1
+
+        # Dispatch to handlers
+        for pattern, handlers in self._handlers.items():
+            if self._pattern_matches(pattern, channel):
+                for handler in handlers:
+                    try:
+                        await handler(event)
+                    except Exception:
+                        pass
+
+    async def subscribe(self, pattern: str, handler) -> None:
+        """Subscribe handler to pattern."""
+        if pattern not in self._handlers:
+            self._handlers[pattern] = []
+        self._handlers[pattern].append(handler)
+
+    async def unsubscribe(self, pattern: str) -> None:
+        """Unsubscribe from pattern."""
+        self._handlers.pop(pattern, None)
+
+    def _pattern_matches(self, pattern: str, channel: str) -> bool:
+        """Simple glob pattern matching."""
+        if pattern == channel:
+            return True
+        if "*" not in pattern:
+            return False
+        parts = pattern.split("*")
+        if len(parts) == 2:
+            return channel.startswith(parts[0]) and channel.endswith(parts[1])
+        return channel.startswith(parts[0])
+
+    def clear(self) -> None:
+        """Clear published events."""
+        self._published_events.clear()
+        self._publish_count = 0
+
+    @property
+    def publish_count(self) -> int:
+        return self._publish_count
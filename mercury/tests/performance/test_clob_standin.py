@@ -0,0 +1,325 @@
+"""
+Execution benchmark against the local CLOB stand-in.
+
+Unlike test_load.py, which executes against an in-process mock, these
+benchmarks drive ExecutionEngine through the real CLOBClient - order
+signing, the pooled HTTP transport and JSON encoding - against
+LocalCLOBServer, so regressions in those layers show up.
+
+Each run reports sustained orders per second and signal-to-ack latency
+percentiles (from queue_signal() to the execution result) and is compared
+with the saved baseline in baselines/clob_standin.json.
+
+Run: pytest tests/performance/test_clob_standin.py -v -s
+Refresh the baseline: MERCURY_UPDATE_BASELINE=1 pytest tests/performance/test_clob_standin.py
+"""
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from mercury.core.config import ConfigManager
+from mercury.core.ratelimit import RateLimiterRegistry
+from mercury.domain.signal import SignalPriority, SignalType
+from mercury.integrations.polymarket.clob import RATE_LIMIT_ORDERS, CLOBClient
+from mercury.integrations.polymarket.simulator import LatencyModel
+from mercury.integrations.polymarket.standin import LocalCLOBServer
+from mercury.integrations.polymarket.transport import DEFAULT_RATE_LIMIT_RETRIES
+from mercury.integrations.polymarket.types import PolymarketSettings
+from mercury.services.execution import ExecutionEngine
+from tests.performance.conftest import MockEventBus
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "clob_standin.json"
+UPDATE_BASELINE = os.environ.get("MERCURY_UPDATE_BASELINE") == "1"
+# Allowed fractional regression against the baseline before a run fails
+TOLERANCE = float(os.environ.get("MERCURY_BENCHMARK_TOLERANCE", "0.5"))
+
+PRIVATE_KEY = "0x" + "1" * 64
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of one benchmark run."""
+
+    signals: int
+    succeeded: int
+    failed: int
+    orders: int
+    duration_s: float
+    latencies_ms: list[float] = field(default_factory=list, repr=False)
+    unwinds_prebuilt: int = 0
+    unwinds_skipped: int = 0
+
+    @property
+    def orders_per_sec(self) -> float:
+        return self.orders / self.duration_s if self.duration_s else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Signal-to-ack latency at quantile q (0-1), in milliseconds."""
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def summary(self) -> dict[str, Any]:
+        """Figures saved to and compared with the baseline."""
+        return {
+            "signals": self.signals,
+            "orders_per_sec": round(self.orders_per_sec, 1),
+            "p50_ms": round(self.percentile(0.50), 2),
+            "p95_ms": round(self.percentile(0.95), 2),
+            "p99_ms": round(self.percentile(0.99), 2),
+        }
+
+    def report(self, name: str) -> None:
+        summary = self.summary()
+        print(f"\n{name}:")
+        print(f"  Signals: {self.signals} ({self.succeeded} ok, {self.failed} failed)")
+        print(f"  Orders: {self.orders} in {self.duration_s:.2f}s")
+        pairs = self.unwinds_prebuilt + self.unwinds_skipped
+        if pairs:
+            print(
+                f"  Unwinds pre-signed: {self.unwinds_prebuilt}/{pairs} pairs "
+                f"(prebuilt=false {self.unwinds_skipped / pairs:.0%})"
+            )
+        print(f"  Sustained: {summary['orders_per_sec']:.1f} orders/sec")
+        print(
+            f"  Signal-to-ack: p50 {summary['p50_ms']:.1f}ms, "
+            f"p95 {summary['p95_ms']:.1f}ms, p99 {summary['p99_ms']:.1f}ms"
+        )
+
+
+def load_baselines() -> dict[str, dict]:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def save_baseline(name: str, result: BenchmarkResult) -> None:
+    baselines = load_baselines()
+    baselines[name] = result.summary()
+    BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    BASELINE_PATH.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+
+
+def regressions(result: BenchmarkResult, baseline: dict, tolerance: float) -> list[str]:
+    """Describe every figure worse than the baseline by more than tolerance."""
+    summary = result.summary()
+    found = []
+    floor = baseline["orders_per_sec"] * (1 - tolerance)
+    if summary["orders_per_sec"] < floor:
+        found.append(
+            f"orders/sec {summary['orders_per_sec']} < {floor:.1f} "
+            f"(baseline {baseline['orders_per_sec']})"
+        )
+    for key in ("p50_ms", "p95_ms", "p99_ms"):
+        ceiling = baseline[key] * (1 + tolerance)
+        if summary[key] > ceiling:
+            found.append(f"{key} {summary[key]} > {ceiling:.1f} (baseline {baseline[key]})")
+    return found
+
+
+def check_baseline(name: str, result: BenchmarkResult, tolerance: float = TOLERANCE) -> None:
+    """Compare a run with its saved baseline, or save it when refreshing."""
+    result.report(name)
+    if UPDATE_BASELINE:
+        save_baseline(name, result)
+        return
+    baseline = load_baselines().get(name)
+    if baseline is None:
+        pytest.skip(f"No baseline for {name}; run with MERCURY_UPDATE_BASELINE=1")
+    found = regressions(result, baseline, tolerance)
+    assert not found, f"{name} regressed: " + "; ".join(found)
+
+
+def create_live_config(values: dict[str, Any]) -> ConfigManager:
+    """Create a config for live (not dry-run) execution with overrides."""
+    values = {"mercury.dry_run": False, **values}
+    config = MagicMock(spec=ConfigManager)
+    config.get.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_bool.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_int.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_float.side_effect = lambda key, default=None: values.get(key, default)
+    config.register_reload_callback = MagicMock()
+    config.unregister_reload_callback = MagicMock()
+    return config
+
+
+class ExecutionBenchmark:
+    """Drive ExecutionEngine through a real CLOBClient at the stand-in.
+
+    Every signal targets its own market (so none coalesce) and one of
+    `token_pairs` YES/NO books priced to fill. Signals are queued all at
+    once to measure saturated throughput, or `rate` per second to measure
+    latency below capacity.
+    A signal is acknowledged when the engine publishes its latency
+    breakdown, which it does once the exchange has answered - whether the
+    execution succeeded or failed.
+    """
+
+    def __init__(
+        self,
+        server: LocalCLOBServer,
+        signals: int = 200,
+        token_pairs: int = 10,
+        max_concurrent: int = 10,
+        rate: Optional[float] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
+    ) -> None:
+        self.server = server
+        self.rate_limiter = rate_limiter
+        self.signals = signals
+        self.rate = rate
+        self.token_pairs = token_pairs
+        self.max_concurrent = max_concurrent
+
+    def _tokens(self, i: int) -> tuple[str, str]:
+        pair = i % self.token_pairs
+        return f"{pair + 1}1", f"{pair + 1}2"
+
+    async def run(self, timeout: float = 60.0) -> BenchmarkResult:
+        for i in range(self.token_pairs):
+            yes_token, no_token = self._tokens(i)
+            self.server.set_book(yes_token, asks=[("0.46", "100000")])
+            self.server.set_book(no_token, asks=[("0.48", "100000")])
+
+        settings = PolymarketSettings(
+            private_key=PRIVATE_KEY,
+            api_key="key",
+            api_secret="c2VjcmV0",
+            api_passphrase="pass",
+            clob_url=self.server.url,
+            batch_window_ms=ExecutionEngine.DEFAULT_BATCH_WINDOW_MS,
+        )
+        event_bus = MockEventBus()
+        config = create_live_config({
+            "execution.max_concurrent": self.max_concurrent,
+            "execution.max_queue_size": self.signals,
+        })
+        clob = CLOBClient(settings, rate_limiter=self.rate_limiter)
+        engine = ExecutionEngine(config, event_bus, clob_client=clob)
+
+        queued_at: dict[str, float] = {}
+        latencies: list[float] = []
+        finished_at = 0.0
+
+        async def on_latency(data: dict) -> None:
+            nonlocal finished_at
+            finished_at = time.perf_counter()
+            latencies.append((finished_at - queued_at[data["signal_id"]]) * 1000)
+
+        await event_bus.subscribe("execution.latency", on_latency)
+        await engine.start()
+        # As on market subscription, so signing doesn't look up market metadata
+        await clob.prepare_order_templates(
+            [token for i in range(self.token_pairs) for token in self._tokens(i)]
+        )
+        orders_before = len(self.server.orders)
+
+        started = time.perf_counter()
+        try:
+            for i in range(self.signals):
+                signal_id = f"bench-{i}"
+                yes_token, no_token = self._tokens(i)
+                if self.rate:
+                    await asyncio.sleep(max(started + i / self.rate - time.perf_counter(), 0))
+                queued_at[signal_id] = time.perf_counter()
+                await engine.queue_signal(
+                    signal_id,
+                    {
+                        "signal_id": signal_id,
+                        "market_id": f"market-{i}",
+                        "signal_type": SignalType.ARBITRAGE.value,
+                        "target_size_usd": "20",
+                        "yes_price": "0.45",
+                        "no_price": "0.47",
+                        "yes_token_id": yes_token,
+                        "no_token_id": no_token,
+                    },
+                    SignalPriority.MEDIUM,
+                )
+
+            deadline = started + timeout
+            while time.perf_counter() < deadline:
+                stats = engine.get_queue_stats()
+                if stats["total_executed"] + stats["total_failed"] >= self.signals:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await engine.stop()
+
+        stats = engine.get_queue_stats()
+        return BenchmarkResult(
+            signals=self.signals,
+            succeeded=stats["total_executed"],
+            failed=stats["total_failed"],
+            orders=len(self.server.orders) - orders_before,
+            duration_s=(finished_at or time.perf_counter()) - started,
+            latencies_ms=latencies,
+            unwinds_prebuilt=clob.unwinds_prebuilt,
+            unwinds_skipped=clob.unwinds_skipped,
+        )
+
+
+class TestStandinExecutionBenchmarks:
+    """End-to-end execution benchmarks through HTTP, signing and serialization."""
+
+    async def test_sustained_throughput(self):
+        """Benchmark saturated orders/sec with a 5ms exchange round trip."""
+        async with LocalCLOBServer(latency=LatencyModel("fixed", mean_ms=5.0)) as server:
+            result = await ExecutionBenchmark(server).run()
+
+        assert result.succeeded == result.signals
+        assert result.orders == 2 * result.signals
+        check_baseline("sustained_throughput", result)
+
+    async def test_signal_to_ack_latency(self):
+        """Benchmark signal-to-ack latency at a rate below capacity."""
+        async with LocalCLOBServer(
+            latency=LatencyModel("lognormal", mean_ms=10.0, jitter_ms=5.0), seed=3
+        ) as server:
+            result = await ExecutionBenchmark(server, signals=100, rate=10.0).run()
+
+        assert result.succeeded == result.signals
+        check_baseline("signal_to_ack_latency", result)
+
+    async def test_injected_errors(self):
+        """Verify failed posts fail their signal only and the run keeps going."""
+        async with LocalCLOBServer(
+            latency=LatencyModel("lognormal", mean_ms=10.0, jitter_ms=5.0),
+            error_rate=0.1,
+            seed=7,
+        ) as server:
+            result = await ExecutionBenchmark(server, signals=100, rate=10.0).run()
+
+        assert result.succeeded + result.failed == result.signals
+        assert result.failed >= server.injected_errors > 0
+        check_baseline("injected_errors", result)
+
+    async def test_rate_limited(self):
+        """Verify a server-side rate limit is respected via Retry-After backoff."""
+        limit = 20.0
+        # A client budget at the server's rate but with a larger burst, so
+        # the first burst overruns the server and is throttled
+        registry = RateLimiterRegistry()
+        registry.configure(RATE_LIMIT_ORDERS, rate=limit, burst=5 * limit)
+        async with LocalCLOBServer(rate_limits={"/orders": limit}) as server:
+            result = await ExecutionBenchmark(server, signals=100, rate_limiter=registry).run()
+
+        # Throttled posts are resent after Retry-After, not failed
+        assert result.succeeded == result.signals
+        assert result.orders == 2 * result.signals
+        posts = sum(1 for r in server.requests if r.path == "/orders") - server.throttled
+        # More posts than one burst of the limit, so the limit was hit...
+        assert posts > limit
+        assert server.throttled > 0
+        # ...and each post was throttled no more often than it may be resent
+        assert server.throttled <= posts * DEFAULT_RATE_LIMIT_RETRIES
+        result.report("rate_limited")
@@ -11,6 +11,7 @@ Run: pytest tests/performance/test_load.py -v
 """
 import asyncio
 import gc
+import random
 import time
 import tracemalloc
 from datetime import datetime, timezone
@@ -24,64 +25,16 @@ from mercury.core.config import ConfigManager
 from mercury.core.events import EventBus
 from mercury.domain.market import OrderBook, OrderBookLevel
 from mercury.domain.order import ExecutionLatency
+from mercury.domain.orderbook import InMemoryOrderBook
 from mercury.domain.signal import SignalPriority, SignalType, TradingSignal
+from mercury.integrations.polymarket.simulator import LatencyModel, SimulatedExchange
+from mercury.integrations.polymarket.types import OrderSide
 from mercury.services.execution import ExecutionEngine, ExecutionSignal
 from mercury.services.market_data import MarketDataService
 from mercury.services.strategy_engine import StrategyEngine
 from mercury.strategies.gabagool.strategy import GabagoolStrategy
 
-
-class MockEventBus:
-    """In-memory event bus for load testing without Redis dependency."""
-
-    def __init__(self) -> None:
-        self._handlers: dict[str, list] = {}
-        self._published_events: list[tuple[str, dict]] = []
-        self._publish_count = 0
-
-    async def publish(self, channel: str, event: dict) -> None:
-        """Publish event and dispatch to handlers."""
-        self._published_events.append((channel, event))
-        self._publish_count += 1
-
-        # Dispatch to handlers
-        for pattern, handlers in self._handlers.items():
-            if self._pattern_matches(pattern, channel):
-                for handler in handlers:
-                    try:
-                        await handler(event)
-                    except Exception:
-                        pass
-
-    async def subscribe(self, pattern: str, handler) -> None:
-        """Subscribe handler to pattern."""
-        if pattern not in self._handlers:
-            self._handlers[pattern] = []
-        self._handlers[pattern].append(handler)
-
-    async def unsubscribe(self, pattern: str) -> None:
-        """Unsubscribe from pattern."""
-        self._handlers.pop(pattern, None)
-
-    def _pattern_matches(self, pattern: str, channel: str) -> bool:
-        """Simple glob pattern matching."""
-        if pattern == channel:
-            return True
-        if "*" not in pattern:
-            return False
-        parts = pattern.split("*")
-        if len(parts) == 2:
-            return channel.startswith(parts[0]) and channel.endswith(parts[1])
-        return channel.startswith(parts[0])
-
-    def clear(self) -> None:
-        """Clear published events."""
-        self._published_events.clear()
-        self._publish_count = 0
-
-    @property
-    def publish_count(self) -> int:
-        return self._publish_count
+from tests.performance.conftest import MockEventBus
 
 
 class MockCLOBClient:
@@ -364,6 +317,73 @@ class TestSignalToOrderLatency:
         print(f"  Simulated delay: 100.00ms")
         print(f"  Overhead: {overhead:.2f}ms")
 
+    @pytest.mark.asyncio
+    async def test_dry_run_with_simulated_exchange(self):
+        """Dry-run signals against book depth: some legs fill short and are rebalanced."""
+        event_bus = MockEventBus()
+        config = create_mock_config()
+        config.get_bool.side_effect = lambda key, default=None: True
+
+        rng = random.Random(42)
+        books: dict[str, InMemoryOrderBook] = {}
+        exchange = SimulatedExchange(
+            books.get,
+            latency=LatencyModel("lognormal", mean_ms=5.0, jitter_ms=3.0),
+            match_interval=0,
+            seed=42,
+        )
+        engine = ExecutionEngine(
+            config, event_bus, clob_client=MockCLOBClient(), simulator=exchange
+        )
+        await engine.start()
+
+        results = []
+        latencies = []
+        for i in range(100):
+            # Fresh books each time, with NO depth sometimes short of the ~21 shares needed
+            for token, ask in (("yes-token", "0.48"), ("no-token", "0.50")):
+                book = InMemoryOrderBook(token_id=token)
+                book.apply_snapshot(
+                    [(Decimal(ask) - Decimal("0.02"), Decimal("100"))],
+                    [(Decimal(ask), Decimal(rng.choice([10, 30, 100])))],
+                )
+                books[token] = book
+
+            signal = ExecutionSignal(
+                signal_id=f"signal-{i}",
+                original_signal_id=f"original-{i}",
+                market_id=f"market-{i % 10}",
+                signal_type=SignalType.ARBITRAGE,
+                target_size_usd=Decimal("20"),
+                yes_price=Decimal("0.47"),
+                no_price=Decimal("0.49"),
+                yes_token_id="yes-token",
+                no_token_id="no-token",
+            )
+
+            start = time.time()
+            results.append(await engine.execute(signal))
+            latencies.append((time.time() - start) * 1000)
+
+        await engine.stop()
+
+        filled = sum(1 for r in results if r.success)
+        partial = len(results) - filled
+        # Excess shares are sold back when the hedge isn't available
+        exits = sum(1 for o in exchange._orders.values() if o.side == OrderSide.SELL)
+        p95 = sorted(latencies)[int(len(latencies) * 0.95)]
+
+        assert 0 < filled < len(results)
+        assert exits > 0
+        assert p95 < 100, f"P95 latency {p95:.1f}ms exceeds 100ms target"
+
+        print(f"\nSimulated dry run (n={len(results)}):")
+        print(f"  Both legs filled: {filled}")
+        print(f"  Partial fills: {partial}")
+        print(f"  Unwind exits: {exits}")
+        print(f"  Avg latency: {sum(latencies) / len(latencies):.2f}ms")
+        print(f"  P95 latency: {p95:.2f}ms")
+
     @pytest.mark.asyncio
     async def test_latency_tracking_breakdown(self):
         """Test detailed latency breakdown tracking."""
@@ -469,7 +489,9 @@ class TestSignalToOrderLatency:
 
         await engine.stop()
 
-        assert stats["total_executed"] + stats["total_failed"] >= num_signals * 0.9
+        # 50 signals over 10 markets: most are coalesced into pending entries
+        handled = stats["total_executed"] + stats["total_failed"] + stats["total_superseded"]
+        assert handled >= num_signals * 0.9
 
 
 class TestConcurrentStrategyExecution:
@@ -842,6 +864,184 @@ class TestPerformanceBenchmarks:
         # Signal generation should be fast (< 1ms average)
         assert avg_latency < 1000, f"Signal generation too slow: {avg_latency:.2f}μs"
 
+    @pytest.mark.asyncio
+    async def test_batch_vs_per_event_evaluation(self):
+        """Benchmark on_market_batch against per-event on_market_data."""
+        from mercury.domain.market_batch import MarketBatch
+        from mercury.strategies.gabagool.config import GabagoolConfig
+
+        config = create_mock_config()
+        gabagool_config = GabagoolConfig()
+        num_markets = 2000
+
+        # 1 in 50 markets has a tradeable spread
+        books = [
+            create_arbitrage_order_book(
+                f"market-{i}",
+                yes_ask=Decimal("0.45") if i % 50 == 0 else Decimal("0.52"),
+                no_ask=Decimal("0.50"),
+            )
+            for i in range(num_markets)
+        ]
+
+        per_event = GabagoolStrategy(config, gabagool_config)
+        start = time.perf_counter()
+        per_event_signals = 0
+        for book in books:
+            async for _ in per_event.on_market_data(book.market_id, book):
+                per_event_signals += 1
+        per_event_ms = (time.perf_counter() - start) * 1000
+
+        batched = GabagoolStrategy(config, gabagool_config)
+        batch = MarketBatch(capacity=num_markets)
+        start = time.perf_counter()
+        for book in books:
+            batch.update(book)
+        ingest_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        batch_signals = 0
+        async for _ in batched.on_market_batch(batch, batch.dirty_rows()):
+            batch_signals += 1
+        batch_ms = (time.perf_counter() - start) * 1000
+
+        print("\nBatch vs per-event evaluation benchmark:")
+        print(f"  Markets: {num_markets}")
+        print(f"  Per-event evaluation: {per_event_ms:.2f}ms ({per_event_signals} signals)")
+        print(f"  Batch evaluation: {batch_ms:.2f}ms ({batch_signals} signals)")
+        print(f"  Batch ingest (array updates): {ingest_ms:.2f}ms")
+        print(f"  Evaluation speedup: {per_event_ms / batch_ms:.1f}x")
+
+        assert batch_signals == per_event_signals == num_markets // 50
+        assert batch_ms < per_event_ms, "Batch evaluation slower than per-event"
+
+    @pytest.mark.asyncio
+    async def test_scenario_risk_latency(self):
+        """Benchmark worst-case scenario P&L for hundreds of open positions."""
+        from mercury.domain.scenario import PortfolioScenarios
+
+        portfolio = PortfolioScenarios()
+        assets = ["BTC", "ETH", "SOL"]
+        for i in range(500):
+            portfolio.apply_fill(
+                f"market-{i}", "YES" if i % 2 else "NO", 20.0, 9.5, asset=assets[i % 3]
+            )
+
+        latencies = []
+        for i in range(2000):
+            start = time.perf_counter()
+            portfolio.evaluate_with(f"market-{i % 600}", 10.0, 10.0, 9.6, asset=assets[i % 3])
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+
+        latencies.sort()
+        avg_latency = sum(latencies) / len(latencies)
+        p99 = latencies[int(len(latencies) * 0.99)]
+
+        print("\nScenario risk benchmark:")
+        print(f"  Positions: {len(portfolio)}")
+        print(f"  Avg latency: {avg_latency:.2f}μs")
+        print(f"  P99 latency: {p99:.2f}μs")
+
+        assert avg_latency < 1000, f"Scenario evaluation too slow: {avg_latency:.2f}μs"
+
+    @pytest.mark.asyncio
+    async def test_check_pre_trade_throughput(self):
+        """Benchmark pre-trade checks interleaved with circuit breaker updates."""
+        from mercury.domain.order import Fill
+        from mercury.services.risk_manager import RiskManager
+
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: default
+        risk_manager = RiskManager(config=config, event_bus=MockEventBus())
+
+        signals = [
+            TradingSignal(
+                strategy_name="gabagool",
+                market_id=f"market-{i % 50}",
+                signal_type=SignalType.ARBITRAGE if i % 4 else SignalType.BUY_YES,
+                confidence=0.9,
+                target_size_usd=Decimal("5"),
+                yes_price=Decimal("0.48"),
+                no_price=Decimal("0.49"),
+            )
+            for i in range(200)
+        ]
+        for i in range(50):
+            risk_manager.record_fill(Fill(
+                order_id=f"order-{i}",
+                market_id=f"market-{i}",
+                side="BUY",
+                size=Decimal("10"),
+                price=Decimal("0.5"),
+            ))
+
+        num_checks = 20000
+        approved = 0
+        start = time.perf_counter()
+        for i in range(num_checks):
+            allowed, _ = await risk_manager.check_pre_trade(signals[i % len(signals)])
+            approved += allowed
+            # Circuit breaker inputs change between checks without crossing thresholds
+            if i % 10 == 0:
+                risk_manager.record_failure()
+                risk_manager.record_success()
+        elapsed = time.perf_counter() - start
+
+        checks_per_sec = num_checks / elapsed
+        avg_us = elapsed / num_checks * 1_000_000
+
+        print("\ncheck_pre_trade throughput benchmark:")
+        print(f"  Checks: {num_checks}")
+        print(f"  Throughput: {checks_per_sec:,.0f} checks/sec")
+        print(f"  Avg latency: {avg_us:.2f}μs")
+
+        assert approved == num_checks
+        assert risk_manager.circuit_breaker_state.value == "NORMAL"
+        assert checks_per_sec > 10000, f"check_pre_trade too slow: {checks_per_sec:,.0f}/sec"
+
+    @pytest.mark.asyncio
+    async def test_order_signing_benchmark(self):
+        """Benchmark dual-leg signing: cold create_order vs templates, threads vs processes."""
+        from py_clob_client.client import ClobClient
+        from py_clob_client.clob_types import OrderArgs
+
+        from mercury.integrations.polymarket.signing import OrderSigner
+
+        client = ClobClient("http://127.0.0.1:1", key="0x" + "1" * 64, chain_id=137)
+        client.get_tick_size = MagicMock(return_value="0.01")
+        client.get_neg_risk = MagicMock(return_value=False)
+        client.get_fee_rate_bps = MagicMock(return_value=0)
+
+        def pair():
+            return [
+                OrderArgs(token_id="1", price=0.48, size=10.0, side="BUY"),
+                OrderArgs(token_id="2", price=0.49, size=10.0, side="BUY"),
+            ]
+
+        num_pairs = 15
+        results = {}
+        for label, use_processes, prepare in (
+            ("cold", False, False),
+            ("template/threads", False, True),
+            ("template/processes", True, True),
+        ):
+            signer = OrderSigner(client, workers=2, use_processes=use_processes)
+            await signer.start()
+            if prepare:
+                await signer.prepare_all(["1", "2"])
+            await signer.sign_all(pair())  # warm up
+            start = time.perf_counter()
+            for _ in range(num_pairs):
+                await signer.sign_all(pair())
+            results[label] = (time.perf_counter() - start) / num_pairs * 1000
+            await signer.stop()
+
+        print(f"\nDual-leg signing benchmark ({num_pairs} pairs):")
+        for label, ms in results.items():
+            print(f"  {label}: {ms:.2f}ms per pair")
+
+        assert results["template/threads"] < results["cold"]
+
     @pytest.mark.asyncio
     async def test_end_to_end_latency_benchmark(self):
         """Full end-to-end latency benchmark from market data to execution."""
@@ -0,0 +1,168 @@
+"""
+StateStore read benchmark under sustained writes.
+
+Settlement, analytics and database stats queries run while a writer saves
+trades as fast as it can, once with every query on the writer
+connection (read_connections = 0, as before the read pool) and once with
+the read pool. Each run reports queries per second and the latency of the
+writes, which stand in for the order path.
+
+Run: pytest tests/performance/test_state_store_reads.py -v -s
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from mercury.core.config import ConfigManager
+from mercury.services.state_store import StateStore, Trade
+
+DURATION_S = 2.0
+READER_TASKS = 4
+
+
+@dataclass
+class ReadBenchmarkResult:
+    """Outcome of one benchmark run."""
+
+    read_connections: int
+    reads: int
+    writes: int
+    duration_s: float
+    write_latencies_ms: list[float] = field(default_factory=list, repr=False)
+
+    @property
+    def reads_per_sec(self) -> float:
+        return self.reads / self.duration_s if self.duration_s else 0.0
+
+    @property
+    def writes_per_sec(self) -> float:
+        return self.writes / self.duration_s if self.duration_s else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Write latency at quantile q (0-1), in milliseconds."""
+        if not self.write_latencies_ms:
+            return 0.0
+        ordered = sorted(self.write_latencies_ms)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def report(self, name: str) -> None:
+        print(f"\n{name} (read_connections={self.read_connections}):")
+        print(f"  Reads: {self.reads_per_sec:.0f}/sec")
+        print(f"  Writes: {self.writes_per_sec:.0f}/sec")
+        print(
+            f"  Write latency: p50 {self.percentile(0.50):.2f}ms, "
+            f"p99 {self.percentile(0.99):.2f}ms"
+        )
+
+
+def create_config(values: dict[str, Any]) -> ConfigManager:
+    config = MagicMock(spec=ConfigManager)
+    config.get.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_bool.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_int.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_float.side_effect = lambda key, default=None: values.get(key, default)
+    return config
+
+
+async def seed(store: StateStore, trades: int = 2000) -> None:
+    """Fill the tables the report queries scan."""
+    for i in range(trades):
+        await store.save_trade(Trade(
+            trade_id=f"seed-{i}",
+            market_id=f"market-{i % 50}",
+            strategy="gabagool",
+            side="YES",
+            size=Decimal("10"),
+            price=Decimal("0.50"),
+            cost=Decimal("5"),
+        ))
+    await store.increment_daily_stats(date.today(), trades=trades, volume=Decimal("10000"))
+
+
+async def run_benchmark(path: str, read_connections: int) -> ReadBenchmarkResult:
+    store = StateStore(
+        db_path=path,
+        config=create_config({"database.read_connections": read_connections}),
+    )
+    await store.connect()
+    await seed(store)
+
+    stop = asyncio.Event()
+    reads = 0
+    write_latencies: list[float] = []
+
+    async def writer() -> None:
+        i = 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            await store.save_trade(Trade(
+                trade_id=f"bench-{read_connections}-{i}",
+                market_id=f"market-{i % 50}",
+                strategy="gabagool",
+                side="YES",
+                size=Decimal("10"),
+                price=Decimal("0.50"),
+                cost=Decimal("5"),
+            ))
+            write_latencies.append((time.perf_counter() - start) * 1000)
+            i += 1
+
+    async def reader(n: int) -> None:
+        nonlocal reads
+        queries = [
+            store.get_settlement_stats,
+            store.aggregate_daily_stats,
+            lambda: store.get_trades(limit=200),
+            store.get_database_stats,
+        ]
+        i = n
+        while not stop.is_set():
+            await queries[i % len(queries)]()
+            reads += 1
+            i += 1
+
+    tasks = [asyncio.create_task(writer())]
+    tasks += [asyncio.create_task(reader(n)) for n in range(READER_TASKS)]
+    started = time.perf_counter()
+    try:
+        await asyncio.sleep(DURATION_S)
+        stop.set()
+        await asyncio.gather(*tasks)
+        duration = time.perf_counter() - started
+    finally:
+        stop.set()
+        await store.close()
+
+    return ReadBenchmarkResult(
+        read_connections=read_connections,
+        reads=reads,
+        writes=len(write_latencies),
+        duration_s=duration,
+        write_latencies_ms=write_latencies,
+    )
+
+
+class TestStateStoreReadPool:
+    """Read throughput and write latency with and without the read pool."""
+
+    @pytest.mark.asyncio
+    async def test_reads_during_sustained_writes(self, tmp_path):
+        """Benchmark queries per second while trades are written continuously."""
+        single = await run_benchmark(str(tmp_path / "single.db"), read_connections=0)
+        pooled = await run_benchmark(
+            str(tmp_path / "pooled.db"), read_connections=StateStore.DEFAULT_READ_CONNECTIONS
+        )
+        single.report("Writer connection only")
+        pooled.report("Read pool")
+
+        assert single.reads > 0 and pooled.reads > 0
+        # Reads no longer queue on the writer's thread, so writes are not
+        # slowed by them
+        assert pooled.percentile(0.50) <= single.percentile(0.50) * 1.5
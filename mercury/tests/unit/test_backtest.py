@@ -0,0 +1,247 @@
+"""
+Unit tests for the backtest harness.
+
+Tests verify:
+- JSON Lines recordings round-trip and sort by time
+- Fills walk recorded depth and respect price limits and budget
+- Settlement against resolutions and final books
+- Replay clock drives strategy cooldowns
+- Parameter sweeps are deterministic and ranked
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from mercury.backtest import (
+    BookTick,
+    FillSimulator,
+    Recording,
+    format_results_table,
+    gabagool_factory,
+    load_recording,
+    run_backtest,
+    run_parameter_sweep,
+    write_recording,
+)
+from mercury.domain.market import OrderBook, OrderBookLevel
+from mercury.domain.signal import SignalType, TradingSignal
+
+T0 = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def levels(*pairs: tuple[str, str]) -> list[OrderBookLevel]:
+    return [OrderBookLevel(price=Decimal(p), size=Decimal(s)) for p, s in pairs]
+
+
+def make_book(market_id: str = "m1", yes_ask: str = "0.45", no_ask: str = "0.50") -> OrderBook:
+    return OrderBook(
+        market_id=market_id,
+        yes_bids=levels(("0.40", "100")),
+        yes_asks=levels((yes_ask, "10"), ("0.46", "100")),
+        no_bids=levels(("0.45", "100")),
+        no_asks=levels((no_ask, "10"), ("0.51", "5"), ("0.52", "100")),
+    )
+
+
+def make_recording(seconds: list[int], market_id: str = "m1") -> Recording:
+    return Recording(ticks=[
+        BookTick(timestamp=T0 + timedelta(seconds=s), book=make_book(market_id))
+        for s in seconds
+    ])
+
+
+def arb_signal(target: str = "100", market_id: str = "m1") -> TradingSignal:
+    return TradingSignal(
+        market_id=market_id,
+        signal_type=SignalType.ARBITRAGE,
+        target_size_usd=Decimal(target),
+        yes_price=Decimal("0.45"),
+        no_price=Decimal("0.50"),
+        max_slippage=Decimal("0.01"),
+    )
+
+
+class TestRecording:
+    """Tests for recording load/write."""
+
+    def test_round_trip(self, tmp_path):
+        """Verify books and resolutions survive a write/load cycle."""
+        recording = make_recording([0, 60])
+        recording.resolutions["m1"] = "YES"
+        path = tmp_path / "books.jsonl"
+
+        write_recording(path, recording)
+        loaded = load_recording(path)
+
+        assert [t.timestamp for t in loaded.ticks] == [t.timestamp for t in recording.ticks]
+        assert loaded.ticks[0].book.yes_asks == recording.ticks[0].book.yes_asks
+        assert loaded.resolutions == {"m1": "YES"}
+        assert loaded.duration_hours == pytest.approx(1 / 60)
+
+    def test_sorted_by_timestamp(self, tmp_path):
+        """Verify out-of-order lines are sorted, epoch timestamps accepted."""
+        path = tmp_path / "books.jsonl"
+        path.write_text(
+            json.dumps({"market_id": "b", "timestamp": T0.timestamp() + 5, "yes_asks": [[0.4, 1]]})
+            + "\n\n"
+            + json.dumps({"market_id": "a", "timestamp": "2026-01-01T12:00:00"})
+            + "\n"
+        )
+
+        loaded = load_recording(path)
+
+        assert loaded.market_ids == ["a", "b"]
+        assert loaded.ticks[0].timestamp == T0
+        assert loaded.ticks[1].book.yes_asks == levels(("0.4", "1"))
+
+    def test_malformed_line_reports_location(self, tmp_path):
+        """Verify parse errors name the offending line."""
+        path = tmp_path / "books.jsonl"
+        path.write_text('{"market_id": "a"}\n')
+
+        with pytest.raises(ValueError, match="books.jsonl:1"):
+            load_recording(path)
+
+
+class TestFillSimulator:
+    """Tests for fills against recorded depth."""
+
+    def test_arbitrage_walks_both_ladders(self):
+        """Verify equal shares are bought across levels within the limit."""
+        simulator = FillSimulator()
+        book = make_book()
+        simulator.on_book(book)
+
+        fill = simulator.fill(arb_signal("100"), book, T0)
+
+        # 10 pairs at 0.95, 5 at 0.97; NO's 0.52 level is beyond the 0.51 limit
+        assert fill.yes_shares == fill.no_shares == Decimal("15")
+        assert fill.cost == Decimal("9.50") + Decimal("4.85")
+
+    def test_arbitrage_respects_budget(self):
+        """Verify fills stop at target_size_usd."""
+        simulator = FillSimulator()
+
+        fill = simulator.fill(arb_signal("4.75"), make_book(), T0)
+
+        assert fill.yes_shares == Decimal("5")
+        assert fill.cost == Decimal("4.75")
+
+    def test_liquidity_consumed_until_next_book(self):
+        """Verify a snapshot cannot be filled twice."""
+        simulator = FillSimulator()
+        book = make_book()
+
+        first = simulator.fill(arb_signal("100"), book, T0)
+        second = simulator.fill(arb_signal("100"), book, T0)
+        simulator.on_book(book)
+        third = simulator.fill(arb_signal("100"), book, T0)
+
+        assert first is not None
+        assert second is None
+        assert third.yes_shares == first.yes_shares
+
+    def test_directional_fill_and_settlement(self):
+        """Verify BUY_YES walks the YES ladder and settles on outcome."""
+        simulator = FillSimulator()
+        signal = TradingSignal(
+            market_id="m1",
+            signal_type=SignalType.BUY_YES,
+            target_size_usd=Decimal("4.5"),
+            yes_price=Decimal("0.45"),
+        )
+
+        fill = simulator.fill(signal, make_book(), T0)
+
+        assert fill.yes_shares == Decimal("10")
+        assert fill.no_shares == 0
+        assert fill.settle("YES") == Decimal("5.5")
+        assert fill.settle("NO") == Decimal("-4.5")
+        # Unresolved: marked at the final YES best bid of 0.40
+        assert fill.settle(None, make_book()) == Decimal("-0.5")
+
+
+class TestRunBacktest:
+    """Tests for strategy replay."""
+
+    def test_cooldown_follows_replay_clock(self):
+        """Verify cooldown is measured in recorded time."""
+        recording = make_recording([0, 1, 2, 10])
+
+        result = run_backtest(gabagool_factory, recording, {"signal_cooldown_seconds": 5})
+
+        # Signals at t=0 and t=10; t=1 and t=2 fall inside the cooldown
+        assert result.signals == 2
+        assert result.fill_count == 2
+        assert result.hit_rate == 1.0
+        assert result.pnl > 0
+        assert result.signals_per_hour == pytest.approx(2 / (10 / 3600))
+
+    def test_runs_are_deterministic(self):
+        """Verify identical inputs give identical results."""
+        recording = make_recording([0, 3, 6, 9, 12])
+        params = {"signal_cooldown_seconds": 2, "max_trade_size_usd": 15}
+
+        first = run_backtest(gabagool_factory, recording, params)
+        second = run_backtest(gabagool_factory, recording, params)
+
+        assert (first.signals, first.pnl, first.volume_usd) == (
+            second.signals, second.pnl, second.volume_usd
+        )
+
+    def test_unknown_parameter_rejected(self):
+        """Verify typos in grid keys fail loudly."""
+        with pytest.raises(ValueError, match="min_sprd"):
+            run_backtest(gabagool_factory, make_recording([0]), {"min_sprd": 1})
+
+
+class TestParameterSweep:
+    """Tests for grid sweeps and ranking."""
+
+    GRID = {
+        "min_spread_threshold": ["0.01", "0.10"],
+        "signal_cooldown_seconds": ["1", "30"],
+    }
+
+    def test_results_ranked_by_pnl(self):
+        """Verify every combination runs and the best PnL ranks first."""
+        results = run_parameter_sweep(
+            gabagool_factory, make_recording(list(range(0, 60, 2))), self.GRID, max_workers=1
+        )
+
+        assert len(results) == 4
+        assert [r.pnl for r in results] == sorted((r.pnl for r in results), reverse=True)
+        assert results[0].params == {
+            "min_spread_threshold": "0.01",
+            "signal_cooldown_seconds": "1",
+        }
+        # 10 cent threshold is above the 5 cent spread
+        assert all(r.signals == 0 for r in results[2:])
+
+    def test_process_pool_matches_inline(self):
+        """Verify pool results equal inline results."""
+        recording = make_recording(list(range(0, 60, 2)))
+
+        inline = run_parameter_sweep(gabagool_factory, recording, self.GRID, max_workers=1)
+        pooled = run_parameter_sweep(gabagool_factory, recording, self.GRID, max_workers=2)
+
+        assert [(r.params, r.signals, r.pnl) for r in pooled] == [
+            (r.params, r.signals, r.pnl) for r in inline
+        ]
+
+    def test_format_results_table(self):
+        """Verify the table has a header plus one row per result."""
+        results = run_parameter_sweep(
+            gabagool_factory, make_recording([0, 10]), self.GRID, max_workers=1
+        )
+
+        table = format_results_table(results, limit=2)
+        lines = table.splitlines()
+
+        assert len(lines) == 3
+        assert "min_spread_threshold" in lines[0]
+        assert "signals/hr" in lines[0]
+        assert lines[1].split()[0] == "1"
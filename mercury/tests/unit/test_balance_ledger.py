@@ -0,0 +1,184 @@
+"""Unit tests for the in-memory balance ledger."""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mercury.core.config import ConfigManager
+from mercury.domain.signal import SignalType, TradingSignal
+from mercury.services.balance import BalanceLedger
+from mercury.services.execution import ExecutionEngine, ExecutionSignal
+from mercury.services.risk_manager import RiskManager
+
+
+def create_config(values=None) -> ConfigManager:
+    values = values or {}
+    config = MagicMock(spec=ConfigManager)
+    config.get.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_bool.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_int.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_float.side_effect = lambda key, default=None: values.get(key, default)
+    return config
+
+
+def create_clob(balance="100", allowance="80"):
+    clob = MagicMock()
+    clob.get_balance = AsyncMock(
+        return_value={"balance": Decimal(balance), "allowance": Decimal(allowance)}
+    )
+    return clob
+
+
+def create_signal(size="10", signal_type=SignalType.ARBITRAGE, signal_id="s1"):
+    return TradingSignal(
+        signal_id=signal_id,
+        strategy_name="gabagool",
+        market_id=f"market-{signal_id}",
+        signal_type=signal_type,
+        confidence=0.8,
+        target_size_usd=Decimal(size),
+        yes_price=Decimal("0.48"),
+        no_price=Decimal("0.50"),
+    )
+
+
+@pytest.fixture
+async def ledger(mock_event_bus):
+    ledger = BalanceLedger(
+        create_config({"balance.reconcile_interval_seconds": 0}),
+        mock_event_bus,
+        clob_client=create_clob(),
+        metrics_emitter=MagicMock(),
+    )
+    await ledger.start()
+    yield ledger
+    await ledger.stop()
+
+
+class TestBalanceLedger:
+    """Tests for holds, fills and reconciliation."""
+
+    async def test_seeded_from_exchange(self, ledger):
+        """Verify available is the lower of balance and allowance."""
+        assert ledger.is_seeded
+        assert ledger.available == Decimal("80")
+
+    async def test_hold_fill_release(self, ledger):
+        assert ledger.hold("o1", Decimal("30"))
+        assert ledger.available == Decimal("50")
+
+        ledger.fill("o1", Decimal("10"))
+        ledger.fill("o1", Decimal("20"))
+        assert ledger.balance == Decimal("80")
+        assert ledger.held == Decimal("10")
+
+        assert ledger.release("o1") == Decimal("10")
+        assert ledger.held == Decimal("0")
+        assert ledger.available == Decimal("60")
+
+    async def test_hold_refused_over_available(self, ledger):
+        assert ledger.hold("o1", Decimal("70"))
+        assert not ledger.hold("o2", Decimal("20"))
+        assert ledger.held == Decimal("70")
+
+    async def test_unseeded_allows_everything(self, mock_event_bus):
+        """Verify checks pass until the balance is known."""
+        ledger = BalanceLedger(create_config(), mock_event_bus)
+
+        assert ledger.can_afford(Decimal("1000000"))
+        assert ledger.hold("o1", Decimal("1000000"))
+
+    async def test_reconcile_reports_and_corrects_drift(self, ledger):
+        ledger._clob.get_balance.return_value = {
+            "balance": Decimal("95"), "allowance": Decimal("80"),
+        }
+
+        drift = await ledger.reconcile()
+
+        assert drift == Decimal("5")
+        assert ledger.balance == Decimal("95")
+        ledger._metrics.update_balance_drift.assert_called_with(Decimal("5"))
+
+    async def test_reconcile_keeps_fills_during_fetch(self, ledger):
+        """Verify a fill landing while the balance is fetched is not drift."""
+        async def get_balance():
+            ledger.fill("o1", Decimal("10"))
+            return {"balance": Decimal("100"), "allowance": Decimal("80")}
+
+        ledger._clob.get_balance = get_balance
+
+        assert await ledger.reconcile() == Decimal("0")
+        assert ledger.balance == Decimal("90")
+
+    async def test_chain_fallback(self, mock_event_bus):
+        clob = MagicMock()
+        clob.get_balance = AsyncMock(side_effect=RuntimeError("down"))
+        chain = MagicMock()
+        chain.get_usdc_balance = AsyncMock(return_value=Decimal("40"))
+        ledger = BalanceLedger(
+            create_config(), mock_event_bus, clob_client=clob, chain_client=chain
+        )
+
+        assert await ledger.seed()
+        assert ledger.available == Decimal("40")
+
+    async def test_settlement_credited(self, ledger):
+        await ledger._on_settlement_claimed({"proceeds": "12.5", "dry_run": False})
+        await ledger._on_settlement_claimed({"proceeds": "99", "dry_run": True})
+
+        assert ledger.balance == Decimal("112.5")
+
+
+class TestBalanceChecks:
+    """Tests for funds checked by risk and execution without I/O."""
+
+    async def test_risk_rejects_unaffordable_signal(self, ledger, mock_event_bus):
+        risk = RiskManager(create_config(), mock_event_bus, balance_ledger=ledger)
+        ledger.hold("o1", Decimal("75"))
+
+        allowed, reason = await risk.check_pre_trade(create_signal())
+
+        assert not allowed
+        assert reason.startswith("Insufficient available balance")
+        allowed, _ = await risk.check_pre_trade(create_signal(signal_type=SignalType.SELL_YES))
+        assert allowed
+
+    async def test_batch_reserves_funds(self, ledger, mock_event_bus):
+        """Verify a burst cannot jointly spend more than is available."""
+        risk = RiskManager(create_config(), mock_event_bus, balance_ledger=ledger)
+
+        approved, rejected = await risk.validate_batch(
+            [create_signal("25", signal_id=str(i)) for i in range(4)]
+        )
+
+        assert len(approved) == 3 and len(rejected) == 1
+        assert ledger._clob.get_balance.await_count == 1
+
+    async def test_engine_refuses_without_submitting(self, ledger, mock_event_bus):
+        clob = MagicMock()
+        clob.execute_dual_leg_order = AsyncMock()
+        engine = ExecutionEngine(
+            create_config({"mercury.dry_run": False}),
+            mock_event_bus,
+            clob_client=clob,
+            balance_ledger=ledger,
+        )
+        ledger.hold("o1", Decimal("75"))
+
+        result = await engine.execute(ExecutionSignal(
+            signal_id="s1",
+            original_signal_id="o1",
+            market_id="m1",
+            signal_type=SignalType.ARBITRAGE,
+            target_size_usd=Decimal("10"),
+            yes_price=Decimal("0.45"),
+            no_price=Decimal("0.47"),
+            yes_token_id="11",
+            no_token_id="12",
+        ))
+
+        assert not result.success
+        assert "Insufficient available balance" in result.error
+        clob.execute_dual_leg_order.assert_not_called()
+        assert ledger.held == Decimal("75")
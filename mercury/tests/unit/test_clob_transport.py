@@ -0,0 +1,276 @@
+"""Unit tests for the async CLOB transport against the local stand-in."""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from mercury.core.ratelimit import RateLimiterRegistry
+from mercury.integrations.polymarket.clob import (
+    RATE_LIMIT_BOOK,
+    CLOBClient,
+    CLOBClientError,
+    ConnectionError,
+    OrderRejectedError,
+    RateLimitedError,
+)
+from mercury.integrations.polymarket.simulator import LatencyModel
+from mercury.integrations.polymarket.standin import LocalCLOBServer
+from mercury.integrations.polymarket.transport import AsyncCLOBTransport
+from mercury.integrations.polymarket.types import OrderSide, OrderStatus, PolymarketSettings
+
+PRIVATE_KEY = "0x" + "1" * 64
+TOKEN = "123"
+
+
+@pytest.fixture
+async def server():
+    """Run a stand-in with a book for TOKEN."""
+    async with LocalCLOBServer(page_size=2) as server:
+        server.set_book(TOKEN, bids=[("0.44", "100")], asks=[("0.46", "100")])
+        yield server
+
+
+@pytest.fixture
+def settings(server):
+    """Create settings pointing at the stand-in."""
+    return PolymarketSettings(
+        private_key=PRIVATE_KEY,
+        api_key="key",
+        api_secret="c2VjcmV0",
+        api_passphrase="pass",
+        clob_url=server.url,
+    )
+
+
+@pytest.fixture
+def signing_client(settings):
+    """Create a py-clob-client ClobClient used only for signing."""
+    from py_clob_client.client import ClobClient
+    from py_clob_client.clob_types import ApiCreds
+
+    creds = ApiCreds(settings.api_key, settings.api_secret, settings.api_passphrase)
+    return ClobClient(settings.clob_url, key=PRIVATE_KEY, chain_id=137, creds=creds)
+
+
+@pytest.fixture
+async def transport(server, signing_client):
+    """Open a transport on the stand-in."""
+    async with AsyncCLOBTransport(
+        server.url, signer=signing_client.signer, creds=signing_client.creds
+    ) as transport:
+        yield transport
+
+
+async def sign(client, price: float, size: float = 10, side: str = "BUY"):
+    from py_clob_client.clob_types import OrderArgs
+
+    args = OrderArgs(token_id=TOKEN, price=price, size=size, side=side)
+    return await asyncio.to_thread(client.create_order, args)
+
+
+class TestAsyncCLOBTransport:
+    """Tests for the hot endpoints over the pooled client."""
+
+    async def test_get_order_book(self, transport):
+        """Verify the raw book is returned without auth."""
+        book = await transport.get_order_book(TOKEN)
+
+        assert book["asks"] == [{"price": "0.46", "size": "100"}]
+
+    async def test_post_order_signed_with_l2_headers(self, transport, server, signing_client):
+        """Verify the body matches py-clob-client's and L2 headers are sent."""
+        from py_clob_client.utilities import order_to_json
+
+        order = await sign(signing_client, 0.46)
+
+        result = await transport.post_order(order)
+
+        assert result["status"] == "MATCHED"
+        posted = server.requests[-1]
+        assert posted.body == order_to_json(order, "key", "GTC")
+        assert server.orders[result["orderID"]].price == Decimal("0.46")
+
+    async def test_post_orders_batch(self, transport, server, signing_client):
+        """Verify one request carries both legs and results keep order."""
+        resting = await sign(signing_client, 0.40)
+        killed = await sign(signing_client, 0.40)
+        before = len(server.requests)
+
+        results = await transport.post_orders([(resting, "GTC"), (killed, "FOK")])
+
+        assert len(server.requests) == before + 1
+        assert [r["status"] for r in results] == ["LIVE", "CANCELLED"]
+
+    async def test_cancel_and_cancel_orders(self, transport, signing_client):
+        """Verify single and batch cancels of resting orders."""
+        ids = [
+            (await transport.post_order(await sign(signing_client, 0.40)))["orderID"]
+            for _ in range(3)
+        ]
+
+        single = await transport.cancel(ids[0])
+        batch = await transport.cancel_orders(ids)
+
+        assert single["canceled"] == [ids[0]]
+        assert batch["canceled"] == ids[1:]
+        assert ids[0] in batch["not_canceled"]
+
+    async def test_get_orders_follows_pagination(self, transport, server, signing_client):
+        """Verify every page of resting orders is collected."""
+        for _ in range(5):
+            await transport.post_order(await sign(signing_client, 0.40))
+        before = len(server.requests)
+
+        orders = await transport.get_orders()
+
+        assert len(orders) == 5
+        assert len(server.requests) - before == 3
+
+    async def test_connection_reused(self, transport, server):
+        """Verify sequential requests share one keep-alive connection."""
+        for _ in range(20):
+            await transport.get_order_book(TOKEN)
+
+        assert len(server.connections) == 1
+
+    async def test_errors(self, server):
+        """Verify missing credentials and unreachable hosts raise CLOB errors."""
+        async with AsyncCLOBTransport(server.url) as anonymous:
+            with pytest.raises(CLOBClientError, match="credentials"):
+                await anonymous.get_orders()
+            with pytest.raises(CLOBClientError, match="404"):
+                await anonymous.get_order_book("unknown")
+
+        async with AsyncCLOBTransport("http://127.0.0.1:1", timeout=1.0) as unreachable:
+            with pytest.raises(ConnectionError):
+                await unreachable.get_order_book(TOKEN)
+
+
+class TestStandinConditions:
+    """Tests for the stand-in's latency, error injection and rate limits."""
+
+    async def test_latency(self, signing_client):
+        async with LocalCLOBServer(latency=LatencyModel("fixed", mean_ms=30.0)) as slow:
+            slow.set_book(TOKEN, asks=[("0.46", "100")])
+            async with AsyncCLOBTransport(slow.url) as transport:
+                started = asyncio.get_running_loop().time()
+                await transport.get_order_book(TOKEN)
+
+                assert asyncio.get_running_loop().time() - started >= 0.03
+
+    async def test_fail_next(self, transport, server, signing_client):
+        """Verify forced failures hit only the next requests to a path."""
+        server.fail_next("/book", status=503)
+        server.fail_next("/order", status=400)
+
+        with pytest.raises(CLOBClientError, match="503"):
+            await transport.get_order_book(TOKEN)
+        with pytest.raises(OrderRejectedError, match="400"):
+            await transport.post_order(await sign(signing_client, 0.46))
+
+        assert (await transport.get_order_book(TOKEN))["asset_id"] == TOKEN
+        assert server.injected_errors == 2
+        assert server.orders == {}
+
+    async def test_error_rate(self, signing_client):
+        """Verify a seeded share of order posts fail and reads never do."""
+        async with LocalCLOBServer(error_rate=0.5, seed=3) as flaky:
+            flaky.set_book(TOKEN, asks=[("0.46", "100")])
+            async with AsyncCLOBTransport(
+                flaky.url, signer=signing_client.signer, creds=signing_client.creds
+            ) as transport:
+                order = await sign(signing_client, 0.46)
+                failed = 0
+                for _ in range(20):
+                    try:
+                        await transport.post_order(order)
+                    except CLOBClientError:
+                        failed += 1
+                for _ in range(5):
+                    await transport.get_order_book(TOKEN)
+
+        assert 0 < failed < 20
+        assert flaky.injected_errors == failed
+        assert len(flaky.orders) == 20 - failed
+
+    async def test_rate_limit_backs_off_transport(self, signing_client):
+        """Verify a 429 is retried once the client has waited out Retry-After."""
+        registry = RateLimiterRegistry()
+        registry.configure(RATE_LIMIT_BOOK, rate=100.0)
+        async with LocalCLOBServer(rate_limits={"/book": 2.0}) as limited:
+            limited.set_book(TOKEN, asks=[("0.46", "100")])
+            async with AsyncCLOBTransport(limited.url, rate_limiter=registry) as transport:
+                await transport.get_order_book(TOKEN)
+                await transport.get_order_book(TOKEN)
+                started = asyncio.get_running_loop().time()
+                book = await transport.get_order_book(TOKEN)
+
+                assert book["asset_id"] == TOKEN
+                assert asyncio.get_running_loop().time() - started >= 0.4
+
+        assert limited.throttled == 1
+
+    async def test_rate_limited_order_post_is_retried(self, signing_client):
+        """Verify a throttled order post is sent again rather than rejected."""
+        async with LocalCLOBServer(rate_limits={"/order": 2.0}) as limited:
+            async with AsyncCLOBTransport(
+                limited.url, signer=signing_client.signer, creds=signing_client.creds
+            ) as transport:
+                order = await sign(signing_client, 0.46)
+                for _ in range(3):
+                    await transport.post_order(order)
+
+        assert limited.throttled >= 1
+        assert len(limited.orders) == 3
+
+    async def test_rate_limit_retries_exhausted(self, signing_client):
+        """Verify RateLimitedError (retryable) once retries run out."""
+        registry = RateLimiterRegistry()
+        bucket = registry.configure(RATE_LIMIT_BOOK, rate=100.0)
+        async with LocalCLOBServer(rate_limits={"/book": 2.0}) as limited:
+            limited.set_book(TOKEN, asks=[("0.46", "100")])
+            async with AsyncCLOBTransport(
+                limited.url, rate_limiter=registry, rate_limit_retries=0
+            ) as transport:
+                await transport.get_order_book(TOKEN)
+                await transport.get_order_book(TOKEN)
+                with pytest.raises(RateLimitedError, match="429") as exc_info:
+                    await transport.get_order_book(TOKEN)
+
+                assert isinstance(exc_info.value, ConnectionError)
+                assert bucket.tokens < 0
+
+        assert limited.throttled == 1
+
+
+class TestCLOBClientTransport:
+    """Tests for CLOBClient routing hot paths through the transport."""
+
+    async def test_hot_paths_use_transport(self, settings, server):
+        """Verify book, order, open orders and cancel go over the pool."""
+        async with CLOBClient(settings) as client:
+            assert client.transport is not None and client.transport.is_open
+
+            book = await client.get_order_book(TOKEN)
+            result = await client.execute_order(
+                TOKEN, OrderSide.BUY, amount_shares=Decimal("10"), price=Decimal("0.40")
+            )
+            open_orders = await client.get_open_orders()
+            cancelled = await client.cancel_order(result.order_id)
+
+        assert book.best_ask == Decimal("0.46")
+        assert result.status == OrderStatus.LIVE
+        assert [o["id"] for o in open_orders] == [result.order_id]
+        assert cancelled
+        assert client.transport is None
+
+    async def test_transport_disabled(self, settings):
+        """Verify async_transport=False keeps the py-clob-client path."""
+        from dataclasses import replace
+
+        client = CLOBClient(replace(settings, async_transport=False))
+        await client.connect()
+
+        assert client.transport is None
+        await client.close()
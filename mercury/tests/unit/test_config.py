@@ -269,3 +269,25 @@ value = "updated"
 
         finally:
             os.unlink(config_path)
+
+    def test_pickle_drops_reload_callbacks(self):
+        """Verify config can be shipped to worker processes."""
+        import pickle
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+            f.write("[test]\nvalue = 1")
+            f.flush()
+            config_path = Path(f.name)
+
+        try:
+            config = ConfigManager(config_path=config_path)
+            config.register_reload_callback(lambda old, new: None)
+
+            restored = pickle.loads(pickle.dumps(config))
+
+            assert restored.get("test.value") == 1
+            assert restored._reload_callbacks == []
+            assert len(config._reload_callbacks) == 1
+
+        finally:
+            os.unlink(config_path)
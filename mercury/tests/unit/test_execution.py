@@ -4,7 +4,9 @@ Unit tests for ExecutionEngine.
 Tests the core ExecutionEngine functionality including:
 - Lifecycle (start/stop)
 - Queue management
+- Signal coalescing
 - Concurrent execution limits
+- Per-market serialization and deadline expiry
 - Signal processing
 - Health checks
 - Single order execution (FOK/GTC)
@@ -280,6 +282,128 @@ class TestPriorityOrdering:
         assert first < second
 
 
+class TestSignalCoalescing:
+    """Test latest-signal-wins coalescing per market and signal type."""
+
+    @staticmethod
+    def make_signal(signal_id: str, market_id: str = "market-1", yes_price: str = "0.45") -> dict:
+        return {
+            "signal_id": signal_id,
+            "market_id": market_id,
+            "signal_type": "ARBITRAGE",
+            "target_size_usd": "10.0",
+            "yes_price": yes_price,
+            "no_price": "0.50",
+        }
+
+    @pytest.mark.asyncio
+    async def test_newer_signal_replaces_pending(self, execution_engine, mock_event_bus):
+        """Verify a newer signal refreshes the pending entry in place."""
+        await execution_engine.queue_signal("sig-1", self.make_signal("sig-1", yes_price="0.45"))
+        result = await execution_engine.queue_signal(
+            "sig-2", self.make_signal("sig-2", yes_price="0.44")
+        )
+
+        assert result is True
+        assert execution_engine.get_queue_size() == 1
+        assert set(execution_engine._queue_items) == {"sig-2"}
+
+        entry = execution_engine._queue.get_nowait()
+        assert entry.signal_id == "sig-2"
+        assert entry.signal_data["yes_price"] == "0.44"
+        assert entry.superseded_count == 1
+        assert execution_engine.get_queue_stats()["total_superseded"] == 1
+        assert execution_engine.get_queue_stats()["total_queued"] == 1
+
+        channels = [c[0][0] for c in mock_event_bus.publish.call_args_list]
+        assert "execution.queue.superseded" in channels
+
+    @pytest.mark.asyncio
+    async def test_replacement_keeps_queue_position(self, execution_engine):
+        """Verify the refreshed entry stays ahead of signals queued after it."""
+        await execution_engine.queue_signal("a-1", self.make_signal("a-1", "market-a"))
+        await asyncio.sleep(0.001)
+        await execution_engine.queue_signal("b-1", self.make_signal("b-1", "market-b"))
+        await execution_engine.queue_signal("a-2", self.make_signal("a-2", "market-a"))
+
+        order = [execution_engine._queue.get_nowait().signal_id for _ in range(2)]
+
+        assert order == ["a-2", "b-1"]
+
+    @pytest.mark.asyncio
+    async def test_different_signal_type_not_coalesced(self, execution_engine):
+        """Verify coalescing is keyed by signal type as well as market."""
+        await execution_engine.queue_signal("sig-1", self.make_signal("sig-1"))
+        directional = dict(self.make_signal("sig-2"), signal_type="BUY_YES")
+        await execution_engine.queue_signal("sig-2", directional)
+
+        assert execution_engine.get_queue_size() == 2
+        assert execution_engine.get_queue_stats()["total_superseded"] == 0
+
+    @pytest.mark.asyncio
+    async def test_higher_priority_signal_requeued(self, execution_engine):
+        """Verify an outranking signal is queued at its own priority."""
+        await execution_engine.queue_signal("low", self.make_signal("low"), SignalPriority.LOW)
+        low_entry = execution_engine._queue_items["low"]
+
+        await execution_engine.queue_signal(
+            "critical", self.make_signal("critical"), SignalPriority.CRITICAL
+        )
+
+        assert low_entry.status == QueuedSignalStatus.SUPERSEDED
+        assert set(execution_engine._queue_items) == {"critical"}
+        assert execution_engine._queue.get_nowait().signal_id == "critical"
+        assert execution_engine.get_queue_stats()["total_superseded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_executing_signal_not_coalesced(self, execution_engine):
+        """Verify a signal already dequeued is not replaced."""
+        await execution_engine.queue_signal("sig-1", self.make_signal("sig-1"))
+        entry = execution_engine._queue.get_nowait()
+        execution_engine._release_coalesce_key(entry)
+        entry.status = QueuedSignalStatus.EXECUTING
+
+        await execution_engine.queue_signal("sig-2", self.make_signal("sig-2"))
+
+        assert execution_engine.get_queue_size() == 1
+        assert execution_engine._queue.get_nowait().signal_id == "sig-2"
+        assert entry.signal_id == "sig-1"
+
+    @pytest.mark.asyncio
+    async def test_coalescing_disabled(self, mock_config, mock_event_bus, mock_clob):
+        """Verify execution.coalesce_signals = false queues every signal."""
+        mock_config.get_bool.side_effect = lambda key, default=False: (
+            key != "execution.coalesce_signals"
+        )
+        engine = ExecutionEngine(
+            config=mock_config, event_bus=mock_event_bus, clob_client=mock_clob
+        )
+
+        await engine.queue_signal("sig-1", self.make_signal("sig-1"))
+        await engine.queue_signal("sig-2", self.make_signal("sig-2"))
+
+        assert engine.get_queue_size() == 2
+
+    @pytest.mark.asyncio
+    async def test_superseded_entries_skipped_by_processor(self, execution_engine):
+        """Verify dropped entries are discarded instead of executed."""
+        await execution_engine.start()
+        execution_engine.execute = AsyncMock(
+            return_value=ExecutionResult(success=True, signal_id="x")
+        )
+
+        await execution_engine.queue_signal("low", self.make_signal("low"), SignalPriority.LOW)
+        await execution_engine.queue_signal(
+            "critical", self.make_signal("critical"), SignalPriority.CRITICAL
+        )
+        await asyncio.sleep(0.1)
+
+        executed = [c[0][0].signal_id for c in execution_engine.execute.call_args_list]
+        assert executed == ["critical"]
+
+        await execution_engine.stop()
+
+
 class TestConcurrentExecutionLimits:
     """Test concurrent execution limiting."""
 
@@ -311,6 +435,169 @@ class TestConcurrentExecutionLimits:
         await engine.stop()
 
 
+class TestPerMarketScheduling:
+    """Test one in-flight execution per market with parallelism across markets."""
+
+    @staticmethod
+    def make_signal(signal_id: str, market_id: str, signal_type: str = "ARBITRAGE") -> dict:
+        return {
+            "signal_id": signal_id,
+            "market_id": market_id,
+            "signal_type": signal_type,
+            "target_size_usd": "10.0",
+            "yes_price": "0.45",
+            "no_price": "0.50",
+        }
+
+    @staticmethod
+    def track_executions(engine, duration: float = 0.05):
+        """Replace execute() with a slow fake recording start order and overlap."""
+        started: list[str] = []
+        running: dict[str, int] = {}
+        overlaps: list[str] = []
+
+        async def execute(signal):
+            started.append(signal.signal_id)
+            running[signal.market_id] = running.get(signal.market_id, 0) + 1
+            if running[signal.market_id] > 1:
+                overlaps.append(signal.market_id)
+            await asyncio.sleep(duration)
+            running[signal.market_id] -= 1
+            return ExecutionResult(success=True, signal_id=signal.signal_id)
+
+        engine.execute = execute
+        return started, overlaps
+
+    @pytest.mark.asyncio
+    async def test_same_market_serialized(self, execution_engine):
+        """Verify two signals for one market never execute concurrently."""
+        await execution_engine.start()
+        started, overlaps = self.track_executions(execution_engine)
+
+        await execution_engine.queue_signal("a-1", self.make_signal("a-1", "market-a"))
+        await execution_engine.queue_signal(
+            "a-2", self.make_signal("a-2", "market-a", "BUY_YES")
+        )
+        await asyncio.sleep(0.02)
+
+        assert started == ["a-1"]
+        assert execution_engine.get_queue_stats()["deferred_signals"] == 1
+
+        await asyncio.sleep(0.15)
+        assert started == ["a-1", "a-2"]
+        assert overlaps == []
+        assert execution_engine.get_queue_size() == 0
+
+        await execution_engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_other_markets_not_blocked(self, execution_engine):
+        """Verify a signal waiting on its market does not hold up other markets."""
+        await execution_engine.start()
+        started, _ = self.track_executions(execution_engine, duration=0.1)
+
+        await execution_engine.queue_signal("a-1", self.make_signal("a-1", "market-a"))
+        await execution_engine.queue_signal(
+            "a-2", self.make_signal("a-2", "market-a", "BUY_YES")
+        )
+        await execution_engine.queue_signal("b-1", self.make_signal("b-1", "market-b"))
+        await execution_engine.queue_signal("c-1", self.make_signal("c-1", "market-c"))
+        await asyncio.sleep(0.03)
+
+        assert started == ["a-1", "b-1", "c-1"]
+        assert execution_engine.get_queue_stats()["markets_in_flight"] == 3
+
+        await execution_engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_priority_order_across_markets(self, mock_config, mock_event_bus, mock_clob):
+        """Verify the next permit goes to the highest priority queued signal."""
+        mock_config.get_int.side_effect = lambda key, default: {
+            "execution.max_concurrent": 1,
+        }.get(key, default)
+        engine = ExecutionEngine(
+            config=mock_config, event_bus=mock_event_bus, clob_client=mock_clob
+        )
+        await engine.start()
+        started, _ = self.track_executions(engine, duration=0.02)
+
+        await engine.queue_signal("first", self.make_signal("first", "m-0"))
+        await asyncio.sleep(0.005)
+        for signal_id, priority in (
+            ("low", SignalPriority.LOW),
+            ("critical", SignalPriority.CRITICAL),
+            ("medium", SignalPriority.MEDIUM),
+        ):
+            await engine.queue_signal(signal_id, self.make_signal(signal_id, signal_id), priority)
+        await asyncio.sleep(0.15)
+
+        assert started == ["first", "critical", "medium", "low"]
+
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_serialization_disabled(self, mock_config, mock_event_bus, mock_clob):
+        """Verify execution.serialize_markets = false allows same-market overlap."""
+        mock_config.get_bool.side_effect = lambda key, default=False: (
+            key != "execution.serialize_markets"
+        )
+        engine = ExecutionEngine(
+            config=mock_config, event_bus=mock_event_bus, clob_client=mock_clob
+        )
+        await engine.start()
+        _, overlaps = self.track_executions(engine)
+
+        await engine.queue_signal("a-1", self.make_signal("a-1", "market-a"))
+        await engine.queue_signal("a-2", self.make_signal("a-2", "market-a", "BUY_YES"))
+        await asyncio.sleep(0.1)
+
+        assert overlaps == ["market-a"]
+
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_deadline_expiry(self, mock_config, mock_event_bus, mock_clob):
+        """Verify pending signals expire on their deadline without a queue scan."""
+        mock_config.get_float.side_effect = lambda key, default: {
+            "execution.queue_timeout_seconds": 0.05,
+        }.get(key, default)
+        engine = ExecutionEngine(
+            config=mock_config, event_bus=mock_event_bus, clob_client=mock_clob
+        )
+
+        await engine.queue_signal("a-1", self.make_signal("a-1", "market-a"))
+        entry = engine._queue_items["a-1"]
+        await asyncio.sleep(0.03)
+        await engine.queue_signal("b-1", self.make_signal("b-1", "market-b"))
+        await asyncio.sleep(0.03)
+
+        assert entry.status == QueuedSignalStatus.EXPIRED
+        assert set(engine._queue_items) == {"b-1"}
+        assert engine.get_queue_stats()["total_expired"] == 1
+
+        await asyncio.sleep(0.05)
+        assert engine.get_queue_stats()["total_expired"] == 2
+        assert engine._expiry_timer is None
+
+    @pytest.mark.asyncio
+    async def test_refreshed_signal_gets_new_deadline(self, mock_config, mock_event_bus, mock_clob):
+        """Verify a coalesced signal's expiry is measured from the refresh."""
+        mock_config.get_float.side_effect = lambda key, default: {
+            "execution.queue_timeout_seconds": 0.05,
+        }.get(key, default)
+        engine = ExecutionEngine(
+            config=mock_config, event_bus=mock_event_bus, clob_client=mock_clob
+        )
+
+        await engine.queue_signal("a-1", self.make_signal("a-1", "market-a"))
+        await asyncio.sleep(0.03)
+        await engine.queue_signal("a-2", self.make_signal("a-2", "market-a"))
+        await asyncio.sleep(0.03)
+
+        assert engine._queue_items["a-2"].status == QueuedSignalStatus.PENDING
+        assert engine.get_queue_stats()["total_expired"] == 0
+
+
 class TestHealthCheck:
     """Test health check functionality."""
 
@@ -2237,7 +2524,10 @@ class MockCLOBClient:
     async def close(self):
         self._connected = False
 
-    async def execute_order(self, token_id, side, amount_usd=None, amount_shares=None, price=None, timeout_seconds=5.0):
+    async def execute_order(
+        self, token_id, side, amount_usd=None, amount_shares=None, price=None,
+        timeout_seconds=5.0, time_in_force=None,
+    ):
         from mercury.integrations.polymarket.types import OrderResult, OrderSide, OrderStatus
 
         self.submit_count += 1
@@ -3006,7 +3296,8 @@ class TestConcurrentExecutionControl:
         for i in range(5):
             signal_data = {
                 "signal_id": f"concurrent-{i}",
-                "market_id": "test-market",
+                # Distinct markets so signals are not coalesced
+                "market_id": f"test-market-{i}",
                 "signal_type": "ARBITRAGE",
                 "target_size_usd": "10.0",
                 "yes_price": "0.45",
@@ -3252,7 +3543,7 @@ class TestSignalValidationFlowIntegration:
 
         low_priority_signal = {
             "signal_id": "low-priority-signal",
-            "market_id": "test-market",
+            "market_id": "other-market",
             "signal_type": "ARBITRAGE",
             "target_size_usd": "5.0",
             "yes_price": "0.48",
@@ -8,6 +8,7 @@ Tests verify:
 - Position size calculation
 - Signal generation
 - Cooldown behavior
+- Batch evaluation hook
 """
 
 from datetime import datetime, timedelta, timezone
@@ -18,6 +19,7 @@ import pytest
 
 from mercury.core.config import ConfigManager
 from mercury.domain.market import OrderBook, OrderBookLevel
+from mercury.domain.market_batch import MarketBatch
 from mercury.domain.signal import SignalPriority, SignalType
 from mercury.strategies.gabagool import GabagoolConfig, GabagoolStrategy
 from mercury.strategies.gabagool.strategy import ArbitrageOpportunity, ValidationResult
@@ -209,6 +211,12 @@ def order_book_empty() -> OrderBook:
 class TestGabagoolStrategy:
     """Tests for GabagoolStrategy class."""
 
+    def test_declares_ask_interest(self, gabagool_strategy):
+        """Verify the strategy is only invoked on best-ask changes."""
+        from mercury.strategies.base import BookInterest
+
+        assert gabagool_strategy.interest == BookInterest.ASKS
+
     def test_strategy_name(self, gabagool_strategy):
         """Verify strategy name is 'gabagool'."""
         assert gabagool_strategy.name == "gabagool"
@@ -721,3 +729,66 @@ class TestPriorityDetermination:
         """Verify LOW priority for tiny spread (< 2 cents)."""
         priority = gabagool_strategy._determine_priority(Decimal("1.5"))
         assert priority == SignalPriority.LOW
+
+
+class TestMarketBatchEvaluation:
+    """Tests for the on_market_batch hook."""
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_per_event(
+        self,
+        mock_config_manager,
+        order_book_with_arbitrage,
+        order_book_small_spread,
+        order_book_no_arbitrage,
+        order_book_empty,
+    ):
+        """Verify batch evaluation yields the same signals as per-event."""
+        books = [
+            order_book_with_arbitrage,
+            order_book_small_spread,
+            order_book_no_arbitrage,
+            order_book_empty,
+        ]
+        per_event = GabagoolStrategy(config=mock_config_manager)
+        batched = GabagoolStrategy(config=mock_config_manager)
+
+        expected = []
+        for book in books:
+            expected += [s async for s in per_event.on_market_data(book.market_id, book)]
+
+        batch = MarketBatch()
+        for book in books:
+            batch.update(book)
+        signals = [s async for s in batched.on_market_batch(batch, batch.dirty_rows())]
+
+        assert [s.market_id for s in signals] == [s.market_id for s in expected]
+        assert signals[0].yes_price == expected[0].yes_price
+        assert signals[0].no_price == expected[0].no_price
+        assert signals[0].target_size_usd == expected[0].target_size_usd
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_cooldown(self, gabagool_strategy, order_book_with_arbitrage):
+        """Verify the batch path shares per-market cooldown state."""
+        batch = MarketBatch()
+        batch.update(order_book_with_arbitrage)
+        rows = batch.dirty_rows()
+
+        first = [s async for s in gabagool_strategy.on_market_batch(batch, rows)]
+        second = [s async for s in gabagool_strategy.on_market_batch(batch, rows)]
+
+        assert len(first) == 1
+        assert second == []
+
+    @pytest.mark.asyncio
+    async def test_batch_disabled_yields_nothing(
+        self, gabagool_strategy, order_book_with_arbitrage
+    ):
+        """Verify a disabled strategy ignores batches."""
+        gabagool_strategy.disable()
+        batch = MarketBatch()
+        batch.update(order_book_with_arbitrage)
+
+        signals = [s async for s in gabagool_strategy.on_market_batch(batch, batch.dirty_rows())]
+
+        assert signals == []
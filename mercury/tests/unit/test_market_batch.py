@@ -0,0 +1,104 @@
+"""
+Unit tests for MarketBatch columnar top-of-book state.
+
+Tests verify:
+- Row allocation and growth
+- Top-of-book updates and NaN for missing levels
+- Dirty tracking
+- OrderBook reconstruction
+"""
+
+from decimal import Decimal
+
+import numpy as np
+
+from mercury.domain.market import OrderBook, OrderBookLevel
+from mercury.domain.market_batch import MarketBatch
+
+
+def make_book(market_id: str, yes_ask: str = "0.45", no_ask: str | None = "0.50") -> OrderBook:
+    """Create a book with a YES bid/ask and optional NO ask."""
+    return OrderBook(
+        market_id=market_id,
+        yes_bids=[OrderBookLevel(price=Decimal("0.44"), size=Decimal("10"))],
+        yes_asks=[
+            OrderBookLevel(price=Decimal(yes_ask), size=Decimal("100")),
+            OrderBookLevel(price=Decimal("0.60"), size=Decimal("5")),
+        ],
+        no_asks=[OrderBookLevel(price=Decimal(no_ask), size=Decimal("75"))] if no_ask else [],
+    )
+
+
+class TestMarketBatch:
+    """Tests for MarketBatch."""
+
+    def test_update_stores_top_of_book(self):
+        """Verify only the best level is stored, missing sides are NaN."""
+        batch = MarketBatch()
+
+        row = batch.update(make_book("m1", no_ask=None))
+
+        assert batch.yes_ask[row] == 0.45
+        assert batch.yes_ask_size[row] == 100.0
+        assert batch.yes_bid[row] == 0.44
+        assert np.isnan(batch.no_ask[row])
+        assert np.isnan(batch.no_bid[row])
+
+    def test_rows_are_stable(self):
+        """Verify a market keeps its row across updates."""
+        batch = MarketBatch()
+
+        first = batch.update(make_book("m1"))
+        batch.update(make_book("m2"))
+        again = batch.update(make_book("m1", yes_ask="0.40"))
+
+        assert first == again
+        assert len(batch) == 2
+        assert batch.yes_ask[first] == 0.40
+
+    def test_grows_past_capacity(self):
+        """Verify rows keep their values when capacity doubles."""
+        batch = MarketBatch(capacity=2)
+
+        for i in range(5):
+            batch.update(make_book(f"m{i}", yes_ask=f"0.4{i}"))
+
+        assert len(batch) == 5
+        assert list(batch.yes_ask) == [0.40, 0.41, 0.42, 0.43, 0.44]
+        assert batch.dirty_count == 5
+
+    def test_dirty_tracking(self):
+        """Verify dirty rows are counted once and cleared."""
+        batch = MarketBatch()
+        batch.ensure_row("idle")
+
+        batch.update(make_book("m1"))
+        batch.update(make_book("m1"))
+
+        assert batch.dirty_count == 1
+        assert list(batch.dirty_rows()) == [batch.row_of("m1")]
+
+        batch.clear_dirty()
+
+        assert batch.dirty_count == 0
+        assert len(batch.dirty_rows()) == 0
+
+    def test_rows_for_skips_untracked(self):
+        """Verify rows_for only returns tracked markets."""
+        batch = MarketBatch()
+        batch.ensure_row("a")
+        batch.ensure_row("b")
+
+        assert list(batch.rows_for(["b", "missing", "a"])) == [1, 0]
+
+    def test_to_order_book(self):
+        """Verify a row converts back to an exact Decimal OrderBook."""
+        batch = MarketBatch()
+        row = batch.update(make_book("m1", no_ask=None))
+
+        book = batch.to_order_book(row)
+
+        assert book.market_id == "m1"
+        assert book.yes_best_ask == Decimal("0.45")
+        assert book.yes_asks[0].size == Decimal("100.0")
+        assert book.no_asks == []
@@ -642,6 +642,19 @@ class TestInMemoryOrderBookIntegration:
         assert isinstance(no_book, InMemoryOrderBook)
         await service.stop()
 
+    @pytest.mark.asyncio
+    async def test_get_token_order_book(self, service):
+        """Test get_token_order_book looks up either token's book."""
+        await service.start()
+        await service.subscribe_market("test-market")
+        yes_book = service.get_yes_order_book("test-market")
+        no_book = service.get_no_order_book("test-market")
+
+        assert service.get_token_order_book(yes_book.token_id) is yes_book
+        assert service.get_token_order_book(no_book.token_id) is no_book
+        assert service.get_token_order_book("unknown") is None
+        await service.stop()
+
 
 class TestDepthQueries:
     """Tests for order book depth queries."""
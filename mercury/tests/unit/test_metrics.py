@@ -71,6 +71,13 @@ class TestExecutionLatencyMetrics:
         output = metrics_emitter.get_metrics()
         assert "mercury_execution_fill_time_seconds" in output
 
+    def test_record_execution_signal_superseded(self, metrics_emitter):
+        """Verify coalesced queue signals are counted per signal type."""
+        metrics_emitter.record_execution_signal_superseded("ARBITRAGE")
+
+        output = metrics_emitter.get_metrics()
+        assert 'mercury_execution_signals_superseded_total{signal_type="ARBITRAGE"} 1.0' in output
+
     def test_record_execution_total_time_within_target(self, metrics_emitter):
         """Verify total time recording and within-target counter."""
         metrics_emitter.record_execution_total_time(50.0)
@@ -330,3 +337,63 @@ class TestSettlementMetrics:
 
         output = metrics_emitter.get_metrics()
         assert "mercury_settlement_queue_depth 0.0" in output
+
+
+class TestStrategyEvaluationMetrics:
+    """Test strategy evaluation metrics."""
+
+    def test_record_strategy_evaluation_time(self, metrics_emitter):
+        """Verify per-strategy evaluation latency is recorded."""
+        metrics_emitter.record_strategy_evaluation_time("gabagool", 0.5)
+
+        output = metrics_emitter.get_metrics()
+        assert 'mercury_strategy_evaluation_seconds_count{strategy="gabagool"} 1.0' in output
+
+    def test_record_strategy_overrun(self, metrics_emitter):
+        """Verify overruns are counted per strategy."""
+        metrics_emitter.record_strategy_overrun("gabagool")
+        metrics_emitter.record_strategy_overrun("gabagool")
+
+        output = metrics_emitter.get_metrics()
+        assert 'mercury_strategy_overrun_total{strategy="gabagool"} 2.0' in output
+
+    def test_record_strategy_skipped(self, metrics_emitter):
+        """Verify interest-filter skips are counted per strategy."""
+        metrics_emitter.record_strategy_skipped("gabagool")
+
+        output = metrics_emitter.get_metrics()
+        assert 'mercury_strategy_skipped_total{strategy="gabagool"} 1.0' in output
+
+    def test_strategy_mailbox_metrics(self, metrics_emitter):
+        """Verify per-market mailbox depth and lag are exported and removable."""
+        metrics_emitter.update_strategy_mailbox_depth("m1", 3)
+        metrics_emitter.record_strategy_mailbox_lag("m1", 2.0)
+
+        output = metrics_emitter.get_metrics()
+        assert 'mercury_strategy_mailbox_depth{market_id="m1"} 3.0' in output
+        assert 'mercury_strategy_mailbox_lag_seconds_count{market_id="m1"} 1.0' in output
+
+        metrics_emitter.remove_strategy_mailbox("m1")
+        metrics_emitter.remove_strategy_mailbox("m1")
+
+        output = metrics_emitter.get_metrics()
+        assert 'market_id="m1"' not in output
+
+
+class TestRiskMetrics:
+    """Tests for risk manager gauges."""
+
+    def test_update_risk_exposure_drift(self, metrics_emitter):
+        """Verify ledger drift is exported in USD."""
+        metrics_emitter.update_risk_exposure_drift(Decimal("2.5"))
+
+        output = metrics_emitter.get_metrics()
+        assert "mercury_risk_exposure_drift_usd 2.5" in output
+
+    def test_update_risk_scenario_pnl(self, metrics_emitter):
+        """Verify worst-case and stress P&L are exported per scenario."""
+        metrics_emitter.update_risk_scenario_pnl(-45.0, 5.0)
+
+        output = metrics_emitter.get_metrics()
+        assert 'mercury_risk_scenario_pnl_usd{scenario="worst_case"} -45.0' in output
+        assert 'mercury_risk_scenario_pnl_usd{scenario="stress"} 5.0' in output
@@ -0,0 +1,151 @@
+"""Unit tests for cross-execution order batching."""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mercury.integrations.polymarket.batching import OrderBatcher
+from mercury.integrations.polymarket.clob import CLOBClient
+from mercury.integrations.polymarket.standin import LocalCLOBServer
+from mercury.integrations.polymarket.types import OrderStatus, PolymarketSettings
+
+PRIVATE_KEY = "0x" + "1" * 64
+
+
+def echo_post():
+    """A batch post answering each order with its own name."""
+    return AsyncMock(side_effect=lambda orders: [{"orderID": o} for o, _ in orders])
+
+
+class TestOrderBatcher:
+    """Tests for coalescing and splitting batch responses."""
+
+    async def test_window_coalesces_executions(self):
+        """Verify pairs submitted within the window share one request."""
+        post = echo_post()
+        metrics = MagicMock()
+        batcher = OrderBatcher(post, window_seconds=0.01, metrics_emitter=metrics)
+
+        first, second = await asyncio.gather(
+            batcher.submit([("a1", "GTC"), ("a2", "GTC")]),
+            batcher.submit([("b1", "GTC"), ("b2", "GTC")]),
+        )
+
+        post.assert_awaited_once()
+        assert first == [{"orderID": "a1"}, {"orderID": "a2"}]
+        assert second == [{"orderID": "b1"}, {"orderID": "b2"}]
+        metrics.record_order_batch.assert_called_once_with(2)
+
+    async def test_full_batch_sent_without_waiting(self):
+        """Verify executions are split at the order limit, never across requests."""
+        post = echo_post()
+        batcher = OrderBatcher(post, window_seconds=60.0, max_orders=5)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(
+                batcher.submit([(f"{i}y", "GTC"), (f"{i}n", "GTC")]) for i in range(5)
+            ), batcher.close()),
+            timeout=1.0,
+        )
+
+        sizes = [len(call.args[0]) for call in post.await_args_list]
+        assert sizes == [4, 4, 2]
+        assert results[4] == [{"orderID": "4y"}, {"orderID": "4n"}]
+
+    async def test_failed_request_fails_every_execution(self):
+        post = AsyncMock(side_effect=RuntimeError("boom"))
+        batcher = OrderBatcher(post, window_seconds=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit([("a", "GTC")]),
+            batcher.submit([("b", "GTC")]),
+            return_exceptions=True,
+        )
+
+        assert [str(r) for r in results] == ["boom", "boom"]
+
+    async def test_error_object_returned_to_each(self):
+        post = AsyncMock(return_value={"error": "invalid"})
+        batcher = OrderBatcher(post, window_seconds=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit([("a", "GTC")]), batcher.submit([("b", "GTC")])
+        )
+
+        assert results == [{"error": "invalid"}, {"error": "invalid"}]
+
+    async def test_cancelled_caller_does_not_break_batch(self):
+        """Verify a caller timing out leaves the others' results intact."""
+        post = echo_post()
+        batcher = OrderBatcher(post, window_seconds=0.05)
+
+        impatient = asyncio.create_task(batcher.submit([("a", "GTC")]))
+        patient = asyncio.create_task(batcher.submit([("b", "GTC")]))
+        await asyncio.sleep(0)
+        impatient.cancel()
+
+        assert await patient == [{"orderID": "b"}]
+        assert len(post.await_args.args[0]) == 2
+
+
+class TestCLOBClientBatching:
+    """Tests for dual-leg executions sharing batch requests at the stand-in."""
+
+    PAIRS = [("11", "12"), ("21", "22"), ("31", "32")]
+
+    @pytest.fixture
+    async def server(self):
+        async with LocalCLOBServer() as server:
+            for yes_token, no_token in self.PAIRS:
+                server.set_book(yes_token, asks=[("0.46", "1000")])
+                server.set_book(no_token, asks=[("0.48", "1000")])
+            yield server
+
+    @pytest.fixture
+    async def client(self, server):
+        settings = PolymarketSettings(
+            private_key=PRIVATE_KEY,
+            api_key="key",
+            api_secret="c2VjcmV0",
+            api_passphrase="pass",
+            clob_url=server.url,
+            batch_window_ms=100.0,
+        )
+        async with CLOBClient(settings) as client:
+            await client.prepare_order_templates([t for pair in self.PAIRS for t in pair])
+            yield client
+
+    async def execute_all(self, client):
+        return await asyncio.gather(*(
+            client.execute_dual_leg_order(
+                yes_token, no_token, Decimal("10"),
+                yes_price=Decimal("0.45"), no_price=Decimal("0.47"),
+            )
+            for yes_token, no_token in self.PAIRS
+        ))
+
+    async def test_concurrent_pairs_share_one_request(self, client, server):
+        """Verify three executions post six orders in one call and get their own results."""
+        results = await self.execute_all(client)
+
+        posts = [r for r in server.requests if r.path == "/orders"]
+        assert len(posts) == 1 and len(posts[0].body) == 6
+        assert all(result.both_filled for result in results)
+        for result, (yes_token, no_token) in zip(results, self.PAIRS):
+            assert server.orders[result.yes_result.order_id].token_id == yes_token
+            assert server.orders[result.no_result.order_id].token_id == no_token
+
+    async def test_unwind_stays_per_execution(self, client, server):
+        """Verify a leg left resting is cancelled for its own execution only."""
+        server.set_book("22", asks=[("0.60", "1000")])
+
+        with patch("mercury.integrations.polymarket.clob.LIVE_ORDER_WAIT_SECONDS", 0.05):
+            results = await self.execute_all(client)
+
+        assert [r.both_filled for r in results] == [True, False, True]
+        assert results[1].yes_result.status == OrderStatus.FILLED
+        assert results[1].no_result.status != OrderStatus.FILLED
+        assert server.orders[results[1].no_result.order_id].status == "CANCELLED"
+        assert [o.status for o in server.orders.values()].count("CANCELLED") == 1
@@ -0,0 +1,380 @@
+"""Unit tests for the order signing pool, order templates and pre-signed orders."""
+
+import asyncio
+import threading
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mercury.integrations.polymarket.clob import CLOBClient, OrderSigningError
+from mercury.integrations.polymarket.signing import (
+    OrderSigner,
+    OrderTemplate,
+    PresignedOrderCache,
+)
+from mercury.integrations.polymarket.standin import LocalCLOBServer
+from mercury.integrations.polymarket.types import PolymarketSettings
+
+PRIVATE_KEY = "0x" + "1" * 64
+TOKEN = "123"
+
+
+@pytest.fixture
+def clob():
+    """Create a py-clob-client ClobClient with market metadata stubbed."""
+    from py_clob_client.client import ClobClient
+
+    client = ClobClient("http://127.0.0.1:1", key=PRIVATE_KEY, chain_id=137)
+    client.get_tick_size = MagicMock(return_value="0.01")
+    client.get_neg_risk = MagicMock(return_value=False)
+    client.get_fee_rate_bps = MagicMock(return_value=0)
+    return client
+
+
+@pytest.fixture
+async def signer(clob):
+    signer = OrderSigner(clob)
+    await signer.start()
+    yield signer
+    await signer.stop()
+
+
+def order_args(price=0.46, size=10.0, token_id=TOKEN):
+    from py_clob_client.clob_types import OrderArgs
+
+    return OrderArgs(token_id=token_id, price=price, size=size, side="BUY")
+
+
+def recover_signer(signed, neg_risk=False) -> str:
+    from eth_account import Account
+    from py_clob_client.config import get_contract_config
+    from py_order_utils.builders import OrderBuilder
+    from py_order_utils.signer import Signer
+
+    builder = OrderBuilder(
+        get_contract_config(137, neg_risk).exchange, 137, Signer(PRIVATE_KEY)
+    )
+    struct_hash = builder._create_struct_hash(signed.order)
+    return Account._recover_hash(bytes.fromhex(struct_hash[2:]), signature=signed.signature)
+
+
+class TestOrderSigner:
+    """Tests for template signing and the worker pool."""
+
+    async def test_template_order_matches_py_clob_client(self, signer, clob):
+        """Verify warm-builder orders equal create_order() apart from salt."""
+        await signer.prepare(TOKEN)
+
+        signed = await signer.sign(order_args())
+        reference = clob.create_order(order_args())
+
+        ours, theirs = signed.dict(), reference.dict()
+        for field in ("salt", "signature"):
+            ours.pop(field)
+            theirs.pop(field)
+        assert ours == theirs
+        assert recover_signer(signed) == clob.signer.address()
+
+    async def test_neg_risk_uses_its_exchange(self, signer, clob):
+        """Verify neg-risk templates sign for the neg-risk exchange."""
+        clob.get_neg_risk.return_value = True
+        await signer.prepare(TOKEN)
+
+        signed = await signer.sign(order_args())
+
+        assert recover_signer(signed, neg_risk=True) == clob.signer.address()
+        assert recover_signer(signed, neg_risk=False) != clob.signer.address()
+
+    async def test_prepare_fetches_once(self, signer, clob):
+        """Verify metadata is fetched once per token."""
+        templates = await signer.prepare_all([TOKEN, TOKEN, "456"])
+        await signer.prepare(TOKEN)
+
+        assert templates[0] == OrderTemplate(TOKEN, "0.01", False, 0)
+        assert clob.get_tick_size.call_count == 2
+
+    async def test_cold_path_uses_create_order(self, signer):
+        """Verify tokens without a template fall back to create_order()."""
+        signer._client = MagicMock()
+        signer._client.create_order.return_value = "signed"
+
+        assert await signer.sign(order_args()) == "signed"
+        signer._client.create_order.assert_called_once()
+
+    async def test_workers_persist(self, signer):
+        """Verify signing reuses the same named workers across orders."""
+        await signer.prepare(TOKEN)
+        executor = signer._executor
+        names = set()
+
+        original = signer._warm_builder().sign
+
+        def record(*args):
+            names.add(threading.current_thread().name)
+            return original(*args)
+
+        signer._builder.sign = record
+        for _ in range(3):
+            await signer.sign_all([order_args(), order_args(0.5)])
+
+        assert signer._executor is executor
+        assert names and all(n.startswith("order-signer") for n in names)
+
+    async def test_invalid_price_rejected(self, signer):
+        """Verify the tick size check create_order() does is kept."""
+        await signer.prepare(TOKEN)
+
+        with pytest.raises(ValueError, match="price"):
+            await signer.sign(order_args(price=0.999))
+
+    async def test_latency_recorded(self, clob):
+        """Verify sign latency is reported per path."""
+        metrics = MagicMock()
+        signer = OrderSigner(clob, metrics_emitter=metrics)
+        await signer.prepare(TOKEN)
+
+        await signer.sign(order_args())
+        await signer.stop()
+
+        latency_ms, path = metrics.record_order_sign_latency.call_args[0]
+        assert path == "template"
+        assert latency_ms > 0
+
+    async def test_process_pool(self, clob):
+        """Verify signing in worker processes."""
+        signer = OrderSigner(clob, workers=2, use_processes=True)
+        await signer.start()
+        try:
+            signed = await signer.sign_all([order_args(), order_args(0.5)])
+        finally:
+            await signer.stop()
+
+        assert [recover_signer(s) for s in signed] == [clob.signer.address()] * 2
+
+
+class TestCLOBClientSigning:
+    """Tests for CLOBClient using the signing pool."""
+
+    @pytest.fixture
+    def client(self, clob):
+        client = CLOBClient(PolymarketSettings(private_key=PRIVATE_KEY))
+        client._client = clob
+        client._connected = True
+        return client
+
+    async def test_templates_used_for_prepared_orders(self, client):
+        """Verify prepared orders carry template fields and sign warm."""
+        client._client.get_fee_rate_bps.return_value = 5
+        assert await client.prepare_order_templates([TOKEN, "456"]) == 2
+
+        yes = client._prepare_order(TOKEN, "YES", Decimal("10"), Decimal("0.46"))
+        no = client._prepare_order("456", "NO", Decimal("10"), Decimal("0.50"))
+        pair = await client._sign_orders_parallel(yes, no)
+
+        assert yes.order_args.fee_rate_bps == 5
+        assert pair.yes_order.dict()["feeRateBps"] == "5"
+        assert pair.no_order.dict()["tokenId"] == "456"
+        await client.close()
+
+    async def test_signer_survives_orders(self, client):
+        """Verify one signing pool serves consecutive dual-leg orders."""
+        await client.prepare_order_templates([TOKEN])
+        signer = client.order_signer
+
+        for _ in range(2):
+            prep = client._prepare_order(TOKEN, "YES", Decimal("10"), Decimal("0.46"))
+            await client._sign_orders_parallel(prep, prep)
+
+        assert client.order_signer is signer and signer.is_running
+        await client.close()
+
+    async def test_template_failure_logged(self, client):
+        """Verify a failed lookup skips that token without raising."""
+        client._client.get_tick_size.side_effect = [RuntimeError("down"), "0.01"]
+
+        assert await client.prepare_order_templates([TOKEN, "456"]) == 1
+
+    async def test_signing_error_wrapped(self, client):
+        """Verify signing failures raise OrderSigningError."""
+        client._client.create_order = MagicMock(side_effect=RuntimeError("bad key"))
+        prep = client._prepare_order(TOKEN, "YES", Decimal("10"), Decimal("0.46"))
+
+        with pytest.raises(OrderSigningError, match="bad key"):
+            await client._sign_orders_parallel(prep, prep)
+
+
+class TestExecutionEngineTemplates:
+    """Tests for template preparation at market subscription."""
+
+    async def test_market_subscribed_prepares_templates(self):
+        """Verify both tokens of a subscribed market are prepared."""
+        from mercury.services.execution import ExecutionEngine
+
+        config = MagicMock()
+        config.get.return_value = None
+        config.get_bool.side_effect = lambda key, default=None: default
+        config.get_int.side_effect = lambda key, default: default
+        config.get_float.side_effect = lambda key, default: default
+        clob = MagicMock()
+        clob.prepare_order_templates = AsyncMock(return_value=2)
+        engine = ExecutionEngine(config=config, event_bus=MagicMock(), clob_client=clob)
+
+        await engine._on_market_subscribed(
+            {"market_id": "m1", "yes_token_id": "y", "no_token_id": "n"}
+        )
+        await asyncio.gather(*engine._template_tasks)
+
+        clob.prepare_order_templates.assert_awaited_once_with(["y", "n"])
+
+
+class TestPresignedOrderCache:
+    """Tests for the pre-signed order cache."""
+
+    def test_take_consumes_and_expires(self):
+        """Verify orders are used once and not after their TTL."""
+        cache = PresignedOrderCache()
+        cache.put("t", Decimal("0.48"), Decimal("10"), "signed", ttl_seconds=60)
+        cache.put("t", Decimal("0.49"), Decimal("10"), "stale", ttl_seconds=0)
+
+        assert cache.take("t", Decimal("0.48"), Decimal("10")) == "signed"
+        assert cache.take("t", Decimal("0.48"), Decimal("10")) is None
+        assert cache.take("t", Decimal("0.49"), Decimal("10")) is None
+
+    def test_extend_and_discard(self):
+        """Verify re-arming extends entries and disarming drops a token."""
+        cache = PresignedOrderCache()
+        cache.put("t", Decimal("0.48"), Decimal("10"), "a", ttl_seconds=60)
+        cache.put("u", Decimal("0.48"), Decimal("10"), "b", ttl_seconds=60)
+
+        assert cache.extend("t", Decimal("0.48"), Decimal("10"), 120)
+        assert not cache.extend("t", Decimal("0.47"), Decimal("10"), 120)
+        assert cache.discard(["t"]) == 1
+        assert len(cache) == 1
+
+    def test_bounded(self):
+        """Verify the soonest-expiring orders are dropped beyond max_orders."""
+        cache = PresignedOrderCache(max_orders=2)
+        for i, ttl in enumerate((10, 30, 20)):
+            cache.put("t", Decimal(i), Decimal("1"), i, ttl_seconds=ttl)
+
+        assert len(cache) == 2
+        assert cache.take("t", Decimal(0), Decimal("1")) is None
+
+    def test_hit_rate(self):
+        cache = PresignedOrderCache()
+        for hit in (True, False, True, True):
+            cache.record(hit)
+
+        assert cache.hit_rate == 0.75
+
+
+class TestArmedMarkets:
+    """Tests for pre-signing armed markets through the stand-in exchange."""
+
+    @pytest.fixture
+    async def server(self):
+        async with LocalCLOBServer() as server:
+            server.set_book(TOKEN, asks=[("0.47", "1000")])
+            server.set_book("456", asks=[("0.50", "1000")])
+            yield server
+
+    @pytest.fixture
+    async def client(self, server):
+        settings = PolymarketSettings(
+            private_key=PRIVATE_KEY,
+            api_key="key",
+            api_secret="c2VjcmV0",
+            api_passphrase="pass",
+            clob_url=server.url,
+        )
+        metrics = MagicMock()
+        async with CLOBClient(settings, metrics_emitter=metrics) as client:
+            await client.prepare_order_templates([TOKEN, "456"])
+            yield client
+
+    async def execute(self, client):
+        return await client.execute_dual_leg_order(
+            TOKEN, "456", Decimal("10"), yes_price=Decimal("0.47"), no_price=Decimal("0.50")
+        )
+
+    async def test_armed_signal_skips_signing(self, client, server):
+        """Verify a signal at an armed price posts the pre-signed orders."""
+        signed = await client.arm_market(
+            TOKEN, "456", Decimal("10"), Decimal("0.47"), Decimal("0.50"), levels=1
+        )
+        cached = {key[0]: entry.order for key, entry in client.presigned._orders.items()
+                  if key[1] in (Decimal("0.48"), Decimal("0.51"))}
+        sign = client._get_order_signer().sign
+        client._get_order_signer().sign = AsyncMock(side_effect=AssertionError("signed"))
+
+        result = await self.execute(client)
+
+        assert signed == 6
+        assert result.both_filled
+        posted = [o["order"]["signature"] for o in server.requests[-1].body]
+        assert posted == [cached[TOKEN].signature, cached["456"].signature]
+        assert client.presigned.hits == 1
+        client._metrics.record_presigned_lookup.assert_called_with(True, 0.0)
+
+        # Consumed: the next signal at the same price signs inline
+        client._get_order_signer().sign = sign
+        await self.execute(client)
+        assert client.presigned.misses == 1
+
+    async def test_rearm_only_signs_new_levels(self, client):
+        """Verify re-arming after a one-tick move signs just the new prices."""
+        await client.arm_market(TOKEN, "456", Decimal("10"), Decimal("0.47"), Decimal("0.50"))
+
+        signed = await client.arm_market(
+            TOKEN, "456", Decimal("10"), Decimal("0.46"), Decimal("0.50")
+        )
+
+        assert signed == 1
+        assert client.disarm_market(TOKEN, "456") == 11
+
+
+class TestExecutionEngineArming:
+    """Tests for arming markets from order book snapshots."""
+
+    @pytest.fixture
+    def engine(self):
+        from mercury.services.execution import ExecutionEngine
+
+        values = {"execution.presign_size_usd": 10.0, "mercury.dry_run": False}
+        config = MagicMock()
+        config.get.return_value = None
+        config.get_bool.side_effect = lambda key, default=None: values.get(key, default)
+        config.get_int.side_effect = lambda key, default: values.get(key, default)
+        config.get_float.side_effect = lambda key, default: values.get(key, default)
+        clob = MagicMock()
+        clob.arm_market = AsyncMock(return_value=10)
+        engine = ExecutionEngine(config=config, event_bus=MagicMock(), clob_client=clob)
+        engine._market_tokens["m1"] = ("y", "n")
+        return engine
+
+    async def test_arms_near_threshold_and_disarms(self, engine):
+        """Verify snapshots within the window arm and leaving it disarms."""
+        await engine._on_orderbook_snapshot(
+            {"market_id": "m1", "yes_best_ask": "0.49", "no_best_ask": "0.53"}
+        )
+        await asyncio.gather(*engine._arm_tasks.values())
+
+        engine._clob.arm_market.assert_awaited_once_with(
+            "y", "n", Decimal("10.0"), Decimal("0.49"), Decimal("0.53"),
+            levels=2, ttl_seconds=5.0,
+        )
+
+        await engine._on_orderbook_snapshot(
+            {"market_id": "m1", "yes_best_ask": "0.55", "no_best_ask": "0.53"}
+        )
+        engine._clob.disarm_market.assert_called_once_with("y", "n")
+
+    async def test_unchanged_quotes_not_rearmed(self, engine):
+        snapshot = {"market_id": "m1", "yes_best_ask": "0.48", "no_best_ask": "0.50"}
+
+        for _ in range(3):
+            await engine._on_orderbook_snapshot(snapshot)
+            await asyncio.gather(*engine._arm_tasks.values())
+
+        assert engine._clob.arm_market.await_count == 1
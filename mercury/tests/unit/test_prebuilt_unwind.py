@@ -0,0 +1,149 @@
+"""Unit tests for unwind orders pre-signed alongside dual-leg pairs."""
+
+from decimal import Decimal
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+
+import pytest
+
+from mercury.core.config import ConfigManager
+from mercury.domain.signal import SignalType
+from mercury.integrations.polymarket.clob import UNWIND_SIGN_SLOTS, CLOBClient
+from mercury.integrations.polymarket.standin import LocalCLOBServer
+from mercury.integrations.polymarket.types import OrderStatus, PolymarketSettings
+from mercury.services.execution import ExecutionEngine, ExecutionSignal
+
+PRIVATE_KEY = "0x" + "1" * 64
+YES, NO = "11", "12"
+
+
+class TestPrebuiltUnwinds:
+    """Tests for one-legged fills unwound with orders signed up front."""
+
+    @pytest.fixture
+    async def server(self):
+        async with LocalCLOBServer() as server:
+            server.set_book(YES, bids=[("0.45", "1000")], asks=[("0.46", "1000")])
+            yield server
+
+    @pytest.fixture
+    async def client(self, server):
+        settings = PolymarketSettings(
+            private_key=PRIVATE_KEY,
+            api_key="key",
+            api_secret="c2VjcmV0",
+            api_passphrase="pass",
+            clob_url=server.url,
+        )
+        async with CLOBClient(settings, metrics_emitter=MagicMock()) as client:
+            await client.prepare_order_templates([YES, NO])
+            yield client
+
+    async def execute(self, client, prebuild_unwind=True):
+        # Limits after the 1 cent buffer: YES 0.46, NO 0.48
+        with patch("mercury.integrations.polymarket.clob.LIVE_ORDER_WAIT_SECONDS", 0.05):
+            return await client.execute_dual_leg_order(
+                YES, NO, Decimal("10"),
+                yes_price=Decimal("0.45"), no_price=Decimal("0.47"),
+                prebuild_unwind=prebuild_unwind,
+            )
+
+    def unwind_orders(self, server):
+        legs = (Decimal("0.46"), Decimal("0.48"))
+        return [o for o in server.orders.values() if o.price not in legs]
+
+    async def test_hedge_posted_without_book_fetch_or_signing(self, client, server):
+        """Verify a partial fill is hedged with the pre-signed BUY at limit + slippage."""
+        server.set_book(NO, asks=[("0.50", "1000")])
+        client.execute_order = AsyncMock(side_effect=AssertionError("signed on demand"))
+
+        result = await self.execute(client)
+
+        assert result.rebalance_action == "hedge_completed"
+        [hedge] = self.unwind_orders(server)
+        assert (hedge.token_id, hedge.side, hedge.price) == (NO, "BUY", Decimal("0.5"))
+        assert hedge.order_type == "FOK" and hedge.status == "MATCHED"
+        assert [r.path for r in server.requests].count("/book") == 2
+        client._metrics.record_unwind_time_to_flat.assert_called_once_with(
+            ANY, "hedge_completed", True
+        )
+        client._metrics.record_unwind_presign.assert_called_once_with(True)
+        assert (client.unwinds_prebuilt, client.unwinds_skipped) == (1, 0)
+        assert client._unwind_signs == 0
+
+    async def test_exit_when_hedge_does_not_fill(self, client, server):
+        """Verify a hedge over the book is killed and the filled leg sold."""
+        server.set_book(NO, asks=[("0.60", "1000")])
+        client.execute_order = AsyncMock(side_effect=AssertionError("signed on demand"))
+
+        result = await self.execute(client)
+
+        assert result.rebalance_action == "exited"
+        assert result.yes_result.status == OrderStatus.FILLED
+        hedge, exit_order = self.unwind_orders(server)
+        assert hedge.status == "CANCELLED"
+        assert (exit_order.token_id, exit_order.side, exit_order.price) == (
+            YES, "SELL", Decimal("0.44")
+        )
+        client._metrics.record_unwind_time_to_flat.assert_called_once_with(ANY, "exited", True)
+
+    async def test_on_demand_without_prebuild(self, client, server):
+        """Verify the unwind is built from the book when nothing was pre-signed."""
+        server.set_book(NO, asks=[("0.60", "1000")])
+
+        result = await self.execute(client, prebuild_unwind=False)
+
+        assert result.rebalance_action == "exited"
+        assert [r.path for r in server.requests].count("/book") == 3
+        client._metrics.record_unwind_time_to_flat.assert_called_once_with(ANY, "exited", False)
+
+    async def test_not_prebuilt_while_unwind_slots_busy(self, client, server):
+        """Verify unwinds are built on demand when every unwind slot is signing."""
+        server.set_book(NO, asks=[("0.60", "1000")])
+        client._unwind_signs = UNWIND_SIGN_SLOTS
+
+        result = await self.execute(client)
+
+        assert result.rebalance_action == "exited"
+        client._metrics.record_unwind_time_to_flat.assert_called_once_with(ANY, "exited", False)
+        client._metrics.record_unwind_presign.assert_called_once_with(False)
+        assert (client.unwinds_prebuilt, client.unwinds_skipped) == (0, 1)
+
+    async def test_both_filled_posts_no_unwind(self, client, server):
+        server.set_book(NO, asks=[("0.48", "1000")])
+
+        result = await self.execute(client)
+
+        assert result.both_filled and result.rebalance_action is None
+        assert self.unwind_orders(server) == []
+        client._metrics.record_unwind_time_to_flat.assert_not_called()
+
+    async def test_engine_does_not_unwind_twice(self, client, server):
+        """Verify the engine leaves a partial the client already unwound alone."""
+        server.set_book(NO, asks=[("0.60", "1000")])
+        values = {"mercury.dry_run": False, "execution.rebalance_partial_fills": True}
+        config = MagicMock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: values.get(key, default)
+        config.get_bool.side_effect = lambda key, default=None: values.get(key, default)
+        config.get_int.side_effect = lambda key, default=None: default
+        config.get_float.side_effect = lambda key, default=None: default
+        event_bus = MagicMock()
+        event_bus.publish = AsyncMock()
+        engine = ExecutionEngine(config, event_bus, clob_client=client)
+
+        with patch("mercury.integrations.polymarket.clob.LIVE_ORDER_WAIT_SECONDS", 0.05):
+            result = await engine.execute(ExecutionSignal(
+                signal_id="s1",
+                original_signal_id="o1",
+                market_id="m1",
+                signal_type=SignalType.ARBITRAGE,
+                target_size_usd=Decimal("10"),
+                yes_price=Decimal("0.45"),
+                no_price=Decimal("0.47"),
+                yes_token_id=YES,
+                no_token_id=NO,
+            ))
+
+        assert not result.success
+        sells = [o for o in server.orders.values() if o.side == "SELL"]
+        assert len(sells) == 1 and sells[0].status == "MATCHED"
+        client._metrics.record_unwind_time_to_flat.assert_called_once_with(ANY, "exited", True)
@@ -0,0 +1,224 @@
+"""Unit tests for requoting resting orders by diff."""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from mercury.integrations.polymarket.clob import CLOBClient
+from mercury.integrations.polymarket.quoting import (
+    Quote,
+    QuoteManager,
+    RestingOrder,
+    RestingOrderIndex,
+    diff_quotes,
+)
+from mercury.integrations.polymarket.standin import LocalCLOBServer
+from mercury.integrations.polymarket.types import OrderSide, PolymarketSettings
+from mercury.integrations.polymarket.user_channel import OrderStateIndex
+
+PRIVATE_KEY = "0x" + "1" * 64
+YES, NO = "11", "12"
+BUY, SELL = OrderSide.BUY, OrderSide.SELL
+
+
+def quote(price, size="100", side=BUY, token=YES):
+    return Quote(token, side, Decimal(price), Decimal(size))
+
+
+def resting(*orders):
+    """Index of resting orders given as (order_id, price, size)."""
+    index = RestingOrderIndex()
+    for order_id, price, size in orders:
+        index.add(RestingOrder(order_id, "m1", YES, BUY, Decimal(price), Decimal(size)))
+    return index
+
+
+class TestDiffQuotes:
+    """Tests for the minimal cancel/post set."""
+
+    def test_matching_levels_untouched(self):
+        index = resting(("a", "0.47", "100"), ("b", "0.46", "100"))
+
+        diff = diff_quotes([quote("0.47"), quote("0.46")], index.levels("m1"))
+
+        assert diff.is_empty and diff.kept == 2
+
+    def test_moved_level_cancels_and_posts_only_it(self):
+        index = resting(("a", "0.47", "100"), ("b", "0.46", "100"))
+
+        diff = diff_quotes([quote("0.47"), quote("0.45")], index.levels("m1"))
+
+        assert [o.order_id for o in diff.cancels] == ["b"]
+        assert diff.posts == [quote("0.45")]
+        assert diff.kept == 1
+
+    def test_growing_level_adds_increment(self):
+        """Verify a larger size is posted behind the resting order, not instead of it."""
+        index = resting(("a", "0.47", "100"))
+
+        diff = diff_quotes([quote("0.47", "150")], index.levels("m1"))
+
+        assert diff.cancels == [] and diff.posts == [quote("0.47", "50")]
+
+    def test_shrinking_level_cancels_newest(self):
+        index = resting(("old", "0.47", "60"), ("new", "0.47", "60"))
+
+        diff = diff_quotes([quote("0.47", "80")], index.levels("m1"))
+
+        assert [o.order_id for o in diff.cancels] == ["new"]
+        assert diff.posts == [quote("0.47", "20")]
+
+    def test_size_tolerance(self):
+        index = resting(("a", "0.47", "100"))
+
+        diff = diff_quotes([quote("0.47", "103")], index.levels("m1"), Decimal("5"))
+
+        assert diff.is_empty
+
+
+class SlowClient:
+    """Client stub recording each pass; every request takes `delay`."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.posts: list[list] = []
+        self.cancels: list[list] = []
+
+    async def cancel_orders(self, order_ids):
+        self.cancels.append(list(order_ids))
+        await asyncio.sleep(self.delay)
+        return list(order_ids)
+
+    async def post_limit_orders(self, orders):
+        self.posts.append(list(orders))
+        await asyncio.sleep(self.delay)
+        return [
+            MagicMock(
+                order_id=f"o{len(self.posts)}-{i}",
+                status="LIVE",
+                requested_size=shares,
+                filled_size=Decimal("0"),
+            )
+            for i, (_, _, _, shares) in enumerate(orders)
+        ]
+
+
+class TestQuoteManager:
+    """Tests for coalescing and fill tracking."""
+
+    async def test_requotes_coalesce_to_latest(self):
+        """Verify requotes arriving mid-flight skip to the latest state."""
+        client = SlowClient()
+        metrics = MagicMock()
+        manager = QuoteManager(client, metrics_emitter=metrics)
+
+        first = asyncio.create_task(manager.requote("m1", [quote("0.40")]))
+        await asyncio.sleep(0.005)
+        second, third = await asyncio.gather(
+            manager.requote("m1", [quote("0.41")]),
+            manager.requote("m1", [quote("0.42")]),
+        )
+
+        # 0.41 was superseded while the first pass was in flight
+        assert (await first).coalesced == 0
+        assert [[p for _, _, p, _ in post] for post in client.posts] == [
+            [Decimal("0.40")], [Decimal("0.42")],
+        ]
+        assert second is third and third.coalesced == 1
+        assert [o.price for o in manager.resting.orders("m1")] == [Decimal("0.42")]
+        metrics.record_requotes_coalesced.assert_called_once_with(1)
+
+    async def test_fills_read_from_order_index(self):
+        """Verify only the filled part of an order is reposted."""
+        client = SlowClient(delay=0)
+        updates = OrderStateIndex()
+        manager = QuoteManager(client, order_index=updates)
+        await manager.requote("m1", [quote("0.47")])
+        [order] = manager.resting.orders("m1")
+
+        updates.apply({
+            "event_type": "order",
+            "id": order.order_id,
+            "type": "UPDATE",
+            "status": "LIVE",
+            "original_size": "100",
+            "size_matched": "40",
+        })
+        await manager.requote("m1", [quote("0.47")])
+
+        assert client.cancels == []
+        assert client.posts[-1] == [(YES, BUY, Decimal("0.47"), Decimal("40"))]
+
+    async def test_dry_run_sends_nothing(self):
+        client = MagicMock()
+        manager = QuoteManager(client, dry_run=True)
+
+        await manager.requote("m1", [quote("0.47")])
+        result = await manager.cancel_market("m1")
+
+        assert len(result.cancelled) == 1 and len(manager.resting) == 0
+        assert client.mock_calls == []
+
+
+class TestRequoteAtStandin:
+    """Tests for batched cancels and posts through the real client."""
+
+    @pytest.fixture
+    async def server(self):
+        async with LocalCLOBServer() as server:
+            server.set_book(YES, bids=[("0.40", "1000")], asks=[("0.60", "1000")])
+            server.set_book(NO, bids=[("0.40", "1000")], asks=[("0.60", "1000")])
+            yield server
+
+    @pytest.fixture
+    async def client(self, server):
+        settings = PolymarketSettings(
+            private_key=PRIVATE_KEY,
+            api_key="key",
+            api_secret="c2VjcmV0",
+            api_passphrase="pass",
+            clob_url=server.url,
+        )
+        async with CLOBClient(settings) as client:
+            await client.prepare_order_templates([YES, NO])
+            yield client
+
+    def ladder(self, top):
+        """Three bids from `top` down and three asks from `top` + 0.10 up, per token."""
+        top = Decimal(top)
+        ticks = [Decimal("0.01") * i for i in range(3)]
+        return [
+            quote(str(top - tick), "20", BUY, token) for token in (YES, NO) for tick in ticks
+        ] + [
+            quote(str(top + Decimal("0.10") + tick), "20", SELL, token)
+            for token in (YES, NO) for tick in ticks
+        ]
+
+    async def test_requote_sends_only_changes(self, client, server):
+        manager = QuoteManager(client)
+        first = await manager.requote("m1", self.ladder("0.47"))
+        assert len(first.posted) == 12
+        server.requests.clear()
+
+        # One tick up: each side drops its far level and adds a new near one
+        second = await manager.requote("m1", self.ladder("0.48"))
+
+        paths = [(r.method, r.path) for r in server.requests]
+        assert paths == [("DELETE", "/orders"), ("POST", "/orders")]
+        assert len(second.cancelled) == 4 and len(second.posted) == 4
+        assert second.kept == 8
+        kept = {o.order_id for o in first.posted} & {o.order_id for o in manager.resting.orders()}
+        assert len(kept) == 8
+        assert all(server.orders[order_id].status == "LIVE" for order_id in kept)
+
+    async def test_posts_split_at_batch_limit(self, client, server):
+        manager = QuoteManager(client)
+        quotes = [quote(f"0.{30 + i}", "10") for i in range(20)]
+
+        result = await manager.requote("m1", quotes)
+
+        posts = [r for r in server.requests if r.path == "/orders"]
+        assert [len(r.body) for r in posts] == [15, 5]
+        assert len(result.posted) == 20
@@ -0,0 +1,192 @@
+"""Unit tests for the shared token-bucket rate limiter."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from mercury.core.config import ConfigManager
+from mercury.core.ratelimit import Priority, RateLimiterRegistry, TokenBucket
+from mercury.integrations.chain.client import PolygonClient
+from mercury.integrations.polymarket.clob import RateLimitedError
+from mercury.integrations.polymarket.transport import AsyncCLOBTransport
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    async def test_burst_then_rate(self):
+        """Verify the burst is served at once and the rest at the refill rate."""
+        bucket = TokenBucket("clob", rate=100.0, burst=3)
+
+        waits = [await bucket.acquire() for _ in range(3)]
+        started = time.monotonic()
+        await bucket.acquire()
+
+        assert waits == [0.0, 0.0, 0.0]
+        assert time.monotonic() - started >= 0.009
+
+    async def test_priority_order(self):
+        """Verify queued orders go ahead of queued book and metadata requests."""
+        bucket = TokenBucket("clob", rate=200.0, burst=1)
+        await bucket.acquire()
+        served = []
+
+        async def request(priority):
+            await bucket.acquire(priority)
+            served.append(priority)
+
+        tasks = [
+            asyncio.create_task(request(priority))
+            for priority in (Priority.METADATA, Priority.MARKET_DATA, Priority.ORDER)
+        ]
+        await asyncio.sleep(0)
+        assert bucket.waiting == 3
+        await asyncio.gather(*tasks)
+
+        assert served == [Priority.ORDER, Priority.MARKET_DATA, Priority.METADATA]
+
+    async def test_resend_served_first(self):
+        """Verify a request resent after a 429 goes ahead of first attempts."""
+        bucket = TokenBucket("clob", rate=200.0, burst=1)
+        await bucket.acquire()
+        served = []
+
+        async def request(name, resend):
+            await bucket.acquire(Priority.ORDER, resend=resend)
+            served.append(name)
+
+        tasks = [
+            asyncio.create_task(request("first", False)),
+            asyncio.create_task(request("resent", True)),
+        ]
+        await asyncio.gather(*tasks)
+
+        assert served == ["resent", "first"]
+
+    async def test_cancelled_waiter_skipped(self):
+        """Verify a cancelled acquire does not hold up the queue."""
+        bucket = TokenBucket("clob", rate=100.0, burst=1)
+        await bucket.acquire()
+        first = asyncio.create_task(bucket.acquire(Priority.ORDER))
+        second = asyncio.create_task(bucket.acquire(Priority.METADATA))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        waited = await asyncio.wait_for(second, timeout=1.0)
+
+        assert waited < 0.05
+        assert bucket.waiting == 0
+
+    async def test_backoff(self):
+        """Verify a backoff holds every request for the given time."""
+        bucket = TokenBucket("clob", rate=1000.0, burst=10)
+
+        bucket.backoff(0.05)
+        waited = await bucket.acquire(Priority.ORDER)
+
+        assert waited >= 0.045
+
+    async def test_metrics(self):
+        """Verify wait time and fill level are exported."""
+        metrics = MagicMock()
+        bucket = TokenBucket("clob.orders", rate=10.0, burst=2, metrics_emitter=metrics)
+
+        await bucket.acquire(Priority.ORDER)
+
+        metrics.record_rate_limit_wait.assert_called_once_with("clob.orders", "order", 0.0)
+        endpoint, tokens = metrics.update_rate_limit_tokens.call_args[0]
+        assert endpoint == "clob.orders" and tokens == pytest.approx(1.0, abs=0.01)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket("clob", rate=0)
+
+
+class TestRateLimiterRegistry:
+    """Tests for RateLimiterRegistry."""
+
+    def test_parent_fallback(self):
+        """Verify endpoints without a bucket use their parent's."""
+        registry = RateLimiterRegistry()
+        clob = registry.configure("clob", rate=10.0)
+        orders = registry.configure("clob.orders", rate=5.0)
+
+        assert registry.bucket("clob.orders") is orders
+        assert registry.bucket("clob.book") is clob
+        assert registry.bucket("gamma") is None
+
+    async def test_unlimited_endpoint(self):
+        registry = RateLimiterRegistry()
+
+        assert await registry.acquire("gamma") == 0.0
+
+    def test_from_config(self, tmp_path):
+        """Verify nested [rate_limits] tables become buckets."""
+        path = tmp_path / "config.toml"
+        path.write_text(
+            "[rate_limits.clob]\nrate = 100.0\nburst = 200\n"
+            "[rate_limits.clob.orders]\nrate = 50.0\n"
+        )
+
+        registry = RateLimiterRegistry.from_config(ConfigManager(config_path=path))
+
+        assert registry.endpoints == ["clob", "clob.orders"]
+        assert registry.bucket("clob").burst == 200
+        assert registry.bucket("clob.orders").burst == 50
+
+    def test_disabled(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_text("[rate_limits]\nenabled = false\n[rate_limits.clob]\nrate = 1.0\n")
+        registry = RateLimiterRegistry()
+        registry.configure("gamma", rate=1.0)
+
+        registry.load(ConfigManager(config_path=path))
+
+        assert registry.endpoints == []
+
+    def test_reconfigure_keeps_bucket(self):
+        """Verify reloading updates a bucket in place."""
+        registry = RateLimiterRegistry()
+        bucket = registry.configure("clob", rate=10.0)
+
+        assert registry.configure("clob", rate=20.0, burst=5) is bucket
+        assert bucket.rate == 20.0 and bucket.tokens <= 5
+
+
+class TestClientThrottling:
+    """Tests for integration clients drawing from the registry."""
+
+    async def test_transport_uses_endpoint_buckets(self):
+        """Verify book requests draw from clob.book and a 429 pauses it."""
+        registry = RateLimiterRegistry()
+        book = registry.configure("clob.book", rate=10.0, burst=10)
+        orders = registry.configure("clob.orders", rate=10.0, burst=10)
+        responses = iter([
+            httpx.Response(200, json={"bids": [], "asks": []}),
+            httpx.Response(429, headers={"Retry-After": "2"}, text="slow down"),
+        ])
+        transport = AsyncCLOBTransport(
+            "http://clob.test",
+            transport=httpx.MockTransport(lambda request: next(responses)),
+            rate_limiter=registry,
+            rate_limit_retries=0,
+        )
+
+        async with transport:
+            await transport.get_order_book("123")
+            with pytest.raises(RateLimitedError, match="429"):
+                await transport.get_order_book("123")
+
+        assert book.tokens < -10
+        assert orders.tokens == pytest.approx(10)
+
+    async def test_polygon_rpc_calls_throttled(self):
+        registry = RateLimiterRegistry()
+        chain = registry.configure("chain", rate=1.0, burst=2)
+        client = PolygonClient("http://rpc.test", "0x" + "1" * 64, rate_limiter=registry)
+
+        assert await client._run_sync(lambda: 1) == 1
+        assert chain.tokens == pytest.approx(1.0, abs=0.01)
@@ -3,6 +3,7 @@ Unit tests for the RiskManager service.
 
 Tests cover:
 - Pre-trade validation
+- Batch validation of signal bursts
 - 4-level circuit breaker state transitions (NORMAL -> WARNING -> CAUTION -> HALT)
 - Exposure tracking
 - Daily reset functionality
@@ -11,7 +12,8 @@ Tests cover:
 - Position size multipliers
 - Daily loss limit tracking with configurable thresholds
 - Automatic daily reset scheduling
-- Daily stats event publishing
+- Daily stats event publishing and rate limiting
+- Incremental circuit breaker counters (threshold-crossing detection)
 """
 import pytest
 from datetime import timedelta
@@ -19,9 +21,9 @@ from decimal import Decimal
 from unittest.mock import MagicMock, AsyncMock
 
 from mercury.services.risk_manager import RiskManager
-from mercury.domain.signal import TradingSignal, SignalType
+from mercury.domain.signal import TradingSignal, SignalPriority, SignalType
 from mercury.domain.order import Fill
-from mercury.domain.risk import CircuitBreakerState
+from mercury.domain.risk import CircuitBreakerState, ThresholdCounter
 
 
 @pytest.fixture
@@ -875,14 +877,26 @@ class TestUnhedgedExposureLimit:
 
 
 class TestStateStoreIntegration:
-    """Test RiskManager integration with StateStore for position queries."""
+    """Test the exposure ledger seeded and reconciled from StateStore."""
 
     @pytest.fixture
     def mock_state_store(self):
-        """Create a mock StateStore."""
+        """Create a mock StateStore with one $90 market."""
+        from mercury.services.state_store import MarketExposure
+
         store = MagicMock()
         store.is_connected = True
         store.get_open_positions = AsyncMock(return_value=[])
+        store.get_open_exposures = AsyncMock(return_value=[
+            MarketExposure(
+                market_id="test-market",
+                asset="btc",
+                yes_size=Decimal("100"),
+                yes_cost=Decimal("45"),
+                no_size=Decimal("100"),
+                no_cost=Decimal("45"),
+            ),
+        ])
         return store
 
     @pytest.fixture
@@ -892,85 +906,385 @@ class TestStateStoreIntegration:
             config=risk_config,
             event_bus=mock_event_bus,
             state_store=mock_state_store,
+            metrics_emitter=MagicMock(),
         )
 
-    @pytest.mark.asyncio
-    async def test_queries_state_store_for_market_exposure(
-        self, risk_manager_with_store, mock_state_store
-    ):
-        """RiskManager should query StateStore for current market exposure."""
-        # Create mock position
-        from mercury.services.state_store import Position as StorePosition
-        mock_position = MagicMock()
-        mock_position.size = Decimal("100.0")
-        mock_position.entry_price = Decimal("0.50")
-        mock_state_store.get_open_positions.return_value = [mock_position]
-
-        signal = TradingSignal(
-            signal_id="test-store-query",
+    def make_signal(self, size: str = "10.0", market_id: str = "test-market") -> TradingSignal:
+        return TradingSignal(
+            signal_id="test-store",
             strategy_name="gabagool",
-            market_id="test-market",
+            market_id=market_id,
             signal_type=SignalType.ARBITRAGE,
             confidence=0.8,
-            target_size_usd=Decimal("10.0"),
+            target_size_usd=Decimal(size),
             yes_price=Decimal("0.48"),
             no_price=Decimal("0.50"),
         )
 
-        await risk_manager_with_store.check_pre_trade(signal)
-
-        # Should have queried state store for market positions
-        mock_state_store.get_open_positions.assert_called()
+    @pytest.mark.asyncio
+    async def test_ledger_seeded_at_start(self, risk_manager_with_store):
+        """Open positions are loaded per market and per asset on start."""
+        await risk_manager_with_store.start()
+        try:
+            assert risk_manager_with_store.get_market_exposure("test-market") == Decimal("90")
+            assert risk_manager_with_store.get_asset_exposure("BTC") == Decimal("90")
+            assert risk_manager_with_store.current_exposure == Decimal("90")
+            # Fully paired YES/NO shares carry no unhedged exposure
+            assert risk_manager_with_store.unhedged_exposure == Decimal("0")
+        finally:
+            await risk_manager_with_store.stop()
 
     @pytest.mark.asyncio
-    async def test_uses_state_store_positions_for_limit_check(
+    async def test_pre_trade_does_not_query_state_store(
         self, risk_manager_with_store, mock_state_store
     ):
-        """RiskManager should use StateStore positions for per-market limit check."""
-        # Create mock position with $90 exposure
-        mock_position = MagicMock()
-        mock_position.size = Decimal("180.0")
-        mock_position.entry_price = Decimal("0.50")  # Cost = 180 * 0.5 = $90
-        mock_state_store.get_open_positions.return_value = [mock_position]
+        """Pre-trade checks read the ledger only."""
+        await risk_manager_with_store.start()
+        try:
+            mock_state_store.get_open_exposures.reset_mock()
 
-        signal = TradingSignal(
-            signal_id="test-store-limit",
+            await risk_manager_with_store.check_pre_trade(self.make_signal())
+
+            mock_state_store.get_open_positions.assert_not_called()
+            mock_state_store.get_open_exposures.assert_not_called()
+        finally:
+            await risk_manager_with_store.stop()
+
+    @pytest.mark.asyncio
+    async def test_seeded_exposure_enforces_market_limit(self, risk_manager_with_store):
+        """A seeded $90 market rejects a $15 signal against the $100 limit."""
+        await risk_manager_with_store.start()
+        try:
+            allowed, reason = await risk_manager_with_store.check_pre_trade(
+                self.make_signal("15.0")
+            )
+        finally:
+            await risk_manager_with_store.stop()
+
+        assert allowed is False
+        assert "per-market exposure" in reason.lower()
+
+    @pytest.mark.asyncio
+    async def test_seed_failure_starts_empty(self, risk_manager_with_store, mock_state_store):
+        """A StateStore error at start leaves an empty ledger."""
+        mock_state_store.get_open_exposures.side_effect = Exception("DB error")
+
+        await risk_manager_with_store.start()
+        try:
+            allowed, reason = await risk_manager_with_store.check_pre_trade(self.make_signal())
+        finally:
+            await risk_manager_with_store.stop()
+
+        assert allowed is True
+
+    def make_adopting(self, risk_config, mock_event_bus, mock_state_store, grace=0):
+        """Create a RiskManager that adopts stored values on drift."""
+        base = risk_config.get.side_effect
+        overrides = {
+            "risk.exposure_reconcile_adopt": True,
+            "risk.exposure_reconcile_grace_seconds": grace,
+        }
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: overrides.get(key, base(key, default))
+        return RiskManager(
+            config=config,
+            event_bus=mock_event_bus,
+            state_store=mock_state_store,
+            metrics_emitter=MagicMock(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_reconcile_reports_drift_only_by_default(self, risk_manager_with_store):
+        """Drift is reported as a metric; the ledger keeps its own values."""
+        risk_manager_with_store._market_exposures["test-market"] = Decimal("80")
+        risk_manager_with_store._market_exposures["gone-market"] = Decimal("5")
+
+        drift = await risk_manager_with_store.reconcile_exposure()
+
+        assert drift == Decimal("15")
+        assert risk_manager_with_store.exposure_drift == Decimal("15")
+        risk_manager_with_store._metrics.update_risk_exposure_drift.assert_called_once_with(
+            Decimal("15")
+        )
+        assert risk_manager_with_store.market_exposures == {
+            "test-market": Decimal("80"),
+            "gone-market": Decimal("5"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_reconcile_adopts_stored_values_when_enabled(
+        self, risk_config, mock_event_bus, mock_state_store
+    ):
+        """With adoption enabled, drift above tolerance resyncs the ledger."""
+        manager = self.make_adopting(risk_config, mock_event_bus, mock_state_store)
+        manager._market_exposures["test-market"] = Decimal("80")
+
+        assert await manager.reconcile_exposure() == Decimal("10")
+        assert manager.market_exposures == {"test-market": Decimal("90")}
+
+    @pytest.mark.asyncio
+    async def test_reconcile_keeps_recent_fills(
+        self, risk_config, mock_event_bus, mock_state_store
+    ):
+        """A fill within the grace period is not rolled back by a reconcile."""
+        manager = self.make_adopting(risk_config, mock_event_bus, mock_state_store, grace=30)
+        mock_state_store.get_open_exposures.return_value = []
+
+        await manager._on_order_filled({
+            "market_id": "m1", "size": "100", "price": "0.45", "signal_type": "DIRECTIONAL",
+        })
+        drift = await manager.reconcile_exposure()
+
+        assert drift == Decimal("90")
+        assert manager.market_exposures == {"m1": Decimal("45.00")}
+        assert manager.unhedged_exposure == Decimal("45.00")
+
+    @pytest.mark.asyncio
+    async def test_reconcile_within_tolerance_keeps_ledger(self, risk_manager_with_store):
+        """Matching ledger reports zero drift."""
+        risk_manager_with_store._market_exposures["test-market"] = Decimal("90")
+
+        drift = await risk_manager_with_store.reconcile_exposure()
+
+        assert drift == Decimal("0")
+        risk_manager_with_store._metrics.update_risk_exposure_drift.assert_called_once_with(
+            Decimal("0")
+        )
+
+    @pytest.mark.asyncio
+    async def test_fill_and_close_update_asset_exposure(self, risk_manager):
+        """Fills carrying an asset are tracked per asset until closed."""
+        await risk_manager._on_order_filled({
+            "market_id": "eth-market",
+            "asset": "ETH",
+            "size": "20",
+            "price": "0.5",
+            "signal_type": "ARBITRAGE",
+        })
+
+        assert risk_manager.asset_exposures == {"ETH": Decimal("10.0")}
+
+        await risk_manager._on_position_closed({
+            "market_id": "eth-market",
+            "realized_pnl": "1",
+            "cost_basis": "10",
+            "is_hedged": True,
+        })
+
+        assert risk_manager.asset_exposures == {}
+        assert risk_manager.get_market_exposure("eth-market") == Decimal("0")
+
+
+class TestBatchValidation:
+    """Test validate_batch headroom allocation for signal bursts."""
+
+    def make_signal(
+        self,
+        signal_id: str,
+        market_id: str = "test-market",
+        signal_type: SignalType = SignalType.ARBITRAGE,
+        priority: SignalPriority = SignalPriority.MEDIUM,
+        expected_pnl: str = "0.1",
+        size: str = "20.0",
+    ) -> TradingSignal:
+        return TradingSignal(
+            signal_id=signal_id,
             strategy_name="gabagool",
-            market_id="test-market",
-            signal_type=SignalType.ARBITRAGE,
+            market_id=market_id,
+            signal_type=signal_type,
+            priority=priority,
             confidence=0.8,
-            target_size_usd=Decimal("15.0"),  # Would push to $105, over $100 limit
+            target_size_usd=Decimal(size),
             yes_price=Decimal("0.48"),
             no_price=Decimal("0.50"),
+            expected_pnl=Decimal(expected_pnl),
         )
 
-        allowed, reason = await risk_manager_with_store.check_pre_trade(signal)
+    @pytest.mark.asyncio
+    async def test_burst_shares_market_headroom(self, risk_manager):
+        """Signals that each fit alone cannot jointly exceed the market limit."""
+        risk_manager._market_exposures["test-market"] = Decimal("60")
+        signals = [
+            self.make_signal("low", priority=SignalPriority.LOW),
+            self.make_signal("critical", priority=SignalPriority.CRITICAL),
+            self.make_signal("high", priority=SignalPriority.HIGH),
+        ]
 
-        assert allowed is False
-        assert "per-market exposure" in reason.lower()
+        approved, rejected = await risk_manager.validate_batch(signals)
+
+        assert [a.signal.signal_id for a in approved] == ["critical", "high"]
+        assert [r.signal.signal_id for r in rejected] == ["low"]
+        assert "per-market exposure" in rejected[0].rejection_reason.lower()
 
     @pytest.mark.asyncio
-    async def test_falls_back_to_memory_on_store_error(
-        self, risk_manager_with_store, mock_state_store
-    ):
-        """RiskManager should fallback to in-memory tracking on StateStore errors."""
-        mock_state_store.get_open_positions.side_effect = Exception("DB error")
+    async def test_ranks_by_expected_pnl_within_priority(self, risk_manager):
+        """Unhedged headroom goes to the most profitable directional signals first."""
+        signals = [
+            self.make_signal("a", "m1", SignalType.BUY_YES, expected_pnl="0.1"),
+            self.make_signal("b", "m2", SignalType.BUY_YES, expected_pnl="0.5"),
+            self.make_signal("c", "m3", SignalType.BUY_NO, expected_pnl="0.3"),
+        ]
 
-        signal = TradingSignal(
-            signal_id="test-fallback",
+        approved, rejected = await risk_manager.validate_batch(signals)
+
+        assert [a.signal.signal_id for a in approved] == ["b", "c"]
+        assert [r.signal.signal_id for r in rejected] == ["a"]
+        assert "unhedged exposure" in rejected[0].rejection_reason.lower()
+
+    @pytest.mark.asyncio
+    async def test_publishes_all_decisions(self, risk_manager, mock_event_bus):
+        """Every signal in the batch gets an approval or rejection event."""
+        risk_manager._market_exposures["test-market"] = Decimal("90")
+        signals = [self.make_signal("a", size="5.0"), self.make_signal("b", size="10.0")]
+
+        await risk_manager.validate_batch(signals)
+
+        channels = sorted(call.args[0] for call in mock_event_bus.publish.call_args_list)
+        assert channels == ["risk.approved.a", "risk.rejected.b"]
+
+    @pytest.mark.asyncio
+    async def test_on_signal_collects_within_window(self, risk_config, mock_event_bus):
+        """With a batch window, signals are validated together after the window."""
+        import asyncio
+
+        base = risk_config.get.side_effect
+        risk_config.get.side_effect = lambda key, default=None: {
+            "risk.batch_window_ms": 20,
+        }.get(key, base(key, default))
+        risk_manager = RiskManager(config=risk_config, event_bus=mock_event_bus)
+        risk_manager.validate_batch = AsyncMock(return_value=([], []))
+
+        for signal_id in ("s1", "s2"):
+            await risk_manager._on_signal({
+                "signal_id": signal_id,
+                "market_id": "test-market",
+                "signal_type": "ARBITRAGE",
+                "target_size_usd": "10",
+                "priority": "high",
+                "expected_pnl": "0.2",
+            })
+
+        risk_manager.validate_batch.assert_not_called()
+        await asyncio.sleep(0.05)
+
+        risk_manager.validate_batch.assert_awaited_once()
+        batch = risk_manager.validate_batch.call_args.args[0]
+        assert [s.signal_id for s in batch] == ["s1", "s2"]
+        assert batch[0].priority == SignalPriority.HIGH
+        assert batch[0].expected_pnl == Decimal("0.2")
+
+    @pytest.mark.asyncio
+    async def test_batch_max_signals_flushes_early(self, risk_config, mock_event_bus):
+        """Reaching batch_max_signals validates without waiting for the window."""
+        base = risk_config.get.side_effect
+        risk_config.get.side_effect = lambda key, default=None: {
+            "risk.batch_window_ms": 10_000,
+            "risk.batch_max_signals": 2,
+        }.get(key, base(key, default))
+        risk_manager = RiskManager(config=risk_config, event_bus=mock_event_bus)
+
+        for signal_id in ("s1", "s2"):
+            await risk_manager._on_signal({
+                "signal_id": signal_id,
+                "market_id": "test-market",
+                "signal_type": "ARBITRAGE",
+                "target_size_usd": "10",
+            })
+
+        assert mock_event_bus.publish.await_count == 2
+        assert risk_manager._batch_task is None
+
+
+class TestScenarioRisk:
+    """Test scenario P&L tracking and the worst-case loss check."""
+
+    @pytest.fixture
+    def scenario_manager(self, risk_config, mock_event_bus):
+        """RiskManager with a $20 worst-case loss limit."""
+        base = risk_config.get.side_effect
+        risk_config.get.side_effect = lambda key, default=None: {
+            "risk.max_scenario_loss_usd": 20,
+        }.get(key, base(key, default))
+        return RiskManager(
+            config=risk_config,
+            event_bus=mock_event_bus,
+            metrics_emitter=MagicMock(),
+        )
+
+    def make_signal(self, signal_id: str, market_id: str, signal_type: SignalType) -> TradingSignal:
+        return TradingSignal(
+            signal_id=signal_id,
             strategy_name="gabagool",
-            market_id="test-market",
-            signal_type=SignalType.ARBITRAGE,
+            market_id=market_id,
+            signal_type=signal_type,
             confidence=0.8,
-            target_size_usd=Decimal("10.0"),
+            target_size_usd=Decimal("12.0"),
             yes_price=Decimal("0.48"),
             no_price=Decimal("0.50"),
+            metadata={"asset": "ETH"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_fill_updates_scenario_gauge(self, scenario_manager):
+        """Every fill re-evaluates scenario P&L and exports it."""
+        await scenario_manager._on_order_filled({
+            "market_id": "eth-market",
+            "asset": "ETH",
+            "outcome": "YES",
+            "size": "20",
+            "price": "0.5",
+        })
+
+        assert scenario_manager.scenario_risk.worst_case_pnl == pytest.approx(-10.0)
+        assert scenario_manager.scenario_risk.stress_pnl == pytest.approx(-10.0)
+        scenario_manager._metrics.update_risk_scenario_pnl.assert_called_with(
+            pytest.approx(-10.0), pytest.approx(-10.0)
         )
 
-        # Should not raise, should fallback to in-memory (which is 0)
-        allowed, reason = await risk_manager_with_store.check_pre_trade(signal)
+        await scenario_manager._on_position_closed({
+            "market_id": "eth-market",
+            "realized_pnl": "0",
+            "cost_basis": "10",
+        })
+
+        assert scenario_manager.scenario_risk.worst_case_pnl == 0.0
+
+    @pytest.mark.asyncio
+    async def test_rejects_signal_exceeding_worst_case_loss(self, scenario_manager):
+        """A directional signal that could push worst-case loss past the limit is rejected."""
+        await scenario_manager._on_order_filled({
+            "market_id": "eth-market",
+            "asset": "ETH",
+            "outcome": "YES",
+            "size": "30",
+            "price": "0.5",
+        })
+
+        allowed, reason = await scenario_manager.check_pre_trade(
+            self.make_signal("dir", "eth-market-2", SignalType.BUY_YES)
+        )
+        arb_allowed, _ = await scenario_manager.check_pre_trade(
+            self.make_signal("arb", "eth-market-2", SignalType.ARBITRAGE)
+        )
+
+        assert allowed is False
+        assert "scenario worst-case loss" in reason.lower()
+        assert arb_allowed is True
+
+    @pytest.mark.asyncio
+    async def test_batch_stages_approved_positions(self, scenario_manager):
+        """Earlier approvals in a batch count toward the scenario check."""
+        signals = [
+            self.make_signal("first", "eth-a", SignalType.BUY_YES),
+            self.make_signal("second", "eth-b", SignalType.BUY_YES),
+        ]
+
+        approved, rejected = await scenario_manager.validate_batch(signals)
 
-        assert allowed is True  # In-memory starts at 0
+        assert [a.signal.signal_id for a in approved] == ["first"]
+        assert "scenario" in rejected[0].rejection_reason.lower()
+        # Staging does not touch the live portfolio
+        assert scenario_manager.scenario_risk.total_cost == 0.0
 
 
 class TestClosePositionSignals:
@@ -3104,3 +3418,122 @@ class TestCircuitBreakerEventData:
         assert "HALT" in states_seen
 
         await risk_manager.stop()
+
+
+class TestThresholdCounter:
+    """Test threshold-crossing detection for circuit breaker inputs."""
+
+    def test_reports_only_band_changes(self):
+        """update() should return True only when a threshold is crossed."""
+        counter = ThresholdCounter(warning=3, caution=4, halt=5)
+
+        assert counter.update(1) is False
+        assert counter.update(2) is False
+        assert counter.update(3) is True
+        assert counter.state == CircuitBreakerState.WARNING
+        assert counter.threshold == 3
+        assert counter.update(5) is True
+        assert counter.state == CircuitBreakerState.HALT
+        assert counter.update(9) is False
+        assert counter.update(0) is True
+        assert counter.state == CircuitBreakerState.NORMAL
+        assert counter.threshold is None
+
+    def test_disabled_thresholds_never_trip(self):
+        """Zero thresholds should be ignored."""
+        counter = ThresholdCounter(warning=Decimal("0"), caution=Decimal("0"), halt=Decimal("10"))
+
+        assert counter.add(Decimal("9.99")) is False
+        assert counter.add(Decimal("0.01")) is True
+        assert counter.state == CircuitBreakerState.HALT
+
+        counter.reset()
+        assert counter.value == 0
+        assert counter.state == CircuitBreakerState.NORMAL
+
+
+class TestIncrementalCircuitBreaker:
+    """Test circuit breaker driven by drawdown and volume counters."""
+
+    @pytest.fixture
+    def counter_config(self, risk_config):
+        base = risk_config.get.side_effect
+        risk_config.get.side_effect = lambda key, default=None: {
+            "risk.circuit_breaker_warning_drawdown": Decimal("20"),
+            "risk.circuit_breaker_caution_drawdown": Decimal("40"),
+            "risk.circuit_breaker_warning_volume": Decimal("100"),
+            "risk.daily_stats_interval_ms": Decimal("50"),
+        }.get(key, base(key, default))
+        return risk_config
+
+    def test_drawdown_from_peak_trips(self, counter_config, mock_event_bus):
+        """A drop from the daily peak should trip even while P&L is positive."""
+        manager = RiskManager(config=counter_config, event_bus=mock_event_bus)
+
+        manager.record_pnl(Decimal("60"))
+        manager.record_pnl(Decimal("-45"))
+
+        assert manager.daily_pnl == Decimal("15")
+        assert manager.circuit_breaker_state == CircuitBreakerState.CAUTION
+        assert any("drawdown" in r.lower() for r in manager.circuit_breaker_reasons)
+
+    def test_volume_threshold_trips(self, counter_config, mock_event_bus):
+        """Daily volume crossing its threshold should move to WARNING."""
+        manager = RiskManager(config=counter_config, event_bus=mock_event_bus)
+
+        for i in range(5):
+            manager.record_fill(Fill(
+                order_id=f"order-{i}",
+                market_id=f"market-{i}",
+                token_id="token",
+                side="BUY",
+                size=Decimal("40"),
+                price=Decimal("0.5"),
+            ))
+
+        assert manager.circuit_breaker_state == CircuitBreakerState.WARNING
+        assert manager.daily_volume == Decimal("100")
+
+        manager.reset_daily()
+        assert manager.circuit_breaker_state == CircuitBreakerState.NORMAL
+        assert manager._volume_counter.value == 0
+
+    @pytest.mark.asyncio
+    async def test_no_event_without_transition(self, risk_manager, mock_event_bus):
+        """Updates that stay within a band should not publish circuit breaker events."""
+        import asyncio
+
+        for _ in range(10):
+            risk_manager.record_pnl(Decimal("-1"))
+            risk_manager.record_failure()
+            risk_manager.record_success()
+        await asyncio.sleep(0.01)
+
+        calls = mock_event_bus.publish.call_args_list
+        assert not [c for c in calls if c[0][0] == "risk.circuit_breaker"]
+
+    @pytest.mark.asyncio
+    async def test_daily_stats_rate_limited(self, counter_config, mock_event_bus):
+        """A burst of P&L updates should publish once now and once at the interval."""
+        import asyncio
+
+        manager = RiskManager(config=counter_config, event_bus=mock_event_bus)
+
+        manager.record_pnl(Decimal("1"))
+        await asyncio.sleep(0.005)
+        for _ in range(20):
+            manager.record_pnl(Decimal("1"))
+            await asyncio.sleep(0)
+
+        def stats_events():
+            return [
+                c[0][1] for c in mock_event_bus.publish.call_args_list
+                if c[0][0] == "risk.daily_stats"
+            ]
+
+        assert len(stats_events()) == 1
+
+        await asyncio.sleep(0.1)
+        events = stats_events()
+        assert len(events) == 2
+        assert events[-1]["daily_pnl"] == "21"
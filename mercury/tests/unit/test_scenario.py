@@ -0,0 +1,120 @@
+"""
+Unit tests for PortfolioScenarios scenario P&L.
+
+Tests verify:
+- Hedged pairs are profitable in every scenario
+- Same-asset markets resolve together; worst case picks each asset's worse side
+- Stress P&L for correlated moves across assets
+- Hypothetical positions do not modify the portfolio
+- Sells, closes and row removal
+"""
+
+import pytest
+
+from mercury.domain.scenario import PortfolioScenarios
+
+
+@pytest.fixture
+def scenarios():
+    """Hedged BTC pair plus directional ETH YES and SOL NO."""
+    portfolio = PortfolioScenarios(capacity=2)
+    portfolio.apply_fill("btc", "YES", 100.0, 45.0, asset="BTC")
+    portfolio.apply_fill("btc", "NO", 100.0, 50.0, asset="BTC")
+    portfolio.apply_fill("eth", "YES", 50.0, 25.0, asset="eth")
+    portfolio.apply_fill("sol", "NO", 50.0, 25.0, asset="SOL")
+    return portfolio
+
+
+class TestPortfolioScenarios:
+    """Tests for PortfolioScenarios."""
+
+    def test_hedged_pair_profits_either_way(self):
+        """Verify a YES+NO pair below $1 has positive worst case."""
+        portfolio = PortfolioScenarios()
+        portfolio.apply_fill("btc", "YES", 100.0, 45.0, asset="BTC")
+        portfolio.apply_fill("btc", "NO", 100.0, 50.0, asset="BTC")
+
+        result = portfolio.evaluate()
+
+        assert result.worst_case_pnl == pytest.approx(5.0)
+        assert result.worst_case_loss == 0.0
+
+    def test_worst_case_and_stress(self, scenarios):
+        """Verify independent moves lose both directional legs, correlated moves one."""
+        result = scenarios.evaluate()
+
+        # ETH down and SOL up: only the BTC pair pays
+        assert result.worst_case_pnl == pytest.approx(100.0 - 145.0)
+        # All up or all down: one directional leg pays
+        assert result.stress_pnl == pytest.approx(150.0 - 145.0)
+        assert result.total_cost == pytest.approx(145.0)
+        assert scenarios.assets == ["BTC", "ETH", "SOL"]
+
+    def test_same_asset_markets_resolve_together(self):
+        """Verify YES and NO on two markets of one asset do not hedge each other."""
+        portfolio = PortfolioScenarios()
+        portfolio.apply_fill("btc-a", "YES", 10.0, 5.0, asset="BTC")
+        portfolio.apply_fill("btc-b", "NO", 10.0, 5.0, asset="BTC")
+        portfolio.apply_fill("other-a", "YES", 10.0, 5.0)
+        portfolio.apply_fill("other-a", "NO", 10.0, 4.0)
+
+        result = portfolio.evaluate()
+
+        # BTC legs pay 10 whichever way it moves; unassigned pair pays 10
+        assert result.worst_case_pnl == pytest.approx(20.0 - 19.0)
+
+    def test_evaluate_with_is_hypothetical(self, scenarios):
+        """Verify a hypothetical position changes the result but not the portfolio."""
+        before = scenarios.evaluate()
+
+        result = scenarios.evaluate_with("eth-2", 0.0, 50.0, 25.0, asset="ETH")
+
+        # ETH now pays 50 either way; SOL can still lose
+        assert result.worst_case_pnl == pytest.approx(150.0 - 170.0)
+        assert scenarios.evaluate() == before
+        assert "eth-2" not in scenarios
+
+    def test_evaluate_with_new_asset(self, scenarios):
+        """Verify a hypothetical position on an unseen asset is its own scenario axis."""
+        result = scenarios.evaluate_with("xrp", 20.0, 0.0, 10.0, asset="XRP")
+
+        assert result.worst_case_pnl == pytest.approx(100.0 - 155.0)
+        assert result.stress_pnl == pytest.approx(150.0 - 155.0)
+
+    def test_reduce_removes_average_cost(self, scenarios):
+        """Verify sells remove shares and cost at the average price."""
+        scenarios.reduce("eth", "YES", 20.0)
+
+        assert scenarios.position("eth") == pytest.approx((30.0, 0.0, 15.0))
+
+        scenarios.reduce("eth", "YES", 100.0)
+
+        assert "eth" not in scenarios
+        assert len(scenarios) == 2
+
+    def test_close_scales_position(self, scenarios):
+        """Verify closes remove cost basis proportionally across both sides."""
+        scenarios.close("btc", 47.5)
+
+        assert scenarios.position("btc") == pytest.approx((50.0, 50.0, 47.5))
+
+        scenarios.close("btc", 47.5)
+
+        assert scenarios.position("btc") is None
+
+    def test_row_removal_keeps_other_markets(self, scenarios):
+        """Verify swap-removal keeps the moved row's values and asset."""
+        scenarios.close("btc", 95.0)
+
+        assert scenarios.position("sol") == pytest.approx((0.0, 50.0, 25.0))
+        result = scenarios.evaluate()
+        assert result.worst_case_pnl == pytest.approx(-50.0)
+        assert result.stress_pnl == pytest.approx(0.0)
+
+    def test_copy_is_independent(self, scenarios):
+        """Verify staged fills on a copy leave the original unchanged."""
+        staged = scenarios.copy()
+        staged.apply_fill("eth", "NO", 50.0, 25.0)
+
+        assert scenarios.position("eth") == pytest.approx((50.0, 0.0, 25.0))
+        assert staged.position("eth") == pytest.approx((50.0, 50.0, 50.0))
@@ -0,0 +1,271 @@
+"""Unit tests for the simulated matching exchange used in dry runs."""
+
+import random
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mercury.core.config import ConfigManager
+from mercury.domain.order import OrderRequest, OrderType
+from mercury.domain.order import OrderSide as DomainOrderSide
+from mercury.domain.orderbook import InMemoryOrderBook
+from mercury.domain.signal import SignalType
+from mercury.integrations.polymarket.simulator import LatencyModel, SimulatedExchange
+from mercury.integrations.polymarket.types import OrderSide, OrderStatus, TimeInForce
+from mercury.services.execution import ExecutionEngine, ExecutionSignal
+
+
+def make_book(token_id, bids=(), asks=()):
+    book = InMemoryOrderBook(token_id=token_id)
+    book.apply_snapshot(
+        [(Decimal(p), Decimal(s)) for p, s in bids],
+        [(Decimal(p), Decimal(s)) for p, s in asks],
+    )
+    return book
+
+
+@pytest.fixture
+def books():
+    return {
+        "yes": make_book("yes", bids=[("0.44", "50")], asks=[("0.46", "10"), ("0.47", "20")]),
+        "no": make_book("no", bids=[("0.49", "50")], asks=[("0.50", "5")]),
+    }
+
+
+@pytest.fixture
+def exchange(books):
+    return SimulatedExchange(books.get, match_interval=0)
+
+
+class TestLatencyModel:
+    """Tests for LatencyModel sampling."""
+
+    def test_zero_mean_is_instant(self):
+        assert LatencyModel().sample(random.Random(1)) == 0.0
+
+    def test_lognormal_mean(self):
+        """Verify lognormal samples average to the configured mean."""
+        model = LatencyModel("lognormal", mean_ms=40.0, jitter_ms=20.0)
+        rng = random.Random(7)
+
+        samples = [model.sample(rng) for _ in range(5000)]
+
+        assert min(samples) > 0
+        assert sum(samples) / len(samples) == pytest.approx(0.040, rel=0.05)
+
+    def test_uniform_bounds(self):
+        model = LatencyModel("uniform", mean_ms=10.0, jitter_ms=5.0)
+        rng = random.Random(3)
+
+        assert all(0.005 <= model.sample(rng) <= 0.015 for _ in range(200))
+
+    def test_unknown_distribution(self):
+        with pytest.raises(ValueError):
+            LatencyModel("pareto")
+
+
+class TestSimulatedExchange:
+    """Tests for matching against book depth."""
+
+    def test_from_config(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_text(
+            "[execution.simulator]\nlatency_distribution = \"uniform\"\n"
+            "latency_mean_ms = 10.0\nmatch_interval_ms = 0\n"
+        )
+
+        exchange = SimulatedExchange.from_config(ConfigManager(config_path=path), {}.get)
+
+        assert exchange._latency == LatencyModel("uniform", mean_ms=10.0, jitter_ms=15.0)
+        assert exchange._match_interval == 0
+
+    async def test_walks_levels_up_to_limit(self, exchange):
+        """Verify a marketable order takes each level at its own price."""
+        result = await exchange.execute_order(
+            "yes", OrderSide.BUY, amount_shares=Decimal("25"), price=Decimal("0.47")
+        )
+
+        assert result.status == OrderStatus.FILLED
+        assert result.filled_size == Decimal("25")
+        assert result.filled_cost == (
+            Decimal("10") * Decimal("0.46") + Decimal("15") * Decimal("0.47")
+        )
+
+    async def test_fok_killed_without_full_depth(self, exchange):
+        result = await exchange.execute_order(
+            "no", OrderSide.BUY, amount_shares=Decimal("8"), price=Decimal("0.50"),
+            time_in_force=TimeInForce.FOK,
+        )
+
+        assert result.status == OrderStatus.CANCELLED
+        assert result.filled_size == 0
+        assert exchange.orders.get(result.order_id).is_done
+
+    async def test_gtc_remainder_rests(self, exchange):
+        """Verify a GTC order fills what it can and rests the rest."""
+        result = await exchange.execute_order(
+            "no", OrderSide.BUY, amount_shares=Decimal("8"), price=Decimal("0.50")
+        )
+
+        assert result.status == OrderStatus.LIVE
+        assert result.filled_size == Decimal("5")
+        open_orders = await exchange.get_open_orders()
+        assert [o["id"] for o in open_orders] == [result.order_id]
+        assert open_orders[0]["size_matched"] == "5"
+
+    async def test_taken_depth_not_reused(self, exchange, books):
+        """Verify displayed size we took is gone until the feed updates it."""
+        first = await exchange.execute_order(
+            "no", OrderSide.BUY, amount_shares=Decimal("5"), price=Decimal("0.50"),
+            time_in_force=TimeInForce.FOK,
+        )
+        second = await exchange.execute_order(
+            "no", OrderSide.BUY, amount_shares=Decimal("5"), price=Decimal("0.50"),
+            time_in_force=TimeInForce.FOK,
+        )
+        books["no"].update_ask(Decimal("0.50"), Decimal("6"))
+        third = await exchange.execute_order(
+            "no", OrderSide.BUY, amount_shares=Decimal("5"), price=Decimal("0.50"),
+            time_in_force=TimeInForce.FOK,
+        )
+
+        assert [first.status, second.status, third.status] == [
+            OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.FILLED,
+        ]
+
+    async def test_queue_position(self, exchange, books):
+        """Verify a resting bid fills only after the size ahead of it trades."""
+        result = await exchange.execute_order(
+            "yes", OrderSide.BUY, amount_shares=Decimal("10"), price=Decimal("0.44")
+        )
+        book = books["yes"]
+
+        book.update_bid(Decimal("0.44"), Decimal("20"))  # 30 of the 50 ahead left
+        assert exchange.match_resting() == 0
+        book.update_bid(Decimal("0.44"), Decimal("40"))  # 20 join behind us
+        assert exchange.match_resting() == 0
+
+        book.update_bid(Decimal("0.44"), Decimal("14"))  # 20 ahead gone, then 6 ours
+        assert exchange.match_resting() == 1
+        assert exchange.get_order(result.order_id).size_matched == Decimal("6")
+
+        book.update_bid(Decimal("0.44"), Decimal("10"))
+        exchange.match_resting()
+
+        order = exchange.get_order(result.order_id)
+        assert order.status == OrderStatus.FILLED
+        assert order.cost == Decimal("10") * Decimal("0.44")
+        assert exchange.orders.get(result.order_id).is_filled
+        assert await exchange.get_open_orders() == []
+
+    async def test_traded_through_level_fills(self, exchange, books):
+        result = await exchange.execute_order(
+            "yes", OrderSide.BUY, amount_shares=Decimal("10"), price=Decimal("0.44")
+        )
+
+        books["yes"].apply_snapshot(
+            [(Decimal("0.42"), Decimal("30"))], [(Decimal("0.45"), Decimal("10"))]
+        )
+        exchange.match_resting()
+
+        assert exchange.get_order(result.order_id).status == OrderStatus.FILLED
+
+    async def test_crossing_fills_resting_at_own_price(self, exchange, books):
+        result = await exchange.execute_order(
+            "yes", OrderSide.BUY, amount_shares=Decimal("10"), price=Decimal("0.45")
+        )
+
+        books["yes"].update_ask(Decimal("0.44"), Decimal("4"))
+        exchange.match_resting()
+
+        order = exchange.get_order(result.order_id)
+        assert order.size_matched == Decimal("4")
+        assert order.cost == Decimal("4") * Decimal("0.45")
+
+    async def test_cancel(self, exchange):
+        result = await exchange.execute_order(
+            "yes", OrderSide.SELL, amount_shares=Decimal("5"), price=Decimal("0.60")
+        )
+
+        assert await exchange.cancel_order(result.order_id) is True
+        assert await exchange.cancel_order(result.order_id) is False
+        assert exchange.orders.get(result.order_id).status == "CANCELLED"
+
+    async def test_dual_leg_returns_partial_fill(self, exchange):
+        """Verify thin depth on one leg leaves a partial fill and no resting orders."""
+        result = await exchange.execute_dual_leg_order(
+            "yes", "no", Decimal("10"), yes_price=Decimal("0.46"), no_price=Decimal("0.49"),
+        )
+
+        assert result.yes_result.status == OrderStatus.FILLED
+        assert result.no_result.status == OrderStatus.CANCELLED
+        assert result.no_result.filled_size == Decimal("5")
+        assert result.has_partial_fill
+        assert await exchange.get_open_orders() == []
+
+
+class TestSimulatedExecution:
+    """Tests for ExecutionEngine dry runs against the simulated exchange."""
+
+    @pytest.fixture
+    async def engine(self, exchange):
+        config = MagicMock()
+        config.get.return_value = None
+        config.get_bool.side_effect = lambda key, default=None: {
+            "mercury.dry_run": True,
+        }.get(key, default)
+        config.get_int.side_effect = lambda key, default: default
+        config.get_float.side_effect = lambda key, default: default
+        event_bus = MagicMock()
+        event_bus.publish = AsyncMock()
+        event_bus.subscribe = AsyncMock()
+        engine = ExecutionEngine(config, event_bus, clob_client=MagicMock(), simulator=exchange)
+        await engine.start()
+        yield engine
+        await engine.stop()
+
+    @staticmethod
+    def published(engine):
+        return [call.args[0] for call in engine._event_bus.publish.call_args_list]
+
+    async def test_fok_order_expires_on_thin_book(self, engine):
+        """Verify an unfillable FOK order is reported expired, not filled."""
+        result = await engine.execute_order(OrderRequest(
+            market_id="m1",
+            token_id="no",
+            side=DomainOrderSide.BUY,
+            outcome="NO",
+            price=Decimal("0.50"),
+            size=Decimal("8"),
+            order_type=OrderType.FOK,
+        ))
+
+        assert not result.success
+        assert result.order.filled_size == 0
+        assert self.published(engine) == ["order.pending", "order.submitted", "order.expired"]
+
+    async def test_partial_dual_leg_is_rebalanced(self, engine):
+        """Verify a partial arbitrage fill goes through the rebalance path."""
+        result = await engine.execute(ExecutionSignal(
+            signal_id="s1",
+            original_signal_id="o1",
+            market_id="m1",
+            signal_type=SignalType.ARBITRAGE,
+            target_size_usd=Decimal("10"),
+            yes_price=Decimal("0.45"),
+            no_price=Decimal("0.49"),
+            yes_token_id="yes",
+            no_token_id="no",
+        ))
+
+        assert not result.success
+        assert result.yes_filled > result.no_filled == Decimal("5")
+        # The excess YES is sold back into the 0.44 bid
+        sells = [
+            o for o in engine._clob._orders.values()
+            if o.side == OrderSide.SELL and o.token_id == "yes"
+        ]
+        assert len(sells) == 1 and sells[0].status == OrderStatus.FILLED
+        assert sells[0].size == result.yes_filled - result.no_filled
+        assert "position.opened" not in self.published(engine)
@@ -149,6 +149,48 @@ class TestConnectionPool:
 
         await pool.close()
 
+    @pytest.mark.asyncio
+    async def test_connection_pool_readers(self, tmp_path):
+        """Test readers are read-only, round robin and see committed writes."""
+        import aiosqlite
+
+        from mercury.services.state_store import ConnectionPool
+
+        db_path = str(tmp_path / "test_pool.db")
+        pool = ConnectionPool(db_path, readers=2)
+        await pool.connect()
+
+        writer = await pool.acquire()
+        await writer.execute("CREATE TABLE t (x INTEGER)")
+        await writer.execute("INSERT INTO t VALUES (1)")
+        await writer.commit()
+
+        first, second, third = [await pool.acquire_reader() for _ in range(3)]
+        assert pool.reader_count == 2
+        assert first is not writer and first is not second and third is first
+
+        async with first.execute("SELECT COUNT(*) FROM t") as cursor:
+            row = await cursor.fetchone()
+            assert row[0] == 1
+
+        with pytest.raises(aiosqlite.OperationalError, match="readonly"):
+            await second.execute("INSERT INTO t VALUES (2)")
+
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_pool_in_memory_reads_on_writer(self):
+        """Test an in-memory database has no readers (they could not see it)."""
+        from mercury.services.state_store import ConnectionPool
+
+        pool = ConnectionPool(":memory:", readers=2)
+        await pool.connect()
+
+        assert pool.reader_count == 0
+        assert await pool.acquire_reader() is await pool.acquire()
+
+        await pool.close()
+
 
 class TestStateStoreConnection:
     """Test StateStore connection functionality."""
@@ -1084,6 +1126,51 @@ class TestPositionOperations:
 
         await store.close()
 
+    @pytest.mark.asyncio
+    async def test_get_open_exposures(self, tmp_path):
+        """Test open position cost aggregated per market with its asset."""
+        from mercury.services.state_store import Position, StateStore, Trade
+
+        db_path = str(tmp_path / "test.db")
+        store = StateStore(db_path=db_path)
+        await store.connect()
+
+        await store.save_trade(Trade(
+            trade_id="exp-trade",
+            market_id="market-A",
+            strategy="gabagool",
+            side="YES",
+            size=Decimal("100.0"),
+            price=Decimal("0.50"),
+            cost=Decimal("50.0"),
+            asset="BTC",
+        ))
+        positions = [
+            # market-A: 100 YES @ 0.50 and 60 NO @ 0.45 -> 40 YES unpaired
+            Position(position_id="exp-1", market_id="market-A", strategy="gabagool",
+                     side="YES", size=Decimal("100.0"), entry_price=Decimal("0.50")),
+            Position(position_id="exp-2", market_id="market-A", strategy="gabagool",
+                     side="NO", size=Decimal("60.0"), entry_price=Decimal("0.45")),
+            Position(position_id="exp-3", market_id="market-B", strategy="gabagool",
+                     side="NO", size=Decimal("10.0"), entry_price=Decimal("0.40")),
+            Position(position_id="exp-4", market_id="market-C", strategy="gabagool",
+                     side="YES", size=Decimal("10.0"), entry_price=Decimal("0.40"),
+                     status="closed"),
+        ]
+        for pos in positions:
+            await store.save_position(pos)
+
+        exposures = {e.market_id: e for e in await store.get_open_exposures()}
+
+        assert set(exposures) == {"market-A", "market-B"}
+        assert exposures["market-A"].asset == "BTC"
+        assert exposures["market-A"].total_cost == Decimal("77.0")
+        assert exposures["market-A"].unhedged_cost == Decimal("20.0")
+        assert exposures["market-B"].asset is None
+        assert exposures["market-B"].unhedged_cost == exposures["market-B"].total_cost
+
+        await store.close()
+
     @pytest.mark.asyncio
     async def test_get_position_returns_none_for_missing(self, tmp_path):
         """Test get_position returns None for non-existent position."""
@@ -20,6 +20,7 @@ from mercury.services.strategy_engine import StrategyEngine
 from mercury.domain.market import OrderBook, OrderBookLevel
 from mercury.domain.signal import TradingSignal, SignalType, SignalPriority
 from mercury.core.lifecycle import HealthStatus
+from mercury.strategies.base import BookInterest
 
 
 class MockStrategy:
@@ -917,3 +918,500 @@ class TestConfigHotReload:
         states = await strategy_engine.sync_strategy_states()
 
         assert states == {"strategy_1": True, "strategy_2": False}
+
+
+class TestConcurrentEvaluation:
+    """Tests for concurrent strategy evaluation with time budgets."""
+
+    MARKET_DATA = {
+        "market_id": "shared_market",
+        "yes_bid": "0.44",
+        "yes_ask": "0.45",
+        "no_bid": "0.49",
+        "no_ask": "0.50",
+    }
+
+    @pytest.mark.asyncio
+    async def test_slow_strategy_does_not_delay_others(
+        self, strategy_engine, mock_event_bus
+    ):
+        """Verify strategies on the same market are evaluated concurrently."""
+        import asyncio
+
+        order = []
+
+        class SlowStrategy(MockStrategy):
+            async def on_market_data(self, market_id, book):
+                await asyncio.sleep(0.05)
+                order.append(self.name)
+                yield TradingSignal(
+                    strategy_name=self.name,
+                    market_id=market_id,
+                    signal_type=SignalType.ARBITRAGE,
+                    confidence=0.9,
+                    target_size_usd=Decimal("10"),
+                    yes_price=Decimal("0.45"),
+                    no_price=Decimal("0.50"),
+                )
+
+        class FastStrategy(MockStrategy):
+            async def on_market_data(self, market_id, book):
+                order.append(self.name)
+                async for signal in super().on_market_data(market_id, book):
+                    yield signal
+
+        slow = SlowStrategy("slow")
+        fast = FastStrategy("fast")
+        slow.subscribe_to_market("shared_market")
+        fast.subscribe_to_market("shared_market")
+        strategy_engine.register_strategy(slow)
+        strategy_engine.register_strategy(fast)
+        await strategy_engine.start()
+
+        await strategy_engine._on_market_data(self.MARKET_DATA)
+
+        assert order == ["fast", "slow"]
+        channels = [call[0][0] for call in mock_event_bus.publish.call_args_list]
+        assert "signal.slow" in channels
+        assert "signal.fast" in channels
+
+    @pytest.mark.asyncio
+    async def test_overrun_drops_signals_and_counts(self, mock_event_bus):
+        """Verify a strategy exceeding its budget has its signals dropped."""
+        import asyncio
+
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: {
+            "strategy_engine.evaluation_timeout_ms": 500.0,
+            "strategies.slow.evaluation_timeout_ms": 10.0,
+        }.get(key, default)
+        metrics = MagicMock()
+        engine = StrategyEngine(
+            config=config, event_bus=mock_event_bus, metrics_emitter=metrics
+        )
+
+        class SlowStrategy(MockStrategy):
+            async def on_market_data(self, market_id, book):
+                await asyncio.sleep(0.2)
+                async for signal in super().on_market_data(market_id, book):
+                    yield signal
+
+        slow = SlowStrategy("slow")
+        fast = MockStrategy("fast")
+        slow.subscribe_to_market("shared_market")
+        fast.subscribe_to_market("shared_market")
+        engine.register_strategy(slow)
+        engine.register_strategy(fast)
+        await engine.start()
+
+        assert engine.get_evaluation_timeout("slow") == pytest.approx(0.010)
+        assert engine.get_evaluation_timeout("fast") == pytest.approx(0.5)
+
+        await engine._on_market_data(self.MARKET_DATA)
+
+        channels = [call[0][0] for call in mock_event_bus.publish.call_args_list]
+        assert "signal.slow" not in channels
+        assert "signal.fast" in channels
+
+        stats = engine.get_evaluation_stats()
+        assert stats["slow"] == {"evaluations": 1, "overruns": 1, "skipped": 0}
+        assert stats["fast"] == {"evaluations": 1, "overruns": 0, "skipped": 0}
+
+        metrics.record_strategy_overrun.assert_called_once_with("slow")
+        timed = {call[0][0] for call in metrics.record_strategy_evaluation_time.call_args_list}
+        assert timed == {"slow", "fast"}
+
+    @pytest.mark.asyncio
+    async def test_synchronous_overrun_drops_signals(self, mock_event_bus):
+        """Verify a strategy blocking without awaiting is still held to its budget."""
+        import time
+
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: {
+            "strategies.busy.evaluation_timeout_ms": 10.0,
+        }.get(key, default)
+        metrics = MagicMock()
+        engine = StrategyEngine(
+            config=config, event_bus=mock_event_bus, metrics_emitter=metrics
+        )
+
+        class BusyStrategy(MockStrategy):
+            async def on_market_data(self, market_id, book):
+                time.sleep(0.05)  # CPU-bound work: wait_for cannot interrupt it
+                async for signal in super().on_market_data(market_id, book):
+                    yield signal
+
+        busy = BusyStrategy("busy")
+        busy.subscribe_to_market("shared_market")
+        engine.register_strategy(busy)
+        await engine.start()
+
+        await engine._on_market_data(self.MARKET_DATA)
+
+        channels = [call[0][0] for call in mock_event_bus.publish.call_args_list]
+        assert "signal.busy" not in channels
+        assert engine.get_evaluation_stats()["busy"]["overruns"] == 1
+        metrics.record_strategy_overrun.assert_called_once_with("busy")
+
+    @pytest.mark.asyncio
+    async def test_default_budget_when_unconfigured(self, strategy_engine, mock_strategy):
+        """Verify the engine default budget applies when config is unset."""
+        strategy_engine.register_strategy(mock_strategy)
+
+        expected = StrategyEngine.DEFAULT_EVALUATION_TIMEOUT_MS / 1000.0
+        assert strategy_engine.get_evaluation_timeout(mock_strategy.name) == expected
+
+
+class TestBatchEvaluation:
+    """Tests for on_market_batch evaluation."""
+
+    class BatchStrategy(MockStrategy):
+        """Strategy recording the rows it is called with."""
+
+        def __init__(self, name: str = "batch"):
+            super().__init__(name)
+            self.batches = []
+            self.per_event_calls = 0
+
+        async def on_market_data(self, market_id, book):
+            self.per_event_calls += 1
+            async for signal in super().on_market_data(market_id, book):
+                yield signal
+
+        async def on_market_batch(self, batch, rows):
+            self.batches.append([batch.market_ids[r] for r in rows])
+            for row in rows:
+                if batch.yes_ask[row] + batch.no_ask[row] < 1.0:
+                    yield TradingSignal(
+                        strategy_name=self.name,
+                        market_id=batch.market_ids[row],
+                        signal_type=SignalType.ARBITRAGE,
+                        confidence=0.9,
+                        target_size_usd=Decimal("10"),
+                        yes_price=Decimal("0.45"),
+                        no_price=Decimal("0.50"),
+                    )
+
+    @staticmethod
+    def make_engine(mock_event_bus, settings):
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: settings.get(key, default)
+        return StrategyEngine(config=config, event_bus=mock_event_bus)
+
+    @staticmethod
+    def market_data(market_id, yes_ask="0.45"):
+        return {"market_id": market_id, "yes_ask": yes_ask, "no_ask": "0.50"}
+
+    @pytest.mark.asyncio
+    async def test_flush_on_dirty_threshold(self, mock_event_bus):
+        """Verify batch strategies run once enough markets changed."""
+        engine = self.make_engine(mock_event_bus, {"strategy_engine.batch_max_dirty": 2})
+        strategy = self.BatchStrategy()
+        for market_id in ("m1", "m2", "m3"):
+            strategy.subscribe_to_market(market_id)
+        engine.register_strategy(strategy)
+
+        await engine._on_market_data(self.market_data("m1"))
+        assert strategy.batches == []
+
+        await engine._on_market_data(self.market_data("m3", yes_ask="0.55"))
+
+        assert strategy.batches == [["m1", "m3"]]
+        assert strategy.per_event_calls == 0
+        channels = [call[0][0] for call in mock_event_bus.publish.call_args_list]
+        assert channels == ["signal.batch"]
+
+    @pytest.mark.asyncio
+    async def test_per_event_strategies_unaffected(self, mock_event_bus):
+        """Verify strategies without the hook still run per event."""
+        engine = self.make_engine(mock_event_bus, {"strategy_engine.batch_max_dirty": 10})
+        batch_strategy = self.BatchStrategy()
+        plain = MockStrategy("plain")
+        batch_strategy.subscribe_to_market("m1")
+        plain.subscribe_to_market("m1")
+        engine.register_strategy(batch_strategy)
+        engine.register_strategy(plain)
+
+        await engine._on_market_data(self.market_data("m1"))
+
+        assert batch_strategy.batches == []
+        mock_event_bus.publish.assert_called_once()
+        assert mock_event_bus.publish.call_args[0][0] == "signal.plain"
+
+        await engine.flush_batch()
+
+        assert batch_strategy.batches == [["m1"]]
+
+    @pytest.mark.asyncio
+    async def test_batch_only_includes_subscribed_rows(self, mock_event_bus):
+        """Verify each batch strategy only sees its own markets."""
+        engine = self.make_engine(mock_event_bus, {"strategy_engine.batch_interval_ms": 1000})
+        first = self.BatchStrategy("first")
+        second = self.BatchStrategy("second")
+        first.subscribe_to_market("m1")
+        second.subscribe_to_market("m2")
+        engine.register_strategy(first)
+        engine.register_strategy(second)
+
+        await engine._on_market_data(self.market_data("m1"))
+        await engine.flush_batch()
+
+        assert first.batches == [["m1"]]
+        assert second.batches == []
+
+    @pytest.mark.asyncio
+    async def test_cadence_flush(self, mock_event_bus):
+        """Verify the batch loop flushes on its interval."""
+        import asyncio
+
+        engine = self.make_engine(mock_event_bus, {"strategy_engine.batch_interval_ms": 5})
+        strategy = self.BatchStrategy()
+        strategy.subscribe_to_market("m1")
+        engine.register_strategy(strategy)
+        await engine.start()
+
+        try:
+            await engine._on_market_data(self.market_data("m1"))
+            await asyncio.sleep(0.05)
+        finally:
+            await engine.stop()
+
+        assert strategy.batches == [["m1"]]
+
+    @pytest.mark.asyncio
+    async def test_hook_ignored_when_batching_disabled(self, strategy_engine):
+        """Verify the hook is unused unless batching is configured."""
+        strategy = self.BatchStrategy()
+        strategy.subscribe_to_market("m1")
+        strategy_engine.register_strategy(strategy)
+
+        await strategy_engine._on_market_data(self.market_data("m1"))
+
+        assert strategy.per_event_calls == 1
+        assert strategy.batches == []
+
+
+class TestInterestFilters:
+    """Tests for strategy-declared interest filters."""
+
+    class AskStrategy(MockStrategy):
+        """Strategy that only depends on best asks."""
+
+        interest = BookInterest.ASKS
+
+        def __init__(self, name: str = "asks"):
+            super().__init__(name)
+            self.calls = 0
+
+        async def on_market_data(self, market_id, book):
+            self.calls += 1
+            return
+            yield
+
+    class TradeStrategy(AskStrategy):
+        """Strategy that also re-evaluates on trades."""
+
+        interest = BookInterest.ASKS | BookInterest.TRADES
+
+    BOOK = {
+        "market_id": "m1",
+        "yes_bid": "0.44",
+        "yes_ask": "0.45",
+        "no_bid": "0.49",
+        "no_ask": "0.50",
+    }
+
+    @pytest.mark.asyncio
+    async def test_bid_change_skips_ask_strategy(self, strategy_engine):
+        """Verify bid-only changes and republishes skip an asks-only strategy."""
+        asks = self.AskStrategy()
+        plain = MockStrategy("plain")
+        asks.subscribe_to_market("m1")
+        plain.subscribe_to_market("m1")
+        strategy_engine.register_strategy(asks)
+        strategy_engine.register_strategy(plain)
+
+        await strategy_engine._on_market_data(dict(self.BOOK))
+        await strategy_engine._on_market_data(dict(self.BOOK, yes_bid="0.43"))
+        await strategy_engine._on_market_data(dict(self.BOOK, yes_bid="0.43"))
+        await strategy_engine._on_market_data(dict(self.BOOK, no_ask="0.51"))
+
+        assert asks.calls == 2
+        stats = strategy_engine.get_evaluation_stats()
+        assert stats["asks"]["skipped"] == 2
+        assert stats["plain"]["skipped"] == 0
+        assert stats["plain"]["evaluations"] == 4
+
+    @pytest.mark.asyncio
+    async def test_size_change_counts_as_change(self, strategy_engine):
+        """Verify a size change at the best ask invokes the strategy."""
+        asks = self.AskStrategy()
+        asks.subscribe_to_market("m1")
+        strategy_engine.register_strategy(asks)
+
+        await strategy_engine._on_market_data(dict(self.BOOK))
+        await strategy_engine._on_market_data(dict(self.BOOK, yes_ask_size="50"))
+
+        assert asks.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_skip_recorded_in_metrics(self, mock_config, mock_event_bus):
+        """Verify skipped invocations are exported."""
+        metrics = MagicMock()
+        engine = StrategyEngine(
+            config=mock_config, event_bus=mock_event_bus, metrics_emitter=metrics
+        )
+        asks = self.AskStrategy()
+        asks.subscribe_to_market("m1")
+        engine.register_strategy(asks)
+
+        await engine._on_market_data(dict(self.BOOK))
+        await engine._on_market_data(dict(self.BOOK))
+
+        metrics.record_strategy_skipped.assert_called_once_with("asks")
+
+    @pytest.mark.asyncio
+    async def test_trades_reevaluate_interested_strategies(self, strategy_engine):
+        """Verify trades invoke only strategies declaring TRADES."""
+        asks = self.AskStrategy()
+        trades = self.TradeStrategy("trades")
+        for strategy in (asks, trades):
+            strategy.subscribe_to_market("m1")
+            strategy_engine.register_strategy(strategy)
+
+        await strategy_engine._on_trade({"market_id": "m1"})
+        assert trades.calls == 0  # No book yet
+
+        await strategy_engine._on_market_data(dict(self.BOOK))
+        await strategy_engine._on_trade({"market_id": "m1", "price": "0.45"})
+
+        assert asks.calls == 1
+        assert trades.calls == 2
+
+
+class TestMarketActors:
+    """Tests for per-market actor scheduling."""
+
+    class RecordingStrategy(MockStrategy):
+        """Strategy recording the YES ask it saw per update."""
+
+        def __init__(self, name: str = "recorder", delay: float = 0.0):
+            super().__init__(name)
+            self.seen = []
+            self.delay = delay
+            self.unsubscribed = []
+
+        async def on_market_data(self, market_id, book):
+            import asyncio
+
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            self.seen.append((market_id, str(book.yes_best_ask)))
+            return
+            yield
+
+        def unsubscribe_market(self, market_id):
+            self.unsubscribed.append(market_id)
+
+    @staticmethod
+    def make_engine(mock_event_bus, metrics=None, **settings):
+        values = {"strategy_engine.market_actors": True}
+        values.update({f"strategy_engine.{k}": v for k, v in settings.items()})
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: values.get(key, default)
+        return StrategyEngine(config=config, event_bus=mock_event_bus, metrics_emitter=metrics)
+
+    @staticmethod
+    def update(market_id, yes_ask):
+        return {"market_id": market_id, "yes_ask": yes_ask, "no_ask": "0.50"}
+
+    @pytest.mark.asyncio
+    async def test_updates_processed_in_order(self, mock_event_bus):
+        """Verify a market's updates are processed in arrival order."""
+        import asyncio
+
+        engine = self.make_engine(mock_event_bus)
+        strategy = self.RecordingStrategy()
+        strategy.subscribe_to_market("m1")
+        engine.register_strategy(strategy)
+
+        for price in ("0.41", "0.42", "0.43"):
+            await engine._on_market_data(self.update("m1", price))
+        await asyncio.sleep(0.01)
+
+        assert strategy.seen == [("m1", "0.41"), ("m1", "0.42"), ("m1", "0.43")]
+        assert engine.get_actor_stats()["m1"]["processed"] == 3
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_mailbox_keeps_latest(self, mock_event_bus):
+        """Verify overflow drops the oldest pending updates."""
+        import asyncio
+
+        engine = self.make_engine(mock_event_bus, mailbox_size=2)
+        strategy = self.RecordingStrategy()
+        strategy.subscribe_to_market("m1")
+        engine.register_strategy(strategy)
+
+        for price in ("0.41", "0.42", "0.43", "0.44", "0.45"):
+            await engine._on_market_data(self.update("m1", price))
+        stats = engine.get_actor_stats()["m1"]
+        assert stats["depth"] == 2
+        assert stats["conflated"] == 3
+
+        await asyncio.sleep(0.01)
+
+        assert strategy.seen == [("m1", "0.44"), ("m1", "0.45")]
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_markets_progress_independently(self, mock_event_bus):
+        """Verify a slow market does not hold up another market."""
+        import asyncio
+
+        engine = self.make_engine(mock_event_bus)
+        slow = self.RecordingStrategy("slow", delay=0.2)
+        fast = self.RecordingStrategy("fast")
+        slow.subscribe_to_market("hot")
+        fast.subscribe_to_market("quiet")
+        engine.register_strategy(slow)
+        engine.register_strategy(fast)
+
+        await engine._on_market_data(self.update("hot", "0.41"))
+        await engine._on_market_data(self.update("quiet", "0.42"))
+        await asyncio.sleep(0.02)
+
+        assert fast.seen == [("quiet", "0.42")]
+        assert slow.seen == []
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_reclaims_actor(self, mock_event_bus):
+        """Verify unsubscribe_market stops routing and drops the actor."""
+        import asyncio
+
+        metrics = MagicMock()
+        engine = self.make_engine(mock_event_bus, metrics=metrics)
+        strategy = self.RecordingStrategy()
+        strategy.subscribe_to_market("m1")
+        engine.register_strategy(strategy)
+
+        await engine._on_market_data(self.update("m1", "0.41"))
+        await asyncio.sleep(0.01)
+        await engine._on_unsubscribe_market({"market_id": "m1"})
+        await engine._on_market_data(self.update("m1", "0.42"))
+
+        assert engine.get_actor_stats() == {}
+        assert strategy.unsubscribed == ["m1"]
+        assert strategy.seen == [("m1", "0.41")]
+        metrics.remove_strategy_mailbox.assert_called_once_with("m1")
+        metrics.record_strategy_mailbox_lag.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unrouted_market_has_no_actor(self, mock_event_bus):
+        """Verify updates for markets without strategies are dropped."""
+        engine = self.make_engine(mock_event_bus)
+
+        await engine._on_market_data(self.update("unknown", "0.41"))
+
+        assert engine.get_actor_stats() == {}
@@ -0,0 +1,248 @@
+"""
+Unit tests for the process-pool strategy tier.
+
+Tests verify:
+- Binary order book encoding round-trips
+- Signals produced in the worker reach the parent
+- Worker description without blocking the event loop
+- Worker crash detection, restart and retry
+- Registry routing of heavy strategies
+"""
+
+import os
+import signal
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from mercury.domain.market import OrderBook, OrderBookLevel
+from mercury.domain.signal import SignalPriority, SignalType, TradingSignal
+from mercury.strategies.base import BookInterest
+from mercury.strategies.process_pool import (
+    ProcessPoolStrategy,
+    decode_order_book,
+    encode_order_book,
+)
+from mercury.strategies.registry import StrategyRegistry
+
+
+class HeavyStrategy:
+    """Picklable strategy that exits its process on the 'crash' market."""
+
+    interest = BookInterest.ASKS
+
+    def __init__(self, markets: list[str] | None = None):
+        self._enabled = True
+        self._subscribed_markets = list(markets or [])
+
+    @property
+    def name(self) -> str:
+        return "heavy"
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def enable(self) -> None:
+        self._enabled = True
+
+    def disable(self) -> None:
+        self._enabled = False
+
+    def get_subscribed_markets(self) -> list[str]:
+        return self._subscribed_markets
+
+    def subscribe_market(self, market_id: str) -> None:
+        self._subscribed_markets.append(market_id)
+
+    async def on_market_data(
+        self,
+        market_id: str,
+        book: OrderBook,
+    ) -> AsyncIterator[TradingSignal]:
+        if market_id == "crash":
+            os._exit(1)
+        if book.has_arbitrage_opportunity:
+            yield TradingSignal(
+                strategy_name=self.name,
+                market_id=market_id,
+                signal_type=SignalType.ARBITRAGE,
+                confidence=0.9,
+                priority=SignalPriority.HIGH,
+                target_size_usd=Decimal("25.00"),
+                yes_price=book.yes_best_ask,
+                no_price=book.no_best_ask,
+                expected_pnl=Decimal("1") - book.combined_ask,
+                metadata={"pid": os.getpid()},
+            )
+
+
+def make_book(market_id: str = "market-1", timestamp=None) -> OrderBook:
+    """Create an order book with an arbitrage opportunity."""
+    return OrderBook(
+        market_id=market_id,
+        yes_bids=[OrderBookLevel(price=Decimal("0.44"), size=Decimal("50"))],
+        yes_asks=[
+            OrderBookLevel(price=Decimal("0.45"), size=Decimal("100")),
+            OrderBookLevel(price=Decimal("0.46"), size=Decimal("12.5")),
+        ],
+        no_bids=[],
+        no_asks=[OrderBookLevel(price=Decimal("0.52"), size=Decimal("100"))],
+        timestamp=timestamp,
+    )
+
+
+@pytest.fixture
+def strategy():
+    """Create a ProcessPoolStrategy and shut its worker down afterwards."""
+    proxy = ProcessPoolStrategy(HeavyStrategy, {"markets": ["market-1"]})
+    yield proxy
+    if proxy._executor is not None:
+        proxy._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class TestOrderBookEncoding:
+    """Tests for the compact binary book encoding."""
+
+    def test_round_trip_preserves_levels(self):
+        """Verify prices and sizes survive encoding."""
+        book = make_book(timestamp=datetime(2026, 1, 1, 12, 0, 0))
+
+        decoded = decode_order_book("market-1", encode_order_book(book))
+
+        assert decoded.market_id == "market-1"
+        assert decoded.yes_asks == book.yes_asks
+        assert decoded.yes_bids == book.yes_bids
+        assert decoded.no_asks == book.no_asks
+        assert decoded.no_bids == []
+        assert decoded.timestamp == book.timestamp
+
+    def test_round_trip_preserves_aware_timestamp(self):
+        """Verify timezone-aware timestamps stay aware."""
+        ts = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        decoded = decode_order_book("m", encode_order_book(make_book(timestamp=ts)))
+
+        assert decoded.timestamp == ts
+
+    def test_encoding_is_compact(self):
+        """Verify payload is header plus two float64 values per level."""
+        payload = encode_order_book(make_book())
+
+        assert len(payload) == 17 + 4 * 16
+
+
+class TestProcessPoolStrategy:
+    """Tests for the worker-process strategy proxy."""
+
+    def test_construction_does_not_wait_for_worker(self, strategy):
+        """Verify nothing is read from the worker until describe()."""
+        assert strategy.name == "HeavyStrategy"
+        assert strategy.get_subscribed_markets() == []
+        assert strategy.interest is None
+
+    @pytest.mark.asyncio
+    async def test_describes_worker_strategy(self, strategy):
+        """Verify name and subscriptions come from the worker instance."""
+        await strategy.describe()
+
+        assert strategy.name == "heavy"
+        assert strategy.enabled is True
+        assert strategy.get_subscribed_markets() == ["market-1"]
+        assert strategy.interest == BookInterest.ASKS
+
+    @pytest.mark.asyncio
+    async def test_signals_come_from_worker(self, strategy):
+        """Verify signals are evaluated out of process and yielded back."""
+        signals = [s async for s in strategy.on_market_data("market-1", make_book())]
+
+        assert len(signals) == 1
+        assert signals[0].market_id == "market-1"
+        assert signals[0].expected_pnl == Decimal("0.03")
+        assert signals[0].metadata["pid"] != os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_disabled_proxy_skips_evaluation(self, strategy):
+        """Verify a disabled proxy yields nothing."""
+        strategy.disable()
+
+        signals = [s async for s in strategy.on_market_data("market-1", make_book())]
+
+        assert signals == []
+
+    @pytest.mark.asyncio
+    async def test_worker_crash_restarts(self, strategy):
+        """Verify an update that crashes the worker is retried once, then dropped."""
+        await strategy.describe()
+        strategy.subscribe_market("market-2")
+
+        crashed = [s async for s in strategy.on_market_data("crash", make_book())]
+        signals = [s async for s in strategy.on_market_data("market-2", make_book())]
+
+        assert crashed == []
+        assert strategy.restart_count == 2
+        assert len(signals) == 1
+        assert strategy.get_subscribed_markets() == ["market-1", "market-2"]
+
+    @pytest.mark.asyncio
+    async def test_dead_worker_update_retried(self, strategy):
+        """Verify an update that finds the worker already dead is not lost."""
+        await strategy.describe()
+        for pid in list(strategy._executor._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        signals = [s async for s in strategy.on_market_data("market-1", make_book())]
+
+        assert strategy.restart_count == 1
+        assert len(signals) == 1
+
+
+class TestHeavyRegistration:
+    """Tests for registry routing of heavy strategies."""
+
+    def test_register_heavy(self):
+        """Verify heavy flag is tracked per strategy."""
+        config = MagicMock()
+        config.get_bool.return_value = False
+        registry = StrategyRegistry(config=config)
+
+        registry.register(HeavyStrategy, heavy=True)
+
+        assert registry.is_heavy("heavy")
+        assert registry.get_heavy_names() == ["heavy"]
+
+    def test_heavy_from_config(self):
+        """Verify strategies.<name>.heavy marks a strategy heavy."""
+        config = MagicMock()
+        config.get_bool.side_effect = lambda key, default=False: key == "strategies.heavy.heavy"
+        registry = StrategyRegistry(config=config)
+
+        registry.register(HeavyStrategy)
+
+        assert registry.is_heavy("heavy")
+
+    @pytest.mark.asyncio
+    async def test_create_instance_returns_proxy(self):
+        """Verify heavy strategies are instantiated in a worker process."""
+        config = MagicMock()
+        config.get_bool.return_value = False
+        registry = StrategyRegistry(config=config)
+        registry.register(HeavyStrategy, heavy=True)
+
+        instance = registry.create_instance("heavy", markets=["m"])
+        try:
+            assert isinstance(instance, ProcessPoolStrategy)
+            assert instance.name == "heavy"
+            await instance.describe()
+            assert instance.get_subscribed_markets() == ["m"]
+        finally:
+            instance._executor.shutdown(wait=True)
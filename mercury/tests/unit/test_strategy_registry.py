@@ -322,8 +322,8 @@ class TestStrategyInstantiation:
         registry.register(BrokenStrategy)
         registry.register(MockStrategy)
 
-        # Both enabled
-        mock_config.get_bool.return_value = True
+        # Both enabled (and in-process: heavy strategies fail in their worker)
+        mock_config.get_bool.side_effect = lambda key, default=False: key.endswith(".enabled")
 
         # Should get MockStrategy despite BrokenStrategy error
         strategies = registry.get_enabled_strategies(config=mock_config)
@@ -0,0 +1,342 @@
+"""Unit tests for the Polymarket user channel and order state index."""
+
+import asyncio
+import json
+import time
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mercury.core.lifecycle import HealthStatus
+from mercury.domain.order import Order, OrderSide, OrderStatus, OrderType
+from mercury.integrations.polymarket.clob import CLOBClient
+from mercury.integrations.polymarket.types import PolymarketSettings
+from mercury.integrations.polymarket.user_channel import (
+    OrderStateIndex,
+    PolymarketUserChannel,
+)
+from mercury.services.execution import ExecutionEngine
+
+
+@pytest.fixture
+def settings():
+    """Create Polymarket settings with API credentials."""
+    return PolymarketSettings(
+        private_key="0x" + "1" * 64,
+        api_key="key",
+        api_secret="secret",
+        api_passphrase="pass",
+        user_ws_url="wss://test.example.com/ws/user",
+    )
+
+
+@pytest.fixture
+def mock_event_bus():
+    """Create mock EventBus."""
+    bus = MagicMock()
+    bus.publish = AsyncMock()
+    bus.subscribe = AsyncMock()
+    return bus
+
+
+def order_update(order_id, update_type="UPDATE", original="10", matched="0"):
+    return {
+        "event_type": "order",
+        "id": order_id,
+        "type": update_type,
+        "original_size": original,
+        "size_matched": matched,
+    }
+
+
+class TestOrderStateIndex:
+    """Tests for applying updates and awaiting orders."""
+
+    def test_order_updates_track_matched_size(self):
+        """Verify placement, partial and full matches update state."""
+        index = OrderStateIndex()
+
+        index.apply(order_update("o1", "PLACEMENT"))
+        assert index.get("o1").status == "LIVE"
+
+        index.apply(order_update("o1", matched="4"))
+        assert index.get("o1").size_matched == Decimal("4")
+        assert not index.get("o1").is_done
+
+        index.apply(order_update("o1", matched="10"))
+        assert index.get("o1").is_filled
+        assert index.get("o1").status == "MATCHED"
+
+    def test_cancellation_is_done_not_filled(self):
+        """Verify a cancellation finishes the order without a fill."""
+        index = OrderStateIndex()
+
+        index.apply(order_update("o1", "CANCELLATION", matched="3"))
+
+        order = index.get("o1")
+        assert order.is_done
+        assert not order.is_filled
+        assert order.size_matched == Decimal("3")
+
+    def test_trade_statuses_count_once(self):
+        """Verify MATCHED/MINED/CONFIRMED for one trade do not double count."""
+        index = OrderStateIndex()
+        index.expect("taker", Decimal("10"))
+        trade = {
+            "event_type": "trade",
+            "id": "t1",
+            "taker_order_id": "taker",
+            "size": "6",
+            "maker_orders": [{"order_id": "maker", "matched_amount": "6"}],
+        }
+
+        for status in ("MATCHED", "MINED", "CONFIRMED"):
+            index.apply({**trade, "status": status})
+        assert index.get("taker").size_matched == Decimal("6")
+        assert not index.get("taker").is_filled
+
+        index.apply({**trade, "id": "t2", "size": "4", "status": "MATCHED"})
+        assert index.get("taker").is_filled
+        assert index.get("maker").size_matched == Decimal("12")
+
+    def test_failed_trade_ignored(self):
+        """Verify FAILED trades do not add matched size."""
+        index = OrderStateIndex()
+
+        changed = index.apply({
+            "event_type": "trade", "id": "t1", "status": "FAILED",
+            "taker_order_id": "o1", "size": "5",
+        })
+
+        assert changed == []
+        assert index.get("o1") is None
+
+    def test_eviction_bounds_size(self):
+        """Verify the oldest orders are dropped beyond max_orders."""
+        index = OrderStateIndex(max_orders=2)
+
+        for order_id in ("a", "b", "c"):
+            index.apply(order_update(order_id, "PLACEMENT"))
+
+        assert len(index) == 2
+        assert index.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_wait_until_done_resolves_on_push(self):
+        """Verify a waiter wakes on the update instead of its timeout."""
+        index = OrderStateIndex()
+        index.apply(order_update("o1", "PLACEMENT"))
+
+        async def push():
+            await asyncio.sleep(0.01)
+            index.apply(order_update("o1", matched="5"))
+            await asyncio.sleep(0.01)
+            index.apply(order_update("o1", matched="10"))
+
+        start = time.monotonic()
+        pusher = asyncio.create_task(push())
+        order = await index.wait_until_done("o1", timeout=2.0)
+        await pusher
+
+        assert order.is_filled
+        assert time.monotonic() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self):
+        """Verify waits return the last state (or None) on timeout."""
+        index = OrderStateIndex()
+
+        assert await index.wait_for_update("o1", timeout=0.01) is None
+        assert await index.wait_until_done("o1", timeout=0.01) is None
+
+        index.apply(order_update("o1", "PLACEMENT"))
+        order = await index.wait_until_done("o1", timeout=0.01)
+        assert order is not None and not order.is_done
+
+
+class TestPolymarketUserChannel:
+    """Tests for the user channel component."""
+
+    def test_subscribe_message_authenticates(self, settings, mock_event_bus):
+        """Verify the subscription carries the API credentials."""
+        channel = PolymarketUserChannel(settings, mock_event_bus)
+
+        message = channel._subscribe_message()
+
+        assert message["type"] == "user"
+        assert message["auth"] == {"apiKey": "key", "secret": "secret", "passphrase": "pass"}
+
+    def test_process_batch_message(self, settings, mock_event_bus):
+        """Verify batched events and PONGs are handled."""
+        channel = PolymarketUserChannel(settings, mock_event_bus)
+
+        channel._process_message("PONG")
+        channel._process_message(json.dumps([
+            order_update("o1", "PLACEMENT"),
+            order_update("o2", "CANCELLATION"),
+        ]))
+
+        assert channel.orders.get("o1").status == "LIVE"
+        assert channel.orders.get("o2").status == "CANCELLED"
+
+    @pytest.mark.asyncio
+    async def test_health_degraded_when_disconnected(self, settings, mock_event_bus):
+        """Verify a running but disconnected channel reports DEGRADED."""
+        channel = PolymarketUserChannel(settings, mock_event_bus)
+        channel._should_run = True
+
+        result = await channel.health_check()
+
+        assert result.status == HealthStatus.DEGRADED
+
+
+class TestCLOBLiveOrderWait:
+    """Tests for dual-leg LIVE order waits using the index."""
+
+    @pytest.fixture
+    def clob(self, settings):
+        client = CLOBClient(settings, order_index=OrderStateIndex())
+        client._client = MagicMock()
+        client._client.get_orders = MagicMock(return_value=[])
+        client._connected = True
+        return client
+
+    @pytest.mark.asyncio
+    async def test_push_fill_skips_sleep_and_poll(self, clob):
+        """Verify both legs filled by push return without REST polling."""
+        clob.order_index.connected = True
+        clob.order_index.apply(order_update("yes-1", matched="10"))
+
+        async def fill_no():
+            await asyncio.sleep(0.01)
+            clob.order_index.apply(order_update("no-1", matched="10"))
+
+        start = time.monotonic()
+        pusher = asyncio.create_task(fill_no())
+        yes_filled, no_filled, yes_matched, no_matched = await clob._wait_for_live_orders(
+            {"id": "yes-1", "status": "LIVE"}, {"id": "no-1", "status": "LIVE"}, False, False
+        )
+        await pusher
+
+        assert yes_filled and no_filled
+        assert yes_matched == no_matched == Decimal("10")
+        assert time.monotonic() - start < 1.0
+        clob._client.get_orders.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_poll_when_open(self, clob, monkeypatch):
+        """Verify a leg without a terminal update is checked via get_orders."""
+        monkeypatch.setattr("mercury.integrations.polymarket.clob.LIVE_ORDER_WAIT_SECONDS", 0.02)
+        clob.order_index.connected = True
+        clob._client.get_orders.return_value = [{"id": "no-1", "status": "MATCHED"}]
+
+        yes_filled, no_filled, _, _ = await clob._wait_for_live_orders(
+            {"id": "yes-1", "status": "MATCHED"}, {"id": "no-1", "status": "LIVE"}, True, False
+        )
+
+        assert yes_filled and no_filled
+        clob._client.get_orders.assert_called_once()
+
+
+class TestExecutionEngineFillUpdates:
+    """Tests for GTC/FOK handling driven by the user channel."""
+
+    @pytest.fixture
+    def channel(self, settings, mock_event_bus):
+        channel = PolymarketUserChannel(settings, mock_event_bus)
+        channel.orders.connected = True
+        return channel
+
+    @pytest.fixture
+    def engine(self, mock_event_bus, channel):
+        config = MagicMock()
+        config.get.return_value = None
+        config.get_bool.side_effect = lambda key, default=None: {
+            "mercury.dry_run": False,
+        }.get(key, default)
+        config.get_int.side_effect = lambda key, default: default
+        config.get_float.side_effect = lambda key, default: default
+        clob = MagicMock()
+        clob.get_open_orders = AsyncMock(return_value=[])
+        return ExecutionEngine(
+            config=config,
+            event_bus=mock_event_bus,
+            clob_client=clob,
+            user_channel=channel,
+        )
+
+    def make_order(self, order_type=OrderType.GTC):
+        return Order(
+            order_id="ord-1",
+            market_id="m1",
+            token_id="tok",
+            side=OrderSide.BUY,
+            outcome="YES",
+            requested_size=Decimal("10"),
+            filled_size=Decimal("0"),
+            price=Decimal("0.5"),
+            status=OrderStatus.SUBMITTED,
+            order_type=order_type,
+            exchange_order_id="0xabc",
+        )
+
+    def test_index_attached_to_clob(self, engine, channel):
+        """Verify the CLOB client receives the channel's index."""
+        engine._clob.set_order_index.assert_called_once_with(channel.orders)
+
+    @pytest.mark.asyncio
+    async def test_gtc_partial_then_fill_events(self, engine, channel, mock_event_bus):
+        """Verify pushes drive partial and full fill events without polling."""
+        async def push():
+            await asyncio.sleep(0.01)
+            channel.orders.apply(order_update("0xabc", matched="4"))
+            await asyncio.sleep(0.01)
+            channel.orders.apply(order_update("0xabc", matched="10"))
+
+        pusher = asyncio.create_task(push())
+        order = await engine._handle_gtc_order(self.make_order(), timeout=2.0)
+        await pusher
+
+        channels = [c[0][0] for c in mock_event_bus.publish.call_args_list]
+        assert channels == ["order.partially_filled", "order.filled"]
+        assert order.status == OrderStatus.FILLED
+        engine._clob.get_open_orders.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fill_during_partial_event_is_not_cancelled(
+        self, engine, channel, mock_event_bus
+    ):
+        """Verify a fill arriving while the partial is published ends FILLED."""
+        async def publish(event_type, data):
+            if event_type == "order.partially_filled":
+                channel.orders.apply(order_update("0xabc", matched="10"))
+
+        mock_event_bus.publish.side_effect = publish
+        channel.orders.apply(order_update("0xabc", matched="4"))
+
+        order = await engine._handle_gtc_order(self.make_order(), timeout=2.0)
+
+        channels = [c[0][0] for c in mock_event_bus.publish.call_args_list]
+        assert channels == ["order.partially_filled", "order.filled"]
+        assert order.status == OrderStatus.FILLED
+        assert order.filled_size == Decimal("10")
+
+    @pytest.mark.asyncio
+    async def test_gtc_timeout_falls_back_to_poll(self, engine):
+        """Verify one REST check runs when no terminal update arrives."""
+        order = await engine._handle_gtc_order(self.make_order(), timeout=0.02)
+
+        engine._clob.get_open_orders.assert_awaited_once()
+        # Not in open orders: treated as filled, as with polling
+        assert order.status == OrderStatus.FILLED
+
+    @pytest.mark.asyncio
+    async def test_fok_cancelled_update_expires(self, engine, channel):
+        """Verify an FOK kill reported by push expires the order immediately."""
+        channel.orders.apply(order_update("0xabc", "CANCELLATION"))
+
+        order = await engine._handle_fok_order(self.make_order(OrderType.FOK), timeout=5.0)
+
+        assert order.status == OrderStatus.EXPIRED
+        engine._clob.get_open_orders.assert_not_called()
@@ -0,0 +1,189 @@
+"""Unit tests for StateStore write-behind group commit."""
+
+import asyncio
+import sqlite3
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from mercury.core.config import ConfigManager
+from mercury.services.state_store import FillRecord, StateStore, Trade
+
+
+def create_config(values=None) -> ConfigManager:
+    values = {"database.write_behind": True, **(values or {})}
+    config = MagicMock(spec=ConfigManager)
+    config.get.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_bool.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_int.side_effect = lambda key, default=None: values.get(key, default)
+    config.get_float.side_effect = lambda key, default=None: values.get(key, default)
+    return config
+
+
+def create_trade(i: int) -> Trade:
+    return Trade(
+        trade_id=f"trade-{i}",
+        market_id="m1",
+        strategy="gabagool",
+        side="YES",
+        size=Decimal("10"),
+        price=Decimal("0.50"),
+        cost=Decimal("5"),
+    )
+
+
+async def save_fill(store: StateStore, fill_id: str, durable: bool = False) -> None:
+    await store.save_fill(
+        fill_id=fill_id,
+        trade_id=None,
+        order_id="order-1",
+        token_id="token-1",
+        side="BUY",
+        size=Decimal("10"),
+        price=Decimal("0.50"),
+        durable=durable,
+    )
+
+
+async def count(path: str, table: str) -> int:
+    """Rows committed to disk, read through a separate connection."""
+    with sqlite3.connect(path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.fixture
+async def store(tmp_path):
+    # Long interval: only max_rows, flush() and close() trigger a commit
+    store = StateStore(
+        db_path=str(tmp_path / "test.db"),
+        config=create_config({"database.flush_interval_ms": 60_000}),
+        metrics_emitter=MagicMock(),
+    )
+    await store.connect()
+    yield store
+    await store.close()
+
+
+class TestWriteBehind:
+    """Tests for queued writes and group commit."""
+
+    async def test_writes_queued_until_flush(self, store):
+        for i in range(20):
+            await save_fill(store, f"fill-{i}")
+
+        assert store.write_queue_depth == 20
+        assert await count(store._db_path, "fills") == 0
+
+        await store.flush()
+
+        assert store.write_queue_depth == 0
+        assert await count(store._db_path, "fills") == 20
+        store._writes._metrics.record_state_store_flush.assert_called_once()
+        assert store._writes._metrics.record_state_store_flush.call_args.args[1] == 20
+
+    async def test_same_statement_sent_with_executemany(self, store):
+        conn = await store._pool.acquire()
+        executemany = MagicMock(wraps=conn.executemany)
+        conn.executemany = executemany
+
+        for i in range(5):
+            await save_fill(store, f"fill-{i}")
+        await store.save_trade(create_trade(1))
+        await store.flush()
+
+        executemany.assert_called_once()
+        assert len(executemany.call_args.args[1]) == 5
+
+    async def test_durable_write_waits_for_commit(self, store):
+        await save_fill(store, "queued")
+
+        await save_fill(store, "durable", durable=True)
+
+        assert await count(store._db_path, "fills") == 2
+
+    async def test_reads_see_queued_writes(self, store):
+        await store.save_trade(create_trade(1))
+
+        trade = await store.get_trade("trade-1")
+
+        assert trade is not None and trade.trade_id == "trade-1"
+
+    async def test_max_rows_flushes_without_waiting(self, tmp_path):
+        store = StateStore(
+            db_path=str(tmp_path / "test.db"),
+            config=create_config({
+                "database.flush_interval_ms": 60_000,
+                "database.flush_max_rows": 3,
+            }),
+        )
+        await store.connect()
+        try:
+            for i in range(3):
+                await save_fill(store, f"fill-{i}")
+            for _ in range(20):
+                if store._writes.idle:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert await count(store._db_path, "fills") == 3
+        finally:
+            await store.close()
+
+    async def test_insert_returns_row_id(self, store):
+        record = FillRecord(
+            token_id="token-1",
+            condition_id="cond-1",
+            asset="BTC",
+            side="BUY",
+            intended_size=Decimal("10"),
+            filled_size=Decimal("10"),
+            intended_price=Decimal("0.50"),
+            actual_avg_price=Decimal("0.50"),
+            time_to_fill_ms=100,
+            slippage=Decimal("0"),
+            pre_fill_depth=Decimal("100"),
+            post_fill_depth=Decimal("90"),
+        )
+
+        first = await store.save_fill_record(record)
+        second = await store.save_fill_record(record)
+
+        assert first > 0 and second == first + 1
+
+    async def test_failed_row_does_not_lose_batch(self, store):
+        """Verify a bad row is replayed alone and only it fails."""
+        await save_fill(store, "before")
+        bad = store._writes.submit("INSERT INTO fills (fill_id) VALUES (?)", ("bad",), wait=True)
+        await save_fill(store, "after")
+
+        await store.flush()
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await bad
+        assert await count(store._db_path, "fills") == 2
+
+    async def test_close_commits_queue(self, tmp_path):
+        path = str(tmp_path / "test.db")
+        store = StateStore(
+            db_path=path, config=create_config({"database.flush_interval_ms": 60_000})
+        )
+        await store.connect()
+        await store.save_trade(create_trade(1))
+
+        await store.close()
+
+        assert await count(path, "trades") == 1
+
+    async def test_disabled_commits_each_write(self, tmp_path):
+        store = StateStore(db_path=str(tmp_path / "test.db"), config=create_config({
+            "database.write_behind": False,
+        }))
+        await store.connect()
+        try:
+            await save_fill(store, "fill-1")
+
+            assert store.write_queue_depth == 0
+            assert await count(store._db_path, "fills") == 1
+        finally:
+            await store.close()